@@ -21,6 +21,7 @@ from app.agents.client_intelligence_types import (
 )
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.prompt_cache import PromptSegment, assemble_system
 from app.db.clients import get_client, get_client_projects
 
 logger = get_logger(__name__)
@@ -148,13 +149,9 @@ What's your reasoning and recommended action?"""
         response = anthropic_client.messages.create(
             model="claude-sonnet-4-6",
             max_tokens=4096,
-            system=[
-                {
-                    "type": "text",
-                    "text": CI_AGENT_SYSTEM_PROMPT,
-                    "cache_control": {"type": "ephemeral"},
-                }
-            ],
+            system=assemble_system(
+                [PromptSegment(CI_AGENT_SYSTEM_PROMPT)], name="client_intelligence"
+            ),
             tools=anthropic_tools,
             messages=[{"role": "user", "content": user_prompt}],
             output_config={"effort": "medium"},
@@ -162,12 +159,10 @@ What's your reasoning and recommended action?"""
         )
 
         # Log usage
-        from app.core.llm_usage import log_llm_usage
+        from app.core.llm_usage import anthropic_usage_tokens, log_llm_usage
         log_llm_usage(
             workflow="client_intelligence", model=response.model, provider="anthropic",
-            tokens_input=response.usage.input_tokens, tokens_output=response.usage.output_tokens,
-            tokens_cache_read=getattr(response.usage, "cache_read_input_tokens", 0),
-            tokens_cache_create=getattr(response.usage, "cache_creation_input_tokens", 0),
+            **anthropic_usage_tokens(response.usage),
         )
 
         # ==================================================================
@@ -37,8 +37,8 @@ from app.db.memory_graph import (
     archive_low_confidence_beliefs,
     archive_old_insights,
     complete_synthesis_log,
-    create_edge,
     create_node,
+    create_nodes,
     fail_synthesis_log,
     get_active_beliefs,
     get_all_edges,
@@ -131,18 +131,25 @@ class MemoryWatcher:
             result = self._parse_watcher_response(content)
 
             # Store extracted facts
-            stored_facts = []
-            for fact in result.get("facts", []):
-                node = create_node(
-                    project_id=project_id,
-                    node_type="fact",
-                    content=fact["content"],
-                    summary=fact["summary"],
-                    source_type="signal" if "signal" in event_type else "agent",
-                    source_id=UUID(event_data.get("signal_id")) if event_data.get("signal_id") else None,
-                )
-                if node:
-                    stored_facts.append({"id": node["id"], "summary": fact["summary"]})
+            facts = result.get("facts", [])
+            source_type = "signal" if "signal" in event_type else "agent"
+            source_id = UUID(event_data.get("signal_id")) if event_data.get("signal_id") else None
+            created = create_nodes(
+                project_id,
+                [
+                    {
+                        "node_type": "fact",
+                        "content": fact["content"],
+                        "summary": fact["summary"],
+                        "source_type": source_type,
+                        "source_id": source_id,
+                    }
+                    for fact in facts
+                ],
+            )["nodes"]
+            stored_facts = [
+                {"id": node["id"], "summary": node["summary"]} for node in created
+            ]
 
             # Complete synthesis log
             complete_synthesis_log(
@@ -549,19 +556,22 @@ Output a JSON array of actions:
             "edges_created": 0,
         }
 
+        # New beliefs and plain edges are written together in one bulk insert
+        # each; supporting edges reference their belief by batch index.
+        new_beliefs: list[dict] = []
+        new_edges: list[dict] = []
+
         for action in actions:
             try:
                 action_type = action.get("action")
 
                 if action_type == "add_edge":
-                    create_edge(
-                        project_id=project_id,
-                        from_node_id=UUID(action["from_id"]),
-                        to_node_id=UUID(action["to_id"]),
-                        edge_type=action["edge_type"],
-                        rationale=action.get("rationale"),
-                    )
-                    results["edges_created"] += 1
+                    new_edges.append({
+                        "from": action["from_id"],
+                        "to": action["to_id"],
+                        "edge_type": action["edge_type"],
+                        "rationale": action.get("rationale"),
+                    })
 
                 elif action_type == "update_belief_confidence":
                     update_belief_confidence(
@@ -573,31 +583,21 @@ Output a JSON array of actions:
                     results["beliefs_updated"] += 1
 
                 elif action_type == "create_belief":
-                    node = create_node(
-                        project_id=project_id,
-                        node_type="belief",
-                        content=action["content"],
-                        summary=action["summary"],
-                        confidence=action["confidence"],
-                        source_type="synthesis",
-                        source_id=synthesis_log_id,
-                        belief_domain=action.get("domain"),
-                    )
-                    results["beliefs_created"] += 1
-
-                    # Create supporting edges
-                    if node and action.get("supported_by"):
-                        for fact_id in action["supported_by"]:
-                            try:
-                                create_edge(
-                                    project_id=project_id,
-                                    from_node_id=UUID(fact_id),
-                                    to_node_id=UUID(node["id"]),
-                                    edge_type="supports",
-                                )
-                                results["edges_created"] += 1
-                            except Exception:
-                                pass  # Skip invalid fact IDs
+                    belief = {
+                        "node_type": "belief",
+                        "content": action["content"],
+                        "summary": action["summary"],
+                        "confidence": action["confidence"],
+                        "source_type": "synthesis",
+                        "source_id": synthesis_log_id,
+                        "belief_domain": action.get("domain"),
+                    }
+                    index = len(new_beliefs)
+                    new_beliefs.append(belief)
+
+                    # Supporting edges (invalid fact IDs are skipped)
+                    for fact_id in action.get("supported_by") or []:
+                        new_edges.append({"from": fact_id, "to": index, "edge_type": "supports"})
 
                 elif action_type == "update_belief_content":
                     update_belief_content(
@@ -634,6 +634,14 @@ Output a JSON array of actions:
             except Exception as e:
                 logger.warning(f"Failed to execute action {action}: {e}")
 
+        if new_beliefs or new_edges:
+            try:
+                created = create_nodes(project_id, new_beliefs, edges=new_edges)
+                results["beliefs_created"] += len(created["nodes"])
+                results["edges_created"] += len(created["edges"])
+            except Exception as e:
+                logger.warning(f"Failed to create {len(new_beliefs)} beliefs: {e}")
+
         return results
 
 
@@ -702,37 +710,37 @@ class MemoryReflector:
             content = response.content[0].text if response.content else "{}"
             result = self._parse_reflector_response(content)
 
-            stored_insights = []
-            for insight in result.get("insights", []):
-                node = create_node(
-                    project_id=project_id,
-                    node_type="insight",
-                    content=insight["content"],
-                    summary=insight["summary"],
-                    confidence=insight.get("confidence", 0.7),
-                    source_type="reflection",
-                    source_id=log_id,
-                    insight_type=insight.get("type"),
-                )
-                if node:
-                    stored_insights.append({
-                        "id": node["id"],
+            insights = result.get("insights", [])
+            created = create_nodes(
+                project_id,
+                [
+                    {
+                        "node_type": "insight",
+                        "content": insight["content"],
                         "summary": insight["summary"],
-                        "type": insight.get("type"),
-                    })
-
-                    # Create supporting edges
-                    for supported_by_id in insight.get("supported_by", []):
-                        try:
-                            create_edge(
-                                project_id=project_id,
-                                from_node_id=UUID(supported_by_id),
-                                to_node_id=UUID(node["id"]),
-                                edge_type="leads_to",
-                                rationale="Evidence for insight",
-                            )
-                        except Exception:
-                            pass
+                        "confidence": insight.get("confidence", 0.7),
+                        "source_type": "reflection",
+                        "source_id": log_id,
+                        "insight_type": insight.get("type"),
+                    }
+                    for insight in insights
+                ],
+                # Supporting edges (invalid IDs are skipped)
+                edges=[
+                    {
+                        "from": supported_by_id,
+                        "to": index,
+                        "edge_type": "leads_to",
+                        "rationale": "Evidence for insight",
+                    }
+                    for index, insight in enumerate(insights)
+                    for supported_by_id in insight.get("supported_by", [])
+                ],
+            )
+            stored_insights = [
+                {"id": node["id"], "summary": node["summary"], "type": node.get("insight_type")}
+                for node in created["nodes"]
+            ]
 
             # Archive old insights
             archived = archive_old_insights(project_id, days_old=INSIGHT_ARCHIVE_DAYS)
@@ -741,7 +749,7 @@ class MemoryReflector:
             complete_synthesis_log(
                 log_id=log_id,
                 insights_created=len(stored_insights),
-                edges_created=len(stored_insights) * 2,  # Approximate
+                edges_created=len(created["edges"]),
                 tokens_input=response.usage.input_tokens if response.usage else 0,
                 tokens_output=response.usage.output_tokens if response.usage else 0,
                 model_used=SONNET_MODEL,
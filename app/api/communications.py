@@ -6,7 +6,7 @@ Covers Google OAuth, email capture, meeting recording, and privacy endpoints.
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 
 from app.core.auth_middleware import AuthContext, require_auth, require_super_admin
 from app.core.config import get_settings
@@ -502,11 +502,18 @@ async def purge_user_data(
 
 
 @router.post("/cron/enforce-retention")
-async def enforce_retention(auth: AuthContext = Depends(require_super_admin)):
+async def enforce_retention(
+    project_id: UUID | None = Query(None, description="Limit to one project"),
+    dry_run: bool = Query(False, description="Report counts without changing anything"),
+    auth: AuthContext = Depends(require_super_admin),
+):
     """Run data retention policies (super_admin only)."""
+    from app.core.executors import run_in_pool
     from app.services.data_retention import enforce_all_retention_policies
 
-    result = enforce_all_retention_policies()
+    result = await run_in_pool(
+        "background", enforce_all_retention_policies, project_id=project_id, dry_run=dry_run,
+    )
     return result
 
 
@@ -11,6 +11,7 @@ from uuid import UUID
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 
+from app.core.executors import run_in_pool
 from app.core.logging import get_logger
 from app.core.schemas_discovery import DiscoveryReadinessReport, DiscoveryRequest
 from app.db.jobs import create_job, get_job, start_job
@@ -38,7 +39,7 @@ class DiscoverResponse(BaseModel):
 # =============================================================================
 
 
-def _run_discovery_background(
+async def _run_discovery_background(
     project_id: UUID,
     run_id: UUID,
     job_id: UUID,
@@ -47,13 +48,13 @@ def _run_discovery_background(
     industry: str | None,
     focus_areas: list[str],
 ) -> None:
-    """Run the discovery pipeline in background."""
+    """Run the discovery pipeline in background, on the server's event loop."""
     try:
-        start_job(job_id)
+        await run_in_pool("background", start_job, job_id)
 
         from app.graphs.discovery_pipeline_graph import run_discovery_pipeline
 
-        result = run_discovery_pipeline(
+        result = await run_discovery_pipeline(
             project_id=project_id,
             run_id=run_id,
             job_id=job_id,
@@ -76,7 +77,7 @@ def _run_discovery_background(
         logger.error(f"Discovery pipeline failed: {e}", exc_info=True)
         try:
             from app.db.jobs import fail_job
-            fail_job(job_id, str(e))
+            await run_in_pool("background", fail_job, job_id, str(e))
         except Exception:
             pass
 
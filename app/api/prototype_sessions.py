@@ -1854,6 +1854,7 @@ def _update_links_from_feedback(
     - New idea ("idea", "suggestion"): create signal from content for extraction
     """
     from app.db.entity_dependencies import get_dependencies
+    from app.db.entity_graph import invalidate_project_graph
     from app.db.supabase_client import get_supabase
 
     sb = get_supabase()
@@ -1890,6 +1891,7 @@ def _update_links_from_feedback(
                 }).eq("id", dep["id"]).execute()
             except Exception:
                 pass
+        invalidate_project_graph(project_id)
         logger.info(f"Boosted {len(deps)} link confidences for feature {feature_id}")
 
     elif is_confusion and deps:
@@ -1903,6 +1905,7 @@ def _update_links_from_feedback(
                 }).eq("id", dep["id"]).execute()
             except Exception:
                 pass
+        invalidate_project_graph(project_id)
         logger.info(f"Reduced {len(deps)} link confidences for feature {feature_id} (confusion)")
 
     elif is_new_idea and content:
@@ -7,12 +7,32 @@ from fastapi import APIRouter, HTTPException, Path, Query
 from pydantic import BaseModel
 
 from app.core.logging import get_logger
-from app.db.revisions_enrichment import list_entity_revisions
+from app.db.revisions_enrichment import get_entity_revision, list_entity_revisions
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+VALID_ENTITY_TYPES = [
+    "vp_step",
+    "feature",
+    "persona",
+    # Strategic Foundation entities
+    "business_driver",
+    "competitor_reference",
+    "stakeholder",
+    "risk",
+    "strategic_context",
+]
+
+
+def _validate_entity_type(entity_type: str) -> None:
+    if entity_type not in VALID_ENTITY_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid entity type: {entity_type}. Must be one of {VALID_ENTITY_TYPES}",
+        )
+
 
 class RevisionOut(BaseModel):
     """Revision output schema."""
@@ -24,7 +44,7 @@ class RevisionOut(BaseModel):
     entity_label: str
     revision_type: str
     trigger_event: str | None
-    snapshot: dict[str, Any]
+    snapshot: dict[str, Any] | None = None  # only loaded on request
     new_signals_count: int
     new_facts_count: int
     context_summary: str | None
@@ -50,6 +70,7 @@ async def list_entity_revisions_api(
     entity_type: str = Path(..., description="Entity type (vp_step, feature, persona)"),
     entity_id: UUID = Path(..., description="Entity UUID"),
     limit: int = Query(50, description="Maximum number of revisions to return", ge=1, le=100),
+    include_snapshots: bool = Query(False, description="Include each revision's full snapshot"),
 ) -> ListRevisionsResponse:
     """
     List enrichment revisions for a specific entity.
@@ -58,6 +79,7 @@ async def list_entity_revisions_api(
         entity_type: Type of entity (vp_step, feature, persona)
         entity_id: Entity UUID
         limit: Maximum results to return (default 50, max 100)
+        include_snapshots: Rebuild full snapshots (default: listing fields only)
 
     Returns:
         ListRevisionsResponse with revision records
@@ -66,23 +88,7 @@ async def list_entity_revisions_api(
         HTTPException 400: If invalid entity type
         HTTPException 500: If database operation fails
     """
-    # Validate entity type
-    valid_types = [
-        "vp_step",
-        "feature",
-        "persona",
-        # Strategic Foundation entities
-        "business_driver",
-        "competitor_reference",
-        "stakeholder",
-        "risk",
-        "strategic_context",
-    ]
-    if entity_type not in valid_types:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid entity type: {entity_type}. Must be one of {valid_types}",
-        )
+    _validate_entity_type(entity_type)
 
     try:
         logger.info(
@@ -94,6 +100,7 @@ async def list_entity_revisions_api(
             entity_type=entity_type,
             entity_id=entity_id,
             limit=limit,
+            include_snapshots=include_snapshots,
         )
 
         # Convert to Pydantic models
@@ -108,3 +115,34 @@ async def list_entity_revisions_api(
         error_msg = f"Failed to list revisions: {str(e)}"
         logger.error(error_msg, extra={"entity_type": entity_type, "entity_id": str(entity_id)})
         raise HTTPException(status_code=500, detail=error_msg) from e
+
+
+@router.get(
+    "/state/{entity_type}/{entity_id}/revisions/{revision_number}",
+    response_model=RevisionOut,
+)
+async def get_entity_revision_api(
+    entity_type: str = Path(..., description="Entity type (vp_step, feature, persona)"),
+    entity_id: UUID = Path(..., description="Entity UUID"),
+    revision_number: int = Path(..., description="Revision number", ge=1),
+) -> RevisionOut:
+    """
+    Get one revision of an entity, including its full snapshot.
+
+    Raises:
+        HTTPException 400: If invalid entity type
+        HTTPException 404: If the revision does not exist
+        HTTPException 500: If database operation fails
+    """
+    _validate_entity_type(entity_type)
+
+    try:
+        revision = get_entity_revision(entity_type, entity_id, revision_number)
+    except Exception as e:
+        error_msg = f"Failed to get revision: {str(e)}"
+        logger.error(error_msg, extra={"entity_type": entity_type, "entity_id": str(entity_id)})
+        raise HTTPException(status_code=500, detail=error_msg) from e
+
+    if not revision:
+        raise HTTPException(status_code=404, detail="Revision not found")
+    return RevisionOut(**revision)
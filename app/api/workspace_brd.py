@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from app.api.workspace_helpers import _parse_evidence
 from app.core.brd_completeness import compute_brd_completeness
+from app.core.executors import run_in_pool
 from app.core.schemas_brd import (
     BRDWorkspaceData,
     BusinessContextSection,
@@ -201,21 +202,21 @@ async def get_brd_workspace_data(
             comp_result, pending_result, workflow_pairs_raw,
             solution_flow_raw, provenance_entity_ids_raw, gap_clusters_raw,
         ) = await asyncio.gather(
-            asyncio.to_thread(_q_project),
-            asyncio.to_thread(_q_company_info),
-            asyncio.to_thread(_q_drivers),
-            asyncio.to_thread(_q_personas),
-            asyncio.to_thread(_q_vp_steps),
-            asyncio.to_thread(_q_features),
-            asyncio.to_thread(_q_constraints),
-            asyncio.to_thread(_q_data_entities),
-            asyncio.to_thread(_q_stakeholders),
-            asyncio.to_thread(_q_competitors),
-            asyncio.to_thread(_q_pending),
-            asyncio.to_thread(_q_workflow_pairs),
-            asyncio.to_thread(_q_solution_flow),
-            asyncio.to_thread(_q_provenance_entity_ids),
-            asyncio.to_thread(_q_gap_clusters),
+            run_in_pool("interactive", _q_project),
+            run_in_pool("interactive", _q_company_info),
+            run_in_pool("interactive", _q_drivers),
+            run_in_pool("interactive", _q_personas),
+            run_in_pool("interactive", _q_vp_steps),
+            run_in_pool("interactive", _q_features),
+            run_in_pool("interactive", _q_constraints),
+            run_in_pool("interactive", _q_data_entities),
+            run_in_pool("interactive", _q_stakeholders),
+            run_in_pool("interactive", _q_competitors),
+            run_in_pool("interactive", _q_pending),
+            run_in_pool("interactive", _q_workflow_pairs),
+            run_in_pool("interactive", _q_solution_flow),
+            run_in_pool("interactive", _q_provenance_entity_ids),
+            run_in_pool("interactive", _q_gap_clusters),
         )
 
         # Validate project exists
@@ -231,7 +232,8 @@ async def get_brd_workspace_data(
         de_link_counts: dict[str, int] = {}
         if de_rows:
             de_ids = [d["id"] for d in de_rows]
-            de_links_result = await asyncio.to_thread(
+            de_links_result = await run_in_pool(
+                "interactive",
                 lambda: client.table("data_entity_workflow_steps").select(
                     "data_entity_id"
                 ).in_("data_entity_id", de_ids).execute()
@@ -858,12 +860,12 @@ async def get_brd_health(project_id: UUID) -> BRDHealthResponse:
             wf_complexity_alerts,
             persona_overload_alerts,
         ) = await asyncio.gather(
-            asyncio.to_thread(get_stale_entities, project_id),
-            asyncio.to_thread(get_dependency_graph, project_id),
-            asyncio.to_thread(get_change_queue_stats, project_id),
-            asyncio.to_thread(_q_features_priority),
-            asyncio.to_thread(_q_workflow_complexity),
-            asyncio.to_thread(_q_persona_overload),
+            run_in_pool("interactive", get_stale_entities, project_id),
+            run_in_pool("interactive", get_dependency_graph, project_id),
+            run_in_pool("interactive", get_change_queue_stats, project_id),
+            run_in_pool("interactive", _q_features_priority),
+            run_in_pool("interactive", _q_workflow_complexity),
+            run_in_pool("interactive", _q_persona_overload),
         )
 
         dependency_count = graph.get("total_count", 0)
@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
@@ -193,6 +194,31 @@ async def get_intelligence_briefing(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/changes")
+async def get_project_changes(
+    project_id: UUID,
+    cursor: int | None = Query(None, ge=0, description="Cursor from a previous /changes response"),
+    since: datetime | None = Query(None, description="Only changes after this time"),
+    limit: int = Query(20, ge=1, le=100),
+) -> dict:
+    """Changes since a cursor (or timestamp) from the project change feed.
+
+    Pass the returned cursor on the next call to get only newer changes.
+    Changes still in flight at the previous call may come back again; dedupe
+    by id. Counts cover every change after the cursor, not just the page.
+    """
+    from app.core.executors import run_in_pool
+    from app.db.change_events import get_change_digest
+
+    try:
+        return await run_in_pool(
+            "interactive", get_change_digest, project_id, since=since, cursor=cursor, limit=limit,
+        )
+    except Exception as e:
+        logger.exception(f"Failed to get changes for project {project_id}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get("/heartbeat")
 async def get_project_heartbeat(project_id: UUID) -> dict:
     """Instant project health snapshot — no LLM, always fresh."""
@@ -2,13 +2,18 @@
 
 Claude analysis with dimension packs — extracts engagement, feature reactions,
 market signals, content nuggets, and competitive intelligence from call transcripts.
+
+Long calls are split into time windows (CALL_ANALYSIS_WINDOW_SECONDS) analyzed
+concurrently and merged deterministically. Each pack's merged result is cached
+by transcript hash, so re-analysis only calls the model for new packs.
 """
 
+import asyncio
+import hashlib
 import json
+from dataclasses import dataclass
 from typing import Any
 
-from anthropic import Anthropic
-
 from app.core.config import Settings, get_settings
 from app.core.llm_usage import log_llm_usage
 from app.core.logging import get_logger
@@ -84,6 +89,33 @@ Analyze the transcript and return a JSON object with ONLY the requested dimensio
 """
 
 
+# Dimensions with their own AnalysisResult field; the rest go to custom_dimensions
+FIELD_DIMENSIONS = {
+    "engagement_score",
+    "talk_ratio",
+    "engagement_timeline",
+    "executive_summary",
+    "feature_insights",
+    "call_signals",
+    "content_nuggets",
+    "competitive_mentions",
+}
+
+# Fields identifying the same item reported by two windows
+_LIST_IDENTITY: dict[str, tuple[str, ...]] = {
+    "feature_insights": ("feature_name", "quote"),
+    "call_signals": ("signal_type", "title"),
+    "content_nuggets": ("content",),
+    "competitive_mentions": ("competitor_name", "quote"),
+}
+
+# Numbers under these names are window-weighted means; other integers are counts
+_AVERAGED_NUMBERS = ("score", "ratio", "share", "depth", "level")
+
+# Part of every pack cache key: editing SYSTEM_PROMPT invalidates cached packs
+_PROMPT_VERSION = hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest()[:12]
+
+
 def resolve_dimensions(active_packs: str) -> list[str]:
     """Resolve pack names to a flat list of dimension names.
 
@@ -103,42 +135,204 @@ def resolve_dimensions(active_packs: str) -> list[str]:
     return dimensions
 
 
-def analyze_call_transcript(
+def resolve_packs(active_packs: str) -> list[str]:
+    """Known pack names from a comma-separated list, in order, without repeats."""
+    packs: list[str] = []
+    for pack_name in active_packs.split(","):
+        pack_name = pack_name.strip()
+        if pack_name in DIMENSION_PACKS:
+            if pack_name not in packs:
+                packs.append(pack_name)
+        elif pack_name:
+            logger.warning(f"Unknown dimension pack: {pack_name}")
+    return packs
+
+
+# ============================================================================
+# Transcript windows
+# ============================================================================
+
+
+@dataclass
+class TranscriptWindow:
+    """A run of consecutive speaker turns analyzed in one request."""
+
+    start: float
+    end: float
+    text: str
+
+    @property
+    def weight(self) -> float:
+        """Share of the call this window covers, for merging averages."""
+        return max(self.end - self.start, 1.0)
+
+
+def _format_timestamp(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+def split_transcript(
     transcript_text: str,
-    dimensions: list[str],
-    context_blocks: list[dict[str, Any]] | None = None,
-    settings: Settings | None = None,
-    model_override: str | None = None,
-    project_id: str | None = None,
-) -> AnalysisResult:
-    """
-    Analyze a call transcript using Claude.
+    segments: list[Any] | None,
+    window_seconds: int,
+) -> list[TranscriptWindow]:
+    """Split a transcript into consecutive time windows of whole speaker turns.
 
     Args:
-        transcript_text: Full transcript text
-        dimensions: List of dimension names to extract
-        context_blocks: Optional project context (features, personas, etc.)
-        settings: App settings (auto-loaded if None)
-        model_override: Override the analysis model
-        project_id: For usage logging
+        transcript_text: Full transcript (used as-is when there are no segments)
+        segments: Diarized segments (TranscriptSegment or dicts with speaker,
+            text, start, end)
+        window_seconds: Target window length
 
     Returns:
-        AnalysisResult with extracted dimensions
+        Windows in call order; each line is "[mm:ss] Speaker: text"
     """
-    if not settings:
-        settings = get_settings()
+    turns = [s if isinstance(s, dict) else s.model_dump() for s in segments or []]
+    turns = [t for t in turns if (t.get("text") or "").strip()]
+    if not turns:
+        return [TranscriptWindow(start=0.0, end=0.0, text=transcript_text)]
+
+    groups: list[list[dict]] = [[]]
+    window_start = turns[0].get("start") or 0.0
+    for turn in turns:
+        start = turn.get("start") or 0.0
+        if groups[-1] and start >= window_start + window_seconds:
+            groups.append([])
+            window_start = start
+        groups[-1].append(turn)
+
+    return [
+        TranscriptWindow(
+            start=group[0].get("start") or 0.0,
+            end=max((t.get("end") or 0.0) for t in group),
+            text="\n".join(
+                f"[{_format_timestamp(t.get('start') or 0.0)}] "
+                f"{t.get('speaker', 'Speaker')}: {t['text'].strip()}"
+                for t in group
+            ),
+        )
+        for group in groups
+    ]
 
-    if not settings.ANTHROPIC_API_KEY:
-        raise ValueError("ANTHROPIC_API_KEY not configured")
 
-    model = model_override or settings.CALL_ANALYSIS_MODEL
-    client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+# ============================================================================
+# Deterministic merge of window analyses
+# ============================================================================
 
-    # Build user message
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _item_key(dimension: str, item: Any) -> str:
+    fields = _LIST_IDENTITY.get(dimension)
+    if fields and isinstance(item, dict):
+        return json.dumps([str(item.get(f) or "").strip().lower() for f in fields])
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def _merge_values(key: str, values: list[tuple[Any, float]]) -> Any:
+    """Merge one dimension's values from several windows (in call order)."""
+    first = values[0][0]
+
+    if isinstance(first, bool):
+        return any(bool(v) for v, _ in values)
+
+    if _is_number(first):
+        numbers = [(v, w) for v, w in values if _is_number(v)]
+        if any(n in key for n in _AVERAGED_NUMBERS) or any(
+            isinstance(v, float) for v, _ in numbers
+        ):
+            total = sum(w for _, w in numbers)
+            return round(sum(v * w for v, w in numbers) / total, 3)
+        return sum(v for v, _ in numbers)
+
+    if isinstance(first, str):
+        texts = list(dict.fromkeys(v.strip() for v, _ in values if isinstance(v, str)))
+        if key.endswith("summary"):
+            return " ".join(texts)
+        # Otherwise the answer from the longest window (earliest on ties)
+        return max(
+            ((v.strip(), w) for v, w in values if isinstance(v, str)),
+            key=lambda vw: vw[1],
+        )[0]
+
+    if isinstance(first, list):
+        merged: list[Any] = []
+        seen: set[str] = set()
+        for value, _ in values:
+            for item in value if isinstance(value, list) else []:
+                item_key = _item_key(key, item)
+                if item_key not in seen:
+                    seen.add(item_key)
+                    merged.append(item)
+        if key == "engagement_timeline":
+            merged.sort(
+                key=lambda e: (e.get("timestamp_seconds") or 0) if isinstance(e, dict) else 0
+            )
+        return merged
+
+    if isinstance(first, dict):
+        dicts = [(v, w) for v, w in values if isinstance(v, dict)]
+        if key == "talk_ratio":
+            # A speaker missing from a window talked 0% of it
+            total = sum(w for _, w in dicts)
+            speakers = list(dict.fromkeys(s for v, _ in dicts for s in v))
+            return {
+                s: round(sum((v.get(s) or 0) * w for v, w in dicts) / total, 3)
+                for s in speakers
+            }
+        return merge_window_analyses([v for v, _ in dicts], [w for _, w in dicts])
+
+    return first
+
+
+def merge_window_analyses(parts: list[dict[str, Any]], weights: list[float]) -> dict[str, Any]:
+    """Merge per-window analyses into one, independent of completion order.
+
+    Scores and ratios are window-length-weighted means, counts are summed,
+    lists are concatenated in call order without repeats, summaries are
+    joined, and other text comes from the longest window.
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    merged: dict[str, Any] = {}
+    keys = list(dict.fromkeys(k for part in parts for k in part))
+    for key in keys:
+        values = [
+            (part[key], weight)
+            for part, weight in zip(parts, weights, strict=True)
+            if part.get(key) not in (None, "", [], {})
+        ]
+        if values:
+            merged[key] = _merge_values(key, values)
+    return merged
+
+
+# ============================================================================
+# Analysis
+# ============================================================================
+
+
+def _build_user_message(
+    transcript_text: str,
+    dimensions: list[str],
+    context_blocks: list[dict[str, Any]] | None,
+    window_label: str | None = None,
+) -> str:
     user_parts: list[str] = []
     user_parts.append(
         f"Analyze the following call transcript for these dimensions: {', '.join(dimensions)}"
     )
+    if window_label:
+        user_parts.append(
+            f"\nThis transcript is {window_label} of a longer call. Analyze only this part. "
+            "timestamp_seconds are seconds from the start of the call, as in the "
+            "[mm:ss] markers."
+        )
 
     if context_blocks:
         user_parts.append("\n## Project Context")
@@ -149,20 +343,36 @@ def analyze_call_transcript(
 
     user_parts.append(f"\n## Transcript\n{transcript_text}")
 
-    user_message = "\n".join(user_parts)
+    return "\n".join(user_parts)
 
-    # Determine active packs from dimensions
-    packs_used = []
-    for pack_name, pack_dims in DIMENSION_PACKS.items():
-        if any(d in dimensions for d in pack_dims):
-            packs_used.append(pack_name)
 
-    logger.info(
-        f"Analyzing call transcript: model={model}, "
-        f"dimensions={len(dimensions)}, packs={packs_used}"
-    )
+def _parse_response(response_text: str) -> dict[str, Any] | None:
+    """JSON object from the model response, or None if it isn't valid JSON."""
+    response_text = response_text.strip()
+    if response_text.startswith("```json"):
+        response_text = response_text[len("```json") :]
+    if response_text.startswith("```"):
+        response_text = response_text[len("```") :]
+    if response_text.endswith("```"):
+        response_text = response_text[: -len("```")]
 
-    response = client.messages.create(
+    try:
+        parsed = json.loads(response_text.strip())
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse call analysis response: {e}")
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+async def _analyze_window(
+    client: Any,
+    model: str,
+    settings: Settings,
+    user_message: str,
+    project_id: str | None,
+) -> tuple[dict[str, Any] | None, int, int]:
+    """One analysis request. Returns (parsed, tokens_input, tokens_output)."""
+    response = await client.messages.create(
         model=model,
         max_tokens=settings.CALL_ANALYSIS_MAX_TOKENS,
         system=SYSTEM_PROMPT,
@@ -184,20 +394,140 @@ def analyze_call_transcript(
         project_id=project_id,
     )
 
-    # Parse JSON response
-    response_text = response.content[0].text.strip()
-    if response_text.startswith("```json"):
-        response_text = response_text[len("```json") :]
-    if response_text.startswith("```"):
-        response_text = response_text[len("```") :]
-    if response_text.endswith("```"):
-        response_text = response_text[: -len("```")]
+    text = response.content[0].text if response.content else ""
+    return _parse_response(text), usage.input_tokens, usage.output_tokens
 
-    try:
-        parsed = json.loads(response_text.strip())
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse call analysis response: {e}")
-        parsed = {}
+
+def _pack_cache_key(transcript_hash: str, pack: str, model: str, window_seconds: int) -> str:
+    # Project context is left out: analyzing a call updates the features and
+    # personas it is built from, which would miss every pack on re-analysis
+    raw = f"{transcript_hash}\n{pack}\n{model}\n{_PROMPT_VERSION}\n{window_seconds}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def analyze_call_transcript(
+    transcript_text: str,
+    packs: list[str],
+    segments: list[Any] | None = None,
+    context_blocks: list[dict[str, Any]] | None = None,
+    settings: Settings | None = None,
+    model_override: str | None = None,
+    project_id: str | None = None,
+    use_cache: bool = True,
+    client: Any = None,
+) -> AnalysisResult:
+    """
+    Analyze a call transcript using Claude.
+
+    Packs already analyzed for the same transcript and model come from the
+    cache, whatever the project context was then. The remaining packs are analyzed in one
+    request per transcript window, run concurrently
+    (CALL_ANALYSIS_CONCURRENCY) and merged with merge_window_analyses.
+
+    Args:
+        transcript_text: Full transcript text
+        packs: Dimension pack names (see resolve_packs)
+        segments: Diarized segments used to split long calls into windows
+        context_blocks: Optional project context (features, personas, etc.)
+        settings: App settings (auto-loaded if None)
+        model_override: Override the analysis model
+        project_id: For usage logging and the pack cache
+        use_cache: Read and write the per-pack cache
+        client: AsyncAnthropic client (created if omitted)
+
+    Returns:
+        AnalysisResult with extracted dimensions
+    """
+    from app.db.call_intelligence import get_cached_pack_analyses, save_pack_analyses
+
+    if not settings:
+        settings = get_settings()
+
+    if not settings.ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not configured")
+
+    model = model_override or settings.CALL_ANALYSIS_MODEL
+    window_seconds = settings.CALL_ANALYSIS_WINDOW_SECONDS
+    use_cache = use_cache and bool(project_id)
+
+    transcript_hash = hashlib.sha256(transcript_text.encode()).hexdigest()
+    cache_keys = {
+        pack: _pack_cache_key(transcript_hash, pack, model, window_seconds)
+        for pack in packs
+    }
+
+    cached: dict[str, dict[str, Any]] = {}
+    if use_cache:
+        try:
+            cached = await asyncio.to_thread(
+                get_cached_pack_analyses, project_id, list(cache_keys.values())
+            )
+        except Exception as e:
+            logger.warning(f"Call analysis cache lookup failed: {e}")
+
+    pack_results = {
+        pack: cached[key]["result"] for pack, key in cache_keys.items() if key in cached
+    }
+    missing = [pack for pack in packs if pack not in pack_results]
+    tokens_input = tokens_output = 0
+
+    if missing:
+        from anthropic import AsyncAnthropic
+
+        dimensions = [d for pack in missing for d in DIMENSION_PACKS[pack]]
+        windows = split_transcript(transcript_text, segments, window_seconds)
+        client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        semaphore = asyncio.Semaphore(settings.CALL_ANALYSIS_CONCURRENCY)
+
+        logger.info(
+            f"Analyzing call transcript: model={model}, dimensions={len(dimensions)}, "
+            f"packs={missing}, cached={list(pack_results)}, windows={len(windows)}"
+        )
+
+        async def run(index: int, window: TranscriptWindow):
+            label = None
+            if len(windows) > 1:
+                label = (
+                    f"part {index + 1} of {len(windows)} "
+                    f"({_format_timestamp(window.start)}-{_format_timestamp(window.end)})"
+                )
+            message = _build_user_message(window.text, dimensions, context_blocks, label)
+            async with semaphore:
+                return await _analyze_window(client, model, settings, message, project_id)
+
+        outcomes = await asyncio.gather(*(run(i, w) for i, w in enumerate(windows)))
+
+        tokens_input = sum(o[1] for o in outcomes)
+        tokens_output = sum(o[2] for o in outcomes)
+        merged = merge_window_analyses(
+            [o[0] or {} for o in outcomes], [w.weight for w in windows]
+        )
+        for pack in missing:
+            pack_results[pack] = {d: merged[d] for d in DIMENSION_PACKS[pack] if d in merged}
+
+        # A window that returned no JSON would leave a pack incomplete
+        if use_cache and all(o[0] is not None for o in outcomes):
+            try:
+                await asyncio.to_thread(
+                    save_pack_analyses,
+                    project_id,
+                    [
+                        {
+                            "cache_key": cache_keys[pack],
+                            "transcript_hash": transcript_hash,
+                            "pack": pack,
+                            "result": pack_results[pack],
+                            "model": model,
+                        }
+                        for pack in missing
+                    ],
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache call analysis: {e}")
+
+    parsed: dict[str, Any] = {}
+    for pack in packs:
+        parsed.update(pack_results[pack])
 
     # Build result
     result = AnalysisResult(
@@ -209,25 +539,12 @@ def analyze_call_transcript(
         call_signals=[cs for cs in parsed.get("call_signals", [])],
         content_nuggets=[cn for cn in parsed.get("content_nuggets", [])],
         competitive_mentions=[cm for cm in parsed.get("competitive_mentions", [])],
-        custom_dimensions={
-            k: v
-            for k, v in parsed.items()
-            if k
-            not in {
-                "engagement_score",
-                "talk_ratio",
-                "engagement_timeline",
-                "executive_summary",
-                "feature_insights",
-                "call_signals",
-                "content_nuggets",
-                "competitive_mentions",
-            }
-        },
-        dimension_packs_used=packs_used,
-        model=response.model,
-        tokens_input=usage.input_tokens,
-        tokens_output=usage.output_tokens,
+        custom_dimensions={k: v for k, v in parsed.items() if k not in FIELD_DIMENSIONS},
+        dimension_packs_used=list(packs),
+        packs_from_cache=[pack for pack in packs if pack not in missing],
+        model=model,
+        tokens_input=tokens_input,
+        tokens_output=tokens_output,
     )
 
     logger.info(
@@ -2,6 +2,7 @@
 
 from .definitions import get_tool_definitions
 from .dispatcher import execute_tool
+from .executor import ToolExecutor
 from .filtering import (
     _MUTATING_TOOLS,
     CORE_TOOLS,
@@ -13,6 +14,7 @@ __all__ = [
     "get_tool_definitions",
     "get_tools_for_context",
     "execute_tool",
+    "ToolExecutor",
     "CORE_TOOLS",
     "PAGE_TOOLS",
     "_MUTATING_TOOLS",
@@ -86,6 +86,14 @@ def get_tool_definitions() -> list[dict[str, Any]]:
                         "description": "Include detailed breakdown (for status action)",
                         "default": False,
                     },
+                    "fuse_vector": {
+                        "type": "boolean",
+                        "description": (
+                            "Also run semantic search and merge with keyword matches "
+                            "(for knowledge; slower, better for paraphrased topics)"
+                        ),
+                        "default": False,
+                    },
                 },
                 "required": ["action"],
             },
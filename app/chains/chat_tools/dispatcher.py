@@ -60,6 +60,7 @@ async def _search_dispatch(project_id: UUID, params: dict[str, Any]) -> dict[str
         legacy_params = {
             "topic": params.get("query", ""),
             "limit": params.get("limit", 5),
+            "fuse_vector": params.get("fuse_vector", False),
         }
         return await _query_knowledge_graph(project_id, legacy_params)
 
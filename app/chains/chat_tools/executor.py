@@ -0,0 +1,118 @@
+"""Per-turn tool execution — concurrency caps, timeouts and read memoization.
+
+A chat turn can loop through several model iterations, and the model often
+repeats the same read (project status, entity lists, pending items) in each.
+ToolExecutor lives for one user turn and wraps execute_tool():
+
+- read-only tools (_MEMOIZED_TOOLS) are memoized by tool + params; identical
+  calls in flight at the same time share one execution
+- any tool in _MUTATING_TOOLS clears the memo before and after it runs
+- each tool has a concurrency cap; read-only tools also have a timeout (a
+  timeout becomes an error result the model can react to). Mutating tools
+  always run to completion: cancelling one part-way would leave a half-applied
+  write that the model, told it failed, would likely repeat
+- every call logs its latency
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+from uuid import UUID
+
+from app.core.logging import get_logger
+
+from .dispatcher import execute_tool
+from .filtering import _MUTATING_TOOLS
+
+logger = get_logger(__name__)
+
+# Tools whose results only depend on their params and project data
+_MEMOIZED_TOOLS = {"search"}
+
+# Max concurrent executions per tool within a turn. Mutating tools run one
+# at a time so their writes apply in the order the model issued them.
+_TOOL_CONCURRENCY: dict[str, int] = {
+    "search": 3,
+    "suggest_actions": 4,
+}
+_DEFAULT_CONCURRENCY = 1
+
+# Seconds before a read-only tool call is abandoned. Tools not listed here
+# (all of _MUTATING_TOOLS) are never timed out.
+_TOOL_TIMEOUTS: dict[str, float] = {
+    "search": 45,
+    "suggest_actions": 5,
+}
+
+
+def _memo_key(tool_name: str, tool_input: dict[str, Any]) -> str:
+    return f"{tool_name}:{json.dumps(tool_input or {}, sort_keys=True, default=str)}"
+
+
+class ToolExecutor:
+    """Runs the tool calls of one chat turn."""
+
+    def __init__(self, project_id: UUID):
+        self.project_id = project_id
+        self._memo: dict[str, asyncio.Task] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def run(self, tool_name: str, tool_input: dict[str, Any]) -> dict[str, Any]:
+        """Execute one tool call, reusing an earlier identical read in this turn."""
+        started = time.monotonic()
+
+        if tool_name not in _MEMOIZED_TOOLS:
+            if tool_name in _MUTATING_TOOLS:
+                self._memo.clear()
+            result = await self._execute(tool_name, tool_input)
+            if tool_name in _MUTATING_TOOLS:
+                self._memo.clear()
+            self._log(tool_name, tool_input, started, memo_hit=False)
+            return result
+
+        key = _memo_key(tool_name, tool_input)
+        task = self._memo.get(key)
+        memo_hit = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self._execute(tool_name, tool_input))
+            self._memo[key] = task
+
+        result = await asyncio.shield(task)
+        if isinstance(result, dict) and "error" in result and self._memo.get(key) is task:
+            # Don't pin failures for the rest of the turn
+            self._memo.pop(key, None)
+        self._log(tool_name, tool_input, started, memo_hit=memo_hit)
+        return result
+
+    async def _execute(self, tool_name: str, tool_input: dict[str, Any]) -> dict[str, Any]:
+        semaphore = self._semaphores.get(tool_name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_TOOL_CONCURRENCY.get(tool_name, _DEFAULT_CONCURRENCY))
+            self._semaphores[tool_name] = semaphore
+
+        timeout = None if tool_name in _MUTATING_TOOLS else _TOOL_TIMEOUTS.get(tool_name)
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    execute_tool(
+                        project_id=self.project_id,
+                        tool_name=tool_name,
+                        tool_input=tool_input,
+                    ),
+                    timeout=timeout,
+                )
+            except TimeoutError:
+                logger.warning(f"Tool {tool_name} timed out after {timeout}s")
+                return {"error": f"Tool {tool_name} timed out after {timeout:.0f}s"}
+
+    def _log(
+        self, tool_name: str, tool_input: dict[str, Any], started: float, memo_hit: bool
+    ) -> None:
+        logger.info(
+            "Tool %s action=%s took %.0fms%s",
+            tool_name,
+            (tool_input or {}).get("action"),
+            (time.monotonic() - started) * 1000,
+            " (memoized)" if memo_hit else "",
+        )
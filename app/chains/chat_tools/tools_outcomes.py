@@ -204,14 +204,12 @@ def _resolve_persona_id(project_id: UUID, persona_name: str) -> UUID | None:
     if not persona_name:
         return None
     try:
-        from app.db.supabase_client import get_supabase
-        sb = get_supabase()
-        resp = sb.table("personas").select("id, name").eq(
-            "project_id", str(project_id)
-        ).execute()
-        for p in resp.data or []:
-            if p.get("name", "").lower() == persona_name.lower():
-                return UUID(p["id"])
+        from app.core.lexical_search import resolve_entity_names
+
+        matches = resolve_entity_names(project_id, "persona", persona_name, limit=1)
+        # Near-exact only: a wrong persona is worse than none
+        if matches and matches[0]["score"] >= 0.8:
+            return UUID(str(matches[0]["id"]))
     except Exception:
         pass
     return None
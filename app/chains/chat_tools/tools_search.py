@@ -167,18 +167,15 @@ async def _query_entity_history(project_id: UUID, params: dict[str, Any]) -> dic
         entity = resp.data
         entity_id = id_or_name
     except (ValueError, Exception):
-        # Fuzzy name match
-        resp = (
-            supabase.table(table)
-            .select("*")
-            .eq("project_id", str(project_id))
-            .ilike("name", f"%{id_or_name}%")
-            .limit(1)
-            .execute()
-        )
-        if resp.data:
-            entity = resp.data[0]
-            entity_id = entity["id"]
+        # Ranked fuzzy name match (trigram index)
+        from app.core.lexical_search import resolve_entity_names
+
+        matches = resolve_entity_names(project_id, entity_type, id_or_name, limit=1)
+        if matches:
+            resp = supabase.table(table).select("*").eq("id", matches[0]["id"]).limit(1).execute()
+            if resp.data:
+                entity = resp.data[0]
+                entity_id = entity["id"]
 
     if not entity:
         return {"error": f"No {entity_type} found matching '{id_or_name}'"}
@@ -236,26 +233,28 @@ async def _query_entity_history(project_id: UUID, params: dict[str, Any]) -> dic
 
 
 async def _query_knowledge_graph(project_id: UUID, params: dict[str, Any]) -> dict[str, Any]:
-    """Search the knowledge graph for facts and beliefs about a topic."""
-    supabase = get_supabase()
+    """Search the knowledge graph for facts and beliefs about a topic.
+
+    Lexical (full-text + trigram) search over node summaries; with
+    fuse_vector, also runs vector retrieval and merges both rankings.
+    """
+    from app.core.lexical_search import fuse_rankings, search_knowledge
+
     topic = params.get("topic", "")
     limit = min(params.get("limit", 5), 20)
 
     if not topic:
         return {"error": "topic is required"}
 
-    # Search memory nodes by summary
     try:
-        nodes_resp = (
-            supabase.table("memory_nodes")
-            .select("id, node_type, summary, confidence, consultant_status, linked_entity_type, linked_entity_id, created_at")
-            .eq("project_id", str(project_id))
-            .ilike("summary", f"%{topic}%")
-            .order("confidence", desc=True)
-            .limit(limit)
-            .execute()
-        )
-        nodes = nodes_resp.data or []
+        if params.get("fuse_vector"):
+            lexical, vector = await asyncio.gather(
+                asyncio.to_thread(search_knowledge, project_id, topic, limit * 2),
+                _vector_beliefs(project_id, topic, limit * 2),
+            )
+            nodes = fuse_rankings([lexical, vector])[:limit]
+        else:
+            nodes = await asyncio.to_thread(search_knowledge, project_id, topic, limit)
     except Exception as e:
         logger.error(f"Knowledge graph search failed: {e}")
         return {"error": str(e)}
@@ -282,3 +281,24 @@ async def _query_knowledge_graph(project_id: UUID, params: dict[str, Any]) -> di
         "findings": findings,
         "total": len(findings),
     }
+
+
+async def _vector_beliefs(project_id: UUID, topic: str, limit: int) -> list[dict]:
+    """Memory nodes from vector retrieval, keyed like lexical results (id)."""
+    from app.core.retrieval import retrieve
+
+    try:
+        result = await retrieve(
+            query=topic,
+            project_id=str(project_id),
+            max_rounds=1,
+            include_entities=False,
+            skip_decomposition=True,
+            skip_reranking=True,
+            skip_evaluation=True,
+            include_graph_expansion=False,
+        )
+    except Exception as e:
+        logger.warning(f"Vector retrieval for knowledge search failed: {e}")
+        return []
+    return [{**b, "id": b.get("node_id") or b.get("id")} for b in result.beliefs[:limit]]
@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Any
 
+import httpx
+
 from app.core.config import get_settings
 from app.core.firecrawl_service import scrape_website_safe
 from app.core.pdl_service import enrich_company_safe
@@ -62,7 +64,9 @@ SCRAPED CONTENT:
 """
 
 
-async def _extract_with_haiku(scraped_content: str, cost_entries: list[dict]) -> dict[str, Any]:
+async def _extract_with_haiku(
+    scraped_content: str, cost_entries: list[dict], client: Any = None
+) -> dict[str, Any]:
     """Use Haiku to extract structured company info from scraped text."""
     from anthropic import AsyncAnthropic
 
@@ -73,7 +77,7 @@ async def _extract_with_haiku(scraped_content: str, cost_entries: list[dict]) ->
     # Truncate to fit context
     content = scraped_content[:12000]
 
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
     response = await client.messages.create(
         model="claude-haiku-4-5-20251001",
         max_tokens=2000,
@@ -106,12 +110,16 @@ async def run_company_intelligence(
     source_registry: dict[str, list[dict[str, Any]]],
     existing_company_info: dict[str, Any] | None = None,
     skip_pdl: bool = False,
+    client: Any = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     """Execute Phase 2: Company Intelligence.
 
     Args:
         existing_company_info: If provided, used to seed profile (skip PDL).
         skip_pdl: If True, skip $0.03 PDL call and use existing_company_info.
+        client: AsyncAnthropic client (created if omitted)
+        http_client: httpx client for PDL/Firecrawl (one per request if omitted)
 
     Returns:
         Tuple of (company_profile, cost_entries)
@@ -139,6 +147,7 @@ async def run_company_intelligence(
         pdl_data = await enrich_company_safe(
             name=company_name,
             website=company_website,
+            http_client=http_client,
         )
         if pdl_data:
             company_profile.update({
@@ -173,7 +182,9 @@ async def run_company_intelligence(
             if len(scrape_urls) >= 3:
                 break
 
-    scrape_tasks = [scrape_website_safe(url) for url in scrape_urls[:3]]
+    scrape_tasks = [
+        scrape_website_safe(url, http_client=http_client) for url in scrape_urls[:3]
+    ]
     scrape_results = await asyncio.gather(*scrape_tasks)
 
     scraped_content_parts = []
@@ -192,7 +203,7 @@ async def run_company_intelligence(
     # 3. Haiku extraction from scraped content
     if scraped_content_parts:
         combined = "\n\n".join(scraped_content_parts)
-        extracted = await _extract_with_haiku(combined, cost_entries)
+        extracted = await _extract_with_haiku(combined, cost_entries, client)
         if extracted:
             company_profile["tagline"] = extracted.get("tagline")
             company_profile["description"] = extracted.get("description")
@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Any
 
+import httpx
+
 from app.core.config import get_settings
 from app.core.firecrawl_service import scrape_website_safe
 from app.core.pdl_service import enrich_company_safe
@@ -101,13 +103,15 @@ async def _profile_one_competitor(
     name: str,
     source_registry: dict[str, list[dict[str, Any]]],
     cost_entries: list[dict[str, Any]],
+    client: Any = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any] | None:
     """Profile a single competitor with PDL + Firecrawl + Haiku."""
     settings = get_settings()
     profile: dict[str, Any] = {"name": name}
 
     # 1. PDL enrichment
-    pdl = await enrich_company_safe(name=name)
+    pdl = await enrich_company_safe(name=name, http_client=http_client)
     if pdl:
         profile.update({
             "website": pdl.get("website"),
@@ -139,7 +143,7 @@ async def _profile_one_competitor(
 
     scraped_parts = []
     if scrape_urls:
-        tasks = [scrape_website_safe(url) for url in scrape_urls[:2]]
+        tasks = [scrape_website_safe(url, http_client=http_client) for url in scrape_urls[:2]]
         results = await asyncio.gather(*tasks)
         for url, result in zip(scrape_urls, results):
             if result and result.get("markdown"):
@@ -157,7 +161,7 @@ async def _profile_one_competitor(
         from anthropic import AsyncAnthropic
 
         combined = "\n\n".join(scraped_parts)[:12000]
-        client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
         try:
             response = await client.messages.create(
@@ -210,12 +214,16 @@ async def run_competitor_intelligence(
     max_competitors: int = 5,
     known_competitor_names: list[str] | None = None,
     known_competitor_urls: list[str] | None = None,
+    client: Any = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """Execute Phase 3: Competitor Intelligence.
 
     Args:
         known_competitor_names: Pre-seeded competitor names from project data.
         known_competitor_urls: Pre-seeded competitor URLs for PDL skip.
+        client: AsyncAnthropic client (created if omitted)
+        http_client: httpx client for PDL/Firecrawl (one per request if omitted)
 
     Returns:
         Tuple of (competitors, cost_entries)
@@ -253,7 +261,7 @@ async def run_competitor_intelligence(
 
     # Profile competitors concurrently (but cap at max_competitors)
     tasks = [
-        _profile_one_competitor(name, source_registry, cost_entries)
+        _profile_one_competitor(name, source_registry, cost_entries, client, http_client)
         for name in candidate_names
     ]
     results = await asyncio.gather(*tasks)
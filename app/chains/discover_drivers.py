@@ -117,12 +117,14 @@ async def run_driver_synthesis(
     feature_matrix: dict[str, Any],
     gap_analysis: list[str],
     existing_drivers: list[str] | None = None,
+    client: Any = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """Execute Phase 7: Evidence-Based Business Driver Synthesis.
 
     Args:
         existing_drivers: Descriptions of already-known business drivers.
             Sonnet will dedup against these.
+        client: AsyncAnthropic client (created if omitted)
 
     Returns:
         Tuple of (business_drivers, cost_entries)
@@ -190,7 +192,7 @@ async def run_driver_synthesis(
         for i, desc in enumerate(existing_drivers[:15], 1):
             existing_drivers_section += f"{i}. {desc[:150]}\n"
 
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     try:
         response = await client.messages.create(
@@ -63,9 +63,13 @@ async def run_feature_analysis(
     company_name: str,
     company_profile: dict[str, Any],
     competitors: list[dict[str, Any]],
+    client: Any = None,
 ) -> tuple[dict[str, Any], list[dict[str, Any]], list[str], list[dict[str, Any]]]:
     """Execute Phase 6: Feature & Pricing Analysis.
 
+    Args:
+        client: AsyncAnthropic client (created if omitted)
+
     Returns:
         Tuple of (feature_matrix, pricing_comparison, gap_analysis, cost_entries)
     """
@@ -100,7 +104,7 @@ async def run_feature_analysis(
         f"Tiers: {', '.join(company_profile.get('pricing_tiers') or [])}\n"
     )
 
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     try:
         response = await client.messages.create(
@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Any
 
+import httpx
+
 from app.core.config import get_settings
 from app.core.firecrawl_service import scrape_website_safe
 
@@ -38,9 +40,15 @@ SCRAPED CONTENT:
 async def run_market_evidence(
     source_registry: dict[str, list[dict[str, Any]]],
     max_pages: int = 5,
+    client: Any = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """Execute Phase 4: Market Evidence.
 
+    Args:
+        client: AsyncAnthropic client (created if omitted)
+        http_client: httpx client for Firecrawl (one per request if omitted)
+
     Returns:
         Tuple of (market_data_points, cost_entries)
     """
@@ -53,7 +61,7 @@ async def run_market_evidence(
 
     # Scrape industry report pages (max 5)
     urls_to_scrape = [src["url"] for src in industry_urls[:max_pages]]
-    scrape_tasks = [scrape_website_safe(url) for url in urls_to_scrape]
+    scrape_tasks = [scrape_website_safe(url, http_client=http_client) for url in urls_to_scrape]
     scrape_results = await asyncio.gather(*scrape_tasks)
 
     scraped_parts: list[str] = []
@@ -79,7 +87,7 @@ async def run_market_evidence(
     from anthropic import AsyncAnthropic
 
     combined = "\n\n".join(scraped_parts)[:12000]
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     try:
         response = await client.messages.create(
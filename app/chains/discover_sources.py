@@ -8,6 +8,8 @@ import asyncio
 import logging
 from typing import Any
 
+import httpx
+
 from app.core.serpapi_service import search_google_safe
 
 logger = logging.getLogger(__name__)
@@ -102,9 +104,13 @@ async def run_source_mapping(
     known_competitors: list[str] | None = None,
     known_pain_keywords: list[str] | None = None,
     company_website: str | None = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[dict[str, list[dict[str, Any]]], list[dict[str, Any]]]:
     """Execute Phase 1: Source Mapping.
 
+    Args:
+        http_client: httpx client for SerpAPI (one per request if omitted)
+
     Returns:
         Tuple of (source_registry, cost_entries)
         source_registry: dict keyed by category -> list of source dicts
@@ -122,7 +128,7 @@ async def run_source_mapping(
 
     # Run all searches concurrently
     async def search_one(q: dict[str, str]) -> list[dict[str, Any]]:
-        results = await search_google_safe(q["query"], num_results=10)
+        results = await search_google_safe(q["query"], num_results=10, http_client=http_client)
         cost_entries.append({
             "phase": "source_mapping",
             "service": "serpapi",
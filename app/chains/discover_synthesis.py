@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
+from app.core.executors import run_in_pool
 from app.core.logging import get_logger
 from app.core.relatability import compute_relatability_score
 
@@ -153,9 +154,52 @@ async def run_synthesis(
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     """Execute Phase 8: Persist & Extract.
 
+    Every step (signal ingest and chunk embedding, driver/competitor writes,
+    memory) is a blocking call, so the whole phase runs on the background
+    pool rather than the event loop.
+
     Returns:
         Tuple of (result_summary, cost_entries)
     """
+    return await run_in_pool(
+        "background",
+        _run_synthesis_sync,
+        project_id=project_id,
+        run_id=run_id,
+        company_name=company_name,
+        company_profile=company_profile,
+        competitors=competitors,
+        market_evidence=market_evidence,
+        user_voice=user_voice,
+        feature_matrix=feature_matrix,
+        gap_analysis=gap_analysis,
+        business_drivers=business_drivers,
+        total_cost_usd=total_cost_usd,
+        persona_ids=persona_ids,
+        feature_ids=feature_ids,
+        workflow_ids=workflow_ids,
+        project_vision=project_vision,
+    )
+
+
+def _run_synthesis_sync(
+    project_id: UUID,
+    run_id: UUID,
+    company_name: str,
+    company_profile: dict[str, Any],
+    competitors: list[dict[str, Any]],
+    market_evidence: list[dict[str, Any]],
+    user_voice: list[dict[str, Any]],
+    feature_matrix: dict[str, Any],
+    gap_analysis: list[str],
+    business_drivers: list[dict[str, Any]],
+    total_cost_usd: float,
+    # Entity context for linking
+    persona_ids: dict[str, str],
+    feature_ids: dict[str, str],
+    workflow_ids: dict[str, str],
+    project_vision: str | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     cost_entries: list[dict[str, Any]] = []
     entities_stored: dict[str, int] = {}
 
@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Any
 
+import httpx
+
 from app.core.brightdata_service import scrape_url_safe
 from app.core.config import get_settings
 from app.core.firecrawl_service import scrape_website_safe
@@ -40,10 +42,11 @@ SCRAPED CONTENT:
 async def _scrape_with_fallback(
     url: str,
     cost_entries: list[dict[str, Any]],
+    http_client: httpx.AsyncClient | None = None,
 ) -> str | None:
     """Try Bright Data first, then Firecrawl, return markdown content."""
     # Try Bright Data for anti-bot sites
-    bd_result = await scrape_url_safe(url)
+    bd_result = await scrape_url_safe(url, http_client=http_client)
     if bd_result and bd_result.get("html"):
         cost_entries.append({
             "phase": "user_voice",
@@ -60,7 +63,7 @@ async def _scrape_with_fallback(
         return text[:4000] if text else None
 
     # Fallback: Firecrawl
-    fc_result = await scrape_website_safe(url)
+    fc_result = await scrape_website_safe(url, http_client=http_client)
     if fc_result and fc_result.get("markdown"):
         cost_entries.append({
             "phase": "user_voice",
@@ -75,9 +78,15 @@ async def _scrape_with_fallback(
 
 async def run_user_voice(
     source_registry: dict[str, list[dict[str, Any]]],
+    client: Any = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """Execute Phase 5: User Voice.
 
+    Args:
+        client: AsyncAnthropic client (created if omitted)
+        http_client: httpx client for Bright Data/Firecrawl (one per request if omitted)
+
     Returns:
         Tuple of (user_voice_items, cost_entries)
     """
@@ -99,7 +108,7 @@ async def run_user_voice(
     # Scrape all URLs concurrently
     async def scrape_one(url_type: tuple[str, str]) -> tuple[str, str | None]:
         url, stype = url_type
-        content = await _scrape_with_fallback(url, cost_entries)
+        content = await _scrape_with_fallback(url, cost_entries, http_client)
         if content:
             return f"--- Source: {url} (type: {stype}) ---\n{content}", url
         return "", ""
@@ -121,7 +130,7 @@ async def run_user_voice(
     from anthropic import AsyncAnthropic
 
     combined = "\n\n".join(scraped_parts)[:12000]
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     try:
         response = await client.messages.create(
@@ -827,35 +827,15 @@ def _persist_steps(
     confirmed_steps: list[dict],
     generation_version: int,
 ) -> list[dict]:
-    """Persist generated steps alongside preserved confirmed steps.
+    """Persist generated steps alongside preserved confirmed steps, in one transaction.
 
     1. Delete only ai_generated and needs_review steps
     2. Keep confirmed steps, update preserved_from_version
     3. Insert new steps with correct step_index around confirmed ones
     4. Embed all new steps
     """
-    from app.db.entity_embeddings import embed_entity
-    from app.db.solution_flow import create_flow_step, update_flow_step
-    from app.db.supabase_client import get_supabase
-
-    supabase = get_supabase()
-
-    # Delete only ai_generated + needs_review steps
-    supabase.table("solution_flow_steps").delete().eq(
-        "flow_id", str(flow_id)
-    ).in_(
-        "confirmation_status", ["ai_generated", "needs_review"]
-    ).execute()
-
-    # Mark confirmed steps as preserved
-    for step in confirmed_steps:
-        try:
-            update_flow_step(UUID(step["id"]), {
-                "preserved_from_version": generation_version - 1,
-                "generation_version": generation_version,
-            })
-        except Exception as e:
-            logger.warning(f"Failed to mark preserved step {step['id']}: {e}")
+    from app.db.entity_embeddings import embed_entities_batch
+    from app.db.solution_flow import persist_flow_steps
 
     # Build combined list: confirmed at their positions + new steps ordered as generated
     all_entries: list[tuple[int, dict, bool]] = []  # (sort_key, step, is_new)
@@ -876,8 +856,8 @@ def _persist_steps(
     import re
     _UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I)
 
-    # Reindex and persist
-    saved_steps: list[dict] = []
+    # Final order: kept steps by id, new steps as full rows
+    ordered: list[dict] = []
     for i, (_, step, is_new) in enumerate(all_entries):
         if is_new:
             step["step_index"] = i
@@ -889,22 +869,25 @@ def _persist_steps(
             for id_field in ("linked_workflow_ids", "linked_feature_ids", "linked_data_entity_ids"):
                 if id_field in step and isinstance(step[id_field], list):
                     step[id_field] = [v for v in step[id_field] if isinstance(v, str) and _UUID_RE.match(v)]
-            try:
-                saved = create_flow_step(flow_id, project_id, step)
-                saved_steps.append(saved)
-
-                try:
-                    embed_entity("solution_flow_step", UUID(saved["id"]), saved)
-                except Exception:
-                    pass
-            except Exception as e:
-                logger.error(f"Failed to save step {i} '{step.get('title')}': {e}")
+            if not step.get("title") or not step.get("goal"):
+                logger.error(f"Skipping step {i} without title/goal: {step.get('title')!r}")
+                continue
+            ordered.append(step)
         else:
-            try:
-                update_flow_step(UUID(step["id"]), {"step_index": i})
-                saved_steps.append(step)
-            except Exception as e:
-                logger.warning(f"Failed to reindex confirmed step {step['id']}: {e}")
+            ordered.append({"id": step["id"]})
+
+    # One transaction: delete superseded steps, mark confirmed steps
+    # preserved, insert new steps and reindex everything
+    saved_steps = persist_flow_steps(flow_id, ordered, generation_version)
+
+    confirmed_ids = {str(s["id"]) for s in confirmed_steps}
+    try:
+        embed_entities_batch(
+            "solution_flow_step",
+            [s for s in saved_steps if str(s["id"]) not in confirmed_ids],
+        )
+    except Exception as e:
+        logger.warning(f"Failed to embed new steps: {e}")
 
     return saved_steps
 
@@ -920,18 +903,14 @@ def _build_narratives_for_steps(
 ) -> None:
     """Build background narratives for newly generated steps. Fire-and-forget."""
     try:
-        from app.core.solution_flow_narrative import build_step_narrative
-        from app.db.solution_flow import update_flow_step
-
-        for step in saved_steps:
-            if step.get("confirmation_status") in ("confirmed_consultant", "confirmed_client"):
-                continue
-            try:
-                narrative = build_step_narrative(step, project_id)
-                if narrative:
-                    update_flow_step(UUID(step["id"]), {"background_narrative": narrative})
-            except Exception as e:
-                logger.debug(f"Narrative build failed for step {step.get('id')}: {e}")
+        from app.core.solution_flow_narrative import build_step_narratives
+        from app.db.solution_flow import update_step_narratives
+
+        generated = [
+            step for step in saved_steps
+            if step.get("confirmation_status") not in ("confirmed_consultant", "confirmed_client")
+        ]
+        update_step_narratives(build_step_narratives(generated, project_id))
     except Exception as e:
         logger.warning(f"Narrative building failed: {e}")
 
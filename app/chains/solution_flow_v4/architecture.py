@@ -27,6 +27,8 @@ import time
 from typing import Any
 from uuid import UUID
 
+from app.core.prompt_cache import PromptSegment, Stability, assemble_system
+
 logger = logging.getLogger(__name__)
 
 _MODEL = "claude-sonnet-4-6"
@@ -227,18 +229,7 @@ async def plan_architecture(
     target_min = max(6, future_wf_count * 2)
     target_max = min(16, target_min + 4)
 
-    system_blocks = [
-        {
-            "type": "text",
-            "text": ARCHITECTURE_SYSTEM_PROMPT,
-            "cache_control": {"type": "ephemeral"},
-        },
-        {
-            "type": "text",
-            "text": f"<project_context>\n{brd_text[:20000]}\n</project_context>",
-            "cache_control": {"type": "ephemeral"},
-        },
-    ]
+    system_blocks = _system_blocks(brd_text)
 
     # Build user prompt with insights
     insights_section = _format_insights_for_architecture(insights)
@@ -461,23 +452,29 @@ def _format_confirmed_constraints(confirmed_steps: list[dict]) -> str:
     return "\n".join(parts)
 
 
-def _log_usage(project_id: UUID, action: str, model: str, response: Any, elapsed_ms: int) -> None:
-    """Log LLM usage."""
-    from app.db.supabase_client import get_supabase
+def _system_blocks(brd_text: str) -> list[dict[str, Any]]:
+    """Instructions (shared by every project), then this project's BRD."""
+    return assemble_system(
+        [
+            PromptSegment(ARCHITECTURE_SYSTEM_PROMPT),
+            PromptSegment(
+                f"<project_context>\n{brd_text[:20000]}\n</project_context>", Stability.PROJECT
+            ),
+        ],
+        name="solution_flow_architecture",
+    )
 
-    try:
-        get_supabase().table("usage_events").insert(
-            {
-                "project_id": str(project_id),
-                "action": action,
-                "model": model,
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-                "cache_read_tokens": getattr(response.usage, "cache_read_input_tokens", 0) or 0,
-                "cache_create_tokens": getattr(response.usage, "cache_creation_input_tokens", 0)
-                or 0,
-                "latency_ms": elapsed_ms,
-            }
-        ).execute()
-    except Exception:
-        pass
+
+def _log_usage(project_id: UUID, action: str, model: str, response: Any, elapsed_ms: int) -> None:
+    """Log LLM usage, including prompt cache reads and writes."""
+    from app.core.llm_usage import anthropic_usage_tokens, log_llm_usage
+
+    log_llm_usage(
+        workflow="solution_flow_v4",
+        chain=action,
+        model=model,
+        provider="anthropic",
+        duration_ms=elapsed_ms,
+        project_id=project_id,
+        **anthropic_usage_tokens(response.usage),
+    )
@@ -12,11 +12,17 @@ Benefits over v3's single-call approach:
 
 System prompt is cached across all parallel calls.
 ~$0.006/step, ~$0.06 total.
+
+Step details are also cached across regenerations, keyed by a hash of the
+model, prompt, skeleton and assembled step context (solution_flow_step_
+detail_cache). After a small edit only the changed or new steps are built.
 """
 
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import time
@@ -24,6 +30,8 @@ from typing import Any
 from uuid import UUID
 
 from app.chains.solution_flow_v4.intelligence import FlowIntelligenceContext
+from app.core.llm_usage import anthropic_usage_tokens
+from app.core.prompt_cache import PromptSegment, assemble_system, warm_prompt_cache
 
 logger = logging.getLogger(__name__)
 
@@ -180,15 +188,23 @@ Fill in the details for this single step:
 """
 
 
+_PROMPT_FINGERPRINT = hashlib.sha256(
+    (BUILDER_SYSTEM_PROMPT + json.dumps(STEP_DETAIL_TOOL, sort_keys=True)).encode()
+).hexdigest()[:16]
+
+
 async def build_step_details(
     skeletons: list[dict[str, Any]],
     ctx: FlowIntelligenceContext,
     insights: dict[str, Any],
     project_id: UUID,
+    use_cache: bool = True,
 ) -> list[dict[str, Any]]:
     """Phase 3: Parallel Haiku calls, one per step skeleton.
 
     Each step gets focused context: its skeleton + only linked entities.
+    Steps whose skeleton and context are unchanged since a previous run
+    reuse that run's details instead of calling the model (use_cache).
 
     Returns list of step detail dicts in same order as skeletons.
     """
@@ -208,18 +224,13 @@ async def build_step_details(
     confidence_map = insights.get("confidence_map", {})
 
     # Shared system prompt (cached across all parallel calls)
-    system_blocks = [
-        {
-            "type": "text",
-            "text": BUILDER_SYSTEM_PROMPT,
-            "cache_control": {"type": "ephemeral"},
-        },
-    ]
+    system_blocks = assemble_system(
+        [PromptSegment(BUILDER_SYSTEM_PROMPT)], name="solution_flow_builders"
+    )
 
-    async def _build_one(idx: int, skeleton: dict) -> dict[str, Any]:
-        """Build details for one step."""
-        # Assemble focused context for this step
-        step_context = _assemble_step_context(
+    # Assemble focused context for each step
+    step_contexts = [
+        _assemble_step_context(
             skeleton,
             idx,
             skeletons,
@@ -231,6 +242,32 @@ async def build_step_details(
             ctx,
             confidence_map,
         )
+        for idx, skeleton in enumerate(skeletons)
+    ]
+
+    # Reuse details for steps whose builder input hasn't changed
+    cache_keys = [
+        _step_cache_key(skeleton, step_context)
+        for skeleton, step_context in zip(skeletons, step_contexts, strict=True)
+    ]
+    cached: dict[str, dict] = {}
+    if use_cache:
+        from app.db.solution_flow import get_cached_step_details
+
+        cached = await asyncio.to_thread(
+            get_cached_step_details, project_id, sorted(set(cache_keys))
+        )
+    fresh: dict[str, dict] = {}
+    usage_totals = dict.fromkeys(
+        ("tokens_input", "tokens_output", "tokens_cache_read", "tokens_cache_create"), 0
+    )
+
+    async def _build_one(idx: int, skeleton: dict) -> dict[str, Any]:
+        """Build details for one step."""
+        step_context = step_contexts[idx]
+        cache_key = cache_keys[idx]
+        if cache_key in cached:
+            return _merge_detail(skeleton, cached[cache_key])
 
         user_prompt = f"""Build detailed content for this solution flow step.
 
@@ -263,23 +300,13 @@ Generate the detailed information_fields, mock_data_narrative, implied_pattern,
                 tools=[STEP_DETAIL_TOOL],
                 tool_choice={"type": "tool", "name": "submit_step_detail"},
             )
+            for key, value in anthropic_usage_tokens(getattr(response, "usage", None)).items():
+                usage_totals[key] += value
 
             for block in response.content:
                 if block.type == "tool_use" and block.name == "submit_step_detail":
-                    detail = block.input
-
-                    # Merge skeleton with detail
-                    merged = {**skeleton, **detail}
-                    # Rename goal_sentence → goal
-                    if "goal_sentence" in merged and "goal" not in merged:
-                        merged["goal"] = merged.pop("goal_sentence")
-
-                    # Post-process: clean implied_pattern to keyword
-                    merged = _clean_implied_pattern(merged)
-                    # Post-process: ensure ai_config exists
-                    merged = _ensure_ai_config(merged)
-
-                    return merged
+                    fresh[cache_key] = block.input
+                    return _merge_detail(skeleton, block.input)
 
             logger.warning(f"No tool_use for step {idx} '{skeleton.get('title')}'")
             return _skeleton_to_fallback(skeleton)
@@ -288,8 +315,13 @@ Generate the detailed information_fields, mock_data_narrative, implied_pattern,
             logger.warning(f"Builder failed for step {idx} '{skeleton.get('title')}': {e}")
             return _skeleton_to_fallback(skeleton)
 
-    # Run all builders in parallel
+    # Run all builders in parallel, writing the shared prefix to the cache first
     t0 = time.monotonic()
+    if sum(1 for key in cache_keys if key not in cached) > 1:
+        await warm_prompt_cache(
+            client, _MODEL, system_blocks, [STEP_DETAIL_TOOL],
+            workflow="solution_flow_v4", project_id=project_id,
+        )
     results = await asyncio.gather(
         *[_build_one(i, skel) for i, skel in enumerate(skeletons)],
         return_exceptions=True,
@@ -305,13 +337,28 @@ Generate the detailed information_fields, mock_data_narrative, implied_pattern,
         else:
             details.append(result)
 
+    cache_hits = sum(1 for key in cache_keys if key in cached)
     logger.info(
         f"Phase 3 builders: {len(details)} steps built in {elapsed:.1f}s "
-        f"({len([d for d in details if d.get('information_fields')])} with full detail)"
+        f"({len([d for d in details if d.get('information_fields')])} with full detail, "
+        f"{cache_hits} from cache)"
     )
 
+    if use_cache:
+        from app.db.solution_flow import save_cached_step_details
+
+        await asyncio.to_thread(
+            save_cached_step_details,
+            project_id,
+            fresh,
+            [key for key in cached if key in cache_keys],
+        )
+
     try:
-        _log_usage_batch(project_id, "solution_flow_builders", _MODEL, len(skeletons), elapsed)
+        _log_usage_batch(
+            project_id, "solution_flow_builders", _MODEL, len(skeletons), elapsed,
+            cache_hits=cache_hits, usage=usage_totals,
+        )
     except Exception:
         pass
 
@@ -415,6 +462,41 @@ def _assemble_step_context(
     return "\n".join(parts) if parts else "No specific context for this step."
 
 
+def _step_cache_key(skeleton: dict, step_context: str) -> str:
+    """Hash of everything the builder call sees for one step.
+
+    The assembled context already carries the linked entities' content and
+    neighbouring steps' data inputs/outputs, so any change there (or to the
+    skeleton, model, prompt or tool schema) yields a new key.
+    """
+    payload = json.dumps(
+        {
+            "model": _MODEL,
+            "prompt": _PROMPT_FINGERPRINT,
+            "skeleton": skeleton,
+            "context": step_context,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _merge_detail(skeleton: dict, detail: dict) -> dict[str, Any]:
+    """Merge builder output into its skeleton and post-process."""
+    merged = {**skeleton, **copy.deepcopy(detail)}
+    # Rename goal_sentence → goal
+    if "goal_sentence" in merged and "goal" not in merged:
+        merged["goal"] = merged.pop("goal_sentence")
+
+    # Post-process: clean implied_pattern to keyword
+    merged = _clean_implied_pattern(merged)
+    # Post-process: ensure ai_config exists
+    merged = _ensure_ai_config(merged)
+
+    return merged
+
+
 _VALID_PATTERNS = {
     "dashboard", "table", "wizard", "card", "form", "timeline",
     "kanban", "map", "comparison", "report", "chat", "calendar",
@@ -502,21 +584,37 @@ def _skeleton_to_fallback(skeleton: dict) -> dict[str, Any]:
     }
 
 
-def _log_usage_batch(project_id: UUID, action: str, model: str, count: int, elapsed: float) -> None:
-    """Log batch usage."""
-    from app.db.supabase_client import get_supabase
-
-    try:
-        get_supabase().table("usage_events").insert(
-            {
-                "project_id": str(project_id),
-                "action": action,
-                "model": model,
-                "input_tokens": 0,  # Batch — individual tokens not tracked
-                "output_tokens": 0,
-                "latency_ms": int(elapsed * 1000),
-                "metadata": json.dumps({"step_count": count}),
-            }
-        ).execute()
-    except Exception:
-        pass
+def _log_usage_batch(
+    project_id: UUID,
+    action: str,
+    model: str,
+    count: int,
+    elapsed: float,
+    cache_hits: int = 0,
+    usage: dict[str, int] | None = None,
+) -> None:
+    """Log the batch's summed token usage as one row.
+
+    cache_hits = steps served from the step detail cache (no model call);
+    the row's metadata carries it with the hit rate. Logged even when every
+    step came from the cache (zero tokens), so the hit rate stays complete.
+    """
+    from app.core.llm_usage import log_llm_usage
+
+    if not count:
+        return
+    usage = {"tokens_input": 0, "tokens_output": 0, **(usage or {})}
+    log_llm_usage(
+        workflow="solution_flow_v4",
+        chain=action,
+        model=model,
+        provider="anthropic",
+        duration_ms=int(elapsed * 1000),
+        project_id=project_id,
+        metadata={
+            "steps": count,
+            "cache_hits": cache_hits,
+            "cache_hit_rate": round(cache_hits / count, 3),
+        },
+        **usage,
+    )
@@ -23,6 +23,8 @@ import time
 from typing import Any
 from uuid import UUID
 
+from app.core.prompt_cache import PromptSegment, assemble_system
+
 logger = logging.getLogger(__name__)
 
 _MODEL = "claude-sonnet-4-6"
@@ -150,13 +152,9 @@ async def run_coherence_qa(
     # Compact flow representation for QA
     flow_text = _format_flow_for_qa(steps, flow_thesis, insights)
 
-    system_blocks = [
-        {
-            "type": "text",
-            "text": QA_SYSTEM_PROMPT,
-            "cache_control": {"type": "ephemeral"},
-        },
-    ]
+    system_blocks = assemble_system(
+        [PromptSegment(QA_SYSTEM_PROMPT)], name="solution_flow_qa"
+    )
 
     user_prompt = f"""Review this complete Solution Flow for coherence.
 
@@ -388,22 +386,15 @@ def _format_flow_for_qa(
 
 
 def _log_usage(project_id: UUID, action: str, model: str, response: Any, elapsed_ms: int) -> None:
-    """Log LLM usage."""
-    from app.db.supabase_client import get_supabase
-
-    try:
-        get_supabase().table("usage_events").insert(
-            {
-                "project_id": str(project_id),
-                "action": action,
-                "model": model,
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-                "cache_read_tokens": getattr(response.usage, "cache_read_input_tokens", 0) or 0,
-                "cache_create_tokens": getattr(response.usage, "cache_creation_input_tokens", 0)
-                or 0,
-                "latency_ms": elapsed_ms,
-            }
-        ).execute()
-    except Exception:
-        pass
+    """Log LLM usage, including prompt cache reads and writes."""
+    from app.core.llm_usage import anthropic_usage_tokens, log_llm_usage
+
+    log_llm_usage(
+        workflow="solution_flow_v4",
+        chain=action,
+        model=model,
+        provider="anthropic",
+        duration_ms=elapsed_ms,
+        project_id=project_id,
+        **anthropic_usage_tokens(response.usage),
+    )
@@ -1,7 +1,9 @@
 """Structured intent classification for chat messages.
 
-Three-layer: regex patterns (~0ms, ~70% coverage) + page context fallback
-+ optional Haiku LLM fallback for ambiguous messages (~200ms, ~30% coverage).
+Layers: regex patterns (~0ms, ~70% coverage) + page context fallback
++ local embedding router for ambiguous messages (<5ms once the query is
+embedded, see intent_router.py) + Haiku LLM fallback when the router is
+missing or unsure (~200ms).
 """
 
 import asyncio
@@ -134,6 +136,97 @@ Retrieval: none (acks, CRUD), light (simple questions), full (search, planning)
 Return JSON only: {{"intent": "...", "retrieval_strategy": "...", "confidence": 0.0-1.0}}"""
 
 _HAIKU_TIMEOUT_MS = 500
+_ROUTER_EMBED_TIMEOUT_MS = 1500
+
+_haiku_client = None
+
+
+def _get_haiku_client(api_key: str):
+    """Shared AsyncAnthropic client (connection pool reused across turns)."""
+    global _haiku_client
+    if _haiku_client is None or _haiku_client.api_key != api_key:
+        from anthropic import AsyncAnthropic
+
+        _haiku_client = AsyncAnthropic(api_key=api_key)
+    return _haiku_client
+
+
+def _assess_complexity(message: str, topics: list[str]) -> str:
+    word_count = len(message.split())
+    if word_count < 10:
+        return "simple"
+    if len(topics) <= 2:
+        return "moderate"
+    return "strategic"
+
+
+def _query_breadth(intent_type: str, complexity: str, retrieval_strategy: str) -> str:
+    """Strategic for broad/planning queries, focused for specific ones."""
+    if (
+        intent_type in ("plan", "collaborate", "review")
+        or complexity == "strategic"
+        or retrieval_strategy == "full"
+    ):
+        return "strategic"
+    return "focused"
+
+
+async def classify_with_router(
+    message: str,
+    page_context: str | None,
+) -> ChatIntent | None:
+    """Classify with the local embedding router. Returns None if unavailable or unsure.
+
+    The message embedding goes through the shared query cache, so retrieval
+    for the same turn reuses it instead of embedding again.
+    """
+    try:
+        from app.context.intent_router import get_intent_router
+
+        model = get_intent_router()
+        if model is None:
+            return None
+
+        from app.core.embeddings import embed_queries_async
+
+        embeddings = await asyncio.wait_for(
+            embed_queries_async([message]),
+            timeout=_ROUTER_EMBED_TIMEOUT_MS / 1000,
+        )
+        intent_type, intent_p, strategy, strategy_p = model.predict(embeddings[0])
+    except TimeoutError:
+        logger.debug("Intent router embedding timed out")
+        return None
+    except Exception as e:
+        logger.debug(f"Intent router failed: {e}")
+        return None
+
+    if min(intent_p, strategy_p) < model.min_confidence:
+        logger.debug(
+            "Intent router unsure: %s=%.2f %s=%.2f (threshold %.2f)",
+            intent_type, intent_p, strategy, strategy_p, model.min_confidence,
+        )
+        return None
+    if intent_type not in _VALID_INTENTS or strategy not in _VALID_STRATEGIES:
+        return None
+
+    # Same page override as the regex layer
+    if page_context == "brd:solution-flow" and intent_type == "discuss":
+        intent_type = "flow"
+    elif page_context == "collaborate" and intent_type == "discuss":
+        intent_type = "collaborate"
+
+    topics = _extract_topics(message)
+    complexity = _assess_complexity(message, topics)
+    return ChatIntent(
+        type=intent_type,
+        topics=topics,
+        entity_refs=len(topics),
+        complexity=complexity,
+        retrieval_strategy=strategy,
+        classifier_source="router",
+        query_breadth=_query_breadth(intent_type, complexity, strategy),
+    )
 
 
 async def classify_with_llm(
@@ -145,15 +238,13 @@ async def classify_with_llm(
     500ms hard timeout — never blocks the pipeline.
     """
     try:
-        from anthropic import AsyncAnthropic
-
         from app.core.config import get_settings
 
         settings = get_settings()
         if not settings.ANTHROPIC_API_KEY:
             return None
 
-        client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        client = _get_haiku_client(settings.ANTHROPIC_API_KEY)
         prompt = _HAIKU_CLASSIFY_PROMPT.format(
             message=message[:200],
             page=page_context or "none",
@@ -186,13 +277,7 @@ async def classify_with_llm(
             strategy = "light"
 
         topics = _extract_topics(message)
-        word_count = len(message.split())
-        if word_count < 10:
-            complexity = "simple"
-        elif len(topics) <= 2:
-            complexity = "moderate"
-        else:
-            complexity = "strategic"
+        complexity = _assess_complexity(message, topics)
 
         return ChatIntent(
             type=intent_type,
@@ -226,12 +311,13 @@ def classify_intent(
 async def classify_intent_async(
     message: str, page_context: str | None = None
 ) -> ChatIntent:
-    """Classify with regex first, fall back to Haiku for ambiguous cases.
+    """Classify with regex first, then the local router, then Haiku.
 
     Hybrid classification:
     1. Regex match → high confidence → return immediately
-    2. Regex falls to default ("discuss") → try Haiku (500ms timeout)
-    3. Haiku timeout/error → return regex result
+    2. Regex falls to default ("discuss") → local router, if confident
+    3. Router missing/unsure → try Haiku (500ms timeout)
+    4. Haiku timeout/error → return regex result
     """
     regex_result = _classify_regex(message, page_context)
 
@@ -241,7 +327,17 @@ async def classify_intent_async(
         return regex_result
 
     # Regex fell through to "discuss" default — ambiguous case.
-    # Try Haiku for better classification.
+    # Local router first (no LLM call), Haiku when it's unsure.
+    router_result = await classify_with_router(message, page_context)
+    if router_result:
+        logger.info(
+            "Intent router: %s/%s (regex was: discuss/%s)",
+            router_result.type,
+            router_result.retrieval_strategy,
+            regex_result.retrieval_strategy,
+        )
+        return router_result
+
     haiku_result = await classify_with_llm(message, page_context)
     if haiku_result:
         logger.info(
@@ -272,13 +368,7 @@ def _classify_regex(
     topics = _extract_topics(message)
 
     # Complexity assessment
-    word_count = len(message.split())
-    if word_count < 10:
-        complexity = "simple"
-    elif len(topics) <= 2:
-        complexity = "moderate"
-    else:
-        complexity = "strategic"
+    complexity = _assess_complexity(message, topics)
 
     # Retrieval strategy
     retrieval_strategy = _compute_retrieval_strategy(
@@ -286,11 +376,7 @@ def _classify_regex(
     )
 
     # Query breadth: strategic for broad/planning queries, focused for specific
-    query_breadth = "strategic" if (
-        intent_type in ("plan", "collaborate", "review")
-        or complexity == "strategic"
-        or retrieval_strategy == "full"
-    ) else "focused"
+    query_breadth = _query_breadth(intent_type, complexity, retrieval_strategy)
 
     return ChatIntent(
         type=intent_type,
@@ -0,0 +1,268 @@
+"""Local embedding-based intent router for ambiguous chat messages.
+
+Sits between the regex layer and the Haiku fallback in classify_intent_async.
+Two multinomial logistic-regression heads (intent type, retrieval strategy)
+over the message embedding, trained offline from chat_routing_log by
+scripts/train_intent_router.py. The embedding comes from the shared query
+cache, so retrieval reuses it; classification itself is a pair of small
+matrix-vector products (<5ms).
+
+Artifacts are versioned JSON files (app/context/artifacts/intent_router-<version>.json).
+The newest one is loaded at startup unless INTENT_ROUTER_MODEL_PATH pins a
+specific file. Predictions below the artifact's confidence threshold return
+None so the caller falls back to Haiku.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ARTIFACT_DIR = Path(__file__).parent / "artifacts"
+ARTIFACT_PREFIX = "intent_router-"
+DEFAULT_MIN_CONFIDENCE = 0.7
+
+
+@dataclass
+class RouterHead:
+    """One softmax classification head: logits = weights @ x + bias."""
+
+    labels: list[str]
+    weights: np.ndarray  # (n_labels, dim)
+    bias: np.ndarray  # (n_labels,)
+
+    def predict(self, x: np.ndarray) -> tuple[str, float]:
+        """Return (label, probability) for a normalized embedding."""
+        logits = self.weights @ x + self.bias
+        logits = logits - logits.max()
+        probs = np.exp(logits)
+        probs /= probs.sum()
+        i = int(probs.argmax())
+        return self.labels[i], float(probs[i])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "labels": self.labels,
+            "weights": self.weights.round(6).tolist(),
+            "bias": self.bias.round(6).tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RouterHead:
+        return cls(
+            labels=list(data["labels"]),
+            weights=np.asarray(data["weights"], dtype=np.float32),
+            bias=np.asarray(data["bias"], dtype=np.float32),
+        )
+
+
+@dataclass
+class IntentRouterModel:
+    """Trained router artifact."""
+
+    version: str
+    embedding_model: str
+    intent: RouterHead
+    strategy: RouterHead
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE
+    metrics: dict[str, Any] | None = None
+
+    def predict(self, embedding: list[float] | np.ndarray) -> tuple[str, float, str, float]:
+        """Return (intent_type, intent_prob, strategy, strategy_prob)."""
+        x = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(x))
+        if norm:
+            x = x / norm
+        intent_type, intent_p = self.intent.predict(x)
+        strategy, strategy_p = self.strategy.predict(x)
+        return intent_type, intent_p, strategy, strategy_p
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "embedding_model": self.embedding_model,
+            "min_confidence": self.min_confidence,
+            "metrics": self.metrics or {},
+            "intent": self.intent.to_dict(),
+            "strategy": self.strategy.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IntentRouterModel:
+        return cls(
+            version=data["version"],
+            embedding_model=data["embedding_model"],
+            intent=RouterHead.from_dict(data["intent"]),
+            strategy=RouterHead.from_dict(data["strategy"]),
+            min_confidence=float(data.get("min_confidence", DEFAULT_MIN_CONFIDENCE)),
+            metrics=data.get("metrics"),
+        )
+
+
+# ── Training (offline) ────────────────────────────────────────────
+
+
+def _fit_head(x: np.ndarray, labels: list[str]) -> RouterHead:
+    from sklearn.linear_model import LogisticRegression
+
+    classes = sorted(set(labels))
+    if len(classes) == 1:
+        # Degenerate head: always predicts the only label
+        return RouterHead(
+            labels=classes,
+            weights=np.zeros((1, x.shape[1]), dtype=np.float32),
+            bias=np.zeros(1, dtype=np.float32),
+        )
+    clf = LogisticRegression(max_iter=1000, C=4.0)
+    clf.fit(x, labels)
+    weights, bias = clf.coef_, clf.intercept_
+    if len(clf.classes_) == 2:
+        # Binary sklearn models emit one row — expand to a two-way softmax
+        weights = np.vstack([-weights[0] / 2, weights[0] / 2])
+        bias = np.array([-bias[0] / 2, bias[0] / 2])
+    return RouterHead(
+        labels=[str(c) for c in clf.classes_],
+        weights=weights.astype(np.float32),
+        bias=bias.astype(np.float32),
+    )
+
+
+def train_router(
+    embeddings: list[list[float]],
+    intents: list[str],
+    strategies: list[str],
+    version: str,
+    embedding_model: str,
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+) -> IntentRouterModel:
+    """Fit both heads on labelled message embeddings."""
+    x = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    x = x / np.where(norms == 0, 1, norms)
+    return IntentRouterModel(
+        version=version,
+        embedding_model=embedding_model,
+        intent=_fit_head(x, intents),
+        strategy=_fit_head(x, strategies),
+        min_confidence=min_confidence,
+    )
+
+
+# Routing-log rows usable as labels: Haiku decisions, plus regex decisions
+# that matched a real pattern. Regex "discuss" is the fall-through default
+# (Haiku unavailable) and router rows would train the model on itself.
+TRAINING_SOURCES = ("haiku", "regex")
+
+
+def routing_log_examples(rows: list[dict]) -> list[tuple[str, str, str]]:
+    """Turn chat_routing_log rows into (message, intent, strategy) examples.
+
+    Rows are expected newest first; repeated messages keep the newest label.
+    """
+    examples: dict[str, tuple[str, str, str]] = {}
+    for row in rows:
+        message = (row.get("raw_message") or "").strip()
+        intent = row.get("intent_type")
+        strategy = row.get("retrieval_strategy")
+        source = row.get("classifier_source")
+        if not message or not intent or not strategy or source not in TRAINING_SOURCES:
+            continue
+        if intent == "fast_path" or (source == "regex" and intent == "discuss"):
+            continue
+        examples.setdefault(message.lower(), (message, intent, strategy))
+    return list(examples.values())
+
+
+def evaluate_router(
+    model: IntentRouterModel,
+    embeddings: list[list[float]],
+    intents: list[str],
+    strategies: list[str],
+) -> dict[str, float]:
+    """Coverage (share above threshold) and accuracy on the covered share."""
+    covered = correct = 0
+    for emb, intent, strategy in zip(embeddings, intents, strategies, strict=True):
+        p_intent, intent_p, p_strategy, strategy_p = model.predict(emb)
+        if min(intent_p, strategy_p) < model.min_confidence:
+            continue
+        covered += 1
+        correct += int(p_intent == intent and p_strategy == strategy)
+    total = len(intents)
+    return {
+        "examples": total,
+        "coverage": round(covered / total, 4) if total else 0.0,
+        "accuracy": round(correct / covered, 4) if covered else 0.0,
+    }
+
+
+def save_router(model: IntentRouterModel, directory: Path = ARTIFACT_DIR) -> Path:
+    """Write a versioned artifact and return its path."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{ARTIFACT_PREFIX}{model.version}.json"
+    path.write_text(json.dumps(model.to_dict()))
+    return path
+
+
+# ── Runtime loading ───────────────────────────────────────────────
+
+_model: IntentRouterModel | None = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def _latest_artifact(directory: Path = ARTIFACT_DIR) -> Path | None:
+    # Versions are UTC timestamps, so lexical order is chronological
+    paths = sorted(directory.glob(f"{ARTIFACT_PREFIX}*.json"))
+    return paths[-1] if paths else None
+
+
+def load_intent_router(path: str | Path | None = None) -> IntentRouterModel | None:
+    """Load the router artifact (pinned path or newest version).
+
+    Returns None, and leaves the router disabled, when there is no artifact
+    or it was trained against a different embedding model.
+    """
+    global _model, _loaded
+
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    with _lock:
+        _model, _loaded = None, True
+        path = path or settings.INTENT_ROUTER_MODEL_PATH or _latest_artifact()
+        if not path:
+            logger.info("Intent router: no artifact, Haiku fallback only")
+            return None
+        try:
+            model = IntentRouterModel.from_dict(json.loads(Path(path).read_text()))
+        except Exception as e:
+            logger.warning(f"Intent router artifact {path} failed to load: {e}")
+            return None
+        if model.embedding_model != settings.EMBEDDING_MODEL:
+            logger.warning(
+                f"Intent router {model.version} was trained on {model.embedding_model}, "
+                f"not {settings.EMBEDDING_MODEL} — disabled"
+            )
+            return None
+        _model = model
+        logger.info(
+            f"Intent router {model.version} loaded "
+            f"({len(model.intent.labels)} intents, threshold={model.min_confidence})"
+        )
+        return model
+
+
+def get_intent_router() -> IntentRouterModel | None:
+    """Loaded router model, loading it on first use."""
+    if not _loaded:
+        return load_intent_router()
+    return _model
@@ -11,12 +11,13 @@ The Four Dimensions:
   - ConfidencePosture: How sure to be (assertive, exploratory, confirming, evolving)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from app.context.project_awareness import FlowHealth, ProjectAwareness, format_awareness_snapshot
 from app.core.logging import get_logger
+from app.core.prompt_cache import PromptSegment, Stability
 
 logger = get_logger(__name__)
 
@@ -70,6 +71,10 @@ class CompiledPrompt:
     dynamic_block: str  # Evidence + page guidance + solution flow (~500-1500t)
     retrieval_plan: dict  # How retrieval should be shaped
     active_frame: str  # For logging
+    # The same content as cache-ordered segments for assemble_system():
+    # shared instructions, then project identity + awareness, then the
+    # per-turn cognitive instructions and dynamic context
+    segments: list[PromptSegment] = field(default_factory=list)
 
 
 # ── Frame Selection ────────────────────────────────────────────────
@@ -424,10 +429,12 @@ def compile_prompt(
     cached_sections: list[str] = []
 
     # Identity (~200t)
-    cached_sections.append(BLOCK_IDENTITY.format(project_name=awareness.project_name))
+    identity = BLOCK_IDENTITY.format(project_name=awareness.project_name)
+    cached_sections.append(identity)
 
     # Cognitive instructions (~200-300t, varies by frame)
-    cached_sections.append(compile_cognitive_instructions(frame))
+    cognitive = compile_cognitive_instructions(frame)
+    cached_sections.append(cognitive)
 
     # Capabilities + action cards + patterns (~600t)
     cached_sections.append(BLOCK_CAPABILITIES)
@@ -559,12 +566,23 @@ def compile_prompt(
             f"{retrieval_context}"
         )
 
+    awareness_block = "\n\n".join(awareness_sections)
+    dynamic_block = "\n\n".join(dynamic_sections)
     return CompiledPrompt(
         cached_block="\n\n".join(cached_sections),
-        awareness_block="\n\n".join(awareness_sections),
-        dynamic_block="\n\n".join(dynamic_sections),
+        awareness_block=awareness_block,
+        dynamic_block=dynamic_block,
         retrieval_plan=compile_retrieval_plan(frame),
         active_frame=frame.label,
+        segments=[
+            PromptSegment(BLOCK_CAPABILITIES),
+            PromptSegment(BLOCK_ACTION_CARDS),
+            PromptSegment(BLOCK_CONVERSATION_PATTERNS),
+            PromptSegment(identity, Stability.PROJECT),
+            PromptSegment(awareness_block, Stability.PROJECT),
+            PromptSegment(cognitive, Stability.CALL),
+            PromptSegment(dynamic_block, Stability.CALL),
+        ],
     )
 
 
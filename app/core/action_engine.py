@@ -775,7 +775,7 @@ async def compute_actions(
             )
             from app.core.state_snapshot import get_state_snapshot
 
-            snapshot = get_state_snapshot(project_id)
+            snapshot = await asyncio.to_thread(get_state_snapshot, project_id)
             actions, narrative_cached = await generate_narratives(
                 skeletons=top_skeletons,
                 state_snapshot=snapshot,
@@ -1372,9 +1372,9 @@ def _build_entity_inventory(data: dict) -> dict[str, list[dict]]:
 # Context Frame Cache (fingerprint-based — only recompute when data changes)
 # =============================================================================
 
-# Cache entry: (timestamp, data_fingerprint, frame)
-_context_frame_cache: dict[str, tuple[float, str, object]] = {}
-_CONTEXT_FRAME_MAX_TTL = 1800  # 30 min safety net
+# Cache entry: (timestamp, project_version, data_fingerprint, frame)
+_context_frame_cache: dict[str, tuple[float, int | None, str, object]] = {}
+_CONTEXT_FRAME_MAX_TTL = 6 * 3600  # safety net while the project version is unchanged
 
 
 def _compute_data_fingerprint(data: dict) -> str:
@@ -1402,6 +1402,9 @@ def invalidate_context_frame(project_id: UUID | str) -> None:
     Call this after entity mutations (create/update/delete) to ensure
     the next chat message gets fresh context.
     """
+    from app.db.write_versions import note_project_write
+
+    note_project_write(project_id)
     _context_frame_cache.pop(str(project_id), None)
 
 
@@ -1416,12 +1419,15 @@ async def compute_context_frame(
     2. Haiku signal + knowledge gaps (fast, ~200ms)
     3. Merge + rank into terse actions
 
-    Cache strategy: fingerprint-based. The frame is cached until either:
+    Cache strategy: version- then fingerprint-based. While the project write
+    version is unchanged the cached frame is served without loading any
+    project data. After a write, the data is loaded and the frame is still
+    reused if the entity fingerprint matches. The frame is recomputed when:
     - Entity data changes (fingerprint mismatch after DB load)
     - invalidate_context_frame() is called (explicit mutation)
-    - 30-minute safety-net TTL expires
+    - the 6-hour safety-net TTL expires
 
-    This avoids redundant Haiku calls when nothing has changed.
+    This avoids redundant Haiku calls and DB reads when nothing has changed.
 
     Args:
         project_id: Project UUID
@@ -1432,23 +1438,37 @@ async def compute_context_frame(
         ProjectContextFrame,
         TerseAction,
     )
+    from app.db.write_versions import current_project_version
 
     cache_key = str(project_id)
     now = time.time()
+    version = await asyncio.to_thread(current_project_version, project_id)
+    cached = _context_frame_cache.get(cache_key)
+
+    # Nothing written since the frame was computed: skip the data load
+    if cached and version is not None and cached[1] == version:
+        age = now - cached[0]
+        if age < _CONTEXT_FRAME_MAX_TTL:
+            logger.info(
+                f"Context frame cache HIT for {cache_key} "
+                f"(age={age:.0f}s, version {version} unchanged)"
+            )
+            return cached[3]  # type: ignore
 
     # Load project data (needed for both cache check and computation)
     data = await _load_project_data(project_id)
     current_fingerprint = _compute_data_fingerprint(data)
 
     # Check cache: serve if fingerprint matches AND within max TTL
-    if cache_key in _context_frame_cache:
-        cached_at, cached_fp, cached_frame = _context_frame_cache[cache_key]
+    if cached:
+        cached_at, _, cached_fp, cached_frame = cached
         age = now - cached_at
         if cached_fp == current_fingerprint and age < _CONTEXT_FRAME_MAX_TTL:
             logger.info(
                 f"Context frame cache HIT for {cache_key} "
                 f"(age={age:.0f}s, fingerprint match)"
             )
+            _context_frame_cache[cache_key] = (cached_at, version, cached_fp, cached_frame)
             return cached_frame  # type: ignore
         if cached_fp != current_fingerprint:
             logger.info(
@@ -1465,7 +1485,7 @@ async def compute_context_frame(
     # State snapshot (cached)
     try:
         from app.core.state_snapshot import get_state_snapshot
-        state_snapshot = get_state_snapshot(project_id)
+        state_snapshot = await asyncio.to_thread(get_state_snapshot, project_id)
     except Exception:
         state_snapshot = ""
 
@@ -1492,7 +1512,7 @@ async def compute_context_frame(
         logger.warning(f"Gap intelligence failed: {e}")
 
     # Memory hints
-    memory_hints = _load_memory_hints(project_id)
+    memory_hints = await asyncio.to_thread(_load_memory_hints, project_id)
 
     # Merge all gaps into terse actions, ranked
     actions: list[TerseAction] = []
@@ -1579,7 +1599,7 @@ async def compute_context_frame(
     )
 
     # Cache the result with fingerprint
-    _context_frame_cache[cache_key] = (time.time(), current_fingerprint, frame)
+    _context_frame_cache[cache_key] = (time.time(), version, current_fingerprint, frame)
     logger.info(f"Context frame cache MISS for {cache_key} — computed and cached (fp={current_fingerprint})")
 
     return frame
@@ -6,6 +6,15 @@ Composes deterministic engines + LLM chains into a single IntelligenceBriefing.
   Phase 2: Deterministic (tensions, hypotheses, gaps, heartbeat)
   Phase 3: LLM calls — narrative + starters + temporal summary in parallel
   Phase 4: Assembly
+
+Phase 1 reads run on the interactive executor pool, phase 2 engines on the
+background pool. When the background pool is saturated, optional sections
+(gap clusters, belief categories, horizon, discovery protocol, LLM extras)
+are skipped and listed in IntelligenceBriefing.degraded_sections.
+
+Phase 2 sections are incremental: each is cached with the write versions of
+the tables it reads (see briefing_sections) and recomputed only when one of
+those tables changed since.
 """
 
 import asyncio
@@ -14,6 +23,8 @@ import logging
 from datetime import UTC, datetime
 from uuid import UUID
 
+from app.core.briefing_sections import SECTIONS, cached_section, encode_section, input_vector
+from app.core.executors import get_pool
 from app.core.schemas_actions import TerseAction
 from app.core.schemas_briefing import (
     BriefingSituation,
@@ -37,7 +48,9 @@ async def compute_intelligence_briefing(
     """Compute the full intelligence briefing.
 
     Parallel execution of deterministic + LLM phases.
-    Narrative is cached in synthesized_memory_cache.briefing_sections.
+    Narrative is cached in synthesized_memory_cache.briefing_sections;
+    deterministic sections in briefing_section_cache (skipped when
+    force_refresh).
     """
     from app.core.action_engine import (
         _build_structural_gaps,
@@ -54,6 +67,10 @@ async def compute_intelligence_briefing(
     workflow_context_display = _build_workflow_context_display(data["workflow_pairs"])
     entity_counts = count_entities(data)
 
+    interactive = get_pool("interactive")
+    background = get_pool("background")
+    degraded_sections: list[str] = []
+
     # Load project name + session + beliefs + insights + cache in parallel
     def _load_session():
         if not user_id:
@@ -61,14 +78,20 @@ async def compute_intelligence_briefing(
         from app.db.consultant_sessions import get_session
         return get_session(project_id, user_id)
 
+    from app.db.briefings import get_briefing_sections
+    from app.db.write_versions import get_table_versions
+
     (
         project_name, session, beliefs, insights, cached_sections,
+        table_versions, section_cache,
     ) = await asyncio.gather(
-        asyncio.to_thread(_get_project_name, project_id),
-        asyncio.to_thread(_load_session),
-        asyncio.to_thread(_load_beliefs, project_id),
-        asyncio.to_thread(_load_insights, project_id),
-        asyncio.to_thread(_get_cached_briefing, project_id),
+        interactive.run(_get_project_name, project_id),
+        interactive.run(_load_session),
+        interactive.run(_load_beliefs, project_id),
+        interactive.run(_load_insights, project_id),
+        interactive.run(_get_cached_briefing, project_id),
+        interactive.run(get_table_versions, project_id),
+        interactive.run(get_briefing_sections, project_id),
     )
 
     since_timestamp = None
@@ -101,60 +124,84 @@ async def compute_intelligence_briefing(
 
     def _run_intelligence_loop():
         """Detect gaps + run sub-phases 2-5 (clustering, fan-out, accuracy, sources)."""
-        try:
-            # detect_gaps is async — run its sync internals
-            import asyncio as _aio
+        # detect_gaps is async — run its sync internals
+        import asyncio as _aio
 
-            from app.core.gap_detector import detect_gaps as _detect_gaps_sync
-            from app.core.intelligence_loop import run_intelligence_loop
-            gaps = _aio.run(_detect_gaps_sync(project_id))
-            return run_intelligence_loop(gaps, project_id)
-        except Exception as e:
-            logger.warning(f"Intelligence loop failed (non-fatal): {e}")
-            return []
+        from app.core.gap_detector import detect_gaps as _detect_gaps_sync
+        from app.core.intelligence_loop import run_intelligence_loop
+        gaps = _aio.run(_detect_gaps_sync(project_id))
+        return run_intelligence_loop(gaps, project_id)
 
     def _run_categorize_beliefs():
         """Categorize beliefs into North Star categories."""
-        try:
-            from app.core.discovery_protocol import categorize_beliefs
-            return categorize_beliefs(project_id)
-        except Exception as e:
-            logger.warning(f"Belief categorization failed (non-fatal): {e}")
-            return {}
+        from app.core.discovery_protocol import categorize_beliefs
+        return categorize_beliefs(project_id)
 
     def _run_horizon_scan():
         """Build horizon summary for briefing."""
-        try:
-            from app.core.horizon_briefing import build_horizon_summary
-            return build_horizon_summary(project_id)
-        except Exception as e:
-            logger.warning(f"Horizon scan failed (non-fatal): {e}")
-            return None
+        from app.core.horizon_briefing import build_horizon_summary
+        return build_horizon_summary(project_id)
 
     def _run_outcome_trajectory():
         """Build outcome trajectory for briefing."""
+        from app.core.horizon_briefing import build_outcome_trajectory
+        return build_outcome_trajectory(project_id)
+
+    # Unknown versions (read failed) disable section caching for this run
+    use_section_cache = table_versions is not None and not force_refresh
+    recomputed: dict[str, tuple[dict, object]] = {}
+
+    async def _section(name: str, fn, *, extra: dict | None = None, optional: bool = False,
+                       default=None):
+        """Serve a section from cache when its inputs are unchanged, else compute it.
+
+        Optional sections are shed (not computed) when the pool is saturated,
+        and fall back to default when they fail. Only computed values are
+        cached, so a transient failure is retried on the next briefing.
+        """
+        spec = SECTIONS[name]
+        vector = input_vector(spec, table_versions or {}, extra)
+        if use_section_cache:
+            hit, value = cached_section(spec, section_cache.get(name), vector)
+            if hit:
+                return value
+        if optional and not background.admit():
+            degraded_sections.append(name)
+            return default
         try:
-            from app.core.horizon_briefing import build_outcome_trajectory
-            return build_outcome_trajectory(project_id)
+            value = await background.run(fn)
         except Exception as e:
-            logger.warning(f"Outcome trajectory failed (non-fatal): {e}")
-            return None
-
+            if not optional:
+                raise
+            logger.warning(f"Briefing section {name} failed (non-fatal): {e}")
+            return default
+        if table_versions is not None:
+            recomputed[name] = (vector, value)
+        return value
+
+    since_key = since_timestamp.isoformat() if since_timestamp else None
     (
         tensions, scanned_hyps, active_hyps, heartbeat, temporal_diff,
         gap_clusters_raw, categorized_beliefs,
         horizon_summary, outcome_trajectory,
     ) = await asyncio.gather(
-        asyncio.to_thread(_run_tensions),
-        asyncio.to_thread(_run_scan),
-        asyncio.to_thread(_run_active),
-        asyncio.to_thread(_run_heartbeat),
-        asyncio.to_thread(_run_temporal),
-        asyncio.to_thread(_run_intelligence_loop),
-        asyncio.to_thread(_run_categorize_beliefs),
-        asyncio.to_thread(_run_horizon_scan),
-        asyncio.to_thread(_run_outcome_trajectory),
+        _section("tensions", _run_tensions),
+        _section("hypotheses_scan", _run_scan),
+        _section("hypotheses_active", _run_active),
+        _section("heartbeat", _run_heartbeat),
+        _section("temporal_diff", _run_temporal, extra={"since": since_key}),
+        _section("gap_clusters", _run_intelligence_loop, optional=True, default=[]),
+        _section("belief_categories", _run_categorize_beliefs, optional=True, default={}),
+        _section("horizon_summary", _run_horizon_scan, optional=True),
+        _section("outcome_trajectory", _run_outcome_trajectory, optional=True),
     )
+    # Under load, skip the optional LLM extras too
+    shed_extras = bool(degraded_sections)
+    if shed_extras:
+        degraded_sections.extend(
+            ["hypothesis_suggestions", "knowledge_classification", "discovery_protocol"]
+        )
+        logger.info(f"Briefing for {project_id} degraded under load: {degraded_sections}")
 
     hypotheses = _merge_hypotheses(scanned_hyps, active_hyps)
     structural_gaps = _build_structural_gaps(data["workflow_pairs"], phase.value)
@@ -178,6 +225,8 @@ async def compute_intelligence_briefing(
         """Haiku: summarize temporal changes."""
         if not temporal_diff.changes:
             return ""
+        if temporal_diff.change_summary:
+            return temporal_diff.change_summary  # cached section
         try:
             from app.core.temporal_diff import summarize_changes
             return await summarize_changes(
@@ -240,7 +289,7 @@ async def compute_intelligence_briefing(
     async def _run_hypothesis_suggestions() -> list[dict]:
         """Haiku: generate test suggestions for new hypotheses."""
         new_hyps = [h for h in hypotheses if h.status.value == "proposed" and not h.test_suggestion]
-        if not new_hyps:
+        if not new_hyps or shed_extras:
             return []
         try:
             from app.core.hypothesis_engine import generate_test_suggestions
@@ -273,11 +322,13 @@ async def compute_intelligence_briefing(
 
     async def _run_knowledge_classification() -> None:
         """Haiku: classify knowledge types for gap clusters."""
-        if not gap_clusters_raw:
+        # Clusters served from cache keep their earlier classification
+        unclassified = [c for c in gap_clusters_raw if not c.knowledge_type]
+        if not unclassified or shed_extras:
             return
         try:
             from app.chains.classify_gap_knowledge import classify_gap_knowledge
-            await classify_gap_knowledge(gap_clusters_raw, project_id=str(project_id))
+            await classify_gap_knowledge(unclassified, project_id=str(project_id))
         except Exception as e:
             logger.warning(f"Knowledge classification failed (non-fatal): {e}")
 
@@ -285,6 +336,8 @@ async def compute_intelligence_briefing(
         """Discovery Protocol: classify uncategorized beliefs, score ambiguity, generate probes."""
         from app.core.discovery_protocol import classify_uncategorized_beliefs, score_ambiguity
 
+        if shed_extras:
+            return {}, [], {}
         try:
             # Classify uncategorized beliefs via Haiku if needed
             classified = await classify_uncategorized_beliefs(categorized_beliefs)
@@ -352,6 +405,11 @@ async def compute_intelligence_briefing(
             if h.hypothesis_id in suggestion_map:
                 h.test_suggestion = suggestion_map[h.hypothesis_id]
 
+    # Persist recomputed sections, including phase 3 enrichments
+    # (test suggestions, change summary, knowledge types)
+    if recomputed:
+        _persist_sections(project_id, recomputed)
+
     # Conversation starters
     if cs_result.get("cached"):
         cs_list = cached_sections.get("conversation_starters", []) if cached_sections else []
@@ -470,6 +528,7 @@ async def compute_intelligence_briefing(
         horizon_summary=horizon_summary,
         computed_at=datetime.now(UTC),
         narrative_cached=narrative_cached,
+        degraded_sections=degraded_sections,
         phase=phase,
     )
 
@@ -484,6 +543,26 @@ async def compute_intelligence_briefing(
     return briefing
 
 
+def _persist_sections(project_id: UUID, recomputed: dict[str, tuple[dict, object]]) -> None:
+    """Write recomputed sections to briefing_section_cache off the request path."""
+    try:
+        payload = {
+            name: (vector, encode_section(SECTIONS[name], value))
+            for name, (vector, value) in recomputed.items()
+        }
+    except Exception as e:
+        logger.warning(f"Briefing section encode failed (non-fatal): {e}")
+        return
+
+    from app.core.write_behind import enqueue_write
+    from app.db.briefings import save_briefing_sections
+
+    enqueue_write(
+        lambda: save_briefing_sections(project_id, payload),
+        label=f"briefing_sections:{project_id}",
+    )
+
+
 def compute_heartbeat_only(project_id: UUID) -> ProjectHeartbeat:
     """Instant heartbeat — no LLM, always fresh. <100ms."""
     from app.core.project_data import count_entities as _count_entities
@@ -0,0 +1,135 @@
+"""Section-level dependency tracking for the intelligence briefing.
+
+Each deterministic briefing section declares the tables it reads. The
+briefing engine stores every computed section with the input version
+vector it was computed from — the per-project write version of each of
+those tables (project_write_versions) plus any call inputs such as the
+temporal diff's "since". On the next load, a section whose stored vector
+still matches is served from briefing_section_cache; only sections whose
+inputs changed are recomputed.
+
+max_age bounds how long a section may be reused even when nothing changed
+(relative labels like "2 days ago", failure defaults, rows written through
+paths that bypass the triggers).
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.logging import get_logger
+from app.core.schemas_briefing import (
+    ActiveTension,
+    BriefingWhatChanged,
+    GapCluster,
+    Hypothesis,
+    ProjectHeartbeat,
+)
+
+logger = get_logger(__name__)
+
+# Entity tables the gap detector walks
+_GAP_ENTITY_TABLES = (
+    "features", "personas", "workflows", "vp_steps",
+    "data_entities", "business_drivers", "constraints",
+)
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    """A cacheable briefing section and the tables it reads."""
+
+    name: str
+    tables: tuple[str, ...]
+    max_age: timedelta = timedelta(hours=24)
+    model: type[BaseModel] | None = None  # None: payload is plain JSON
+    many: bool = False  # payload is a list of `model`
+
+
+SECTIONS: dict[str, SectionSpec] = {
+    spec.name: spec
+    for spec in (
+        SectionSpec(
+            "tensions",
+            ("memory_nodes", "memory_edges", "features", "signal_impact", "workflows", "vp_steps"),
+            model=ActiveTension, many=True,
+        ),
+        SectionSpec("hypotheses_scan", ("memory_nodes",), model=Hypothesis, many=True),
+        SectionSpec("hypotheses_active", ("memory_nodes",), model=Hypothesis, many=True),
+        SectionSpec(
+            "heartbeat",
+            (
+                "signals", "memory_nodes", "memory_edges", "features", "personas", "vp_steps",
+                "workflows", "business_drivers", "stakeholders", "entity_dependencies",
+            ),
+            max_age=timedelta(hours=1), model=ProjectHeartbeat,
+        ),
+        SectionSpec(
+            "temporal_diff",
+            ("enrichment_revisions", "memory_nodes", "signals", "belief_history"),
+            max_age=timedelta(hours=1), model=BriefingWhatChanged,
+        ),
+        SectionSpec(
+            "gap_clusters",
+            (
+                *_GAP_ENTITY_TABLES, "entity_dependencies", "signal_impact",
+                "solution_flow_steps", "stakeholders",
+            ),
+            model=GapCluster, many=True,
+        ),
+        SectionSpec("belief_categories", ("memory_nodes", "projects")),
+        SectionSpec("horizon_summary", ("project_horizons", "horizon_outcomes")),
+        SectionSpec("outcome_trajectory", ("project_horizons", "horizon_outcomes")),
+    )
+}
+
+
+def input_vector(
+    spec: SectionSpec,
+    versions: dict[str, int],
+    extra: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """The version vector a section is computed from right now."""
+    vector: dict[str, Any] = {table: versions.get(table, 0) for table in spec.tables}
+    if extra:
+        vector.update({f"@{k}": v for k, v in extra.items()})
+    return vector
+
+
+def encode_section(spec: SectionSpec, value: Any) -> Any:
+    """Serialize a computed section for briefing_section_cache.payload."""
+    if spec.model is None or value is None:
+        return value
+    if spec.many:
+        return [item.model_dump(mode="json") for item in value]
+    return value.model_dump(mode="json")
+
+
+def decode_section(spec: SectionSpec, payload: Any) -> Any:
+    """Rebuild a section value from its cached payload."""
+    if spec.model is None or payload is None:
+        return payload
+    if spec.many:
+        return [spec.model.model_validate(item) for item in payload]
+    return spec.model.model_validate(payload)
+
+
+def cached_section(
+    spec: SectionSpec,
+    row: dict[str, Any] | None,
+    vector: dict[str, Any],
+    now: datetime | None = None,
+) -> tuple[bool, Any]:
+    """(hit, value) for a cached row against the current input vector."""
+    if not row or row.get("input_versions") != vector:
+        return False, None
+    try:
+        computed_at = datetime.fromisoformat(str(row["computed_at"]).replace("Z", "+00:00"))
+        if (now or datetime.now(UTC)) - computed_at > spec.max_age:
+            return False, None
+        return True, decode_section(spec, row.get("payload"))
+    except Exception as e:
+        logger.debug(f"Discarding cached briefing section {spec.name}: {e}")
+        return False, None
@@ -13,6 +13,7 @@ from typing import Any
 import httpx
 
 from app.core.config import get_settings
+from app.core.http_client import open_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ def _is_configured() -> bool:
 async def scrape_url(
     url: str,
     timeout: int = 30,
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Scrape a URL using Bright Data Web Unlocker API.
@@ -40,6 +42,7 @@ async def scrape_url(
     Args:
         url: The URL to scrape
         timeout: Request timeout in seconds
+        http_client: Shared client to reuse (a new one is opened if omitted)
 
     Returns:
         Dict with html content and status
@@ -58,7 +61,7 @@ async def scrape_url(
             "at https://brightdata.com/cp/start and set BRIGHTDATA_ZONE in .env"
         )
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    async with open_http_client(http_client, timeout) as client:
         response = await client.post(
             f"{BRIGHTDATA_BASE_URL}/request",
             headers={
@@ -70,6 +73,7 @@ async def scrape_url(
                 "url": url,
                 "format": "raw",
             },
+            timeout=timeout,
         )
         # Log response body on error for debugging
         if response.status_code >= 400:
@@ -94,6 +98,7 @@ async def scrape_url(
 async def scrape_url_safe(
     url: str,
     timeout: int = 30,
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any] | None:
     """Scrape URL with error handling — returns None on failure.
 
@@ -111,7 +116,7 @@ async def scrape_url_safe(
         return None
 
     try:
-        return await scrape_url(url, timeout)
+        return await scrape_url(url, timeout, http_client)
     except ValueError as e:
         if not _zone_warning_logged:
             logger.warning(f"Bright Data config issue: {e}")
@@ -8,7 +8,7 @@ from typing import Any
 from uuid import UUID
 
 from app.core.logging import get_logger
-from app.db.revisions_enrichment import insert_enrichment_revision, list_entity_revisions
+from app.db.revisions_enrichment import insert_enrichment_revisions
 
 logger = get_logger(__name__)
 
@@ -114,24 +114,85 @@ def generate_diff_summary(changes: dict[str, dict[str, Any]]) -> str:
         return f"Updated {', '.join(field_names[:3])} and {len(field_names) - 3} more fields"
 
 
-def get_next_revision_number(entity_type: str, entity_id: UUID) -> int:
+def build_revision(
+    project_id: UUID,
+    entity_type: str,
+    entity_id: UUID,
+    entity_label: str,
+    old_entity: dict[str, Any] | None,
+    new_entity: dict[str, Any],
+    trigger_event: str,
+    source_signal_id: UUID | None = None,
+    run_id: UUID | None = None,
+    created_by: str = "system",
+) -> dict[str, Any] | None:
     """
-    Get the next revision number for an entity.
+    Build the revision row for an entity change (diff + summary).
 
-    Args:
-        entity_type: Type of entity
-        entity_id: Entity UUID
+    Returns None when an update changed nothing. The revision number is
+    allocated by the database on insert.
+    """
+    if old_entity is None:
+        revision_type = "created"
+        changes = {}
+        diff_summary = f"Created {entity_type}: {entity_label}"
+    else:
+        revision_type = "updated"
+        changes = compute_diff(old_entity, new_entity)
+
+        if not changes:
+            # No actual changes, skip creating revision
+            logger.debug(
+                f"No changes detected for {entity_type} {entity_id}, skipping revision"
+            )
+            return None
+
+        diff_summary = generate_diff_summary(changes)
+
+    return {
+        "project_id": project_id,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "entity_label": str(entity_label),
+        "revision_type": revision_type,
+        "trigger_event": trigger_event,
+        "snapshot": new_entity,
+        "changes": changes,
+        "diff_summary": diff_summary,
+        "context_summary": diff_summary,
+        "source_signal_id": source_signal_id,
+        "run_id": run_id,
+        "created_by": created_by,
+    }
+
+
+def track_entity_changes(revisions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Write many revisions (from build_revision) in one call.
 
-    Returns:
-        Next revision number (1 if first revision)
+    Non-blocking: returns [] and logs if the write fails.
     """
+    revisions = [r for r in revisions if r]
+    if not revisions:
+        return []
     try:
-        revisions = list_entity_revisions(entity_type, entity_id, limit=1)
-        if revisions and revisions[0].get("revision_number"):
-            return revisions[0]["revision_number"] + 1
-        return 1
-    except Exception:
-        return 1
+        created = insert_enrichment_revisions(revisions)
+    except Exception as e:
+        logger.warning(f"Failed to track {len(revisions)} entity changes: {e}")
+        return []
+
+    for revision in created:
+        logger.info(
+            f"Tracked {revision['revision_type']} for {revision['entity_type']} "
+            f"{revision['entity_label']}: {revision.get('diff_summary')}",
+            extra={
+                "entity_type": revision["entity_type"],
+                "entity_id": str(revision["entity_id"]),
+                "revision_number": revision.get("revision_number"),
+                "fields_changed": list((revision.get("changes") or {}).keys()),
+            },
+        )
+    return created
 
 
 def track_entity_change(
@@ -152,7 +213,7 @@ def track_entity_change(
     This is the main entry point for change tracking. It:
     1. Computes field-level diff
     2. Generates human-readable summary
-    3. Creates revision record
+    3. Creates revision record (number allocated atomically server-side)
 
     Args:
         project_id: Project UUID
@@ -169,78 +230,22 @@ def track_entity_change(
     Returns:
         Created revision record, or None if tracking failed
     """
-    try:
-        # Determine revision type
-        if old_entity is None:
-            revision_type = "created"
-            changes = {}
-            diff_summary = f"Created {entity_type}: {entity_label}"
-        else:
-            revision_type = "updated"
-            changes = compute_diff(old_entity, new_entity)
-
-            if not changes:
-                # No actual changes, skip creating revision
-                logger.debug(
-                    f"No changes detected for {entity_type} {entity_id}, skipping revision"
-                )
-                return None
-
-            diff_summary = generate_diff_summary(changes)
-
-        # Get next revision number
-        revision_number = get_next_revision_number(entity_type, entity_id)
-
-        # Create revision record
-        revision = insert_enrichment_revision(
-            project_id=project_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            entity_label=str(entity_label),
-            revision_type=revision_type,
-            trigger_event=trigger_event,
-            snapshot=new_entity,
-            context_summary=diff_summary,
-            run_id=run_id,
-        )
-
-        # Update with additional fields (changes, diff_summary, etc.)
-        # These were added in migration 0036
-        from app.db.supabase_client import get_supabase
-        supabase = get_supabase()
-
-        update_data = {
-            "changes": changes,
-            "diff_summary": diff_summary,
-            "revision_number": revision_number,
-            "created_by": created_by,
-        }
-        if source_signal_id:
-            update_data["source_signal_id"] = str(source_signal_id)
-
-        supabase.table("enrichment_revisions").update(update_data).eq(
-            "id", revision["id"]
-        ).execute()
-
-        logger.info(
-            f"Tracked {revision_type} for {entity_type} {entity_label}: {diff_summary}",
-            extra={
-                "entity_type": entity_type,
-                "entity_id": str(entity_id),
-                "revision_number": revision_number,
-                "fields_changed": list(changes.keys()),
-            },
-        )
-
-        return revision
-
-    except Exception as e:
-        # Non-blocking - don't fail the main operation if tracking fails
-        logger.warning(
-            f"Failed to track change for {entity_type} {entity_id}: {e}",
-            extra={"entity_type": entity_type, "entity_id": str(entity_id)},
-        )
+    revision = build_revision(
+        project_id=project_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        entity_label=entity_label,
+        old_entity=old_entity,
+        new_entity=new_entity,
+        trigger_event=trigger_event,
+        source_signal_id=source_signal_id,
+        run_id=run_id,
+        created_by=created_by,
+    )
+    if revision is None:
         return None
+    created = track_entity_changes([revision])
+    return created[0] if created else None
 
 
 def track_bulk_changes(
@@ -254,7 +259,7 @@ def track_bulk_changes(
     label_field: str = "name",
 ) -> int:
     """
-    Track creation of multiple entities in bulk.
+    Track creation of multiple entities in bulk (one insert).
 
     Args:
         project_id: Project UUID
@@ -269,28 +274,26 @@ def track_bulk_changes(
     Returns:
         Number of revisions created
     """
-    count = 0
+    revisions = []
     for entity in created_entities:
         entity_id = entity.get("id")
         if not entity_id:
             continue
 
-        label = entity.get(label_field, entity_id)
-        result = track_entity_change(
+        revisions.append(build_revision(
             project_id=project_id,
             entity_type=entity_type,
             entity_id=UUID(entity_id) if isinstance(entity_id, str) else entity_id,
-            entity_label=str(label),
+            entity_label=str(entity.get(label_field, entity_id)),
             old_entity=None,  # Created
             new_entity=entity,
             trigger_event=trigger_event,
             source_signal_id=source_signal_id,
             run_id=run_id,
             created_by=created_by,
-        )
-        if result:
-            count += 1
+        ))
 
+    count = len(track_entity_changes(revisions))
     logger.info(
         f"Tracked {count} bulk {entity_type} creations",
         extra={"entity_type": entity_type, "count": count},
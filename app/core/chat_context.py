@@ -30,29 +30,41 @@ class ChatContext:
 
 
 # ── Retrieval cache (per-conversation topic dedup) ────────────────
-_retrieval_cache: dict[str, tuple[float, str]] = {}
+# Entries carry the project write version they were retrieved at: served
+# while it is unchanged (up to _RETRIEVAL_CACHE_MAX_AGE), or for the short
+# TTL when the version couldn't be read.
+_retrieval_cache: dict[str, tuple[float, str, int | None]] = {}
 _RETRIEVAL_CACHE_TTL = 60  # seconds
+_RETRIEVAL_CACHE_MAX_AGE = 1800
 
 
-def _check_retrieval_cache(project_id: str, topics: list[str]) -> str | None:
+def _check_retrieval_cache(
+    project_id: str, topics: list[str], version: int | None = None
+) -> str | None:
     """Check retrieval cache. Returns cached result or None."""
     key = f"{project_id}:{','.join(sorted(topics))}"
     if key in _retrieval_cache:
-        ts, result = _retrieval_cache[key]
-        if time.time() - ts < _RETRIEVAL_CACHE_TTL:
+        ts, result, cached_version = _retrieval_cache[key]
+        max_age = _RETRIEVAL_CACHE_TTL if version is None else _RETRIEVAL_CACHE_MAX_AGE
+        if cached_version == version and time.time() - ts < max_age:
             return result
         _retrieval_cache.pop(key, None)
     return None
 
 
-def _store_retrieval_cache(project_id: str, topics: list[str], result: str) -> None:
+def _store_retrieval_cache(
+    project_id: str, topics: list[str], result: str, version: int | None = None
+) -> None:
     """Store retrieval result in cache."""
     key = f"{project_id}:{','.join(sorted(topics))}"
-    _retrieval_cache[key] = (time.time(), result)
+    _retrieval_cache[key] = (time.time(), result, version)
 
 
 def invalidate_retrieval_cache(project_id: str) -> None:
     """Invalidate all cached retrieval for a project."""
+    from app.db.write_versions import note_project_write
+
+    note_project_write(project_id)
     keys = [k for k in _retrieval_cache if k.startswith(f"{project_id}:")]
     for k in keys:
         _retrieval_cache.pop(k, None)
@@ -157,9 +169,18 @@ async def build_solution_flow_ctx(
         return None
 
 
+async def _project_version(project_id: str) -> int | None:
+    """Current project write version (None when it can't be read)."""
+    from app.db.write_versions import current_project_version
+
+    return await asyncio.to_thread(current_project_version, project_id)
+
+
 async def get_project_name(supabase: Any, project_id: str) -> str:
-    """Fetch the project name from the database."""
-    project_row = supabase.table("projects").select("name").eq("id", project_id).single().execute()
+    """Fetch the project name from the database (in a worker thread)."""
+    project_row = await asyncio.to_thread(
+        lambda: supabase.table("projects").select("name").eq("id", project_id).single().execute()
+    )
     return project_row.data.get("name", "Unknown") if project_row.data else "Unknown"
 
 
@@ -232,16 +253,199 @@ async def _safe_load_warm_memory(project_id: str, conversation_id: UUID | str |
         return ""
 
 
-async def _noop_dict() -> dict:
-    return {}
+# ── Speculative prefetch ──────────────────────────────────────────
+# Loader name → value used when the final intent skips that loader.
+_LOADER_DEFAULTS: dict[str, Any] = {
+    "solution_flow": None,
+    "confidence": {},
+    "horizon": {},
+    "warm_memory": "",
+    "forge": {},
+    "next_actions": [],
+}
+
+
+def _wanted_loaders(intent_type: str, has_history: bool, forge_enabled: bool) -> set[str]:
+    """Context loaders a turn with this intent needs."""
+    is_mutation = intent_type in ("create", "update", "delete")
+    wanted = {"solution_flow", "project_name", "awareness"}
+    # Confidence + horizon: skip for mutations
+    if not is_mutation:
+        wanted |= {"confidence", "horizon"}
+    # Warm memory: skip on first message
+    if has_history:
+        wanted.add("warm_memory")
+    # Forge: skip if URL not configured
+    if forge_enabled:
+        wanted.add("forge")
+    # Next actions: skip for search intent
+    if intent_type != "search":
+        wanted.add("next_actions")
+    return wanted
+
+
+def _forge_enabled() -> bool:
+    try:
+        from app.core.config import get_settings
+
+        return bool(get_settings().FORGE_API_URL)
+    except Exception:
+        return False
+
+
+@dataclass
+class ContextPrefetch:
+    """Context loads started before the final intent is known.
+
+    start_context_prefetch() launches loaders (and retrieval) for a predicted
+    intent while the classifier is still running; assemble_chat_context()
+    joins what the final intent needs and cancels the rest.
+    """
+
+    project_id: str
+    message: str
+    page_context: str | None
+    focused_entity: dict[str, Any] | None
+    supabase: Any
+    conversation_id: UUID | str | None
+    forge_enabled: bool
+    tasks: dict[str, asyncio.Task] = field(default_factory=dict)
+    retrieval: asyncio.Task | None = None
+    retrieval_key: tuple | None = None
+
+    @property
+    def has_history(self) -> bool:
+        return bool(self.conversation_id)
+
+    def start(self, name: str) -> asyncio.Task:
+        """Start a loader if it isn't running yet."""
+        task = self.tasks.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self._load(name))
+            self.tasks[name] = task
+        return task
+
+    async def result(self, name: str) -> Any:
+        """Await a loader without letting the caller's cancellation kill it."""
+        return await asyncio.shield(self.start(name))
+
+    def start_retrieval(self, intent_type: str, strategy: str, topics: list[str]) -> asyncio.Task:
+        """Start retrieval for an intent, reusing the speculative run when it matches."""
+        key = (intent_type, strategy, tuple(sorted(topics)))
+        if self.retrieval is not None and self.retrieval_key == key:
+            return self.retrieval
+        if self.retrieval is not None:
+            self.retrieval.cancel()
+        self.retrieval = asyncio.ensure_future(
+            self._retrieve(intent_type, strategy, topics)
+        )
+        self.retrieval_key = key
+        return self.retrieval
+
+    def cancel(self) -> None:
+        """Cancel every load still in flight."""
+        for task in [*self.tasks.values(), self.retrieval]:
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def _load(self, name: str) -> Any:
+        pid = self.project_id
+        if name == "solution_flow":
+            return await build_solution_flow_ctx(self.page_context, pid, self.focused_entity)
+        if name == "project_name":
+            return await get_project_name(self.supabase, pid)
+        if name == "awareness":
+            return await _safe_load_awareness(pid, await self.result("project_name"))
+        if name == "confidence":
+            return await _safe_load_confidence(pid)
+        if name == "horizon":
+            return await _safe_load_horizon(pid)
+        if name == "warm_memory":
+            return await _safe_load_warm_memory(pid, self.conversation_id)
+        if name == "forge":
+            return await _safe_load_forge(pid, self.page_context)
+        if name == "next_actions":
+            return await _safe_load_next_actions(pid)
+        raise ValueError(f"Unknown context loader: {name}")
+
+    async def _retrieve(self, intent_type: str, strategy: str, topics: list[str]) -> str:
+        pid = self.project_id
+        version = await _project_version(pid)
+        cached = _check_retrieval_cache(pid, topics, version)
+        if cached is not None:
+            logger.info("Retrieval cache hit: topics=%s", topics)
+            return cached
+
+        # Build retrieval plan from cognitive frame
+        retrieval_plan = None
+        wanted = _wanted_loaders(intent_type, self.has_history, self.forge_enabled)
+        awareness = await self.result("awareness")
+        horizon_state = await self.result("horizon") if "horizon" in wanted else {}
+        try:
+            from app.context.prompt_compiler import compile_cognitive_frame
+
+            frame = compile_cognitive_frame(
+                intent_type=intent_type,
+                awareness=awareness,
+                page_context=self.page_context,
+                focused_entity=self.focused_entity,
+                horizon_state=horizon_state,
+            )
+            if hasattr(frame, "retrieval_plan") and frame.retrieval_plan:
+                retrieval_plan = frame.retrieval_plan
+        except Exception as e:
+            logger.debug(f"Retrieval plan compilation failed (non-fatal): {e}")
+
+        retrieval_context = await build_retrieval_context(
+            self.message,
+            pid,
+            self.page_context,
+            self.focused_entity,
+            retrieval_plan,
+            skip_reranking=(strategy == "light"),
+            skip_decomposition=(strategy == "light"),
+        )
+
+        # Cache successful retrieval
+        if retrieval_context and topics:
+            _store_retrieval_cache(pid, topics, retrieval_context, version)
+        return retrieval_context
 
 
-async def _noop_str() -> str:
-    return ""
+def start_context_prefetch(
+    project_id: UUID | str,
+    message: str,
+    page_context: str | None,
+    focused_entity: dict[str, Any] | None,
+    supabase: Any,
+    conversation_id: UUID | str | None = None,
+    predicted_intent: ChatIntent | None = None,
+) -> ContextPrefetch:
+    """Start context loading speculatively for a predicted intent.
 
+    Call as soon as the message arrives (e.g. with the regex classification)
+    so loading overlaps the LLM intent classifier. Must be called from a
+    running event loop. Pass the result to assemble_chat_context().
+    """
+    prefetch = ContextPrefetch(
+        project_id=str(project_id),
+        message=message,
+        page_context=page_context,
+        focused_entity=focused_entity,
+        supabase=supabase,
+        conversation_id=conversation_id,
+        forge_enabled=_forge_enabled(),
+    )
 
-async def _noop_list() -> list[str]:
-    return []
+    intent_type = predicted_intent.type if predicted_intent else "discuss"
+    strategy = predicted_intent.retrieval_strategy if predicted_intent else "full"
+    for name in sorted(_wanted_loaders(intent_type, prefetch.has_history, prefetch.forge_enabled)):
+        prefetch.start(name)
+    if strategy != "none":
+        prefetch.start_retrieval(
+            intent_type, strategy, predicted_intent.topics if predicted_intent else [],
+        )
+    return prefetch
 
 
 async def assemble_chat_context(
@@ -252,109 +456,61 @@ async def assemble_chat_context(
     supabase: Any,
     conversation_id: UUID | str | None = None,
     intent: ChatIntent | None = None,
+    prefetch: ContextPrefetch | None = None,
 ) -> ChatContext:
     """Assemble all chat context with intent-gated loading.
 
-    Phase A (parallel): Load awareness, project_name, and intelligence layers
+    Loaders (awareness, project_name, intelligence layers) run in parallel,
+    gated by the intent. Retrieval follows awareness with plan-driven params,
     gated by intent.retrieval_strategy.
-    Phase B (sequential): Build retrieval (if needed) with plan-driven params.
+
+    If a prefetch from start_context_prefetch() is given, loads it already
+    started are joined (retrieval only when its predicted intent matches);
+    loads this intent doesn't need are cancelled.
     """
-    pid = str(project_id)
+    if prefetch is None:
+        prefetch = start_context_prefetch(
+            project_id, message, page_context, focused_entity, supabase,
+            conversation_id=conversation_id, predicted_intent=intent,
+        )
+    try:
+        return await _join_context_prefetch(prefetch, intent)
+    finally:
+        prefetch.cancel()
+
+
+async def _join_context_prefetch(
+    prefetch: ContextPrefetch,
+    intent: ChatIntent | None,
+) -> ChatContext:
     strategy = intent.retrieval_strategy if intent else "full"
     intent_type = intent.type if intent else "discuss"
-    is_mutation = intent_type in ("create", "update", "delete")
+    topics = intent.topics if intent else []
 
-    # Check FORGE_API_URL to skip forge loading
-    forge_enabled = False
-    try:
-        from app.core.config import get_settings
-        forge_enabled = bool(get_settings().FORGE_API_URL)
-    except Exception:
-        pass
-
-    # Determine if warm memory is useful (skip on first message)
-    has_history = bool(conversation_id)
-
-    # Phase A: Parallel loading, gated by intent
-    tasks = [
-        build_solution_flow_ctx(page_context, pid, focused_entity),
-        get_project_name(supabase, pid),
-        # Confidence: skip for mutations
-        _safe_load_confidence(pid) if not is_mutation else _noop_dict(),
-        # Horizon: skip for mutations
-        _safe_load_horizon(pid) if not is_mutation else _noop_dict(),
-        # Warm memory: skip on first message
-        _safe_load_warm_memory(pid, conversation_id) if has_history else _noop_str(),
-        # Forge: skip if URL not configured
-        _safe_load_forge(pid, page_context) if forge_enabled else _noop_dict(),
-        # Next actions: skip for search intent
-        _safe_load_next_actions(pid) if intent_type != "search" else _noop_list(),
-    ]
-
-    (
-        solution_flow_ctx,
-        project_name,
-        confidence_state,
-        horizon_state,
-        warm_memory,
-        forge_state,
-        next_actions,
-    ) = await asyncio.gather(*tasks)
-
-    # Load awareness (needs project_name)
-    awareness = await _safe_load_awareness(pid, project_name)
-
-    # Phase B: Retrieval, gated by strategy
-    retrieval_context = ""
+    wanted = _wanted_loaders(intent_type, prefetch.has_history, prefetch.forge_enabled)
+    names = sorted(wanted)
+
+    retrieval_task = None
     if strategy == "none":
         logger.info("Retrieval skipped: strategy=none (intent=%s)", intent_type)
+        if prefetch.retrieval is not None:
+            prefetch.retrieval.cancel()
     else:
-        # Check retrieval cache first
-        topics = intent.topics if intent else []
-        cached = _check_retrieval_cache(pid, topics)
-        if cached is not None:
-            retrieval_context = cached
-            logger.info("Retrieval cache hit: topics=%s", topics)
-        else:
-            # Build retrieval plan from cognitive frame
-            retrieval_plan = None
-            try:
-                from app.context.prompt_compiler import compile_cognitive_frame
-
-                frame = compile_cognitive_frame(
-                    intent_type=intent_type,
-                    awareness=awareness,
-                    page_context=page_context,
-                    focused_entity=focused_entity,
-                    horizon_state=horizon_state,
-                )
-                if hasattr(frame, "retrieval_plan") and frame.retrieval_plan:
-                    retrieval_plan = frame.retrieval_plan
-            except Exception as e:
-                logger.debug(f"Retrieval plan compilation failed (non-fatal): {e}")
-
-            retrieval_context = await build_retrieval_context(
-                message,
-                pid,
-                page_context,
-                focused_entity,
-                retrieval_plan,
-                skip_reranking=(strategy == "light"),
-                skip_decomposition=(strategy == "light"),
-            )
+        retrieval_task = prefetch.start_retrieval(intent_type, strategy, topics)
 
-            # Cache successful retrieval
-            if retrieval_context and topics:
-                _store_retrieval_cache(pid, topics, retrieval_context)
+    values = await asyncio.gather(*(prefetch.start(name) for name in names))
+    loaded = dict(_LOADER_DEFAULTS)
+    loaded.update(zip(names, values, strict=True))
+    retrieval_context = await retrieval_task if retrieval_task is not None else ""
 
     return ChatContext(
-        solution_flow_ctx=solution_flow_ctx,
+        solution_flow_ctx=loaded["solution_flow"],
         retrieval_context=retrieval_context,
-        project_name=project_name,
-        awareness=awareness,
-        confidence_state=confidence_state,
-        horizon_state=horizon_state,
-        warm_memory=warm_memory,
-        forge_state=forge_state,
-        next_actions=next_actions,
+        project_name=loaded["project_name"],
+        awareness=loaded["awareness"],
+        confidence_state=loaded["confidence"],
+        horizon_state=loaded["horizon"],
+        warm_memory=loaded["warm_memory"],
+        forge_state=loaded["forge"],
+        next_actions=loaded["next_actions"],
     )
@@ -1,15 +1,16 @@
-"""Async chat routing telemetry — fire-and-forget insert per message.
+"""Chat routing telemetry — fire-and-forget insert per message.
 
-Never blocks the response pipeline. Logs tier classification, latency,
-token counts, cost estimates, and compression ratios.
+Never blocks the response pipeline: rows go through the write-behind queue.
+Logs tier classification, latency, token counts, cost estimates, and
+compression ratios.
 """
 
-import asyncio
 import time
 from decimal import Decimal
 from typing import Any
 
 from app.core.logging import get_logger
+from app.core.write_behind import enqueue_write
 
 logger = get_logger(__name__)
 
@@ -53,7 +54,7 @@ def estimate_cost(
     return input_cost + cache_cost + output_cost
 
 
-async def log_chat_routing(
+def log_chat_routing(
     supabase: Any,
     project_id: str,
     conversation_id: str | None = None,
@@ -71,7 +72,7 @@ async def log_chat_routing(
     compressed_token_count: int | None = None,
     original_token_count: int | None = None,
 ) -> None:
-    """Async insert into chat_routing_log. Fire-and-forget."""
+    """Queue an insert into chat_routing_log. Fire-and-forget, returns immediately."""
     try:
         row = {
             "project_id": project_id,
@@ -95,8 +96,9 @@ async def log_chat_routing(
         if original_token_count is not None:
             row["original_token_count"] = original_token_count
 
-        await asyncio.to_thread(
-            lambda: supabase.table("chat_routing_log").insert(row).execute()
+        enqueue_write(
+            lambda: supabase.table("chat_routing_log").insert(row).execute(),
+            "chat_routing_log",
         )
     except Exception as e:
         logger.debug(f"Chat routing log failed (non-fatal): {e}")
@@ -8,12 +8,21 @@ from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
-from app.chains.chat_tools import execute_tool, get_tools_for_context
+from app.chains.chat_tools import (
+    _MUTATING_TOOLS,
+    ToolExecutor,
+    execute_tool,
+    get_tools_for_context,
+)
 from app.context.dynamic_prompt_builder import build_smart_chat_prompt
-from app.context.intent_classifier import classify_intent_async
+from app.context.intent_classifier import classify_intent, classify_intent_async
 from app.context.prompt_compiler import compile_cognitive_frame, compile_prompt
 from app.context.tool_truncator import truncate_tool_result
-from app.core.chat_context import assemble_chat_context, invalidate_retrieval_cache
+from app.core.chat_context import (
+    assemble_chat_context,
+    invalidate_retrieval_cache,
+    start_context_prefetch,
+)
 from app.core.chat_fast_path import try_fast_path
 from app.core.chat_routing_log import (
     RoutingTimer,
@@ -21,12 +30,19 @@ from app.core.chat_routing_log import (
     estimate_cost,
     log_chat_routing,
 )
+from app.core.llm_usage import log_llm_usage
 from app.core.logging import get_logger
+from app.core.prompt_cache import assemble_system
+from app.core.write_behind import WriteBehindQueue
 
 logger = get_logger(__name__)
 
 MAX_TOOL_TURNS = 5
 
+# Conversation history gets its own write-behind queue: a burst of usage or
+# telemetry rows on the shared queue must not delay the messages inserts
+_message_queue = WriteBehindQueue("chat-messages")
+
 
 @dataclass
 class ChatStreamConfig:
@@ -49,6 +65,19 @@ def _sse_event(data: dict) -> str:
     return f"data: {json.dumps(data)}\n\n"
 
 
+def _persist_message(supabase: Any, row: dict[str, Any]) -> None:
+    """Queue a messages insert on the messages write-behind queue (never blocks the stream)."""
+    _message_queue.submit(
+        lambda: supabase.table("messages").insert(row).execute(),
+        "messages",
+    )
+
+
+def flush_chat_messages(timeout: float = 5.0) -> bool:
+    """Wait for queued chat messages to be written. Returns False on timeout."""
+    return _message_queue.flush(timeout)
+
+
 def _template_summarize(messages: list[dict]) -> tuple[str, int, int]:
     """Template-based summary of older messages — no LLM call.
 
@@ -130,6 +159,7 @@ async def generate_chat_stream(
     timer = RoutingTimer()
     compressed_token_count: int | None = None
     original_token_count: int | None = None
+    prefetch = None
 
     try:
         # Send conversation ID immediately so client can track
@@ -142,12 +172,12 @@ async def generate_chat_stream(
                 config.message, config.page_context, config.project_id,
             )
             if fast:
-                # Persist user message
-                supabase.table("messages").insert({
+                # Persist user message (write-behind, off the event loop)
+                _persist_message(supabase, {
                     "conversation_id": cid,
                     "role": "user",
                     "content": config.message,
-                }).execute()
+                })
 
                 if fast.tool_calls:
                     for tc in fast.tool_calls:
@@ -178,17 +208,17 @@ async def generate_chat_stream(
                         "result": {"cards": fast.cards},
                     })
 
-                supabase.table("messages").insert({
+                _persist_message(supabase, {
                     "conversation_id": cid,
                     "role": "assistant",
                     "content": fast.text,
                     "metadata": {"fast_path": True},
-                }).execute()
+                })
 
                 yield _sse_event({"type": "done"})
 
-                # Log fast path routing (async, non-blocking)
-                asyncio.ensure_future(log_chat_routing(
+                # Log fast path routing (write-behind, non-blocking)
+                log_chat_routing(
                     supabase=supabase,
                     project_id=str(config.project_id),
                     conversation_id=cid,
@@ -198,10 +228,24 @@ async def generate_chat_stream(
                     classifier_source="regex",
                     intent_type="fast_path",
                     latency_ms=timer.latency_ms,
-                ))
+                )
                 return
 
             # ── Normal path: classify → assemble → LLM ───────────
+            # Start context loading speculatively on the regex prediction
+            # so it overlaps the (up to 500ms) Haiku classification
+            prefetch = start_context_prefetch(
+                project_id=config.project_id,
+                message=config.message,
+                page_context=config.page_context,
+                focused_entity=config.focused_entity,
+                supabase=supabase,
+                conversation_id=config.conversation_id,
+                predicted_intent=classify_intent(
+                    config.message, config.page_context,
+                ),
+            )
+
             # Hybrid classification: regex first, Haiku for ambiguous
             intent = await classify_intent_async(
                 config.message, config.page_context,
@@ -268,30 +312,22 @@ async def generate_chat_stream(
                 {"role": "user", "content": user_content}
             ]
 
-            # ── Parallel context assembly ─────────────────────────
-            async def _persist_user_msg():
-                user_msg_data = {
-                    "conversation_id": str(config.conversation_id),
-                    "role": "user",
-                    "content": config.message,
-                }
-                return (
-                    supabase.table("messages")
-                    .insert(user_msg_data)
-                    .execute()
-                )
-
-            chat_ctx, _user_msg_resp = await asyncio.gather(
-                assemble_chat_context(
-                    project_id=config.project_id,
-                    message=config.message,
-                    page_context=config.page_context,
-                    focused_entity=config.focused_entity,
-                    supabase=supabase,
-                    conversation_id=config.conversation_id,
-                    intent=intent,
-                ),
-                _persist_user_msg(),
+            # ── Context assembly (user message persists write-behind) ──
+            _persist_message(supabase, {
+                "conversation_id": str(config.conversation_id),
+                "role": "user",
+                "content": config.message,
+            })
+
+            chat_ctx = await assemble_chat_context(
+                project_id=config.project_id,
+                message=config.message,
+                page_context=config.page_context,
+                focused_entity=config.focused_entity,
+                supabase=supabase,
+                conversation_id=config.conversation_id,
+                intent=intent,
+                prefetch=prefetch,
             )
 
             if chat_ctx.awareness:
@@ -329,22 +365,10 @@ async def generate_chat_stream(
                     forge_state=chat_ctx.forge_state,
                     next_actions=chat_ctx.next_actions,
                 )
-                system_blocks = [
-                    {
-                        "type": "text",
-                        "text": compiled.cached_block,
-                        "cache_control": {"type": "ephemeral"},
-                    },
-                    {
-                        "type": "text",
-                        "text": compiled.awareness_block,
-                        "cache_control": {"type": "ephemeral"},
-                    },
-                    {
-                        "type": "text",
-                        "text": compiled.dynamic_block,
-                    },
-                ]
+                # One breakpoint goes on the tools (below)
+                system_blocks = assemble_system(
+                    compiled.segments, name="chat", max_breakpoints=2,
+                )
                 logger.info(
                     "Compiler: frame=%s, intent=%s, "
                     "strategy=%s, page=%s, history=%d",
@@ -371,6 +395,7 @@ async def generate_chat_stream(
             total_input = 0
             total_output = 0
             total_cache_read = 0
+            total_cache_create = 0
 
             # Build filtered tool set once
             chat_tools = get_tools_for_context(config.page_context)
@@ -395,6 +420,9 @@ async def generate_chat_stream(
                 max_tokens = max(max_tokens, 2500)
                 has_thinking = True
 
+            # Tool calls share memoized reads across the loop's iterations
+            tool_executor = ToolExecutor(config.project_id)
+
             # Tool use loop
             for turn in range(MAX_TOOL_TURNS):
                 stream_kwargs: dict[str, Any] = {
@@ -438,6 +466,7 @@ async def generate_chat_stream(
                             final_message.usage,
                             "cache_creation_input_tokens", 0,
                         )
+                        total_cache_create += cache_create
                         if cache_read or cache_create:
                             logger.info(
                                 "Cache: read=%d, created=%d (turn %d)",
@@ -463,12 +492,10 @@ async def generate_chat_stream(
                             },
                         })
 
-                    # Execute tools in parallel
+                    # Execute tools in parallel (capped per tool)
                     async def _exec_tool(tool_block):
-                        result = await execute_tool(
-                            project_id=config.project_id,
-                            tool_name=tool_block.name,
-                            tool_input=tool_block.input,
+                        result = await tool_executor.run(
+                            tool_block.name, tool_block.input,
                         )
                         truncated = truncate_tool_result(
                             tool_name=tool_block.name,
@@ -480,8 +507,9 @@ async def generate_chat_stream(
                         *[_exec_tool(tb) for tb in tool_use_blocks]
                     )
 
-                    # Invalidate retrieval cache on tool execution
-                    invalidate_retrieval_cache(str(config.project_id))
+                    # Invalidate retrieval cache after writes
+                    if any(tb.name in _MUTATING_TOOLS for tb in tool_use_blocks):
+                        invalidate_retrieval_cache(str(config.project_id))
 
                     tool_results = []
                     for tb, tool_result, truncated_result in exec_results:
@@ -534,23 +562,18 @@ async def generate_chat_stream(
         )):
             logger.info("Tier fallback triggered (not yet active)")
 
-        # Log LLM usage
+        # Log LLM usage (write-behind)
         if total_input or total_output:
-            try:
-                from app.core.llm_usage import log_llm_usage
-
-                log_llm_usage(
-                    model=config.chat_model,
-                    input_tokens=total_input,
-                    output_tokens=total_output,
-                    operation="chat",
-                    project_id=str(config.project_id),
-                    metadata={
-                        "conversation_id": str(config.conversation_id),
-                    },
-                )
-            except Exception:
-                pass
+            log_llm_usage(
+                workflow="chat",
+                model=config.chat_model,
+                provider="anthropic",
+                tokens_input=total_input,
+                tokens_output=total_output,
+                tokens_cache_read=total_cache_read,
+                tokens_cache_create=total_cache_create,
+                project_id=config.project_id,
+            )
 
         # Persist assistant message
         if assistant_content or tool_calls_data:
@@ -567,19 +590,20 @@ async def generate_chat_stream(
             if tool_calls_data:
                 assistant_msg_data["tool_calls"] = tool_calls_data
 
-            supabase.table("messages").insert(
-                assistant_msg_data
-            ).execute()
+            _persist_message(supabase, assistant_msg_data)
 
         yield _sse_event({"type": "done"})
 
-        # ── Async routing log (fire-and-forget) ───────────────────
+        # ── Routing log (write-behind, fire-and-forget) ───────────
         tier = compute_tier(
             intent.retrieval_strategy,
             has_thinking=has_thinking,
         )
-        cost = estimate_cost(total_input, total_output, total_cache_read)
-        asyncio.ensure_future(log_chat_routing(
+        # input_tokens excludes cache reads; estimate_cost wants the total
+        cost = estimate_cost(
+            total_input + total_cache_read, total_output, total_cache_read,
+        )
+        log_chat_routing(
             supabase=supabase,
             project_id=str(config.project_id),
             conversation_id=cid,
@@ -595,8 +619,12 @@ async def generate_chat_stream(
             estimated_cost=cost,
             compressed_token_count=compressed_token_count,
             original_token_count=original_token_count,
-        ))
+        )
 
     except Exception as e:
         logger.error(f"Error in chat stream: {e}", exc_info=True)
         yield _sse_event({"type": "error", "message": str(e)})
+    finally:
+        # Client disconnects / errors before the join leave loads in flight
+        if prefetch is not None:
+            prefetch.cancel()
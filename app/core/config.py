@@ -200,6 +200,20 @@ class Settings(BaseSettings):
     DISCOVERY_SCRAPE_TIMEOUT: int = Field(
         default=30, description="Timeout for scrape requests in discovery"
     )
+    DISCOVERY_PHASE_TIMEOUT_SECONDS: int = Field(
+        default=120, description="Timeout per discovery intelligence phase (company, market, ...)"
+    )
+    DISCOVERY_PHASE_CONCURRENCY: int = Field(
+        default=4, description="Max discovery intelligence phases running at once"
+    )
+
+    # Document vision analysis
+    VISION_MAX_CONCURRENCY: int = Field(
+        default=4, description="Max concurrent vision calls per document"
+    )
+    VISION_MAX_IMAGE_EDGE: int = Field(
+        default=1568, description="Images are downscaled to this longest edge (px) before upload"
+    )
 
     # Prototype Refinement configuration
     PROTOTYPE_PROMPT_MODEL: str = Field(
@@ -243,6 +257,13 @@ class Settings(BaseSettings):
         default="core,research,consultant",
         description="Active dimension packs (comma-separated)",
     )
+    CALL_ANALYSIS_WINDOW_SECONDS: int = Field(
+        default=900,
+        description="Transcript window per call analysis request (longer calls are split)",
+    )
+    CALL_ANALYSIS_CONCURRENCY: int = Field(
+        default=4, description="Max concurrent call analysis requests per recording"
+    )
 
     # Recall.ai (meeting recording)
     RECALL_API_KEY: str | None = Field(default=None, description="Recall.ai API key")
@@ -271,6 +292,21 @@ class Settings(BaseSettings):
     SANITIZED_SOURCE_RETENTION_DAYS: int = Field(
         default=90, description="Days to retain sanitized signal text"
     )
+    CHANGE_EVENT_RETENTION_DAYS: int = Field(
+        default=90, description="Days to retain change feed events (0 = keep forever)"
+    )
+    SWEEP_BATCH_SIZE: int = Field(
+        default=500, description="Rows per archival/retention sweep batch"
+    )
+    SWEEP_BATCH_PAUSE_MS: int = Field(
+        default=200, description="Pause between sweep batches (throttles write load)"
+    )
+    SWEEP_MAX_ROWS_PER_RUN: int = Field(
+        default=20000, description="Max rows one sweep changes per run and project (0 = no cap)"
+    )
+    REVISION_CHECKPOINT_INTERVAL: int = Field(
+        default=10, description="Store a full revision snapshot every N revisions (deltas between)"
+    )
     CONSENT_OPT_OUT_WINDOW_HOURS: int = Field(
         default=1, description="Hours before meeting to allow opt-out"
     )
@@ -332,6 +368,40 @@ class Settings(BaseSettings):
     CHAT_MAX_SUMMARY_TOKENS: int = Field(
         default=2000, description="Max tokens for conversation summary"
     )
+    INTENT_ROUTER_MODEL_PATH: str | None = Field(
+        default=None,
+        description="Pin a local intent router artifact (default: newest in app/context/artifacts)",
+    )
+
+    # Workload executor pools (app/core/executors.py)
+    EXECUTOR_INTERACTIVE_WORKERS: int = Field(
+        default=24, description="Threads for request-path reads (workspace pages, project data)"
+    )
+    EXECUTOR_BACKGROUND_WORKERS: int = Field(
+        default=12, description="Threads for recompute (briefing engines, state snapshots)"
+    )
+    EXECUTOR_LLM_WORKERS: int = Field(
+        default=16, description="Threads for blocking LLM / embedding / rerank SDK calls"
+    )
+    EXECUTOR_CPU_WORKERS: int = Field(
+        default=0, description="Threads for CPU-bound parsing (0 = one per CPU)"
+    )
+
+    # HTTP response caching (app/core/http_cache.py)
+    HTTP_GZIP_MINIMUM_SIZE: int = Field(
+        default=1024, description="Compress JSON responses at least this many bytes"
+    )
+    HTTP_GZIP_LEVEL: int = Field(default=6, description="gzip compression level (1-9)")
+    HTTP_ETAG_MAX_STALENESS_SECONDS: int = Field(
+        default=300,
+        description="Version ETags also roll over this often, bounding staleness from "
+        "inputs without write-version triggers",
+    )
+
+    # Background scheduler (app/services/scheduler.py)
+    SCHEDULER_ENABLED: bool = Field(
+        default=True, description="Run recurring jobs (reminders, retention) in this process"
+    )
 
 
 @lru_cache
@@ -65,6 +65,9 @@ _CORE_ENTITY_TYPES = {"feature", "persona", "workflow", "stakeholder", "business
 def categorize_beliefs(project_id: UUID) -> dict[str, list[dict]]:
     """Categorize all active beliefs into North Star categories.
 
+    Raises if the beliefs can't be loaded, rather than reporting every
+    category empty.
+
     Returns: {category_value: [belief_dicts]}
     """
     from app.db.supabase_client import get_supabase
@@ -72,24 +75,20 @@ def categorize_beliefs(project_id: UUID) -> dict[str, list[dict]]:
     supabase = get_supabase()
     pid = str(project_id)
 
-    try:
-        result = (
-            supabase.table("memory_nodes")
-            .select(
-                "id, content, summary, confidence, belief_domain, "
-                "linked_entity_type, linked_entity_id, "
-                "evidence_for_count, evidence_against_count"
-            )
-            .eq("project_id", pid)
-            .eq("node_type", "belief")
-            .eq("is_active", True)
-            .order("confidence", desc=True)
-            .limit(200)
-            .execute()
+    result = (
+        supabase.table("memory_nodes")
+        .select(
+            "id, content, summary, confidence, belief_domain, "
+            "linked_entity_type, linked_entity_id, "
+            "evidence_for_count, evidence_against_count"
         )
-    except Exception as e:
-        logger.warning(f"Failed to load beliefs for categorization: {e}")
-        return {cat.value: [] for cat in NorthStarCategory}
+        .eq("project_id", pid)
+        .eq("node_type", "belief")
+        .eq("is_active", True)
+        .order("confidence", desc=True)
+        .limit(200)
+        .execute()
+    )
 
     beliefs = result.data or []
 
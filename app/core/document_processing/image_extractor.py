@@ -1,14 +1,13 @@
 """Image document extractor using Claude Vision.
 
 Extracts content from images (screenshots, wireframes, diagrams)
-using Claude's vision capabilities for understanding.
+using Claude's vision capabilities for understanding. Calls go through
+the shared vision pipeline (vision.py): async, downscaled, and cached per
+project by image hash.
 """
 
-import base64
 from typing import Any
 
-from anthropic import Anthropic
-
 from app.core.config import get_settings
 from app.core.document_processing.base import (
     SIZE_LIMITS,
@@ -19,6 +18,7 @@ from app.core.document_processing.base import (
     ExtractionResult,
     ExtractorRegistry,
 )
+from app.core.document_processing.vision import VISION_MODEL, analyze_images
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -103,7 +103,8 @@ class ImageExtractor(BaseExtractor):
             filename: Original filename
             mime_type: MIME type of image
             custom_prompt: Optional custom analysis prompt
-            **kwargs: Additional options
+            **kwargs: Additional options (project_id enables the
+                per-project vision cache)
 
         Returns:
             ExtractionResult with extracted content
@@ -138,39 +139,20 @@ class ImageExtractor(BaseExtractor):
             )
 
         try:
-            # Encode image to base64
-            image_data = base64.standard_b64encode(file_bytes).decode("utf-8")
-
-            # Use Claude for vision analysis
-            client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-
             prompt = custom_prompt or VISION_ANALYSIS_PROMPT
 
-            response = client.messages.create(
-                model="claude-haiku-4-5-20251001",  # Fast and cheap for vision
+            # An uploaded image is never treated as decorative
+            batch = await analyze_images(
+                [file_bytes],
+                prompt,
+                project_id=kwargs.get("project_id"),
                 max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": mime_type,
-                                    "data": image_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt,
-                            },
-                        ],
-                    }
-                ],
+                skip_decorative=False,
             )
+            if batch.errors:
+                raise RuntimeError(batch.errors[0])
 
-            analysis_text = response.content[0].text if response.content else ""
+            analysis_text = batch.analyses[0] or ""
 
             if not analysis_text:
                 raise ExtractionError(
@@ -201,7 +183,8 @@ class ImageExtractor(BaseExtractor):
                     "filename": filename,
                     "mime_type": mime_type,
                     "file_size": len(file_bytes),
-                    "model_used": "claude-haiku-4-5-20251001",
+                    "model_used": VISION_MODEL,
+                    "vision_cached": batch.cache_hits > 0,
                 },
                 warnings=[],
             )
@@ -4,7 +4,6 @@ Uses python-pptx for native text extraction from slides, tables, and speaker not
 Falls back to Claude Vision (Haiku) for slides that are primarily images.
 """
 
-import base64
 import io
 from typing import Any
 
@@ -247,7 +246,7 @@ class PPTXExtractor(BaseExtractor):
             # Process image-heavy slides with vision
             if image_slide_queue:
                 vision_sections, vision_words, vision_calls = await self._process_image_slides(
-                    image_slide_queue
+                    image_slide_queue, project_id=kwargs.get("project_id")
                 )
                 sections.extend(vision_sections)
                 total_words += vision_words
@@ -309,113 +308,122 @@ class PPTXExtractor(BaseExtractor):
     async def _process_image_slides(
         self,
         slide_queue: list[dict],
+        project_id: Any = None,
     ) -> tuple[list[ExtractedSection], int, int]:
         """Process image-heavy slides with Claude Vision.
 
-        Batches up to MAX_IMAGES_PER_CALL images per API call.
+        Decorative images (tiny, banner-shaped, blank) and images already
+        sent for an earlier slide (a logo or template background on every
+        slide) are dropped first; slides left with no images are skipped.
+        Each remaining slide is one call of up to MAX_IMAGES_PER_CALL
+        downscaled images, with at most VISION_MAX_CONCURRENCY in flight.
 
         Returns:
             Tuple of (sections, total_words, vision_calls)
         """
-        from anthropic import Anthropic
+        import asyncio
 
         from app.core.config import get_settings
-        from app.core.llm_usage import log_llm_usage
+        from app.core.document_processing.vision import (
+            VISION_MODEL,
+            create_vision_message,
+            decorative_reason,
+            find_duplicate,
+            find_repeated_asset,
+            fingerprint_image,
+            get_vision_client,
+            image_content_block,
+        )
 
         settings = get_settings()
         if not settings.ANTHROPIC_API_KEY:
             logger.warning("No ANTHROPIC_API_KEY, skipping vision analysis for image slides")
             return [], 0, 0
 
-        client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        model = "claude-haiku-4-5-20251001"
-        sections: list[ExtractedSection] = []
-        total_words = 0
-        vision_calls = 0
+        def select_images() -> list[tuple[dict, list[bytes]]]:
+            seen = []
+            selected = []
+            for slide_info in slide_queue:
+                images = []
+                for img_bytes in slide_info["images"]:
+                    fp = fingerprint_image(img_bytes)
+                    if (
+                        decorative_reason(fp)
+                        or find_duplicate(fp, seen) is not None
+                        or find_repeated_asset(fp, seen) is not None
+                    ):
+                        continue
+                    seen.append((len(seen), fp))
+                    images.append(img_bytes)
+                if images:
+                    selected.append((slide_info, images[:MAX_IMAGES_PER_CALL]))
+            return selected
+
+        selected = await asyncio.to_thread(select_images)
+        if len(selected) < len(slide_queue):
+            logger.info(
+                f"Skipped {len(slide_queue) - len(selected)} image slides "
+                "with only decorative or repeated images"
+            )
+        if len(selected) > MAX_VISION_CALLS:
+            logger.warning("Hit max vision calls limit, skipping remaining image slides")
+            selected = selected[:MAX_VISION_CALLS]
 
-        for slide_info in slide_queue:
-            if vision_calls >= MAX_VISION_CALLS:
-                logger.warning("Hit max vision calls limit, skipping remaining image slides")
-                break
+        client = get_vision_client()
+        semaphore = asyncio.Semaphore(settings.VISION_MAX_CONCURRENCY)
 
-            images = slide_info["images"][:MAX_IMAGES_PER_CALL]
+        async def analyze_slide(slide_info: dict, images: list[bytes]) -> str | None:
             slide_num = slide_info["slide_num"]
-            title = slide_info["title"]
-            section_path = slide_info["section_path"]
-
-            # Build message content with images
-            content: list[dict] = []
-            for img_bytes in images:
-                mime_type = self._detect_image_mime(img_bytes)
-                img_b64 = base64.standard_b64encode(img_bytes).decode("utf-8")
-                content.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": mime_type,
-                        "data": img_b64,
-                    },
-                })
-
-            content.append({
-                "type": "text",
-                "text": f"Slide {slide_num}: \"{title or 'Untitled'}\"\n\n{SLIDE_VISION_PROMPT}",
-            })
-
-            try:
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=2048,
-                    messages=[{"role": "user", "content": content}],
-                )
+            async with semaphore:
+                try:
+                    content: list[dict] = await asyncio.to_thread(
+                        lambda: [image_content_block(img) for img in images]
+                    )
+                    content.append({
+                        "type": "text",
+                        "text": (
+                            f"Slide {slide_num}: \"{slide_info['title'] or 'Untitled'}\""
+                            f"\n\n{SLIDE_VISION_PROMPT}"
+                        ),
+                    })
+                    return await create_vision_message(
+                        client,
+                        content,
+                        max_tokens=2048,
+                        chain="pptx_vision",
+                        project_id=project_id,
+                    )
+                except Exception as e:
+                    logger.warning(f"Vision analysis failed for slide {slide_num}: {e}")
+                    return None
 
-                vision_calls += 1
-                analysis_text = response.content[0].text if response.content else ""
-
-                # Log LLM usage
-                usage = response.usage
-                log_llm_usage(
-                    workflow="document_processing",
-                    model=model,
-                    provider="anthropic",
-                    tokens_input=usage.input_tokens,
-                    tokens_output=usage.output_tokens,
-                    chain="pptx_vision",
-                )
+        results = await asyncio.gather(
+            *(analyze_slide(slide_info, images) for slide_info, images in selected)
+        )
 
-                if analysis_text:
-                    word_count = len(analysis_text.split())
-                    total_words += word_count
-                    sections.append(
-                        ExtractedSection(
-                            section_type="image_description",
-                            content=analysis_text,
-                            section_title=title or f"Slide {slide_num} (Vision)",
-                            page_number=slide_num,
-                            section_path=section_path,
-                            metadata={"vision_analyzed": True, "model": model},
-                        )
+        sections: list[ExtractedSection] = []
+        total_words = 0
+        vision_calls = 0
+        for (slide_info, _), analysis_text in zip(selected, results, strict=True):
+            if analysis_text is None:
+                continue
+            vision_calls += 1
+            if analysis_text:
+                slide_num = slide_info["slide_num"]
+                total_words += len(analysis_text.split())
+                sections.append(
+                    ExtractedSection(
+                        section_type="image_description",
+                        content=analysis_text,
+                        section_title=slide_info["title"] or f"Slide {slide_num} (Vision)",
+                        page_number=slide_num,
+                        section_path=slide_info["section_path"],
+                        metadata={"vision_analyzed": True, "model": VISION_MODEL},
                     )
-
-            except Exception as e:
-                logger.warning(f"Vision analysis failed for slide {slide_num}: {e}")
+                )
 
         return sections, total_words, vision_calls
 
-    @staticmethod
-    def _detect_image_mime(img_bytes: bytes) -> str:
-        """Detect image MIME type from magic bytes."""
-        if img_bytes[:8] == b"\x89PNG\r\n\x1a\n":
-            return "image/png"
-        elif img_bytes[:2] == b"\xff\xd8":
-            return "image/jpeg"
-        elif img_bytes[:4] == b"RIFF" and img_bytes[8:12] == b"WEBP":
-            return "image/webp"
-        elif img_bytes[:6] in (b"GIF87a", b"GIF89a"):
-            return "image/gif"
-        # Default to PNG
-        return "image/png"
-
 
 # Register the extractor
 ExtractorRegistry.register(PPTXExtractor())
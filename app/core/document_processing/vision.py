@@ -0,0 +1,363 @@
+"""Shared vision pipeline for document images.
+
+Every image bound for a vision call goes through here:
+
+- fingerprint: SHA-256 plus a 64-bit difference hash (dHash) of a 9x8
+  grayscale thumbnail
+- skip: tiny, banner-shaped and near-blank images (decorative), and small
+  assets whose dHash matches one already seen (a logo re-encoded on every
+  slide). The dHash is too coarse to tell apart two screenshots sharing a
+  header and sidebar, so it is never used to reuse an analysis
+- dedup: byte-identical images in one batch are analyzed once, and results
+  are cached per project by SHA-256 (vision_analysis_cache), so the same
+  image in another document of the project is not analyzed again
+- downscale: longest edge capped at VISION_MAX_IMAGE_EDGE and re-encoded
+  before the base64 upload
+- calls use AsyncAnthropic with at most VISION_MAX_CONCURRENCY in flight
+
+Decoding uses PyMuPDF (already required for PDFs). Images it can't decode
+fall back to exact-hash dedup and are sent as-is.
+"""
+
+import asyncio
+import base64
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+VISION_MODEL = "claude-haiku-4-5-20251001"
+
+# Decorative image thresholds
+MIN_IMAGE_BYTES = 5 * 1024  # 5KB — icons, bullets
+MIN_IMAGE_EDGE = 64  # px
+MAX_ASPECT_RATIO = 8.0  # rules, header strips
+MIN_TONAL_SPREAD = 12  # grayscale levels; below this the image is blank
+# dHash bits that may differ for two small assets to count as repeats
+NEAR_DUPLICATE_DISTANCE = 6
+# Longest edge (px) of an image still treated as a small asset (logo, icon)
+MAX_REPEATED_ASSET_EDGE = 320
+
+
+@dataclass
+class ImageFingerprint:
+    """Identity and shape of one image."""
+
+    sha256: str
+    phash: int | None = None  # 64-bit dHash; None if the image couldn't be decoded
+    width: int = 0
+    height: int = 0
+    tonal_spread: int = 255  # max - min grayscale level of the thumbnail
+    size_bytes: int = 0
+
+    @property
+    def key(self) -> str:
+        """Cache key: exact hash, so only identical images share an analysis."""
+        return f"s{self.sha256}"
+
+    @property
+    def is_small_asset(self) -> bool:
+        return 0 < max(self.width, self.height) <= MAX_REPEATED_ASSET_EDGE
+
+
+@dataclass
+class VisionBatchResult:
+    """Analyses for a batch of images, aligned with the input list."""
+
+    analyses: list[str | None]
+    skipped: dict[int, str] = field(default_factory=dict)  # index -> reason
+    duplicate_of: dict[int, int] = field(default_factory=dict)  # index -> analyzed index
+    errors: dict[int, str] = field(default_factory=dict)
+    cache_hits: int = 0
+    vision_calls: int = 0
+
+
+def _fitz():
+    import fitz
+
+    return fitz
+
+
+def fingerprint_image(img_bytes: bytes) -> ImageFingerprint:
+    """Exact and perceptual hash of an image, plus its size."""
+    fp = ImageFingerprint(
+        sha256=hashlib.sha256(img_bytes).hexdigest(),
+        size_bytes=len(img_bytes),
+    )
+    try:
+        fitz = _fitz()
+        pix = fitz.Pixmap(img_bytes)
+        fp.width, fp.height = pix.width, pix.height
+        if pix.alpha:
+            pix = fitz.Pixmap(pix, 0)
+        gray = pix if pix.n == 1 else fitz.Pixmap(fitz.csGRAY, pix)
+        thumb = fitz.Pixmap(gray, 9, 8, None).samples
+        bits = 0
+        for row in range(8):
+            for col in range(8):
+                bits = (bits << 1) | (thumb[row * 9 + col] > thumb[row * 9 + col + 1])
+        fp.phash = bits
+        fp.tonal_spread = max(thumb) - min(thumb)
+    except Exception as e:
+        logger.debug(f"Could not decode image for fingerprinting: {e}")
+    return fp
+
+
+def decorative_reason(fp: ImageFingerprint) -> str | None:
+    """Why an image is not worth a vision call, or None if it is."""
+    if fp.size_bytes < MIN_IMAGE_BYTES:
+        return "too_small_bytes"
+    if fp.width and fp.height:
+        if min(fp.width, fp.height) < MIN_IMAGE_EDGE:
+            return "too_small_pixels"
+        if max(fp.width, fp.height) / min(fp.width, fp.height) > MAX_ASPECT_RATIO:
+            return "banner"
+    if fp.phash is not None and fp.tonal_spread < MIN_TONAL_SPREAD:
+        return "blank"
+    return None
+
+
+def is_same_image(a: ImageFingerprint, b: ImageFingerprint) -> bool:
+    """Byte-identical images — the only match that may share an analysis."""
+    return a.sha256 == b.sha256
+
+
+def is_repeated_asset(a: ImageFingerprint, b: ImageFingerprint) -> bool:
+    """Small assets (logos, icons) whose dHashes are within NEAR_DUPLICATE_DISTANCE bits."""
+    if a.phash is None or b.phash is None:
+        return False
+    if not (a.is_small_asset and b.is_small_asset):
+        return False
+    return (a.phash ^ b.phash).bit_count() <= NEAR_DUPLICATE_DISTANCE
+
+
+def find_duplicate(fp: ImageFingerprint, seen: list[tuple[int, ImageFingerprint]]) -> int | None:
+    """Index of the first seen image that is byte-identical to fp."""
+    for idx, other in seen:
+        if is_same_image(fp, other):
+            return idx
+    return None
+
+
+def find_repeated_asset(
+    fp: ImageFingerprint, seen: list[tuple[int, ImageFingerprint]]
+) -> int | None:
+    """Index of the first seen small asset that fp repeats."""
+    for idx, other in seen:
+        if is_repeated_asset(fp, other):
+            return idx
+    return None
+
+
+def detect_image_mime(img_bytes: bytes) -> str:
+    """Detect image MIME type from magic bytes."""
+    if img_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    elif img_bytes[:2] == b"\xff\xd8":
+        return "image/jpeg"
+    elif img_bytes[:4] == b"RIFF" and len(img_bytes) > 12 and img_bytes[8:12] == b"WEBP":
+        return "image/webp"
+    elif img_bytes[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return "image/png"
+
+
+def downscale_for_vision(
+    img_bytes: bytes,
+    mime_type: str | None = None,
+    max_edge: int | None = None,
+) -> tuple[bytes, str]:
+    """Shrink an image so its longest edge is at most max_edge.
+
+    The model downsamples larger images anyway, so the extra pixels only
+    cost upload time and tokens. Returns (bytes, mime_type); images already
+    small enough, or that can't be decoded, are returned unchanged.
+    """
+    mime_type = mime_type or detect_image_mime(img_bytes)
+    max_edge = max_edge or get_settings().VISION_MAX_IMAGE_EDGE
+    try:
+        fitz = _fitz()
+        pix = fitz.Pixmap(img_bytes)
+        longest = max(pix.width, pix.height)
+        if longest <= max_edge:
+            return img_bytes, mime_type
+        scale = max_edge / longest
+        if pix.alpha:
+            pix = fitz.Pixmap(pix, 0)
+        width = max(1, round(pix.width * scale))
+        height = max(1, round(pix.height * scale))
+        small = fitz.Pixmap(pix, width, height, None)
+        candidates = [(small.tobytes("png"), "image/png")]
+        if small.n >= 3:
+            candidates.append((small.tobytes("jpeg", jpg_quality=85), "image/jpeg"))
+        return min(candidates, key=lambda c: len(c[0]))
+    except Exception as e:
+        logger.debug(f"Could not downscale image: {e}")
+        return img_bytes, mime_type
+
+
+def image_content_block(img_bytes: bytes, mime_type: str | None = None) -> dict[str, Any]:
+    """Downscaled base64 image block for a Messages API request."""
+    data, media_type = downscale_for_vision(img_bytes, mime_type)
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": media_type,
+            "data": base64.standard_b64encode(data).decode("utf-8"),
+        },
+    }
+
+
+def prompt_key(prompt: str, model: str = VISION_MODEL) -> str:
+    """Short hash of model + prompt; part of every cache key."""
+    return hashlib.sha256(f"{model}\n{prompt}".encode()).hexdigest()[:16]
+
+
+def get_vision_client():
+    """AsyncAnthropic client for vision calls."""
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(api_key=get_settings().ANTHROPIC_API_KEY)
+
+
+async def create_vision_message(
+    client: Any,
+    content: list[dict[str, Any]],
+    max_tokens: int,
+    chain: str,
+    project_id: UUID | str | None = None,
+    model: str = VISION_MODEL,
+) -> str:
+    """One vision request; logs usage and returns the response text."""
+    from app.core.llm_usage import log_llm_usage
+
+    response = await client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": content}],
+    )
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        log_llm_usage(
+            workflow="document_processing",
+            model=model,
+            provider="anthropic",
+            tokens_input=usage.input_tokens,
+            tokens_output=usage.output_tokens,
+            project_id=project_id,
+            chain=chain,
+        )
+    return response.content[0].text if response.content else ""
+
+
+async def analyze_images(
+    images: list[bytes],
+    prompt: str,
+    project_id: UUID | None = None,
+    max_tokens: int = 4096,
+    chain: str = "image_vision",
+    skip_decorative: bool = True,
+    client: Any = None,
+) -> VisionBatchResult:
+    """Analyze images with one vision call per distinct, non-decorative image.
+
+    Args:
+        images: Raw image bytes
+        prompt: Analysis prompt (sent after each image)
+        project_id: Enables the per-project result cache
+        max_tokens: Max output tokens per call
+        chain: Usage log label
+        skip_decorative: Skip tiny/banner/blank images and repeated small assets
+        client: AsyncAnthropic client (created if omitted)
+
+    Returns:
+        VisionBatchResult; analyses[i] is None for skipped or failed images
+    """
+    from app.db.document_extracted_images import (
+        get_cached_vision_analyses,
+        save_vision_analyses,
+    )
+
+    result = VisionBatchResult(analyses=[None] * len(images))
+    if not images:
+        return result
+
+    fingerprints = await asyncio.to_thread(lambda: [fingerprint_image(b) for b in images])
+
+    # Pick one representative per distinct image
+    representatives: list[tuple[int, ImageFingerprint]] = []
+    for i, fp in enumerate(fingerprints):
+        reason = decorative_reason(fp) if skip_decorative else None
+        if reason:
+            result.skipped[i] = reason
+            continue
+        dup = find_duplicate(fp, representatives)
+        if dup is not None:
+            result.duplicate_of[i] = dup
+        elif skip_decorative and find_repeated_asset(fp, representatives) is not None:
+            result.skipped[i] = "repeated_asset"
+        else:
+            representatives.append((i, fp))
+
+    pkey = prompt_key(prompt)
+    cached: dict[str, str] = {}
+    if project_id and representatives:
+        cached = await asyncio.to_thread(
+            get_cached_vision_analyses,
+            project_id,
+            sorted({fp.key for _, fp in representatives}),
+            pkey,
+        )
+
+    todo = [(i, fp) for i, fp in representatives if fp.key not in cached]
+    for i, fp in representatives:
+        if fp.key in cached:
+            result.analyses[i] = cached[fp.key]
+            result.cache_hits += 1
+
+    if todo:
+        client = client or get_vision_client()
+        semaphore = asyncio.Semaphore(get_settings().VISION_MAX_CONCURRENCY)
+
+        async def analyze_one(i: int) -> None:
+            async with semaphore:
+                try:
+                    block = await asyncio.to_thread(image_content_block, images[i])
+                    text = await create_vision_message(
+                        client,
+                        [block, {"type": "text", "text": prompt}],
+                        max_tokens=max_tokens,
+                        chain=chain,
+                        project_id=project_id,
+                    )
+                    result.vision_calls += 1
+                    result.analyses[i] = text or None
+                except Exception as e:
+                    logger.warning(f"Vision analysis failed for image {i}: {e}")
+                    result.errors[i] = str(e)
+
+        await asyncio.gather(*(analyze_one(i) for i, _ in todo))
+
+        fresh = {
+            fp.key: result.analyses[i]
+            for i, fp in todo
+            if result.analyses[i]
+        }
+        if project_id and fresh:
+            await asyncio.to_thread(save_vision_analyses, project_id, fresh, pkey, VISION_MODEL)
+
+    for i, rep in result.duplicate_of.items():
+        result.analyses[i] = result.analyses[rep]
+
+    logger.info(
+        f"Vision batch: {len(images)} images, {len(result.skipped)} skipped, "
+        f"{len(result.duplicate_of)} duplicates, {result.cache_hits} cached, "
+        f"{result.vision_calls} calls"
+    )
+    return result
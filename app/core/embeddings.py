@@ -1,6 +1,8 @@
 """OpenAI embeddings generation with validation."""
 
 import asyncio
+import time
+from collections import OrderedDict
 
 from openai import OpenAI
 
@@ -70,8 +72,96 @@ def embed_texts(texts: list[str]) -> list[list[float]]:
 
 
 async def embed_texts_async(texts: list[str]) -> list[list[float]]:
-    """Async wrapper around embed_texts using thread pool."""
-    return await asyncio.to_thread(embed_texts, texts)
+    """Async wrapper around embed_texts using the llm executor pool."""
+    from app.core.executors import run_in_pool
+
+    return await run_in_pool("llm", embed_texts, texts)
+
+
+# ── Query embedding cache ─────────────────────────────────────────
+# One chat turn embeds the same query for intent routing and for each
+# retrieval search (chunks, entities, memory). Query-sized texts are cached
+# briefly and concurrent requests for the same text share one API call.
+_QUERY_CACHE_TTL = 300  # seconds
+_QUERY_CACHE_MAX = 256
+_QUERY_MAX_CHARS = 2000
+_query_cache: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+_query_inflight: dict[tuple[int, str], asyncio.Future] = {}
+
+
+def _cached_query(text: str) -> list[float] | None:
+    entry = _query_cache.get(text)
+    if entry is None:
+        return None
+    ts, embedding = entry
+    if time.time() - ts > _QUERY_CACHE_TTL:
+        _query_cache.pop(text, None)
+        return None
+    _query_cache.move_to_end(text)
+    return embedding
+
+
+def _store_query(text: str, embedding: list[float]) -> None:
+    _query_cache[text] = (time.time(), embedding)
+    _query_cache.move_to_end(text)
+    while len(_query_cache) > _QUERY_CACHE_MAX:
+        _query_cache.popitem(last=False)
+
+
+def clear_query_embedding_cache() -> None:
+    """Drop all cached query embeddings."""
+    _query_cache.clear()
+
+
+async def embed_queries_async(queries: list[str]) -> list[list[float]]:
+    """Embed search queries, reusing recent and in-flight embeddings.
+
+    Use for short query texts (chat messages, retrieval sub-queries). Texts
+    longer than a query go straight to embed_texts_async uncached.
+    """
+    if not queries:
+        return []
+    if any(len(q) > _QUERY_MAX_CHARS for q in queries):
+        return await embed_texts_async(queries)
+
+    loop = asyncio.get_running_loop()
+    found: dict[str, list[float]] = {}
+    waiting: dict[str, asyncio.Future] = {}
+    misses: list[str] = []
+    for q in dict.fromkeys(queries):
+        cached = _cached_query(q)
+        if cached is not None:
+            found[q] = cached
+        elif (fut := _query_inflight.get((id(loop), q))) is not None:
+            waiting[q] = fut
+        else:
+            misses.append(q)
+
+    if misses:
+        futures = {q: loop.create_future() for q in misses}
+        for q, fut in futures.items():
+            _query_inflight[(id(loop), q)] = fut
+        try:
+            embeddings = await embed_texts_async(misses)
+        except BaseException as e:
+            for fut in futures.values():
+                if isinstance(e, asyncio.CancelledError):
+                    fut.cancel()
+                else:
+                    fut.set_exception(e)
+                    fut.exception()  # mark retrieved — waiters re-raise it
+            raise
+        finally:
+            for q in misses:
+                _query_inflight.pop((id(loop), q), None)
+        for q, embedding in zip(misses, embeddings, strict=True):
+            _store_query(q, embedding)
+            futures[q].set_result(embedding)
+            found[q] = embedding
+
+    for q, fut in waiting.items():
+        found[q] = await asyncio.shield(fut)
+    return [found[q] for q in queries]
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -2,7 +2,8 @@
 Entity Versioning Service.
 
 Provides comprehensive version tracking for all entity types:
-- Full version history with snapshots
+- Version history (lightweight listing; snapshots rebuilt on demand from
+  checkpoint + delta, see migration 0207)
 - Field-level diffs between any two versions
 - Source attribution (which signals contributed to which fields)
 - Version comparison and restoration
@@ -33,6 +34,7 @@ from typing import Any
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.db.revisions_enrichment import REVISION_LIST_COLUMNS, attach_revision_snapshots
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
@@ -135,8 +137,8 @@ class Version:
             entity_type=revision.get("entity_type", ""),
             entity_id=revision.get("entity_id", ""),
             entity_label=revision.get("entity_label", ""),
-            snapshot=revision.get("snapshot", {}),
-            changes=revision.get("changes", {}),
+            snapshot=revision.get("snapshot") or {},
+            changes=revision.get("changes") or {},
             diff_summary=revision.get("diff_summary") or revision.get("context_summary", ""),
             revision_type=revision.get("revision_type", ""),
             trigger_event=revision.get("trigger_event"),
@@ -208,12 +210,13 @@ class EntityVersioning:
             limit: Maximum versions to return
 
         Returns:
-            List of Version objects, newest first
+            List of Version objects, newest first. Snapshots are not loaded
+            (empty); use get_version() for a version's full body.
         """
         try:
             response = (
                 self.supabase.table("enrichment_revisions")
-                .select("*")
+                .select(REVISION_LIST_COLUMNS)
                 .eq("entity_type", entity_type)
                 .eq("entity_id", str(entity_id))
                 .order("created_at", desc=True)
@@ -251,12 +254,13 @@ class EntityVersioning:
                 .eq("entity_type", entity_type)
                 .eq("entity_id", str(entity_id))
                 .eq("revision_number", version_number)
-                .maybe_single()
+                .order("created_at", desc=True)
+                .limit(1)
                 .execute()
             )
 
             if response.data:
-                return Version.from_revision(response.data)
+                return Version.from_revision(attach_revision_snapshots(response.data)[0])
             return None
 
         except Exception as e:
@@ -278,8 +282,24 @@ class EntityVersioning:
         Returns:
             Latest Version object or None if no versions
         """
-        history = self.get_history(entity_type, entity_id, limit=1)
-        return history[0] if history else None
+        try:
+            response = (
+                self.supabase.table("enrichment_revisions")
+                .select("*")
+                .eq("entity_type", entity_type)
+                .eq("entity_id", str(entity_id))
+                .order("created_at", desc=True)
+                .limit(1)
+                .execute()
+            )
+
+            if response.data:
+                return Version.from_revision(attach_revision_snapshots(response.data)[0])
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to get latest version for {entity_type} {entity_id}: {e}")
+            return None
 
     def get_version_count(
         self,
@@ -332,62 +352,71 @@ class EntityVersioning:
         Returns:
             Version ID (revision UUID) or None if failed
         """
-        try:
-            # Determine label
-            if not entity_label:
-                entity_label = (
-                    entity_data.get("name")
-                    or entity_data.get("slug")
-                    or entity_data.get("title")
-                    or str(entity_id)
-                )
-
-            # Get next version number
-            latest = self.get_latest_version(entity_type, entity_id)
-            next_version = (latest.version_number + 1) if latest else 1
-
-            # Get project_id from entity data
-            project_id = entity_data.get("project_id", "")
-
-            # Determine revision type
-            revision_type = "created" if next_version == 1 else "updated"
-
-            # Create revision record
-            data = {
-                "project_id": str(project_id),
-                "entity_type": entity_type,
-                "entity_id": str(entity_id),
-                "entity_label": str(entity_label),
-                "revision_type": revision_type,
-                "revision_number": next_version,
-                "trigger_event": trigger_event,
-                "snapshot": entity_data,
-                "changes": changes or {},
-                "diff_summary": diff_summary or f"Version {next_version}",
-                "context_summary": diff_summary or f"Version {next_version}",
-                "source_signal_id": str(source_signal_id) if source_signal_id else None,
-                "created_by": created_by,
-            }
-
-            response = self.supabase.table("enrichment_revisions").insert(data).execute()
+        return self.create_snapshots([{
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "entity_data": entity_data,
+            "entity_label": entity_label,
+            "trigger_event": trigger_event,
+            "source_signal_id": source_signal_id,
+            "created_by": created_by,
+            "changes": changes,
+            "diff_summary": diff_summary,
+        }])[0]
+
+    def create_snapshots(self, snapshots: list[dict[str, Any]]) -> list[str | None]:
+        """
+        Create version snapshots for many entities in one call.
 
-            if response.data:
-                version_id = response.data[0]["id"]
-                logger.info(
-                    f"Created version {next_version} for {entity_type} {entity_label}",
-                    extra={
-                        "entity_type": entity_type,
-                        "entity_id": str(entity_id),
-                        "version_number": next_version,
-                    },
-                )
-                return version_id
+        Each dict takes the create_snapshot() arguments. Version numbers are
+        allocated atomically by the database (insert_enrichment_revisions),
+        so concurrent writers never reuse a number.
 
-            return None
+        Returns:
+            Version IDs in input order (all None if the write failed)
+        """
+        from app.db.revisions_enrichment import insert_enrichment_revisions
+
+        rows = []
+        for snap in snapshots:
+            entity_data = snap["entity_data"]
+            entity_label = (
+                snap.get("entity_label")
+                or entity_data.get("name")
+                or entity_data.get("slug")
+                or entity_data.get("title")
+                or str(snap["entity_id"])
+            )
+            rows.append({
+                "project_id": str(entity_data.get("project_id", "")),
+                "entity_type": snap["entity_type"],
+                "entity_id": str(snap["entity_id"]),
+                "entity_label": str(entity_label),
+                "trigger_event": snap.get("trigger_event", "manual_snapshot"),
+                "snapshot": entity_data,
+                "changes": snap.get("changes") or {},
+                "diff_summary": snap.get("diff_summary"),
+                "source_signal_id": snap.get("source_signal_id"),
+                "created_by": snap.get("created_by", "system"),
+            })
 
+        try:
+            created = insert_enrichment_revisions(rows)
         except Exception as e:
-            logger.error(f"Failed to create snapshot for {entity_type} {entity_id}: {e}")
-            return None
+            logger.error(f"Failed to create {len(rows)} snapshots: {e}")
+            return [None] * len(rows)
+
+        for revision in created:
+            logger.info(
+                f"Created version {revision['revision_number']} for "
+                f"{revision['entity_type']} {revision['entity_label']}",
+                extra={
+                    "entity_type": revision["entity_type"],
+                    "entity_id": str(revision["entity_id"]),
+                    "version_number": revision["revision_number"],
+                },
+            )
+        return [revision["id"] for revision in created]
 
     # =========================================================================
     # Version Comparison
@@ -587,30 +616,9 @@ class EntityVersioning:
         Returns:
             True if recorded successfully
         """
-        try:
-            # Get current version if not specified
-            if version_number is None:
-                latest = self.get_latest_version(entity_type, entity_id)
-                version_number = latest.version_number if latest else 1
-
-            data = {
-                "entity_type": entity_type,
-                "entity_id": str(entity_id),
-                "field_path": field_path,
-                "signal_id": str(signal_id),
-                "version_number": version_number,
-            }
-
-            self.supabase.table("field_attributions").insert(data).execute()
-
-            logger.debug(
-                f"Recorded attribution: {entity_type}/{entity_id}.{field_path} <- signal {signal_id}"
-            )
-            return True
-
-        except Exception as e:
-            logger.warning(f"Failed to record field attribution: {e}")
-            return False
+        return self.record_bulk_attributions(
+            entity_type, entity_id, {field_path: signal_id}, version_number
+        ) == 1
 
     def record_bulk_attributions(
         self,
@@ -620,24 +628,46 @@ class EntityVersioning:
         version_number: int | None = None,
     ) -> int:
         """
-        Record multiple field attributions at once.
+        Record multiple field attributions at once (one insert).
 
         Args:
             entity_type: Type of entity
             entity_id: Entity UUID
             field_signal_map: Dict of field_path -> signal_id
             version_number: Version where these attributions apply
+                (default: the entity's latest version, looked up once)
 
         Returns:
             Number of attributions recorded
         """
-        count = 0
-        for field_path, signal_id in field_signal_map.items():
-            if self.record_field_attribution(
-                entity_type, entity_id, field_path, signal_id, version_number
-            ):
-                count += 1
-        return count
+        if not field_signal_map:
+            return 0
+        try:
+            if version_number is None:
+                latest = self.get_latest_version(entity_type, entity_id)
+                version_number = latest.version_number if latest else 1
+
+            rows = [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": str(entity_id),
+                    "field_path": field_path,
+                    "signal_id": str(signal_id),
+                    "version_number": version_number,
+                }
+                for field_path, signal_id in field_signal_map.items()
+            ]
+            self.supabase.table("field_attributions").insert(rows).execute()
+
+            logger.debug(
+                f"Recorded {len(rows)} attributions for {entity_type}/{entity_id} "
+                f"(version {version_number})"
+            )
+            return len(rows)
+
+        except Exception as e:
+            logger.warning(f"Failed to record field attributions: {e}")
+            return 0
 
     def get_field_sources(
         self,
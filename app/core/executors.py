@@ -0,0 +1,197 @@
+"""Named, bounded thread pools per workload class.
+
+Sync work (Supabase calls, blocking SDK calls, parsing) used to run through
+``asyncio.to_thread``, i.e. the event loop's one default executor. A single
+dashboard load fans out 10-20 threads there, so one heavy page starves auth,
+chat context loads and health checks served by the same worker. Heavy
+fan-outs now run in their own pools instead:
+
+    interactive  request-path reads (workspace pages, project data loads)
+    background   recompute (briefing engines, state snapshot rebuilds)
+    llm          blocking LLM / embedding / rerank SDK calls
+    cpu          parsing and other CPU-bound work
+
+Each pool tracks queue depth and queue wait time (``pool_stats()``).
+Callers with optional work ask ``admit(pool)`` first and skip it when the
+pool is saturated (more tasks waiting than the pool has workers).
+
+Code already running inside a pool worker must not block on that same pool
+(deadlock under load) — ``WorkloadPool.run_all`` runs inline in that case.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic
+from typing import Any, TypeVar
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+POOL_NAMES = ("interactive", "background", "llm", "cpu")
+_WAIT_SAMPLES = 512
+_SLOW_WAIT_S = 1.0
+
+
+class WorkloadPool:
+    """A bounded ThreadPoolExecutor with queue metrics and admission control."""
+
+    def __init__(self, name: str, max_workers: int, saturation_depth: int | None = None):
+        self.name = name
+        self.max_workers = max_workers
+        # Saturated once this many tasks are waiting for a worker
+        self.saturation_depth = saturation_depth or max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"pool-{name}",
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._shed = 0
+        self._waits: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+    @property
+    def queued(self) -> int:
+        """Tasks submitted but not yet started."""
+        return self._queued
+
+    @property
+    def saturated(self) -> bool:
+        return self._queued >= self.saturation_depth
+
+    def admit(self) -> bool:
+        """Whether optional work should run now. Counts a shed when not."""
+        if not self.saturated:
+            return True
+        with self._lock:
+            self._shed += 1
+        return False
+
+    def in_worker(self) -> bool:
+        """True when called from one of this pool's threads."""
+        return threading.current_thread().name.startswith(f"pool-{self.name}_")
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future:
+        """Submit a call, carrying over the caller's contextvars (like to_thread)."""
+        ctx = contextvars.copy_context()
+        enqueued = monotonic()
+        with self._lock:
+            self._queued += 1
+
+        def _run() -> T:
+            wait = monotonic() - enqueued
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._waits.append(wait)
+            if wait > _SLOW_WAIT_S:
+                logger.warning(f"Pool '{self.name}' task waited {wait:.2f}s for a worker")
+            try:
+                return ctx.run(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        try:
+            return self._executor.submit(_run)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await a blocking call on this pool (drop-in for asyncio.to_thread)."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def run_all(self, *calls: Callable[[], Any]) -> list[Any]:
+        """Run zero-arg calls in parallel from sync code; results in order.
+
+        Runs them sequentially when already on one of this pool's threads.
+        """
+        if self.in_worker():
+            return [call() for call in calls]
+        futures = [self.submit(call) for call in calls]
+        return [f.result() for f in futures]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            stats = {
+                "workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "shed": self._shed,
+                "saturated": self._queued >= self.saturation_depth,
+            }
+        for label, q in (("p50", 0.5), ("p95", 0.95)):
+            stats[f"wait_ms_{label}"] = (
+                round(waits[min(len(waits) - 1, int(len(waits) * q))] * 1000, 1) if waits else 0.0
+            )
+        stats["wait_ms_max"] = round(waits[-1] * 1000, 1) if waits else 0.0
+        return stats
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_pools: dict[str, WorkloadPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_size(name: str) -> int:
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    return {
+        "interactive": settings.EXECUTOR_INTERACTIVE_WORKERS,
+        "background": settings.EXECUTOR_BACKGROUND_WORKERS,
+        "llm": settings.EXECUTOR_LLM_WORKERS,
+        "cpu": settings.EXECUTOR_CPU_WORKERS or (os.cpu_count() or 2),
+    }[name]
+
+
+def get_pool(name: str) -> WorkloadPool:
+    """The named pool, created on first use."""
+    pool = _pools.get(name)
+    if pool is not None:
+        return pool
+    if name not in POOL_NAMES:
+        raise ValueError(f"Unknown executor pool '{name}' (expected one of {POOL_NAMES})")
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = WorkloadPool(name, _pool_size(name))
+        return _pools[name]
+
+
+async def run_in_pool(name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on a named pool."""
+    return await get_pool(name).run(fn, *args, **kwargs)
+
+
+def admit(name: str) -> bool:
+    """Admission check for optional work on a named pool."""
+    return get_pool(name).admit()
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """Metrics for every pool created so far."""
+    return {name: pool.stats() for name, pool in list(_pools.items())}
+
+
+def shutdown_pools(wait: bool = False) -> None:
+    """Stop all pools (tests and worker shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -6,19 +6,25 @@ from typing import Any
 import httpx
 
 from app.core.config import get_settings
+from app.core.http_client import open_http_client
 
 logger = logging.getLogger(__name__)
 
 FIRECRAWL_BASE_URL = "https://api.firecrawl.dev/v1"
 
 
-async def scrape_website(url: str, timeout: int | None = None) -> dict[str, Any]:
+async def scrape_website(
+    url: str,
+    timeout: int | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> dict[str, Any]:
     """
     Scrape a website using Firecrawl API.
 
     Args:
         url: The website URL to scrape
         timeout: Optional timeout override in seconds
+        http_client: Shared client to reuse (a new one is opened if omitted)
 
     Returns:
         Dict with:
@@ -36,7 +42,7 @@ async def scrape_website(url: str, timeout: int | None = None) -> dict[str, Any]
 
     request_timeout = timeout or settings.FIRECRAWL_TIMEOUT
 
-    async with httpx.AsyncClient(timeout=request_timeout) as client:
+    async with open_http_client(http_client, request_timeout) as client:
         logger.info(f"Scraping website: {url}")
 
         response = await client.post(
@@ -46,7 +52,8 @@ async def scrape_website(url: str, timeout: int | None = None) -> dict[str, Any]
                 "url": url,
                 "formats": ["markdown"],
                 "onlyMainContent": True,
-            }
+            },
+            timeout=request_timeout,
         )
         response.raise_for_status()
 
@@ -138,7 +145,11 @@ async def scrape_website_full_safe(url: str, timeout: int | None = None) -> dict
         return None
 
 
-async def scrape_website_safe(url: str, timeout: int | None = None) -> dict[str, Any] | None:
+async def scrape_website_safe(
+    url: str,
+    timeout: int | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> dict[str, Any] | None:
     """
     Scrape a website with error handling - returns None on failure.
 
@@ -147,12 +158,13 @@ async def scrape_website_safe(url: str, timeout: int | None = None) -> dict[str,
     Args:
         url: The website URL to scrape
         timeout: Optional timeout override in seconds
+        http_client: Shared client to reuse (a new one is opened if omitted)
 
     Returns:
         Scrape result dict or None if scraping failed
     """
     try:
-        return await scrape_website(url, timeout)
+        return await scrape_website(url, timeout, http_client)
     except ValueError as e:
         logger.warning(f"Firecrawl not configured: {e}")
         return None
@@ -0,0 +1,220 @@
+"""Response compression and conditional GET.
+
+HTTPCacheMiddleware is a pure ASGI middleware that:
+
+- gzips JSON responses of at least HTTP_GZIP_MINIMUM_SIZE bytes when the
+  client accepts it (SSE streams and other content types pass through)
+- on the heavy workspace reads (VERSIONED_ROUTES), derives the ETag from
+  the project write version (project_versions) and answers a
+  matching If-None-Match with 304 before the endpoint runs — one version
+  lookup instead of the full recompute
+- on other cacheable reads (BODY_HASH_ROUTES, e.g. the user's project list)
+  hashes the rendered body, so an unchanged payload costs no bandwidth
+
+Responses carry Cache-Control: no-cache, so browsers keep them and
+revalidate with If-None-Match on every poll.
+"""
+
+import gzip
+import hashlib
+import re
+import time
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+# Project-scoped reads whose payload only changes with a project write
+VERSIONED_ROUTES = re.compile(
+    r"^/v1/projects/(?P<project_id>[0-9a-fA-F-]{36})/workspace"
+    r"(?:/brd|/canvas|/solution-flow|/agents)?/?$"
+)
+# Reads that aren't tied to one project's version
+BODY_HASH_ROUTES = re.compile(r"^/v1/projects/?$")
+
+# Bodies this large are compressed on the cpu pool instead of the event loop
+_THREAD_GZIP_SIZE = 128 * 1024
+
+
+def _etag(*parts: Any) -> str:
+    digest = hashlib.sha256("\n".join(str(p) for p in parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in if_none_match.split(","))
+
+
+def version_etag(scope: Scope, version: int) -> str:
+    """ETag for a versioned route: path, query, caller and project version.
+
+    Writes to the tables these routes read, link tables included (migration
+    0219), bump the version. A time bucket is mixed in so any input without a
+    write-version trigger is never stale for longer than
+    HTTP_ETAG_MAX_STALENESS_SECONDS.
+    """
+    headers = Headers(scope=scope)
+    bucket = int(time.time() // max(get_settings().HTTP_ETAG_MAX_STALENESS_SECONDS, 1))
+    return _etag(
+        scope["path"],
+        scope.get("query_string", b"").decode(),
+        headers.get("authorization", ""),
+        version,
+        bucket,
+    )
+
+
+async def _project_version(project_id: str) -> int | None:
+    from app.core.executors import run_in_pool
+    from app.db.write_versions import get_project_version
+
+    return await run_in_pool("interactive", get_project_version, project_id)
+
+
+class HTTPCacheMiddleware:
+    """gzip for JSON responses plus ETag / 304 for cacheable reads."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        compresslevel: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.app = app
+        self.minimum_size = minimum_size or settings.HTTP_GZIP_MINIMUM_SIZE
+        self.compresslevel = compresslevel or settings.HTTP_GZIP_LEVEL
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        etag: str | None = None
+        hash_body = False
+
+        if scope["method"] == "GET":
+            match = VERSIONED_ROUTES.match(scope["path"])
+            if match:
+                version = await _project_version(match.group("project_id"))
+                if version is not None:
+                    etag = version_etag(scope, version)
+                    if etag_matches(headers.get("if-none-match"), etag):
+                        await _send_not_modified(send, etag)
+                        return
+            elif BODY_HASH_ROUTES.match(scope["path"]):
+                hash_body = True
+
+        responder = _Responder(
+            send,
+            etag=etag,
+            hash_body=hash_body,
+            if_none_match=headers.get("if-none-match"),
+            accepts_gzip="gzip" in headers.get("accept-encoding", ""),
+            minimum_size=self.minimum_size,
+            compresslevel=self.compresslevel,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+async def _send_not_modified(send: Send, etag: str) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": 304,
+        "headers": [
+            (b"etag", etag.encode()),
+            (b"cache-control", b"no-cache"),
+            (b"vary", b"Accept-Encoding, Authorization"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b""})
+
+
+class _Responder:
+    """Buffers a JSON response body, then adds ETag / gzip before sending."""
+
+    def __init__(
+        self,
+        send: Send,
+        etag: str | None,
+        hash_body: bool,
+        if_none_match: str | None,
+        accepts_gzip: bool,
+        minimum_size: int,
+        compresslevel: int,
+    ) -> None:
+        self._send = send
+        self.etag = etag
+        self.hash_body = hash_body
+        self.if_none_match = if_none_match
+        self.accepts_gzip = accepts_gzip
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.start: Message | None = None
+        self.chunks: list[bytes] = []
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if (
+                message["status"] != 200
+                or not content_type.startswith("application/json")
+                or "content-encoding" in headers
+            ):
+                self.passthrough = True
+                await self._send(message)
+                return
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        await self._finish(b"".join(self.chunks))
+
+    async def _finish(self, body: bytes) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+
+        etag = self.etag or (_etag(hashlib.sha256(body).hexdigest()) if self.hash_body else None)
+        if etag:
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "no-cache"
+            headers.add_vary_header("Authorization")
+            if self.hash_body and etag_matches(self.if_none_match, etag):
+                await _send_not_modified(self._send, etag)
+                return
+
+        if self.accepts_gzip and len(body) >= self.minimum_size:
+            if len(body) >= _THREAD_GZIP_SIZE:
+                from app.core.executors import run_in_pool
+
+                body = await run_in_pool("cpu", gzip.compress, body, self.compresslevel)
+            else:
+                body = gzip.compress(body, compresslevel=self.compresslevel)
+            headers["Content-Encoding"] = "gzip"
+            headers.add_vary_header("Accept-Encoding")
+        headers["Content-Length"] = str(len(body))
+
+        await self._send({**self.start, "headers": headers.raw})
+        await self._send({"type": "http.response.body", "body": body})
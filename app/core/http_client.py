@@ -0,0 +1,28 @@
+"""Shared httpx clients for the external API services.
+
+The scraping/enrichment services (firecrawl, pdl, serpapi, brightdata)
+accept an optional http_client so a multi-phase run (e.g. the discovery
+pipeline) can reuse one connection pool instead of opening a client per
+request.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+
+@asynccontextmanager
+async def open_http_client(
+    http_client: httpx.AsyncClient | None, timeout: float
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the caller's client (left open), or a new one closed on exit.
+
+    Services also pass timeout on each request, so a shared client still
+    applies the service's own timeout.
+    """
+    if http_client is not None:
+        yield http_client
+        return
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield client
@@ -0,0 +1,262 @@
+"""Lexical search: ranked entity-name resolution and knowledge topic search.
+
+Backed by the trigram/full-text RPCs from migration 0209
+(search_entity_names, search_memory_nodes_lexical). When an RPC is
+unavailable the same ranking is approximated in-process — trigram
+similarity for names, BM25 for node summaries — over the project's rows,
+which is also what tests exercise.
+
+fuse_rankings() merges lexical hits with vector hits (retrieval.retrieve)
+by Reciprocal Rank Fusion, the same scheme retrieval uses across vector
+types.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any
+from uuid import UUID
+
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+# Entity type -> (table, name column)
+ENTITY_NAME_COLUMNS: dict[str, tuple[str, str]] = {
+    "feature": ("features", "name"),
+    "persona": ("personas", "name"),
+    "vp_step": ("vp_steps", "label"),
+    "stakeholder": ("stakeholders", "name"),
+    "data_entity": ("data_entities", "name"),
+    "workflow": ("workflows", "name"),
+}
+
+_NODE_COLUMNS = (
+    "id, node_type, summary, confidence, consultant_status, "
+    "linked_entity_type, linked_entity_id, created_at"
+)
+_FALLBACK_MAX_ROWS = 2000  # local fallback scans at most this many rows
+_RRF_K = 60
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+# =============================================================================
+# In-process ranking
+# =============================================================================
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _trigrams(text: str) -> set[str]:
+    """pg_trgm-style trigrams: each word padded with two leading spaces, one trailing."""
+    grams: set[str] = set()
+    for word in tokenize(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Shared / total trigrams, as pg_trgm's similarity()."""
+    ga, gb = _trigrams(a), _trigrams(b)
+    if not ga or not gb:
+        return 0.0
+    return len(ga & gb) / len(ga | gb)
+
+
+def word_similarity(query: str, text: str) -> float:
+    """Best trigram similarity of the query against any run of words in text.
+
+    Close to pg_trgm's word_similarity(): a short query scores high against
+    a long text that contains it.
+    """
+    q = _trigrams(query)
+    if not q:
+        return 0.0
+    words = tokenize(text)
+    width = max(len(tokenize(query)), 1)
+    best = 0.0
+    for i in range(max(len(words) - width + 1, 1)):
+        window = _trigrams(" ".join(words[i:i + width]))
+        if window:
+            best = max(best, len(q & window) / len(q | window))
+    return best
+
+
+class BM25Index:
+    """Okapi BM25 over a small in-memory document set."""
+
+    def __init__(self, docs: list[tuple[str, str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._ids = [doc_id for doc_id, _ in docs]
+        self._tfs = [Counter(tokenize(text)) for _, text in docs]
+        self._lengths = [sum(tf.values()) for tf in self._tfs]
+        self._avg_len = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        df: Counter[str] = Counter()
+        for tf in self._tfs:
+            df.update(tf.keys())
+        n = len(docs)
+        self._idf = {t: math.log(1 + (n - d + 0.5) / (d + 0.5)) for t, d in df.items()}
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[str, float]]:
+        """(doc id, score) for documents sharing a term with the query, best first."""
+        terms = set(tokenize(query))
+        scored = []
+        for doc_id, tf, length in zip(self._ids, self._tfs, self._lengths, strict=True):
+            score = 0.0
+            for term in terms & tf.keys():
+                freq = tf[term]
+                norm = self.k1 * (1 - self.b + self.b * length / (self._avg_len or 1))
+                score += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            if score > 0:
+                scored.append((doc_id, score))
+        scored.sort(key=lambda s: s[1], reverse=True)
+        return scored[:limit]
+
+
+def rank_names(query: str, rows: list[dict], column: str, limit: int = 5) -> list[dict]:
+    """Rank rows by how well row[column] matches the query, like search_entity_names."""
+    q = query.strip().lower()
+    ranked = []
+    for row in rows:
+        name = row.get(column) or ""
+        if name.lower() == q:
+            score = 1.0
+        else:
+            score = max(trigram_similarity(name, query), word_similarity(query, name))
+            if q and q in name.lower():
+                score = max(score, 0.5)
+        if score >= 0.3:  # pg_trgm default thresholds
+            ranked.append({"id": row["id"], "name": name, "score": round(score, 4)})
+    ranked.sort(key=lambda r: (-r["score"], r["name"]))
+    return ranked[:limit]
+
+
+def fuse_rankings(
+    rankings: list[list[dict]],
+    key: str = "id",
+    weights: list[float] | None = None,
+) -> list[dict]:
+    """Reciprocal Rank Fusion of several ranked result lists.
+
+    Items are matched on `key`; the first list an item appears in supplies
+    its fields. Each result gets a "fused_score".
+    """
+    weights = weights or [1.0] * len(rankings)
+    merged: dict[Any, dict] = {}
+    scores: dict[Any, float] = {}
+    for ranking, weight in zip(rankings, weights, strict=True):
+        for rank, item in enumerate(ranking):
+            item_key = item.get(key)
+            if item_key is None:
+                continue
+            merged.setdefault(item_key, dict(item))
+            scores[item_key] = scores.get(item_key, 0.0) + weight / (_RRF_K + rank + 1)
+    fused = []
+    for item_key, item in merged.items():
+        item["fused_score"] = round(scores[item_key], 6)
+        fused.append(item)
+    fused.sort(key=lambda i: i["fused_score"], reverse=True)
+    return fused
+
+
+# =============================================================================
+# Search entry points
+# =============================================================================
+
+
+def resolve_entity_names(
+    project_id: UUID,
+    entity_type: str,
+    query: str,
+    limit: int = 5,
+) -> list[dict]:
+    """Ranked fuzzy match of an entity name within a project.
+
+    Args:
+        project_id: Project UUID
+        entity_type: Key of ENTITY_NAME_COLUMNS
+        query: Full or partial name
+        limit: Max matches
+
+    Returns:
+        [{id, name, score}] best first (score 1 = exact match)
+    """
+    if entity_type not in ENTITY_NAME_COLUMNS or not query.strip():
+        return []
+    supabase = get_supabase()
+
+    try:
+        response = supabase.rpc("search_entity_names", {
+            "p_project_id": str(project_id),
+            "p_entity_type": entity_type,
+            "p_query": query,
+            "p_limit": limit,
+        }).execute()
+        return response.data or []
+    except Exception as e:
+        logger.debug(f"search_entity_names unavailable, ranking locally: {e}")
+
+    table, column = ENTITY_NAME_COLUMNS[entity_type]
+    response = (
+        supabase.table(table)
+        .select(f"id, {column}")
+        .eq("project_id", str(project_id))
+        .limit(_FALLBACK_MAX_ROWS)
+        .execute()
+    )
+    return rank_names(query, response.data or [], column, limit)
+
+
+def search_knowledge(
+    project_id: UUID,
+    query: str,
+    limit: int = 10,
+    node_types: list[str] | None = None,
+) -> list[dict]:
+    """Lexical search over active memory node summaries.
+
+    Args:
+        project_id: Project UUID
+        query: Topic words
+        limit: Max nodes
+        node_types: Restrict to these node types (fact, belief, insight)
+
+    Returns:
+        Memory node dicts with a "score", best first
+    """
+    if not query.strip():
+        return []
+    supabase = get_supabase()
+
+    try:
+        response = supabase.rpc("search_memory_nodes_lexical", {
+            "p_project_id": str(project_id),
+            "p_query": query,
+            "p_limit": limit,
+            "p_node_types": node_types,
+        }).execute()
+        return response.data or []
+    except Exception as e:
+        logger.debug(f"search_memory_nodes_lexical unavailable, ranking locally: {e}")
+
+    q = (
+        supabase.table("memory_nodes")
+        .select(_NODE_COLUMNS)
+        .eq("project_id", str(project_id))
+        .eq("is_active", True)
+    )
+    if node_types:
+        q = q.in_("node_type", node_types)
+    nodes = {n["id"]: n for n in q.limit(_FALLBACK_MAX_ROWS).execute().data or []}
+
+    index = BM25Index([(nid, n.get("summary") or "") for nid, n in nodes.items()])
+    return [
+        {**nodes[nid], "score": round(score, 4)}
+        for nid, score in index.search(query, limit)
+    ]
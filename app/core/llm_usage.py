@@ -1,8 +1,10 @@
 """Centralized LLM usage logger for token/cost tracking."""
 
 import logging
+from typing import Any
 from uuid import UUID
 
+from app.core.write_behind import enqueue_write
 from app.db.supabase_client import get_supabase
 
 logger = logging.getLogger(__name__)
@@ -32,8 +34,14 @@ def _estimate_cost(
     tokens_input: int,
     tokens_output: int,
     tokens_cache_read: int = 0,
+    tokens_cache_create: int = 0,
 ) -> float:
-    """Estimate cost in USD based on model pricing."""
+    """Estimate cost in USD based on model pricing.
+
+    tokens_input is the uncached input (Anthropic's input_tokens, which
+    excludes cache reads and writes). Cache reads bill at 10% of the input
+    rate and cache writes at 125%.
+    """
     pricing = MODEL_PRICING.get(model)
     if not pricing:
         # Try prefix match for model variants
@@ -46,9 +54,7 @@ def _estimate_cost(
         return 0.0
 
     input_rate, output_rate = pricing
-    # Cache reads are typically 90% cheaper
-    cache_discount = 0.1
-    effective_input = (tokens_input - tokens_cache_read) + (tokens_cache_read * cache_discount)
+    effective_input = tokens_input + tokens_cache_read * 0.1 + tokens_cache_create * 1.25
     cost = (effective_input * input_rate / 1_000_000) + (tokens_output * output_rate / 1_000_000)
     return round(cost, 6)
 
@@ -66,10 +72,18 @@ def log_llm_usage(
     chain: str | None = None,
     tokens_cache_read: int = 0,
     tokens_cache_create: int = 0,
+    metadata: dict[str, Any] | None = None,
 ) -> None:
-    """Log an LLM call to the usage tracking table. Fire-and-forget."""
+    """Log an LLM call to the usage tracking table. Fire-and-forget.
+
+    The insert runs on the write-behind queue, so this never blocks the
+    caller (including async callers on the event loop). metadata holds
+    chain-specific stats (e.g. cache hit rates) for the row.
+    """
     try:
-        estimated_cost = _estimate_cost(model, tokens_input, tokens_output, tokens_cache_read)
+        estimated_cost = _estimate_cost(
+            model, tokens_input, tokens_output, tokens_cache_read, tokens_cache_create
+        )
 
         row = {
             "workflow": workflow,
@@ -91,15 +105,30 @@ def log_llm_usage(
             row["job_id"] = str(job_id)
         if chain:
             row["chain"] = chain
+        if metadata:
+            row["metadata"] = metadata
 
-        client = get_supabase()
-        client.table("llm_usage_log").insert(row).execute()
+        enqueue_write(
+            lambda: get_supabase().table("llm_usage_log").insert(row).execute(),
+            "llm_usage_log",
+        )
 
         logger.debug(
             f"LLM usage logged: {workflow}/{chain or '-'} "
             f"model={model} tokens={tokens_input}+{tokens_output} "
+            f"cache={tokens_cache_read}r/{tokens_cache_create}w "
             f"cost=${estimated_cost:.4f}"
         )
     except Exception as e:
         # Never fail the main operation due to logging
         logger.error(f"Failed to log LLM usage: {e}")
+
+
+def anthropic_usage_tokens(usage: Any) -> dict[str, int]:
+    """log_llm_usage token arguments from an Anthropic response.usage."""
+    return {
+        "tokens_input": getattr(usage, "input_tokens", 0) or 0,
+        "tokens_output": getattr(usage, "output_tokens", 0) or 0,
+        "tokens_cache_read": getattr(usage, "cache_read_input_tokens", 0) or 0,
+        "tokens_cache_create": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+    }
@@ -1,19 +1,53 @@
 """Semantic contradiction detection for the memory system.
 
-Embeds new fact summaries and queries match_memory_nodes() RPC to find
-similar existing beliefs. For high-similarity pairs, classifies whether
-the new fact supports, contradicts, or is unrelated to the belief.
+Embeds new fact summaries and finds the most similar existing beliefs for
+all of them at once: in memory against a cached belief matrix for projects
+with up to _MATRIX_MAX_BELIEFS embedded beliefs, otherwise with a single
+match_memory_nodes_batch() RPC. Pairs above the similarity threshold are
+classified as supports / contradicts / unrelated — near-identical pairs with
+the same negations are taken as support directly, pairs classified before
+come from a cache, and only the rest go to Haiku in one batched call.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
+import numpy as np
+
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_TOP_K = 5  # beliefs considered per fact
+_MAX_CLASSIFY = 10  # pairs per Haiku call
+_RESTATEMENT_SIMILARITY = 0.97  # fact restates the belief — no need to ask
+_FALLBACK_SIMILARITY = 0.85  # kept unclassified when Haiku fails
+_RELATIONSHIPS = ("supports", "contradicts", "unrelated")
+# "X is required" / "X is not required" embed almost identically
+_NEGATION = re.compile(
+    r"\b(?:not|no|never|none|nobody|nothing|neither|nor|without|cannot)\b|n't\b",
+    re.IGNORECASE,
+)
+
+_MATRIX_MAX_BELIEFS = 1000
+_MATRIX_TTL = 300  # seconds
+_PAIR_CACHE_TTL = 24 * 3600  # seconds
+_PAIR_CACHE_MAX = 5000
+
+_lock = threading.Lock()
+# project_id -> (loaded_at, matrix); None marks a project too large for memory
+_belief_matrices: dict[str, tuple[float, _BeliefMatrix | None]] = {}
+_pair_cache: dict[str, tuple[float, str]] = {}  # pair key -> (classified_at, relationship)
+
 
 async def detect_contradictions(
     project_id: UUID,
@@ -26,7 +60,8 @@ async def detect_contradictions(
     Args:
         project_id: Project UUID
         new_facts: List of new fact dicts with at least 'summary' and 'content'
-        existing_beliefs: Optional pre-loaded beliefs (otherwise loads via RPC)
+        existing_beliefs: Optional pre-loaded beliefs. When they carry an
+            'embedding', they are searched in memory instead of the database.
         similarity_threshold: Minimum cosine similarity to consider related
 
     Returns:
@@ -36,14 +71,13 @@ async def detect_contradictions(
             "belief_id": str,
             "belief_summary": str,
             "similarity": float,
-            "relationship": "supports" | "contradicts" | "unrelated",
+            "relationship": "supports" | "contradicts",
         }
     """
     if not new_facts:
         return []
 
-    from app.core.embeddings import embed_texts
-    from app.db.supabase_client import get_supabase
+    from app.core.embeddings import embed_texts_async
 
     # Embed fact summaries
     fact_texts = [f.get("summary", f.get("content", ""))[:200] for f in new_facts]
@@ -52,55 +86,246 @@ async def detect_contradictions(
         return []
 
     try:
-        embeddings = embed_texts(fact_texts)
+        embeddings = await embed_texts_async(fact_texts)
     except Exception as e:
         logger.warning(f"Contradiction detection embedding failed: {e}")
         return []
 
-    sb = get_supabase()
-    contradictions: list[dict] = []
-
-    for i, embedding in enumerate(embeddings):
-        try:
-            # Query similar beliefs via RPC
-            result = sb.rpc("match_memory_nodes", {
-                "query_embedding": embedding,
-                "match_count": 5,
-                "filter_project_id": str(project_id),
-                "filter_node_type": "belief",
-            }).execute()
-
-            for belief in result.data or []:
-                if belief.get("similarity", 0) >= similarity_threshold:
-                    contradictions.append({
-                        "fact_summary": fact_texts[i],
-                        "belief_id": belief["node_id"],
-                        "belief_summary": belief.get("summary", ""),
-                        "belief_content": belief.get("content", ""),
-                        "similarity": belief["similarity"],
-                        "relationship": "pending_classification",
-                    })
-
-        except Exception as e:
-            logger.debug(f"Belief similarity search failed for fact {i}: {e}")
-
-    if not contradictions:
+    matches = await asyncio.to_thread(
+        _match_beliefs, project_id, embeddings, existing_beliefs,
+    )
+
+    pairs: dict[str, dict[str, Any]] = {}
+    for i, beliefs in enumerate(matches):
+        for belief in beliefs:
+            if belief.get("similarity", 0) < similarity_threshold:
+                continue
+            pair = {
+                "fact_summary": fact_texts[i],
+                "belief_id": belief["node_id"],
+                "belief_summary": belief.get("summary", ""),
+                "belief_content": belief.get("content", ""),
+                "similarity": belief["similarity"],
+                "relationship": "pending_classification",
+            }
+            pairs.setdefault(_pair_key(pair), pair)
+
+    if not pairs:
         return []
 
-    # Classify relationships using Haiku
-    classified = await _classify_relationships(contradictions)
-    return classified
+    return await _classify_pairs(list(pairs.values()))
+
+
+# =============================================================================
+# Belief search
+# =============================================================================
+
+
+@dataclass
+class _BeliefMatrix:
+    """Active beliefs with unit-normalized embeddings, one row per belief."""
+
+    beliefs: list[dict[str, Any]]
+    vectors: np.ndarray  # (n_beliefs, dim)
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> _BeliefMatrix:
+        beliefs, vectors = [], []
+        for row in rows:
+            embedding = row.get("embedding")
+            if isinstance(embedding, str):  # PostgREST returns vectors as text
+                embedding = json.loads(embedding)
+            if not embedding:
+                continue
+            beliefs.append({
+                "node_id": row.get("node_id") or row["id"],
+                "summary": row.get("summary", ""),
+                "content": row.get("content", ""),
+            })
+            vectors.append(embedding)
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return cls(beliefs=beliefs, vectors=matrix / np.where(norms == 0, 1, norms))
+
+    def top_k(self, embeddings: list[list[float]], k: int) -> list[list[dict[str, Any]]]:
+        """Top-k beliefs (with cosine similarity) for each query embedding."""
+        if not self.beliefs:
+            return [[] for _ in embeddings]
+        queries = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        scores = (queries / np.where(norms == 0, 1, norms)) @ self.vectors.T
+        k = min(k, len(self.beliefs))
+        results = []
+        for row in scores:
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top])]
+            results.append([
+                {**self.beliefs[j], "similarity": float(row[j])} for j in top
+            ])
+        return results
+
+
+def _match_beliefs(
+    project_id: UUID,
+    embeddings: list[list[float]],
+    existing_beliefs: list[dict[str, Any]] | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Top-k similar beliefs per fact embedding, in one pass."""
+    if existing_beliefs and any(b.get("embedding") for b in existing_beliefs):
+        matrix = _BeliefMatrix.from_rows(existing_beliefs)
+    else:
+        matrix = _project_belief_matrix(project_id)
+    if matrix is not None:
+        return matrix.top_k(embeddings, _TOP_K)
 
+    from app.db.supabase_client import get_supabase
+
+    matches: list[list[dict[str, Any]]] = [[] for _ in embeddings]
+    try:
+        result = get_supabase().rpc("match_memory_nodes_batch", {
+            "query_embeddings": embeddings,
+            "match_count": _TOP_K,
+            "filter_project_id": str(project_id),
+            "filter_node_type": "belief",
+        }).execute()
+        for row in result.data or []:
+            idx = row.get("query_index", -1)
+            if 0 <= idx < len(matches):
+                matches[idx].append(row)
+    except Exception as e:
+        logger.debug(f"Batched belief similarity search failed: {e}")
+    return matches
+
+
+def _project_belief_matrix(project_id: UUID) -> _BeliefMatrix | None:
+    """Cached in-memory belief matrix, or None when the project is too large."""
+    pid = str(project_id)
+    with _lock:
+        entry = _belief_matrices.get(pid)
+        if entry and time.time() - entry[0] < _MATRIX_TTL:
+            return entry[1]
+
+    from app.db.supabase_client import get_supabase
+
+    try:
+        result = (
+            get_supabase().table("memory_nodes")
+            .select("id, summary, content, embedding")
+            .eq("project_id", pid)
+            .eq("node_type", "belief")
+            .eq("is_active", True)
+            .not_.is_("embedding", "null")
+            .limit(_MATRIX_MAX_BELIEFS + 1)
+            .execute()
+        )
+        rows = result.data or []
+    except Exception as e:
+        logger.debug(f"Belief matrix load failed for {pid}: {e}")
+        return None
+
+    matrix = _BeliefMatrix.from_rows(rows) if len(rows) <= _MATRIX_MAX_BELIEFS else None
+    with _lock:
+        _belief_matrices[pid] = (time.time(), matrix)
+    return matrix
+
+
+def invalidate_belief_matrix(project_id: UUID | str | None = None) -> None:
+    """Drop the cached belief matrix for a project (or all projects)."""
+    with _lock:
+        if project_id is None:
+            _belief_matrices.clear()
+        else:
+            _belief_matrices.pop(str(project_id), None)
+
+
+# =============================================================================
+# Classification
+# =============================================================================
+
+
+def _pair_key(pair: dict[str, Any]) -> str:
+    # The belief summary is part of the key, so a revised belief is re-asked
+    raw = "\x00".join([
+        str(pair["belief_id"]),
+        pair.get("belief_summary", ""),
+        pair["fact_summary"].strip().lower(),
+    ])
+    return hashlib.sha1(raw.encode()).hexdigest()
 
-async def _classify_relationships(
-    pairs: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    """Classify fact-belief pairs as supports/contradicts/unrelated.
 
-    Uses a single Haiku call with all pairs batched for efficiency.
+def _cached_relationship(pair: dict[str, Any]) -> str | None:
+    key = _pair_key(pair)
+    with _lock:
+        entry = _pair_cache.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > _PAIR_CACHE_TTL:
+            _pair_cache.pop(key, None)
+            return None
+        return entry[1]
+
+
+def _store_relationship(pair: dict[str, Any]) -> None:
+    with _lock:
+        _pair_cache[_pair_key(pair)] = (time.time(), pair["relationship"])
+        while len(_pair_cache) > _PAIR_CACHE_MAX:
+            _pair_cache.pop(next(iter(_pair_cache)))
+
+
+def clear_classification_cache() -> None:
+    """Forget all classified (fact, belief) pairs."""
+    with _lock:
+        _pair_cache.clear()
+
+
+async def _classify_pairs(pairs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Resolve pair relationships; only unseen, ambiguous pairs reach Haiku.
+
+    Returns the supports/contradicts pairs (plus high-similarity pairs left
+    unclassified if Haiku fails).
+    """
+    results: list[dict[str, Any]] = []
+    pending: list[dict[str, Any]] = []
+    for pair in pairs:
+        cached = _cached_relationship(pair)
+        if cached:
+            pair["relationship"] = cached
+            results.append(pair)
+        elif pair["similarity"] >= _RESTATEMENT_SIMILARITY and _same_negations(pair):
+            pair["relationship"] = "supports"
+            results.append(pair)
+        else:
+            pending.append(pair)
+
+    pending.sort(key=lambda p: p["similarity"], reverse=True)
+    batch = pending[:_MAX_CLASSIFY]
+    if batch:
+        if await _classify_relationships(batch):
+            for pair in batch:
+                if pair["relationship"] in _RELATIONSHIPS:
+                    _store_relationship(pair)
+            results.extend(p for p in batch if p["relationship"] in ("supports", "contradicts"))
+        else:
+            # Return pairs as pending
+            results.extend(p for p in batch if p["similarity"] >= _FALLBACK_SIMILARITY)
+
+    return [p for p in results if p["relationship"] != "unrelated"]
+
+
+def _same_negations(pair: dict[str, Any]) -> bool:
+    """Whether fact and belief negate the same way (a restatement, not a denial)."""
+    fact, belief = pair["fact_summary"], pair.get("belief_summary", "")
+    return sorted(_NEGATION.findall(fact.lower())) == sorted(_NEGATION.findall(belief.lower()))
+
+
+async def _classify_relationships(pairs: list[dict[str, Any]]) -> bool:
+    """Classify fact-belief pairs as supports/contradicts/unrelated, in place.
+
+    Uses a single Haiku call with all pairs batched for efficiency. Returns
+    False if the call failed (pairs keep their previous relationship).
     """
     if not pairs:
-        return []
+        return True
 
     try:
         from anthropic import AsyncAnthropic
@@ -112,7 +337,7 @@ async def _classify_relationships(
 
         # Build batch prompt
         pair_descriptions = []
-        for i, p in enumerate(pairs[:10]):  # Cap at 10 pairs
+        for i, p in enumerate(pairs[:_MAX_CLASSIFY]):
             pair_descriptions.append(
                 f"{i+1}. NEW FACT: {p['fact_summary']}\n"
                 f"   EXISTING BELIEF: {p['belief_summary']}"
@@ -135,7 +360,6 @@ async def _classify_relationships(
             messages=[{"role": "user", "content": prompt}],
         )
 
-        import json
         text = response.content[0].text.strip()
 
         # Parse the JSON response
@@ -154,10 +378,8 @@ async def _classify_relationships(
             if 0 <= idx < len(pairs):
                 pairs[idx]["relationship"] = cls.get("relationship", "unrelated")
 
-        # Filter to only supports/contradicts (drop unrelated)
-        return [p for p in pairs if p["relationship"] in ("supports", "contradicts")]
+        return True
 
     except Exception as e:
         logger.warning(f"Contradiction classification failed: {e}")
-        # Return pairs as pending
-        return [p for p in pairs if p.get("similarity", 0) >= 0.85]
+        return False
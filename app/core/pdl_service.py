@@ -6,6 +6,7 @@ from typing import Any
 import httpx
 
 from app.core.config import get_settings
+from app.core.http_client import open_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ async def enrich_company(
     name: str | None = None,
     website: str | None = None,
     timeout: int = 15,
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """
     Enrich a company using People Data Labs.
@@ -41,6 +43,7 @@ async def enrich_company(
         name: Company name
         website: Company website URL
         timeout: Request timeout in seconds
+        http_client: Shared client to reuse (a new one is opened if omitted)
 
     Returns:
         Dict with employee_count, revenue_range, funding, tech_stack, industries, etc.
@@ -63,11 +66,12 @@ async def enrich_company(
     if website:
         params["website"] = website
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    async with open_http_client(http_client, timeout) as client:
         response = await client.get(
             f"{PDL_BASE_URL}/company/enrich",
             headers={"X-Api-Key": settings.PDL_API_KEY},
             params=params,
+            timeout=timeout,
         )
         response.raise_for_status()
 
@@ -235,10 +239,11 @@ async def enrich_company_safe(
     name: str | None = None,
     website: str | None = None,
     timeout: int = 15,
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any] | None:
     """Enrich company with error handling — returns None on failure."""
     try:
-        return await enrich_company(name, website, timeout)
+        return await enrich_company(name, website, timeout, http_client)
     except ValueError as e:
         logger.warning(f"PDL not configured or bad input: {e}")
         return None
@@ -8,13 +8,16 @@ import asyncio
 import logging
 from uuid import UUID
 
+from app.core.executors import run_in_pool
+
 logger = logging.getLogger(__name__)
 
 
 async def load_project_data(project_id: UUID) -> dict:
     """Load all project data needed for health scoring and intelligence.
 
-    Single async boundary — everything below is sync DB calls run in parallel.
+    Single async boundary — everything below is sync DB calls run in parallel
+    on the interactive pool.
     """
     from app.db.business_drivers import list_business_drivers
     from app.db.entity_dependencies import get_dependency_graph
@@ -54,13 +57,13 @@ async def load_project_data(project_id: UUID) -> dict:
         questions,
         stakeholder_names,
     ) = await asyncio.gather(
-        asyncio.to_thread(get_workflow_pairs, project_id),
-        asyncio.to_thread(list_business_drivers, project_id, None, 200),
-        asyncio.to_thread(list_personas, project_id),
-        asyncio.to_thread(list_features, project_id),
-        asyncio.to_thread(get_dependency_graph, project_id),
-        asyncio.to_thread(lambda: list_open_questions(project_id, status="open", limit=50)),
-        asyncio.to_thread(_q_stakeholders),
+        run_in_pool("interactive", get_workflow_pairs, project_id),
+        run_in_pool("interactive", list_business_drivers, project_id, None, 200),
+        run_in_pool("interactive", list_personas, project_id),
+        run_in_pool("interactive", list_features, project_id),
+        run_in_pool("interactive", get_dependency_graph, project_id),
+        run_in_pool("interactive", lambda: list_open_questions(project_id, status="open", limit=50)),
+        run_in_pool("interactive", _q_stakeholders),
     )
 
     return {
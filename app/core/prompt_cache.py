@@ -0,0 +1,178 @@
+"""Prompt-cache-aware system prompt assembly for Anthropic calls.
+
+Anthropic caches the request prefix (tools, then system, then messages) up
+to each cache_control breakpoint, and only reuses it when it is
+byte-identical. Callers describe the system prompt as PromptSegments tagged
+with how often each one changes; assemble_system() orders them static-first
+and puts a breakpoint at the end of each stable tier, so per-call content
+never invalidates the shared prefix.
+
+Parallel fan-outs (one call per screen/step) all start before any of them
+has written the cache, so each pays for a cache write. warm_prompt_cache()
+writes it once with a 1-token call before the fan-out.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+from uuid import UUID
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Anthropic allows 4 breakpoints per request; leave one for the tools
+MAX_SYSTEM_BREAKPOINTS = 3
+
+# Shortest prefix (tokens) each model will cache; shorter prefixes are
+# sent uncached whatever the breakpoints say. Prefix-matched on model name.
+_MIN_CACHEABLE_TOKENS: dict[str, int] = {
+    "claude-haiku-4-5": 4096,
+    "claude-opus-4-5": 4096,
+    "claude-3-5-haiku": 2048,
+}
+_DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Last static-tier fingerprint per named prompt (see _check_static_prefix)
+_static_fingerprints: dict[str, str] = {}
+
+
+class Stability(IntEnum):
+    """How often a segment changes — also its position in the prompt."""
+
+    STATIC = 0  # Same for every call of the chain (instructions, schemas)
+    PROJECT = 1  # Same across calls for one project or run (BRD, plan context)
+    CALL = 2  # Differs per call; never cached
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    """One system prompt block and how stable it is."""
+
+    text: str
+    stability: Stability = Stability.STATIC
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (4 chars = 1 token)."""
+    return len(text) // 4
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Shortest prefix the model caches."""
+    for prefix, tokens in _MIN_CACHEABLE_TOKENS.items():
+        if model.startswith(prefix):
+            return tokens
+    return _DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def assemble_system(
+    segments: list[PromptSegment],
+    name: str | None = None,
+    max_breakpoints: int = MAX_SYSTEM_BREAKPOINTS,
+) -> list[dict[str, Any]]:
+    """Anthropic system blocks, static-first, with breakpoints at tier ends.
+
+    Segments keep their relative order within a tier; empty ones are
+    dropped. When there are more tiers than breakpoints, the later
+    (longer) prefixes win. Pass name to get a warning whenever the static
+    tier of that prompt differs from the previous call in this process.
+    """
+    ordered = sorted((s for s in segments if s.text), key=lambda s: s.stability)
+    blocks: list[dict[str, Any]] = [{"type": "text", "text": s.text} for s in ordered]
+
+    tier_ends = [
+        i
+        for i, segment in enumerate(ordered)
+        if segment.stability < Stability.CALL
+        and (i + 1 == len(ordered) or ordered[i + 1].stability != segment.stability)
+    ]
+    for i in tier_ends[-max_breakpoints:] if max_breakpoints > 0 else []:
+        blocks[i]["cache_control"] = dict(_CACHE_CONTROL)
+
+    if name:
+        _check_static_prefix(name, [s.text for s in ordered if s.stability == Stability.STATIC])
+    return blocks
+
+
+def cached_prefixes(blocks: list[dict[str, Any]]) -> list[str]:
+    """System text up to each breakpoint, shortest first."""
+    prefixes: list[str] = []
+    texts: list[str] = []
+    for block in blocks:
+        texts.append(block.get("text", ""))
+        if "cache_control" in block:
+            prefixes.append("\x00".join(texts))
+    return prefixes
+
+
+def prefix_fingerprint(text: str) -> str:
+    """Short stable hash of a prompt prefix."""
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _check_static_prefix(name: str, static_texts: list[str]) -> None:
+    fingerprint = prefix_fingerprint("\x00".join(static_texts))
+    previous = _static_fingerprints.get(name)
+    _static_fingerprints[name] = fingerprint
+    if previous is not None and previous != fingerprint:
+        logger.warning(
+            f"Static prompt prefix for {name} changed between calls "
+            f"({previous} → {fingerprint}) — each change is a cache write"
+        )
+
+
+def is_cacheable(model: str, system: list[dict[str, Any]], tools: list[dict] | None = None) -> bool:
+    """Whether the tools + system prefix is long enough for the model to cache."""
+    prefix_tokens = estimate_tokens(json.dumps(tools or [])) + sum(
+        estimate_tokens(block.get("text", "")) for block in system
+    )
+    return prefix_tokens >= min_cacheable_tokens(model)
+
+
+async def warm_prompt_cache(
+    client: Any,
+    model: str,
+    system: list[dict[str, Any]],
+    tools: list[dict] | None = None,
+    workflow: str = "prompt_cache",
+    project_id: UUID | str | None = None,
+) -> bool:
+    """Write the tools + system prefix to the cache before a parallel fan-out.
+
+    Costs one cache write and a single output token. Skipped (False) when
+    the prefix is too short for the model to cache. Failures are logged and
+    swallowed — the fan-out then simply runs cold.
+    """
+    if not is_cacheable(model, system, tools):
+        return False
+
+    from app.core.llm_usage import anthropic_usage_tokens, log_llm_usage
+
+    kwargs: dict[str, Any] = {
+        "model": model,
+        "max_tokens": 1,
+        "system": system,
+        "messages": [{"role": "user", "content": "."}],
+    }
+    if tools:
+        kwargs["tools"] = tools
+    try:
+        response = await client.messages.create(**kwargs)
+    except Exception as e:
+        logger.warning(f"Prompt cache warm-up failed for {workflow}: {e}")
+        return False
+
+    log_llm_usage(
+        workflow=workflow,
+        chain="prompt_cache_warm",
+        model=model,
+        provider="anthropic",
+        project_id=project_id,
+        **anthropic_usage_tokens(response.usage),
+    )
+    return True
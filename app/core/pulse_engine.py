@@ -950,7 +950,7 @@ def _render_directive_prompt(
 
 
 # ---------------------------------------------------------------------------
-# Chain completeness (BFS from entities to business objectives)
+# Chain completeness (multi-source BFS from business objectives)
 # ---------------------------------------------------------------------------
 
 
@@ -958,41 +958,24 @@ def _batch_chain_completeness(
     project_id: UUID,
     entity_ids_by_type: dict[str, list[str]],
 ) -> dict[str, bool]:
-    """Check chain completeness for all entities via BFS.
+    """Check chain completeness for all entities via one multi-source BFS.
 
     Returns {entity_id: True/False} indicating whether any path exists
     from the entity to a business_driver with driver_type in (goal, kpi, objective).
-    Walks entity_dependencies (non-disputed, confidence > 0.3) up to 5 hops.
+    Walks entity_dependencies (non-disputed, confidence >= 0.3) up to 5 hops,
+    starting from every objective at once over the cached project graph.
     """
+    from app.db.entity_graph import get_project_graph
     from app.db.supabase_client import get_supabase
 
     sb = get_supabase()
     pid = str(project_id)
 
-    # Load all non-disputed links for this project in one query
     try:
-        result = (
-            sb.table("entity_dependencies")
-            .select("source_entity_id, source_entity_type, target_entity_id, target_entity_type, confidence")
-            .eq("project_id", pid)
-            .eq("disputed", False)
-            .execute()
-        )
+        graph = get_project_graph(project_id)
     except Exception:
         return {}
 
-    # Build adjacency list (bidirectional)
-    adj: dict[str, set[str]] = {}
-    for row in (result.data or []):
-        conf = row.get("confidence", 0.5)
-        if conf < 0.3:
-            continue
-        src = row.get("source_entity_id", "")
-        tgt = row.get("target_entity_id", "")
-        if src and tgt:
-            adj.setdefault(src, set()).add(tgt)
-            adj.setdefault(tgt, set()).add(src)
-
     # Load business drivers to identify objectives
     try:
         drivers_result = (
@@ -1011,41 +994,13 @@ def _batch_chain_completeness(
     if not objective_ids:
         return {}
 
-    # BFS from each entity, max 5 hops
+    # Reverse BFS: distance from the nearest objective answers every entity at once
+    reachable = graph.link_distances(objective_ids, max_hops=5)
+
     completions: dict[str, bool] = {}
-    all_ids = []
     for ids in entity_ids_by_type.values():
-        all_ids.extend(ids)
-
-    for eid in all_ids:
-        if eid in objective_ids:
-            completions[eid] = True
-            continue
-
-        # BFS
-        visited = {eid}
-        frontier = {eid}
-        found = False
-        for _ in range(5):
-            next_frontier: set[str] = set()
-            for node in frontier:
-                for neighbor in adj.get(node, set()):
-                    if neighbor in visited:
-                        continue
-                    if neighbor in objective_ids:
-                        found = True
-                        break
-                    visited.add(neighbor)
-                    next_frontier.add(neighbor)
-                if found:
-                    break
-            if found:
-                break
-            frontier = next_frontier
-            if not frontier:
-                break
-
-        completions[eid] = found
+        for eid in ids:
+            completions[eid] = eid in objective_ids or eid in reachable
 
     return completions
 
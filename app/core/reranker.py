@@ -5,11 +5,11 @@ Also provides find_dedup_match_cohere() for entity dedup tier 2.5.
 
 from __future__ import annotations
 
-import asyncio
 import json
 from typing import TYPE_CHECKING, Any
 
 from app.core.config import get_settings
+from app.core.executors import run_in_pool
 from app.core.logging import get_logger
 
 if TYPE_CHECKING:
@@ -64,7 +64,8 @@ async def rerank_with_cohere(
         return None
 
     try:
-        response = await asyncio.to_thread(
+        response = await run_in_pool(
+            "llm",
             client.rerank,
             model="rerank-v3.5",
             query=query,
@@ -127,11 +127,11 @@ async def _search_chunks(
     meta_filters: dict | None = None,
 ) -> list[dict]:
     """Vector search for signal_chunks across all sub-queries."""
-    from app.core.embeddings import embed_texts_async
+    from app.core.embeddings import embed_queries_async
     from app.db.supabase_client import get_supabase
 
     try:
-        embeddings = await embed_texts_async(queries)
+        embeddings = await embed_queries_async(queries)
     except Exception as e:
         logger.warning(f"Chunk embedding failed: {e}")
         return []
@@ -212,8 +212,8 @@ async def _search_entities(
 
     # Strategy A: Vector search via match_entities RPC
     try:
-        from app.core.embeddings import embed_texts_async
-        embeddings = await embed_texts_async(queries[:2])  # Cap at 2 queries
+        from app.core.embeddings import embed_queries_async
+        embeddings = await embed_queries_async(queries[:2])  # Cap at 2 queries
 
         for embedding in embeddings:
             try:
@@ -307,8 +307,8 @@ async def _search_entities_multivector(
     from app.db.supabase_client import get_supabase
 
     try:
-        from app.core.embeddings import embed_texts_async
-        embeddings = await embed_texts_async(queries[:2])
+        from app.core.embeddings import embed_queries_async
+        embeddings = await embed_queries_async(queries[:2])
     except Exception:
         return await _search_entities(queries, project_id, entity_types)
 
@@ -417,8 +417,8 @@ async def _search_beliefs(
 
     # Strategy A: Vector search via match_memory_nodes RPC
     try:
-        from app.core.embeddings import embed_texts_async
-        embeddings = await embed_texts_async(queries[:2])
+        from app.core.embeddings import embed_queries_async
+        embeddings = await embed_queries_async(queries[:2])
 
         for embedding in embeddings:
             try:
@@ -471,8 +471,8 @@ async def _search_outcomes(
     outcomes: dict[str, dict] = {}
 
     try:
-        from app.core.embeddings import embed_texts_async
-        embeddings = await embed_texts_async(queries[:2])
+        from app.core.embeddings import embed_queries_async
+        embeddings = await embed_queries_async(queries[:2])
 
         for embedding in embeddings:
             try:
@@ -271,4 +271,5 @@ class IntelligenceBriefing(BaseModel):
     # Metadata
     computed_at: datetime = Field(default_factory=datetime.utcnow)
     narrative_cached: bool = False  # True if Sonnet was skipped (cache hit)
+    degraded_sections: list[str] = Field(default_factory=list)  # shed under load
     phase: ContextPhase = ContextPhase.EMPTY
@@ -147,6 +147,9 @@ class AnalysisResult(BaseModel):
     competitive_mentions: list[CompetitiveMention] = Field(default_factory=list)
     custom_dimensions: dict = Field(default_factory=dict)
     dimension_packs_used: list[str] = Field(default_factory=list)
+    packs_from_cache: list[str] = Field(
+        default_factory=list, description="Packs reused from an earlier analysis"
+    )
     model: str | None = None
     tokens_input: int = 0
     tokens_output: int = 0
@@ -6,6 +6,7 @@ from typing import Any
 import httpx
 
 from app.core.config import get_settings
+from app.core.http_client import open_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,7 @@ async def search_google(
     query: str,
     num_results: int = 10,
     timeout: int = 15,
+    http_client: httpx.AsyncClient | None = None,
 ) -> list[dict[str, Any]]:
     """
     Search Google via SerpAPI.
@@ -24,6 +26,7 @@ async def search_google(
         query: Search query string
         num_results: Number of results to return
         timeout: Request timeout in seconds
+        http_client: Shared client to reuse (a new one is opened if omitted)
 
     Returns:
         List of result dicts with url, title, snippet
@@ -37,7 +40,7 @@ async def search_google(
     if not settings.SERPAPI_API_KEY:
         raise ValueError("SERPAPI_API_KEY not configured")
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    async with open_http_client(http_client, timeout) as client:
         response = await client.get(
             SERPAPI_BASE_URL,
             params={
@@ -46,6 +49,7 @@ async def search_google(
                 "num": num_results,
                 "engine": "google",
             },
+            timeout=timeout,
         )
         response.raise_for_status()
 
@@ -69,10 +73,11 @@ async def search_google_safe(
     query: str,
     num_results: int = 10,
     timeout: int = 15,
+    http_client: httpx.AsyncClient | None = None,
 ) -> list[dict[str, Any]]:
     """Search Google with error handling — returns empty list on failure."""
     try:
-        return await search_google(query, num_results, timeout)
+        return await search_google(query, num_results, timeout, http_client)
     except ValueError as e:
         logger.warning(f"SerpAPI not configured: {e}")
         return []
@@ -7,6 +7,7 @@ cross-step intelligence, retrieval hints.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
@@ -365,7 +366,8 @@ async def build_solution_flow_context(
 ) -> SolutionFlowContext:
     """Build full solution flow context for chat prompts.
 
-    Zero LLM cost, ~100ms. Pure DB reads + string formatting.
+    Zero LLM cost, ~100ms. Pure DB reads + string formatting, run in a
+    worker thread so the reads never block the event loop.
 
     Args:
         project_id: Project UUID string
@@ -374,6 +376,15 @@ async def build_solution_flow_context(
     Returns:
         SolutionFlowContext with 4 layers of prompt content
     """
+    return await asyncio.to_thread(
+        _build_solution_flow_context_sync, project_id, focused_step_id,
+    )
+
+
+def _build_solution_flow_context_sync(
+    project_id: str,
+    focused_step_id: str | None,
+) -> SolutionFlowContext:
     ctx = SolutionFlowContext()
 
     try:
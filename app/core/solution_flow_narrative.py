@@ -2,7 +2,8 @@
 
 Zero-LLM-cost provenance narrative from DB reads.
 Builds 2-4 sentence narrative explaining where a step came from
-and how confident its grounding is.
+and how confident its grounding is. build_step_narratives() does a whole
+flow with one entity query per linked table.
 """
 
 from __future__ import annotations
@@ -14,6 +15,13 @@ from uuid import UUID
 logger = logging.getLogger(__name__)
 
 
+_LINK_TABLES = [
+    ("linked_feature_ids", "features", "Feature"),
+    ("linked_workflow_ids", "workflows", "Workflow"),
+    ("linked_data_entity_ids", "data_entities", "Data Entity"),
+]
+
+
 def build_step_narrative(step: dict[str, Any], project_id: UUID) -> str:
     """Build a provenance narrative for a solution flow step.
 
@@ -24,62 +32,81 @@ def build_step_narrative(step: dict[str, Any], project_id: UUID) -> str:
 
     Returns a 2-4 sentence human-readable narrative.
     """
-    from app.core.solution_flow_context import _resolve_entity_names_batch
-    from app.db.supabase_client import get_supabase
+    return _compose_narrative(step, _load_linked_entities([step]))
 
-    parts: list[str] = []
 
-    # Resolve linked entity names and statuses
-    ids_by_table: dict[str, list[str]] = {}
-    for key, table in [
-        ("linked_feature_ids", "features"),
-        ("linked_workflow_ids", "workflows"),
-        ("linked_data_entity_ids", "data_entities"),
-    ]:
-        ids = step.get(key) or []
-        if ids:
-            ids_by_table[table] = ids
-
-    if not ids_by_table:
-        return "This step was generated from project context without specific entity links."
+def build_step_narratives(
+    steps: list[dict[str, Any]], project_id: UUID
+) -> dict[str, str]:
+    """Build narratives for many steps, sharing one entity lookup per table.
 
-    name_lookup = _resolve_entity_names_batch(ids_by_table)
+    Returns:
+        {step_id: narrative} for steps with a non-empty narrative
+    """
+    entities = _load_linked_entities(steps)
+    narratives: dict[str, str] = {}
+    for step in steps:
+        narrative = _compose_narrative(step, entities)
+        if narrative and step.get("id"):
+            narratives[str(step["id"])] = narrative
+    return narratives
 
-    # Batch-fetch entity details per table (replaces N+1 per-ID queries)
-    supabase = get_supabase()
-    entity_details: list[str] = []
 
+def _load_linked_entities(steps: list[dict[str, Any]]) -> dict[str, dict]:
+    """Fetch name, status and signals of every entity the steps link to.
+
+    One query per entity table, however many steps are passed.
+    """
+    from app.db.supabase_client import get_supabase
+
+    ids_by_table: dict[str, set[str]] = {}
+    for step in steps:
+        for key, table, _ in _LINK_TABLES:
+            ids = step.get(key) or []
+            if ids:
+                ids_by_table.setdefault(table, set()).update(str(i) for i in ids)
+
+    supabase = get_supabase()
+    entities: dict[str, dict] = {}
     for table, ids in ids_by_table.items():
-        entity_type = {
-            "features": "Feature",
-            "workflows": "Workflow",
-            "data_entities": "Data Entity",
-        }.get(table, "Entity")
-
-        # Single batch query for all IDs in this table
-        status_map: dict[str, dict] = {}
         try:
             result = supabase.table(table).select(
-                "id, confirmation_status, source_signal_ids"
-            ).in_("id", ids).execute()
-            status_map = {row["id"]: row for row in (result.data or [])}
+                "id, name, confirmation_status, source_signal_ids"
+            ).in_("id", sorted(ids)).execute()
+            entities.update({row["id"]: row for row in (result.data or [])})
         except Exception:
             pass
 
-        for eid in ids:
-            name = name_lookup.get(eid, eid[:8])
-            data = status_map.get(eid)
+    return entities
+
+
+def _compose_narrative(step: dict[str, Any], entities: dict[str, dict]) -> str:
+    """Narrative for one step from pre-fetched linked entity rows."""
+    parts: list[str] = []
+
+    entity_details: list[str] = []
+    has_links = False
+    for key, _, entity_type in _LINK_TABLES:
+        for eid in step.get(key) or []:
+            has_links = True
+            eid = str(eid)
+            data = entities.get(eid)
+            name = (data or {}).get("name") or eid[:8]
             if data:
-                status = data.get("confirmation_status", "ai_generated")
+                status = data.get("confirmation_status") or "ai_generated"
                 signals = data.get("source_signal_ids") or []
                 signal_count = len(signals) if isinstance(signals, list) else 0
                 status_label = _format_status(status)
+                plural = "s" if signal_count != 1 else ""
                 entity_details.append(
-                    f"{entity_type}: {name} ({status_label}, {signal_count} signal{'s' if signal_count != 1 else ''})"
+                    f"{entity_type}: {name} ({status_label}, {signal_count} signal{plural})"
                 )
             else:
                 entity_details.append(f"{entity_type}: {name}")
 
+    if not has_links:
+        return "This step was generated from project context without specific entity links."
+
     if entity_details:
         parts.append(
             "This step was derived from " + _join_list(entity_details) + "."
@@ -87,7 +114,7 @@ def build_step_narrative(step: dict[str, Any], project_id: UUID) -> str:
 
     # Step's own history
     preserved = step.get("preserved_from_version")
-    version = step.get("generation_version", 1)
+    version = step.get("generation_version") or 1
 
     if preserved:
         parts.append(
@@ -11,26 +11,29 @@ Structure:
 - Next Actions: ~50 tokens
 """
 
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from dateutil import parser as dateutil_parser
 
+from app.core.executors import get_pool
 from app.core.logging import get_logger
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
 
-# Cache TTL - regenerate if older than this
+# Cache TTL - regenerate if older than this when the project version is unknown
 SNAPSHOT_CACHE_TTL_MINUTES = 5
+# Safety net for a snapshot built at the current project write version
+SNAPSHOT_CACHE_MAX_AGE_MINUTES = 24 * 60
 
 
 def get_state_snapshot(project_id: UUID, force_refresh: bool = False) -> str:
     """
     Get the cached state snapshot for a project.
 
-    If the snapshot is stale or doesn't exist, regenerates it.
+    The cached snapshot is reused while the project write version it was
+    built at is unchanged. If it is stale or doesn't exist, regenerates it.
 
     Args:
         project_id: Project UUID
@@ -39,14 +42,17 @@ def get_state_snapshot(project_id: UUID, force_refresh: bool = False) -> str:
     Returns:
         State snapshot text (~500 tokens)
     """
+    from app.db.write_versions import current_project_version
+
     supabase = get_supabase()
+    version = current_project_version(project_id)
 
     if not force_refresh:
         # Try to get cached snapshot
         try:
             response = (
                 supabase.table("state_snapshots")
-                .select("snapshot_text, generated_at")
+                .select("snapshot_text, generated_at, project_version")
                 .eq("project_id", str(project_id))
                 .single()
                 .execute()
@@ -56,8 +62,12 @@ def get_state_snapshot(project_id: UUID, force_refresh: bool = False) -> str:
                 generated_at = response.data.get("generated_at")
                 if generated_at:
                     # Check if still fresh
+                    if version is not None and response.data.get("project_version") == version:
+                        max_age = timedelta(minutes=SNAPSHOT_CACHE_MAX_AGE_MINUTES)
+                    else:
+                        max_age = timedelta(minutes=SNAPSHOT_CACHE_TTL_MINUTES)
                     gen_time = dateutil_parser.isoparse(generated_at)
-                    if datetime.now(gen_time.tzinfo) - gen_time < timedelta(minutes=SNAPSHOT_CACHE_TTL_MINUTES):
+                    if datetime.now(gen_time.tzinfo) - gen_time < max_age:
                         logger.debug(f"Using cached snapshot for project {project_id}")
                         return response.data["snapshot_text"]
 
@@ -65,10 +75,10 @@ def get_state_snapshot(project_id: UUID, force_refresh: bool = False) -> str:
             logger.debug(f"No cached snapshot found: {e}")
 
     # Generate new snapshot
-    return regenerate_state_snapshot(project_id)
+    return regenerate_state_snapshot(project_id, version=version)
 
 
-def regenerate_state_snapshot(project_id: UUID) -> str:
+def regenerate_state_snapshot(project_id: UUID, version: int | None = None) -> str:
     """
     Generate and cache a new state snapshot for a project.
 
@@ -76,11 +86,16 @@ def regenerate_state_snapshot(project_id: UUID) -> str:
 
     Args:
         project_id: Project UUID
+        version: Project write version read before building (looked up if omitted)
 
     Returns:
         Generated snapshot text
     """
+    from app.db.write_versions import get_project_version
+
     supabase = get_supabase()
+    if version is None:
+        version = get_project_version(project_id)
 
     try:
         snapshot_text = _build_snapshot_text(project_id)
@@ -95,6 +110,7 @@ def regenerate_state_snapshot(project_id: UUID) -> str:
                 "generated_at": datetime.utcnow().isoformat(),
                 "last_entity_change_at": datetime.utcnow().isoformat(),
                 "version": 1,
+                "project_version": version,
             },
             on_conflict="project_id",
         ).execute()
@@ -111,7 +127,7 @@ def regenerate_state_snapshot(project_id: UUID) -> str:
 def _build_snapshot_text(project_id: UUID) -> str:
     """Build the actual snapshot text from project data (500-750 tokens target).
 
-    All 14 independent queries run in parallel via ThreadPoolExecutor,
+    All 14 independent queries run in parallel on the background pool,
     then sections are formatted from the results in-memory.
     """
     pid = str(project_id)
@@ -149,38 +165,27 @@ def _build_snapshot_text(project_id: UUID) -> str:
         except Exception:
             return None
 
-    # Fire all 14 queries in parallel
-    with ThreadPoolExecutor(max_workers=14) as pool:
-        f_project = pool.submit(_q_project)
-        f_company = pool.submit(_q_company)
-        f_stakeholders = pool.submit(_q, "stakeholders", "name, role, is_economic_buyer, stakeholder_type", None, None, 4)
-        f_drivers = pool.submit(_q, "business_drivers", "driver_type, description, measurement, priority, status", None, "priority")
-        f_features = pool.submit(_q, "features", "id, is_mvp, name, description, confirmation_status")
-        f_personas = pool.submit(_q, "personas", "name, role, goals, frustrations, is_primary, confirmation_status")
-        f_vp_steps = pool.submit(_q, "vp_steps", "name, step_order, description, outcome, confirmation_status", None, "step_order")
-        f_workflows = pool.submit(_q, "workflows", "id, name, state_type, description", None, "created_at")
-        f_data_entities = pool.submit(_q, "data_entities", "id, name, entity_category", None, None, 10)
-        f_competitors = pool.submit(_q, "competitor_refs", "name, reference_type, research_notes", None, None, 8)
-        f_constraints = pool.submit(_q, "constraints", "name, constraint_type, description", None, None, 6)
-        f_proposals = pool.submit(_q, "batch_proposals", "id, proposal_type", [("status", "pending")])
-        f_confirmations = pool.submit(_q, "confirmation_items", "id, entity_type", [("status", "open")])
-        f_signals = pool.submit(_q, "signals", "id")
-
-    # Collect results
-    proj = f_project.result()
-    company = f_company.result()
-    stakeholders = f_stakeholders.result()
-    drivers = f_drivers.result()
-    features = f_features.result()
-    personas = f_personas.result()
-    vp_steps = f_vp_steps.result()
-    workflows = f_workflows.result()
-    data_entities = f_data_entities.result()
-    competitors = f_competitors.result()
-    constraints = f_constraints.result()
-    proposals = f_proposals.result()
-    confirmations = f_confirmations.result()
-    signals = f_signals.result()
+    # Fire all 14 queries in parallel on the shared background pool
+    (
+        proj, company, stakeholders, drivers, features, personas, vp_steps,
+        workflows, data_entities, competitors, constraints, proposals,
+        confirmations, signals,
+    ) = get_pool("background").run_all(
+        _q_project,
+        _q_company,
+        lambda: _q("stakeholders", "name, role, is_economic_buyer, stakeholder_type", None, None, 4),
+        lambda: _q("business_drivers", "driver_type, description, measurement, priority, status", None, "priority"),
+        lambda: _q("features", "id, is_mvp, name, description, confirmation_status"),
+        lambda: _q("personas", "name, role, goals, frustrations, is_primary, confirmation_status"),
+        lambda: _q("vp_steps", "name, step_order, description, outcome, confirmation_status", None, "step_order"),
+        lambda: _q("workflows", "id, name, state_type, description", None, "created_at"),
+        lambda: _q("data_entities", "id, name, entity_category", None, None, 10),
+        lambda: _q("competitor_refs", "name, reference_type, research_notes", None, None, 8),
+        lambda: _q("constraints", "name, constraint_type, description", None, None, 6),
+        lambda: _q("batch_proposals", "id, proposal_type", [("status", "pending")]),
+        lambda: _q("confirmation_items", "id, entity_type", [("status", "open")]),
+        lambda: _q("signals", "id"),
+    )
 
     # Format sections from pre-loaded data
     sections = []
@@ -530,6 +535,9 @@ def invalidate_snapshot(project_id: UUID) -> None:
     Call this when any entity changes. The next get_state_snapshot call
     will regenerate it.
     """
+    from app.db.write_versions import note_project_write
+
+    note_project_write(project_id)
     supabase = get_supabase()
     try:
         # Delete the cached snapshot so it regenerates on next access
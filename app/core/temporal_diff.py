@@ -1,7 +1,8 @@
 """Temporal diff engine — what changed since the consultant's last session.
 
-Queries belief_history, enrichment_revisions, signals, and memory_nodes
-to build a list of changes. Optionally summarizes via Haiku.
+Reads the change_events feed (belief_history, enrichment_revisions, signals
+and memory_nodes inserts) to build a list of changes. Optionally
+summarizes via Haiku.
 """
 
 import time
@@ -18,12 +19,27 @@ from app.core.schemas_briefing import (
 logger = get_logger(__name__)
 
 
+# Briefing count keys -> change_events kinds they sum
+_COUNT_KINDS: dict[str, tuple[ChangeType, ...]] = {
+    "beliefs_changed": (
+        ChangeType.BELIEF_STRENGTHENED, ChangeType.BELIEF_WEAKENED, ChangeType.BELIEF_CREATED,
+    ),
+    "new_signals": (ChangeType.SIGNAL_PROCESSED,),
+    "new_facts": (ChangeType.FACT_ADDED,),
+    "new_insights": (ChangeType.INSIGHT_ADDED,),
+    "entities_updated": (ChangeType.ENTITY_CREATED, ChangeType.ENTITY_UPDATED),
+}
+
+
 def compute_temporal_diff(
     project_id: UUID,
     since: datetime | None,
 ) -> BriefingWhatChanged:
     """Compute what changed since the given timestamp.
 
+    One get_change_digest call over the change_events feed: the latest 20
+    changes plus exact per-kind counts for the whole window.
+
     Args:
         project_id: Project UUID
         since: Timestamp of last session (None = first visit, returns empty)
@@ -37,139 +53,26 @@ def compute_temporal_diff(
             counts={},
         )
 
-    from app.db.supabase_client import get_supabase
+    from app.db.change_events import get_change_digest
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
 
-    supabase = get_supabase()
-    since_iso = since.isoformat()
-    pid = str(project_id)
     changes: list[TemporalChange] = []
     counts: dict[str, int] = {}
-
-    # 1. Belief history changes
     try:
-        result = (
-            supabase.table("belief_history")
-            .select("node_id, change_type, change_reason, previous_confidence, new_confidence, created_at")
-            .eq("project_id", pid)
-            .gt("created_at", since_iso)
-            .order("created_at", desc=True)
-            .limit(20)
-            .execute()
-        )
-        for row in result.data or []:
-            ct = row.get("change_type", "")
-            delta = None
-            if row.get("new_confidence") is not None and row.get("previous_confidence") is not None:
-                delta = row["new_confidence"] - row["previous_confidence"]
-
-            if ct in ("confidence_increase",):
-                change_type = ChangeType.BELIEF_STRENGTHENED
-            elif ct in ("confidence_decrease",):
-                change_type = ChangeType.BELIEF_WEAKENED
-            else:
-                change_type = ChangeType.BELIEF_CREATED
-
-            changes.append(
-                TemporalChange(
-                    change_type=change_type,
-                    summary=row.get("change_reason", "Belief updated"),
-                    confidence_delta=delta,
-                    timestamp=row.get("created_at"),
-                )
-            )
-        counts["beliefs_changed"] = len(result.data or [])
+        digest = get_change_digest(project_id, since=since, limit=20)
+        kind_counts = digest["counts"]
+        counts = {
+            key: sum(kind_counts.get(kind.value, 0) for kind in kinds)
+            for key, kinds in _COUNT_KINDS.items()
+        }
+        changes = [_to_temporal_change(row) for row in digest["changes"]]
     except Exception as e:
-        logger.warning(f"Belief history query failed: {e}")
-
-    # 2. New signals since last session
-    try:
-        result = (
-            supabase.table("signals")
-            .select("id, signal_type, title, created_at")
-            .eq("project_id", pid)
-            .gt("created_at", since_iso)
-            .order("created_at", desc=True)
-            .limit(10)
-            .execute()
-        )
-        for row in result.data or []:
-            changes.append(
-                TemporalChange(
-                    change_type=ChangeType.SIGNAL_PROCESSED,
-                    summary=f"New {row.get('signal_type', 'signal')}: {row.get('title', 'untitled')[:60]}",
-                    timestamp=row.get("created_at"),
-                )
-            )
-        counts["new_signals"] = len(result.data or [])
-    except Exception as e:
-        logger.warning(f"Signals query failed: {e}")
-
-    # 3. New memory nodes (facts + insights)
-    try:
-        result = (
-            supabase.table("memory_nodes")
-            .select("id, node_type, summary, created_at")
-            .eq("project_id", pid)
-            .in_("node_type", ["fact", "insight"])
-            .eq("is_active", True)
-            .gt("created_at", since_iso)
-            .order("created_at", desc=True)
-            .limit(15)
-            .execute()
-        )
-        fact_count = 0
-        insight_count = 0
-        for row in result.data or []:
-            ntype = row.get("node_type", "fact")
-            if ntype == "fact":
-                change_type = ChangeType.FACT_ADDED
-                fact_count += 1
-            else:
-                change_type = ChangeType.INSIGHT_ADDED
-                insight_count += 1
-
-            changes.append(
-                TemporalChange(
-                    change_type=change_type,
-                    summary=row.get("summary", "New knowledge added")[:80],
-                    timestamp=row.get("created_at"),
-                )
-            )
-        counts["new_facts"] = fact_count
-        counts["new_insights"] = insight_count
-    except Exception as e:
-        logger.warning(f"Memory nodes query failed: {e}")
-
-    # 4. Enrichment revisions (entity updates)
-    try:
-        result = (
-            supabase.table("enrichment_revisions")
-            .select("id, entity_type, entity_id, change_summary, created_at")
-            .eq("project_id", pid)
-            .gt("created_at", since_iso)
-            .order("created_at", desc=True)
-            .limit(10)
-            .execute()
-        )
-        for row in result.data or []:
-            changes.append(
-                TemporalChange(
-                    change_type=ChangeType.ENTITY_UPDATED,
-                    summary=row.get("change_summary", "Entity updated")[:80],
-                    entity_type=row.get("entity_type"),
-                    entity_id=row.get("entity_id"),
-                    timestamp=row.get("created_at"),
-                )
-            )
-        counts["entities_updated"] = len(result.data or [])
-    except Exception as e:
-        logger.warning(f"Enrichment revisions query failed: {e}")
+        logger.warning(f"Change digest query failed for {project_id}: {e}")
 
     # Build since_label
-    now = datetime.now(UTC)
-    if since.tzinfo is None:
-        since = since.replace(tzinfo=UTC)
-    delta = now - since
+    delta = datetime.now(UTC) - since
     if delta.days == 0:
         since_label = "earlier today"
     elif delta.days == 1:
@@ -179,20 +82,29 @@ def compute_temporal_diff(
     else:
         since_label = f"{delta.days // 7} week{'s' if delta.days >= 14 else ''} ago"
 
-    # Sort all changes by timestamp descending
-    changes.sort(
-        key=lambda c: c.timestamp.isoformat() if c.timestamp else "",
-        reverse=True,
-    )
-
     return BriefingWhatChanged(
         since_timestamp=since,
         since_label=since_label,
-        changes=changes[:20],  # cap at 20
+        changes=changes,  # newest first, capped at 20 by the digest
         counts=counts,
     )
 
 
+def _to_temporal_change(row: dict) -> TemporalChange:
+    """Map a change_events row to a TemporalChange."""
+    change_type = ChangeType(row["change_kind"])
+    # Only entity revisions link to a workspace entity
+    is_entity = change_type in (ChangeType.ENTITY_CREATED, ChangeType.ENTITY_UPDATED)
+    return TemporalChange(
+        change_type=change_type,
+        summary=row.get("summary") or "",
+        entity_type=row.get("entity_type") if is_entity else None,
+        entity_id=row.get("entity_id") if is_entity else None,
+        confidence_delta=row.get("confidence_delta"),
+        timestamp=row.get("created_at"),
+    )
+
+
 async def summarize_changes(changes: list[TemporalChange], project_id: str | None = None) -> str:
     """Summarize temporal changes via Haiku (only when changes exist).
 
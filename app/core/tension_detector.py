@@ -1,11 +1,21 @@
 """Tension detector — finds contradictions in the project's belief graph.
 
-Pure graph walking, no LLM, <50ms. Strategies:
+Pure graph walking, no LLM, <50ms. All inputs are loaded up front in a
+fixed number of bulk queries (load_tension_inputs), then every registered
+strategy runs in memory over the same TensionInputs. Strategies:
 1. Walk 'contradicts' edges where both nodes are active
-2. Compare beliefs linked to different stakeholders on same topic
-3. Check competing priority signals in business drivers
+2. Compare beliefs in the same domain with very different confidence
+3. Confirmed features with no evidence trail
+4. High-pain current workflows with no addressing features
+
+New rules register with @tension_strategy and read from TensionInputs —
+add a field (and one bulk query) there if a rule needs new data, never a
+per-entity query.
 """
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID
 
 from app.core.logging import get_logger
@@ -13,19 +23,42 @@ from app.core.schemas_briefing import ActiveTension
 
 logger = get_logger(__name__)
 
+_CONFIRMED_STATUSES = ["confirmed_consultant", "confirmed_client"]
+_HIGH_PAIN = 4
+# PostgREST's default max rows per response
+_PAGE_SIZE = 1000
 
-def detect_tensions(project_id: UUID) -> list[ActiveTension]:
-    """Detect active tensions in a project's belief graph.
 
-    Returns up to 5 tensions sorted by confidence.
+@dataclass
+class TensionInputs:
+    """Everything the tension strategies read, loaded in bulk."""
+
+    contradiction_edges: list[dict] = field(default_factory=list)
+    nodes: dict[str, dict] = field(default_factory=dict)  # edge endpoints by id
+    beliefs: list[dict] = field(default_factory=list)
+    confirmed_features: list[dict] = field(default_factory=list)
+    evidenced_entity_ids: set[str] = field(default_factory=set)
+    current_workflows: list[dict] = field(default_factory=list)
+    high_pain_steps: dict[str, list[dict]] = field(default_factory=dict)  # by workflow_id
+    workflows_with_features: set[str] = field(default_factory=set)
+
+
+def load_tension_inputs(project_id: UUID, supabase: Any = None) -> TensionInputs:
+    """Load all tension inputs in a fixed number of queries (≤ 8).
+
+    The evidence lookups take extra rounds only when a response hits the
+    row cap (see _ids_with_rows). Each group degrades independently: a
+    failed load leaves its fields empty and only the strategies reading
+    them find nothing.
     """
-    from app.db.supabase_client import get_supabase
+    if supabase is None:
+        from app.db.supabase_client import get_supabase
 
-    supabase = get_supabase()
+        supabase = get_supabase()
     pid = str(project_id)
-    tensions: list[ActiveTension] = []
+    inputs = TensionInputs()
 
-    # Strategy 1: Walk 'contradicts' edges where both nodes are active
+    # Contradiction edges + their endpoint nodes
     try:
         edges = (
             supabase.table("memory_edges")
@@ -35,65 +68,23 @@ def detect_tensions(project_id: UUID) -> list[ActiveTension]:
             .limit(20)
             .execute()
         )
-
-        if edges.data:
-            # Batch-load the nodes
-            node_ids = set()
-            for e in edges.data:
-                node_ids.add(e["from_node_id"])
-                node_ids.add(e["to_node_id"])
-
+        inputs.contradiction_edges = edges.data or []
+        node_ids = {
+            nid for e in inputs.contradiction_edges
+            for nid in (e["from_node_id"], e["to_node_id"])
+        }
+        if node_ids:
             nodes_result = (
                 supabase.table("memory_nodes")
                 .select("id, content, summary, confidence, node_type, is_active, linked_entity_type, linked_entity_id, belief_domain")
                 .in_("id", list(node_ids))
                 .execute()
             )
-            node_map = {n["id"]: n for n in (nodes_result.data or [])}
-
-            for edge in edges.data:
-                from_node = node_map.get(edge["from_node_id"])
-                to_node = node_map.get(edge["to_node_id"])
-
-                # Both must be active
-                if not from_node or not to_node:
-                    continue
-                if not from_node.get("is_active") or not to_node.get("is_active"):
-                    continue
-
-                # Build tension
-                involved = []
-                for n in [from_node, to_node]:
-                    if n.get("linked_entity_type") and n.get("linked_entity_id"):
-                        involved.append({
-                            "type": n["linked_entity_type"],
-                            "id": n["linked_entity_id"],
-                            "name": n.get("summary", "")[:40],
-                        })
-
-                # Confidence: average of both nodes' confidence,
-                # weighted by edge strength
-                avg_conf = (
-                    (from_node.get("confidence", 0.5) + to_node.get("confidence", 0.5)) / 2
-                )
-                edge_strength = edge.get("strength", 1.0) or 1.0
-                tension_confidence = min(1.0, avg_conf * edge_strength)
-
-                tensions.append(
-                    ActiveTension(
-                        tension_id=edge["id"],
-                        summary=edge.get("rationale") or _build_tension_summary(from_node, to_node),
-                        side_a=from_node.get("summary", from_node.get("content", "")[:80]),
-                        side_b=to_node.get("summary", to_node.get("content", "")[:80]),
-                        involved_entities=involved,
-                        confidence=round(tension_confidence, 2),
-                    )
-                )
+            inputs.nodes = {n["id"]: n for n in (nodes_result.data or [])}
     except Exception as e:
-        logger.warning(f"Tension detection strategy 1 failed: {e}")
+        logger.warning(f"Tension inputs: contradiction edges failed: {e}")
 
-    # Strategy 2: Beliefs with same domain but very different confidence
-    # (suggests disagreement in evidence)
+    # Active beliefs with a domain
     try:
         beliefs = (
             supabase.table("memory_nodes")
@@ -106,77 +97,32 @@ def detect_tensions(project_id: UUID) -> list[ActiveTension]:
             .limit(50)
             .execute()
         )
-
-        # Group by domain
-        domain_groups: dict[str, list[dict]] = {}
-        for b in beliefs.data or []:
-            domain = b.get("belief_domain", "")
-            if domain:
-                domain_groups.setdefault(domain, []).append(b)
-
-        # Find domains with high variance in confidence
-        existing_tension_ids = {t.tension_id for t in tensions}
-        for domain, group in domain_groups.items():
-            if len(group) < 2:
-                continue
-
-            confidences = [b.get("confidence", 0.5) for b in group]
-            max_conf = max(confidences)
-            min_conf = min(confidences)
-
-            # Only flag if spread is > 0.3
-            if max_conf - min_conf > 0.3:
-                high = next(b for b in group if b.get("confidence", 0) == max_conf)
-                low = next(b for b in group if b.get("confidence", 0) == min_conf)
-
-                tid = f"domain_tension:{domain}"
-                if tid not in existing_tension_ids:
-                    tensions.append(
-                        ActiveTension(
-                            tension_id=tid,
-                            summary=f"Conflicting confidence in '{domain}' — evidence points both ways",
-                            side_a=high.get("summary", "")[:80],
-                            side_b=low.get("summary", "")[:80],
-                            involved_entities=[],
-                            confidence=round((max_conf - min_conf) * 0.8, 2),
-                        )
-                    )
+        inputs.beliefs = beliefs.data or []
     except Exception as e:
-        logger.warning(f"Tension detection strategy 2 failed: {e}")
+        logger.warning(f"Tension inputs: beliefs failed: {e}")
 
-    # Strategy 3: Structural tensions — confirmed features with no evidence
+    # Confirmed features + which of them have any signal_impact (one in_)
     try:
         features_resp = (
             supabase.table("features")
             .select("id, name, confirmation_status")
             .eq("project_id", pid)
-            .in_("confirmation_status", ["confirmed_consultant", "confirmed_client"])
+            .in_("confirmation_status", _CONFIRMED_STATUSES)
             .limit(20)
             .execute()
         )
-        for feature in features_resp.data or []:
-            impact_resp = (
-                supabase.table("signal_impact")
-                .select("id")
-                .eq("entity_id", feature["id"])
-                .limit(1)
-                .execute()
+        inputs.confirmed_features = features_resp.data or []
+        feature_ids = [f["id"] for f in inputs.confirmed_features]
+        if feature_ids:
+            inputs.evidenced_entity_ids = _ids_with_rows(
+                lambda: supabase.table("signal_impact").select("entity_id"),
+                "entity_id",
+                feature_ids,
             )
-            if not impact_resp.data:
-                tensions.append(
-                    ActiveTension(
-                        tension_id=f"ungrounded:{feature['id']}",
-                        summary=f"Confirmed feature '{feature['name']}' has no evidence trail",
-                        side_a=f"Feature '{feature['name']}' is confirmed",
-                        side_b="No source signals found to back it up",
-                        involved_entities=[{"type": "feature", "id": feature["id"], "name": feature["name"]}],
-                        confidence=0.6,
-                    )
-                )
     except Exception as e:
-        logger.warning(f"Tension detection strategy 3 (ungrounded features) failed: {e}")
+        logger.warning(f"Tension inputs: feature evidence failed: {e}")
 
-    # Strategy 4: High-pain workflows with no addressing features
+    # Current workflows, their high-pain steps and feature links (one in_ each)
     try:
         workflows_resp = (
             supabase.table("workflows")
@@ -185,40 +131,204 @@ def detect_tensions(project_id: UUID) -> list[ActiveTension]:
             .eq("workflow_type", "current")
             .execute()
         )
-        for wf in workflows_resp.data or []:
+        inputs.current_workflows = workflows_resp.data or []
+        workflow_ids = [wf["id"] for wf in inputs.current_workflows]
+        if workflow_ids:
             steps_resp = (
                 supabase.table("vp_steps")
-                .select("id, label, pain_level")
-                .eq("workflow_id", wf["id"])
-                .gte("pain_level", 4)
+                .select("id, label, pain_level, workflow_id")
+                .in_("workflow_id", workflow_ids)
+                .gte("pain_level", _HIGH_PAIN)
                 .execute()
             )
-            high_pain_steps = steps_resp.data or []
-            if high_pain_steps:
-                feature_resp = (
-                    supabase.table("features")
-                    .select("id")
-                    .eq("project_id", pid)
-                    .eq("workflow_id", wf["id"])
-                    .limit(1)
-                    .execute()
+            for step in steps_resp.data or []:
+                inputs.high_pain_steps.setdefault(step["workflow_id"], []).append(step)
+
+            if inputs.high_pain_steps:
+                inputs.workflows_with_features = _ids_with_rows(
+                    lambda: supabase.table("features").select("workflow_id").eq("project_id", pid),
+                    "workflow_id",
+                    list(inputs.high_pain_steps),
                 )
-                if not feature_resp.data:
-                    tensions.append(
-                        ActiveTension(
-                            tension_id=f"unaddressed_pain:{wf['id']}",
-                            summary=(
-                                f"Workflow '{wf['name']}' has {len(high_pain_steps)} "
-                                f"high-pain steps but no addressing features"
-                            ),
-                            side_a=f"{len(high_pain_steps)} steps with pain >= 4",
-                            side_b="No features assigned to this workflow",
-                            involved_entities=[{"type": "workflow", "id": wf["id"], "name": wf["name"]}],
-                            confidence=0.7,
-                        )
-                    )
     except Exception as e:
-        logger.warning(f"Tension detection strategy 4 (unaddressed pain) failed: {e}")
+        logger.warning(f"Tension inputs: workflow pain failed: {e}")
+
+    return inputs
+
+
+def _ids_with_rows(build_query: Callable[[], Any], column: str, ids: list[str]) -> set[str]:
+    """Which of ids have at least one row in the query, past the row cap.
+
+    A response holds at most _PAGE_SIZE rows, so one busy id could crowd the
+    rest out. Each further round asks only for ids not found yet, which
+    makes progress every time; one round unless a response comes back full.
+    """
+    found: set[str] = set()
+    remaining = list(ids)
+    while remaining:
+        rows = build_query().in_(column, remaining).limit(_PAGE_SIZE).execute().data or []
+        found.update(r[column] for r in rows if r.get(column))
+        if len(rows) < _PAGE_SIZE:
+            break
+        remaining = [i for i in remaining if i not in found]
+    return found
+
+
+# ── Strategy registry ─────────────────────────────────────────────
+
+TensionStrategy = Callable[[TensionInputs], list[ActiveTension]]
+_STRATEGIES: list[tuple[str, TensionStrategy]] = []
+
+
+def tension_strategy(name: str) -> Callable[[TensionStrategy], TensionStrategy]:
+    """Register a tension rule. Rules run in registration order, in memory."""
+
+    def register(fn: TensionStrategy) -> TensionStrategy:
+        _STRATEGIES.append((name, fn))
+        return fn
+
+    return register
+
+
+@tension_strategy("contradiction_edges")
+def _contradiction_edges(inputs: TensionInputs) -> list[ActiveTension]:
+    """'contradicts' edges where both nodes are active."""
+    tensions: list[ActiveTension] = []
+    for edge in inputs.contradiction_edges:
+        from_node = inputs.nodes.get(edge["from_node_id"])
+        to_node = inputs.nodes.get(edge["to_node_id"])
+
+        # Both must be active
+        if not from_node or not to_node:
+            continue
+        if not from_node.get("is_active") or not to_node.get("is_active"):
+            continue
+
+        involved = []
+        for n in [from_node, to_node]:
+            if n.get("linked_entity_type") and n.get("linked_entity_id"):
+                involved.append({
+                    "type": n["linked_entity_type"],
+                    "id": n["linked_entity_id"],
+                    "name": n.get("summary", "")[:40],
+                })
+
+        # Confidence: average of both nodes' confidence,
+        # weighted by edge strength
+        avg_conf = (
+            (from_node.get("confidence", 0.5) + to_node.get("confidence", 0.5)) / 2
+        )
+        edge_strength = edge.get("strength", 1.0) or 1.0
+        tension_confidence = min(1.0, avg_conf * edge_strength)
+
+        tensions.append(
+            ActiveTension(
+                tension_id=edge["id"],
+                summary=edge.get("rationale") or _build_tension_summary(from_node, to_node),
+                side_a=from_node.get("summary", from_node.get("content", "")[:80]),
+                side_b=to_node.get("summary", to_node.get("content", "")[:80]),
+                involved_entities=involved,
+                confidence=round(tension_confidence, 2),
+            )
+        )
+    return tensions
+
+
+@tension_strategy("domain_confidence_spread")
+def _domain_confidence_spread(inputs: TensionInputs) -> list[ActiveTension]:
+    """Beliefs with same domain but very different confidence (evidence disagrees)."""
+    domain_groups: dict[str, list[dict]] = {}
+    for b in inputs.beliefs:
+        domain = b.get("belief_domain", "")
+        if domain:
+            domain_groups.setdefault(domain, []).append(b)
+
+    tensions: list[ActiveTension] = []
+    for domain, group in domain_groups.items():
+        if len(group) < 2:
+            continue
+
+        confidences = [b.get("confidence", 0.5) for b in group]
+        max_conf = max(confidences)
+        min_conf = min(confidences)
+
+        # Only flag if spread is > 0.3
+        if max_conf - min_conf > 0.3:
+            high = next(b for b in group if b.get("confidence", 0) == max_conf)
+            low = next(b for b in group if b.get("confidence", 0) == min_conf)
+            tensions.append(
+                ActiveTension(
+                    tension_id=f"domain_tension:{domain}",
+                    summary=f"Conflicting confidence in '{domain}' — evidence points both ways",
+                    side_a=high.get("summary", "")[:80],
+                    side_b=low.get("summary", "")[:80],
+                    involved_entities=[],
+                    confidence=round((max_conf - min_conf) * 0.8, 2),
+                )
+            )
+    return tensions
+
+
+@tension_strategy("ungrounded_features")
+def _ungrounded_features(inputs: TensionInputs) -> list[ActiveTension]:
+    """Confirmed features with no evidence trail."""
+    return [
+        ActiveTension(
+            tension_id=f"ungrounded:{feature['id']}",
+            summary=f"Confirmed feature '{feature['name']}' has no evidence trail",
+            side_a=f"Feature '{feature['name']}' is confirmed",
+            side_b="No source signals found to back it up",
+            involved_entities=[{"type": "feature", "id": feature["id"], "name": feature["name"]}],
+            confidence=0.6,
+        )
+        for feature in inputs.confirmed_features
+        if feature["id"] not in inputs.evidenced_entity_ids
+    ]
+
+
+@tension_strategy("unaddressed_pain")
+def _unaddressed_pain(inputs: TensionInputs) -> list[ActiveTension]:
+    """High-pain current workflows with no addressing features."""
+    tensions: list[ActiveTension] = []
+    for wf in inputs.current_workflows:
+        high_pain_steps = inputs.high_pain_steps.get(wf["id"], [])
+        if not high_pain_steps or wf["id"] in inputs.workflows_with_features:
+            continue
+        tensions.append(
+            ActiveTension(
+                tension_id=f"unaddressed_pain:{wf['id']}",
+                summary=(
+                    f"Workflow '{wf['name']}' has {len(high_pain_steps)} "
+                    f"high-pain steps but no addressing features"
+                ),
+                side_a=f"{len(high_pain_steps)} steps with pain >= {_HIGH_PAIN}",
+                side_b="No features assigned to this workflow",
+                involved_entities=[{"type": "workflow", "id": wf["id"], "name": wf["name"]}],
+                confidence=0.7,
+            )
+        )
+    return tensions
+
+
+def detect_tensions(project_id: UUID) -> list[ActiveTension]:
+    """Detect active tensions in a project's belief graph.
+
+    Returns up to 5 tensions sorted by confidence.
+    """
+    inputs = load_tension_inputs(project_id)
+
+    tensions: list[ActiveTension] = []
+    seen: set[str] = set()
+    for name, strategy in _STRATEGIES:
+        try:
+            found = strategy(inputs)
+        except Exception as e:
+            logger.warning(f"Tension detection strategy '{name}' failed: {e}")
+            continue
+        for tension in found:
+            if tension.tension_id not in seen:
+                seen.add(tension.tension_id)
+                tensions.append(tension)
 
     # Sort by confidence descending, limit to 5
     tensions.sort(key=lambda t: t.confidence, reverse=True)
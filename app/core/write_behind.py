@@ -0,0 +1,106 @@
+"""Write-behind queue — run non-critical blocking writes off the event loop.
+
+Chat persistence, LLM usage logging and routing telemetry are synchronous
+Supabase calls. Executing them inside an SSE generator blocks the event loop,
+freezing every other stream served by the same worker. Callers hand those
+writes to ``enqueue_write()`` instead: the call returns immediately and a
+single daemon thread executes writes in FIFO order (so a conversation's user
+message still lands before its assistant reply).
+
+Writes are best-effort: failures are logged, never raised to the caller.
+``flush_writes()`` waits for the queue to drain (shutdown hooks and tests).
+
+Writes that must not queue behind app-wide logging get their own
+WriteBehindQueue (chat messages in chat_stream, node embeddings in
+memory_graph).
+"""
+
+import atexit
+import queue
+import threading
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_DEPTH_WARNING = 500
+
+
+class WriteBehindQueue:
+    """FIFO queue of blocking callables drained by one background thread."""
+
+    def __init__(self, name: str, depth_warning: int = _DEPTH_WARNING):
+        self.name = name
+        self.depth_warning = depth_warning
+        self._queue: queue.Queue[tuple[Callable[[], Any], str]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Writes submitted but not yet completed."""
+        return self._queue.unfinished_tasks
+
+    def submit(self, fn: Callable[[], Any], label: str = "write") -> None:
+        """Queue a blocking write. Never blocks, never raises."""
+        self._ensure_worker()
+        self._queue.put_nowait((fn, label))
+        depth = self.depth
+        if depth and depth % self.depth_warning == 0:
+            logger.warning(f"Write-behind queue '{self.name}' depth={depth}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every submitted write has finished. Returns False on timeout."""
+        deadline = monotonic() + timeout
+        cond = self._queue.all_tasks_done
+        with cond:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                cond.wait(remaining)
+        return True
+
+    def _ensure_worker(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=f"write-behind-{self.name}", daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            fn, label = self._queue.get()
+            try:
+                fn()
+            except Exception as e:
+                logger.warning(f"Write-behind '{label}' failed (non-fatal): {e}")
+            finally:
+                self._queue.task_done()
+
+
+_default_queue = WriteBehindQueue("db")
+# Short-lived scripts exit right after their last write — give it a chance to land
+atexit.register(_default_queue.flush, 2.0)
+
+
+def enqueue_write(fn: Callable[[], Any], label: str = "write") -> None:
+    """Submit a blocking write to the shared write-behind queue."""
+    _default_queue.submit(fn, label)
+
+
+def flush_writes(timeout: float = 5.0) -> bool:
+    """Drain the shared write-behind queue. Returns False if it timed out."""
+    return _default_queue.flush(timeout)
+
+
+def pending_writes() -> int:
+    """Number of writes queued or in flight on the shared queue."""
+    return _default_queue.depth
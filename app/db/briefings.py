@@ -76,3 +76,51 @@ def get_latest_briefing(
             pass  # Can't parse date, return anyway
 
     return briefing
+
+
+def get_briefing_sections(project_id: UUID) -> dict[str, dict[str, Any]]:
+    """Load cached briefing sections, keyed by section name."""
+    supabase = get_supabase()
+
+    try:
+        result = (
+            supabase.table("briefing_section_cache")
+            .select("section, input_versions, payload, computed_at")
+            .eq("project_id", str(project_id))
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load briefing sections: {e}")
+        return {}
+
+    return {row["section"]: row for row in result.data or []}
+
+
+def save_briefing_sections(
+    project_id: UUID,
+    sections: dict[str, tuple[dict[str, Any], Any]],
+) -> None:
+    """Upsert recomputed sections in one call.
+
+    Args:
+        sections: {section: (input_versions, payload)}
+    """
+    if not sections:
+        return
+    now = datetime.now(UTC).isoformat()
+    rows = [
+        {
+            "project_id": str(project_id),
+            "section": name,
+            "input_versions": versions,
+            "payload": payload,
+            "computed_at": now,
+        }
+        for name, (versions, payload) in sections.items()
+    ]
+    try:
+        get_supabase().table("briefing_section_cache").upsert(
+            rows, on_conflict="project_id,section",
+        ).execute()
+    except Exception as e:
+        logger.warning(f"Failed to save briefing sections: {e}")
@@ -256,6 +256,41 @@ def save_competitive_mentions(recording_id: UUID, mentions: list[dict]) -> list[
     return result.data or []
 
 
+# ============================================================================
+# Per-pack analysis cache (migration 0213)
+# ============================================================================
+
+
+def get_cached_pack_analyses(
+    project_id: UUID | str, cache_keys: list[str]
+) -> dict[str, dict[str, Any]]:
+    """Cached pack analyses by cache key (missing keys are omitted)."""
+    if not cache_keys:
+        return {}
+
+    supabase = get_supabase()
+    result = (
+        supabase.table("call_analysis_pack_cache")
+        .select("cache_key, pack, result, model")
+        .eq("project_id", str(project_id))
+        .in_("cache_key", cache_keys)
+        .execute()
+    )
+    return {row["cache_key"]: row for row in result.data or []}
+
+
+def save_pack_analyses(project_id: UUID | str, rows: list[dict[str, Any]]) -> None:
+    """Upsert pack analyses; each row has cache_key, transcript_hash, pack, result."""
+    if not rows:
+        return
+
+    supabase = get_supabase()
+    supabase.table("call_analysis_pack_cache").upsert(
+        [{**row, "project_id": str(project_id)} for row in rows],
+        on_conflict="project_id,cache_key",
+    ).execute()
+
+
 # ============================================================================
 # Aggregated queries
 # ============================================================================
@@ -0,0 +1,70 @@
+"""Unified project change feed (change_events, migrations 0208 and 0218).
+
+Events are written by triggers on enrichment_revisions, belief_history,
+signals and memory_nodes; this module reads them and prunes old ones.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+
+def get_change_digest(
+    project_id: UUID,
+    since: datetime | None = None,
+    cursor: int | None = None,
+    limit: int = 20,
+) -> dict[str, Any]:
+    """
+    Get changes in a project after a timestamp and/or cursor, in one query.
+
+    Args:
+        project_id: Project UUID
+        since: Only events after this time
+        cursor: Only events after this cursor (from a previous digest)
+        limit: Max events returned in "changes" (counts cover all events)
+
+    Returns:
+        Dict with counts (by change kind), entity_counts (by entity type),
+        changes (newest first) and cursor (pass back to get the next page
+        of changes). The cursor is a transaction id, so events committed
+        late by long transactions are never skipped; events may repeat,
+        dedupe by id
+
+    Raises:
+        Exception: If database operation fails
+    """
+    response = get_supabase().rpc(
+        "get_change_digest",
+        {
+            "p_project_id": str(project_id),
+            "p_since": since.isoformat() if since else None,
+            "p_cursor": cursor,
+            "p_limit": limit,
+        },
+    ).execute()
+
+    digest = response.data or {}
+    return {
+        "counts": digest.get("counts") or {},
+        "entity_counts": digest.get("entity_counts") or {},
+        "changes": digest.get("changes") or [],
+        "cursor": digest.get("cursor") or cursor or 0,
+    }
+
+
+def prune_change_events(
+    days: int = 90, project_id: UUID | None = None, dry_run: bool = False,
+) -> int:
+    """Delete change events older than the retention period (batched)."""
+    from app.db.sweeps import run_sweep
+
+    cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+    return run_sweep(
+        "change_events", {"p_cutoff": cutoff}, project_id=project_id, dry_run=dry_run,
+    ).affected
@@ -4,6 +4,7 @@ from typing import Any, Literal
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.db.revisions_enrichment import REVISION_LIST_COLUMNS
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
@@ -154,7 +155,7 @@ def get_entity_history(
 
     query = (
         supabase.table("enrichment_revisions")
-        .select("*")
+        .select(REVISION_LIST_COLUMNS)
         .eq("entity_id", str(entity_id))
     )
 
@@ -186,7 +187,7 @@ def get_project_recent_changes(
 
     query = (
         supabase.table("enrichment_revisions")
-        .select("*")
+        .select(REVISION_LIST_COLUMNS)
         .eq("project_id", str(project_id))
     )
 
@@ -218,7 +219,7 @@ def get_signal_impact(
 
     response = (
         supabase.table("enrichment_revisions")
-        .select("*")
+        .select(REVISION_LIST_COLUMNS)
         .eq("source_signal_id", str(signal_id))
         .order("created_at", desc=True)
         .limit(limit)
@@ -248,7 +249,7 @@ def get_entity_version_diff(
 
     response = (
         supabase.table("enrichment_revisions")
-        .select("*")
+        .select(REVISION_LIST_COLUMNS)
         .eq("entity_id", str(entity_id))
         .gte("revision_number", from_version)
         .lte("revision_number", to_version)
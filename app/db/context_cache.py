@@ -3,6 +3,10 @@
 When multiple enrichment graphs run in parallel, they independently call
 get_state_snapshot(), list_latest_extracted_facts(), and list_confirmation_items()
 with identical parameters. This cache eliminates redundant DB reads.
+
+Entries remember the project write version they were computed at and are
+served while it is unchanged (up to _MAX_AGE_SECONDS). When the version
+can't be read they fall back to the short _TTL_SECONDS.
 """
 
 import threading
@@ -11,24 +15,29 @@ from typing import Any
 from uuid import UUID
 
 _lock = threading.Lock()
-_cache: dict[str, tuple[Any, float]] = {}
+_cache: dict[str, tuple[Any, float, int | None]] = {}
 _TTL_SECONDS = 30
+_MAX_AGE_SECONDS = 900
 
 
-def _get_or_compute(key: str, compute_fn) -> Any:
+def _get_or_compute(key: str, project_id: UUID, compute_fn) -> Any:
     """Get from cache or compute and cache the result."""
+    from app.db.write_versions import current_project_version
+
+    version = current_project_version(project_id)
+    max_age = _TTL_SECONDS if version is None else _MAX_AGE_SECONDS
     now = monotonic()
     with _lock:
         if key in _cache:
-            value, ts = _cache[key]
-            if now - ts < _TTL_SECONDS:
+            value, ts, cached_version = _cache[key]
+            if cached_version == version and now - ts < max_age:
                 return value
 
     # Compute outside the lock to avoid blocking
     result = compute_fn()
 
     with _lock:
-        _cache[key] = (result, monotonic())
+        _cache[key] = (result, monotonic(), version)
     return result
 
 
@@ -38,6 +47,7 @@ def cached_state_snapshot(project_id: UUID) -> str:
 
     return _get_or_compute(
         f"snapshot:{project_id}",
+        project_id,
         lambda: get_state_snapshot(project_id),
     )
 
@@ -48,6 +58,7 @@ def cached_extracted_facts(project_id: UUID, limit: int = 10) -> list:
 
     return _get_or_compute(
         f"facts:{project_id}:{limit}",
+        project_id,
         lambda: list_latest_extracted_facts(project_id, limit=limit),
     )
 
@@ -58,12 +69,16 @@ def cached_confirmation_items(project_id: UUID) -> list:
 
     return _get_or_compute(
         f"confirmations:{project_id}",
+        project_id,
         lambda: list_confirmation_items(project_id),
     )
 
 
 def invalidate_project(project_id: UUID) -> None:
     """Clear all cached entries for a project."""
+    from app.db.write_versions import note_project_write
+
+    note_project_write(project_id)
     prefix = str(project_id)
     with _lock:
         keys_to_remove = [k for k in _cache if prefix in k]
@@ -142,3 +142,75 @@ def get_extracted_image(image_id: UUID) -> dict[str, Any] | None:
     )
 
     return response.data[0] if response.data else None
+
+
+# =============================================================================
+# Vision analysis cache (migration 0212)
+# =============================================================================
+
+
+def get_cached_vision_analyses(
+    project_id: UUID,
+    image_hashes: list[str],
+    prompt_key: str,
+) -> dict[str, str]:
+    """Look up cached vision analyses.
+
+    Args:
+        project_id: Project UUID
+        image_hashes: ImageFingerprint keys
+        prompt_key: Hash of model + prompt
+
+    Returns:
+        {image_hash: analysis} for cached images
+    """
+    if not image_hashes:
+        return {}
+    try:
+        response = (
+            get_supabase()
+            .table("vision_analysis_cache")
+            .select("image_hash, analysis")
+            .eq("project_id", str(project_id))
+            .eq("prompt_key", prompt_key)
+            .in_("image_hash", image_hashes)
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load vision analysis cache: {e}")
+        return {}
+    return {row["image_hash"]: row["analysis"] for row in response.data or []}
+
+
+def save_vision_analyses(
+    project_id: UUID,
+    analyses: dict[str, str],
+    prompt_key: str,
+    model: str,
+) -> None:
+    """Cache vision analyses by image hash. Fire-and-forget.
+
+    Args:
+        project_id: Project UUID
+        analyses: {image_hash: analysis}
+        prompt_key: Hash of model + prompt
+        model: Model that produced the analyses
+    """
+    if not analyses:
+        return
+    rows = [
+        {
+            "project_id": str(project_id),
+            "image_hash": image_hash,
+            "prompt_key": prompt_key,
+            "analysis": analysis,
+            "model": model,
+        }
+        for image_hash, analysis in analyses.items()
+    ]
+    try:
+        get_supabase().table("vision_analysis_cache").upsert(
+            rows, on_conflict="project_id,image_hash,prompt_key",
+        ).execute()
+    except Exception as e:
+        logger.warning(f"Failed to save vision analysis cache: {e}")
@@ -151,20 +151,10 @@ def delete_user_tokens(user_id: UUID) -> int:
     return len(result.data) if result.data else 0
 
 
-def deactivate_expired_tokens() -> int:
-    """Deactivate all expired tokens (retention policy)."""
-    supabase = get_supabase()
-    from datetime import datetime
+def deactivate_expired_tokens(project_id: UUID | None = None, dry_run: bool = False) -> int:
+    """Deactivate all expired tokens (retention policy, batched)."""
+    from app.db.sweeps import run_sweep
 
-    now = datetime.now(UTC).isoformat()
-    result = (
-        supabase.table("email_routing_tokens")
-        .update({"is_active": False})
-        .eq("is_active", True)
-        .lt("expires_at", now)
-        .execute()
-    )
-    count = len(result.data) if result.data else 0
-    if count:
-        logger.info(f"Deactivated {count} expired email routing tokens")
-    return count
+    return run_sweep(
+        "expired_routing_tokens", {}, project_id=project_id, dry_run=dry_run,
+    ).affected
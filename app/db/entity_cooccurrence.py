@@ -0,0 +1,119 @@
+"""Materialized entity co-occurrence edges (entity_cooccurrence table).
+
+Each row is one directed edge (entity_a → entity_b) with the number of signal
+chunks both entities were extracted from, the latest shared-chunk timestamp and
+the per-chunk timestamps used for recency weighting. Edges are refreshed
+incrementally after signal_impact writes, so neighborhood lookups are a single
+indexed read instead of a signal_impact self-join per call. Deleting an entity
+or its impacts prunes its edges in the database (migration 0217).
+
+A missing edge set is not proof of no neighbors — the entity's refresh may
+not have run yet — so readers treat it as unknown and fall back to the join
+(see graph_queries), queueing a refresh with refresh_cooccurrence_later().
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+_EDGE_COLUMNS = (
+    "entity_a_id, entity_b_id, entity_b_type, shared_chunk_count, latest_chunk_at, chunk_times"
+)
+
+
+def refresh_cooccurrence(entity_ids: list[str | UUID]) -> int:
+    """Recompute all co-occurrence edges touching these entities.
+
+    Supplementary bookkeeping — failures are logged, never raised.
+
+    Returns:
+        Number of edges written (0 on failure)
+    """
+    ids = sorted({str(eid) for eid in entity_ids if eid})
+    if not ids:
+        return 0
+    try:
+        resp = get_supabase().rpc(
+            "refresh_entity_cooccurrence", {"p_entity_ids": ids}
+        ).execute()
+        return int(resp.data or 0)
+    except Exception as e:
+        logger.warning(f"Co-occurrence refresh failed for {len(ids)} entities: {e}")
+        return 0
+
+
+def refresh_cooccurrence_later(entity_ids: list[str | UUID]) -> None:
+    """Queue refresh_cooccurrence on the background pool, unless it's saturated."""
+    ids = sorted({str(eid) for eid in entity_ids if eid})
+    if not ids:
+        return
+
+    from app.core.executors import get_pool
+
+    background = get_pool("background")
+    if background.admit():
+        background.submit(refresh_cooccurrence, ids)
+
+
+def _edge_weight(row: dict, apply_recency: bool) -> int | float:
+    """Shared chunk count, or the sum of recency multipliers when requested."""
+    if not apply_recency:
+        return int(row.get("shared_chunk_count") or 0)
+
+    from app.db.graph_queries import _compute_recency_multiplier
+
+    times = row.get("chunk_times") or []
+    if not times:
+        return float(row.get("shared_chunk_count") or 0)
+    return round(sum(_compute_recency_multiplier(t) for t in times), 1)
+
+
+def get_cooccurrences(
+    entity_ids: list[str],
+    limit: int = 50,
+    apply_recency: bool = False,
+    sb: Any | None = None,
+) -> dict[str, dict[str, dict]] | None:
+    """Read co-occurrence edges for one or more seed entities in one query.
+
+    Args:
+        entity_ids: Seed entity ids (entity_a side)
+        limit: Max edges returned, strongest first
+        apply_recency: Weight by recency multipliers instead of raw counts
+        sb: Optional Supabase client (defaults to the shared one)
+
+    Returns:
+        {seed_id: {other_id: {entity_id, entity_type, weight[, freshness]}}},
+        or None when the table can't be read (caller should fall back).
+    """
+    if not entity_ids:
+        return {}
+    sb = sb or get_supabase()
+    try:
+        query = sb.table("entity_cooccurrence").select(_EDGE_COLUMNS)
+        if len(entity_ids) == 1:
+            query = query.eq("entity_a_id", entity_ids[0])
+        else:
+            query = query.in_("entity_a_id", entity_ids)
+        resp = query.order("shared_chunk_count", desc=True).limit(limit).execute()
+    except Exception as e:
+        logger.debug(f"Materialized co-occurrence read failed: {e}")
+        return None
+
+    edges: dict[str, dict[str, dict]] = {}
+    for row in resp.data or []:
+        entry = {
+            "entity_id": row["entity_b_id"],
+            "entity_type": row.get("entity_b_type", ""),
+            "weight": _edge_weight(row, apply_recency),
+        }
+        if apply_recency:
+            entry["freshness"] = (row.get("latest_chunk_at") or "")[:10]
+        edges.setdefault(row["entity_a_id"], {})[row["entity_b_id"]] = entry
+    return edges
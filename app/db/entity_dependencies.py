@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.db.entity_graph import invalidate_project_graph
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
@@ -106,6 +107,8 @@ def register_dependency(
         .execute()
     )
 
+    invalidate_project_graph(project_id)
+
     logger.info(
         f"Registered dependency: {source_type}:{source_id} -> {target_type}:{target_id} ({dependency_type})",
         extra={"project_id": str(project_id)},
@@ -132,6 +135,7 @@ def dispute_dependency(dep_id: str) -> dict | None:
     )
     if result.data:
         logger.info(f"Disputed dependency: {dep_id}")
+        invalidate_project_graph(result.data[0].get("project_id", ""))
         return result.data[0]
     return None
 
@@ -244,7 +248,10 @@ def adjust_link_confidence(
             .eq("id", dep_id)
             .execute()
         )
-        return updated.data[0] if updated.data else None
+        if not updated.data:
+            return None
+        invalidate_project_graph(updated.data[0].get("project_id", ""))
+        return updated.data[0]
     except Exception as e:
         logger.warning(f"Failed to adjust link confidence for {dep_id}: {e}")
         return None
@@ -290,6 +297,7 @@ def remove_dependency(
     response = query.execute()
 
     count = len(response.data) if response.data else 0
+    invalidate_project_graph(project_id)
     logger.info(
         f"Removed {count} dependencies: {source_type}:{source_id} -> {target_type}:{target_id}",
         extra={"project_id": str(project_id)},
@@ -328,6 +336,7 @@ def remove_all_source_dependencies(
     )
 
     count = len(response.data) if response.data else 0
+    invalidate_project_graph(project_id)
     logger.info(
         f"Removed {count} source dependencies for {source_type}:{source_id}",
         extra={"project_id": str(project_id)},
@@ -683,6 +692,7 @@ def rebuild_dependencies_for_workflow(project_id: UUID, workflow_id: UUID) -> di
         ).eq("source_entity_type", "workflow").eq(
             "source_entity_id", str(workflow_id)
         ).eq("source", "structural").execute()
+        invalidate_project_graph(project_id)
     except Exception as e:
         logger.warning(f"Failed to clear structural deps for workflow {workflow_id}: {e}")
 
@@ -846,7 +856,8 @@ def get_impact_analysis(
     """
     Calculate the full impact if this entity changes.
 
-    Performs recursive traversal of dependency graph to find all affected entities.
+    Performs recursive traversal of the cached in-memory dependency graph to find
+    all affected entities (one load per project instead of one query per node).
 
     Args:
         project_id: Project UUID
@@ -862,11 +873,14 @@ def get_impact_analysis(
         - total_affected: total count of affected entities
         - recommendation: auto|review_suggested|high_impact_warning
     """
+    from app.db.entity_graph import get_project_graph
+
+    graph = get_project_graph(project_id)
     visited = set()
     direct_impacts = []
     indirect_impacts = []
 
-    def traverse(etype: str, eid: UUID, depth: int, path: list[str]):
+    def traverse(etype: str, eid: UUID | str, depth: int, path: list[str]):
         if depth > max_depth:
             return
         key = f"{etype}:{eid}"
@@ -874,7 +888,7 @@ def get_impact_analysis(
             return
         visited.add(key)
 
-        dependents = get_dependents(project_id, etype, eid)
+        dependents = graph.dependents(etype, eid)
         for dep in dependents:
             dep_key = f"{dep['source_entity_type']}:{dep['source_entity_id']}"
             impact = {
@@ -893,7 +907,7 @@ def get_impact_analysis(
             # Recurse
             traverse(
                 dep["source_entity_type"],
-                UUID(dep["source_entity_id"]),
+                dep["source_entity_id"],
                 depth + 1,
                 path + [key],
             )
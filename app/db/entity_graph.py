@@ -0,0 +1,329 @@
+"""Per-project in-memory entity graph for multi-hop traversals.
+
+Loads ``entity_dependencies`` and ``signal_impact`` for a project once and keeps
+them as CSR-style adjacency arrays (``indptr`` / ``indices``), so chain
+completeness, impact analysis, path finding and 2-hop neighborhoods run as
+in-memory BFS/DFS instead of one query per hop.
+
+Graphs are cached per project and dropped by ``invalidate_project_graph()``,
+which every dependency / signal_impact write path calls. A TTL is kept only as
+a safety net for writes made outside this process.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+from uuid import UUID
+
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+_GRAPH_TTL_SECONDS = 300
+_PAGE_SIZE = 1000
+_MIN_LINK_CONFIDENCE = 0.3
+
+_lock = threading.Lock()
+_graphs: dict[str, tuple[ProjectGraph, float]] = {}
+_generations: dict[str, int] = {}  # bumped on invalidate; guards against storing stale loads
+
+
+def _build_csr(n: int, pairs: Iterable[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Build (indptr, indices) arrays for ``n`` rows from (row, col) pairs."""
+    buckets: list[list[int]] = [[] for _ in range(n)]
+    for row, col in pairs:
+        buckets[row].append(col)
+    indptr = [0] * (n + 1)
+    indices: list[int] = []
+    for i, bucket in enumerate(buckets):
+        indices.extend(bucket)
+        indptr[i + 1] = len(indices)
+    return indptr, indices
+
+
+@dataclass
+class ProjectGraph:
+    """Immutable adjacency snapshot for one project.
+
+    Nodes are entity ids (and chunk ids for the co-occurrence bipartite graph),
+    interned to dense integer indices. All adjacency is stored CSR-style.
+    """
+
+    project_id: str
+    dependency_rows: list[dict] = field(default_factory=list)
+    node_ids: list[str] = field(default_factory=list)
+    node_types: list[str] = field(default_factory=list)
+    node_index: dict[str, int] = field(default_factory=dict)
+    # entity_dependencies by target node → edge indices into dependency_rows
+    dep_in_ptr: list[int] = field(default_factory=lambda: [0])
+    dep_in_idx: list[int] = field(default_factory=list)
+    # entity_dependencies by source node → edge indices into dependency_rows
+    dep_out_ptr: list[int] = field(default_factory=lambda: [0])
+    dep_out_idx: list[int] = field(default_factory=list)
+    # Undirected, non-disputed, confidence >= 0.3 links → neighbor node indices
+    link_ptr: list[int] = field(default_factory=lambda: [0])
+    link_idx: list[int] = field(default_factory=list)
+    # signal_impact bipartite graph: entity node → chunk index, chunk → entity node
+    chunk_ids: list[str] = field(default_factory=list)
+    entity_chunk_ptr: list[int] = field(default_factory=lambda: [0])
+    entity_chunk_idx: list[int] = field(default_factory=list)
+    chunk_entity_ptr: list[int] = field(default_factory=lambda: [0])
+    chunk_entity_idx: list[int] = field(default_factory=list)
+
+    # ── Construction ──
+
+    @classmethod
+    def build(
+        cls,
+        project_id: str,
+        dependency_rows: list[dict],
+        impact_rows: list[dict],
+    ) -> ProjectGraph:
+        """Intern node ids and build all CSR arrays from raw rows."""
+        graph = cls(project_id=project_id, dependency_rows=dependency_rows)
+
+        def intern(entity_id: str, entity_type: str) -> int:
+            idx = graph.node_index.get(entity_id)
+            if idx is None:
+                idx = len(graph.node_ids)
+                graph.node_index[entity_id] = idx
+                graph.node_ids.append(entity_id)
+                graph.node_types.append(entity_type or "")
+            return idx
+
+        in_pairs: list[tuple[int, int]] = []
+        out_pairs: list[tuple[int, int]] = []
+        link_pairs: list[tuple[int, int]] = []
+        for edge_no, row in enumerate(dependency_rows):
+            src_id = row.get("source_entity_id")
+            tgt_id = row.get("target_entity_id")
+            if not src_id or not tgt_id:
+                continue
+            src = intern(str(src_id), row.get("source_entity_type", ""))
+            tgt = intern(str(tgt_id), row.get("target_entity_type", ""))
+            out_pairs.append((src, edge_no))
+            in_pairs.append((tgt, edge_no))
+            conf = row.get("confidence")
+            if conf is None:
+                conf = 0.5
+            if not row.get("disputed") and conf >= _MIN_LINK_CONFIDENCE:
+                link_pairs.append((src, tgt))
+                link_pairs.append((tgt, src))
+
+        chunk_index: dict[str, int] = {}
+        entity_chunk_pairs: set[tuple[int, int]] = set()
+        for row in impact_rows:
+            eid = row.get("entity_id")
+            cid = row.get("chunk_id")
+            if not eid or not cid:
+                continue
+            node = intern(str(eid), row.get("entity_type", ""))
+            chunk = chunk_index.get(cid)
+            if chunk is None:
+                chunk = len(graph.chunk_ids)
+                chunk_index[cid] = chunk
+                graph.chunk_ids.append(cid)
+            entity_chunk_pairs.add((node, chunk))
+
+        n = len(graph.node_ids)
+        graph.dep_in_ptr, graph.dep_in_idx = _build_csr(n, in_pairs)
+        graph.dep_out_ptr, graph.dep_out_idx = _build_csr(n, out_pairs)
+        graph.link_ptr, graph.link_idx = _build_csr(n, dict.fromkeys(link_pairs))
+        ordered = sorted(entity_chunk_pairs)
+        graph.entity_chunk_ptr, graph.entity_chunk_idx = _build_csr(n, ordered)
+        graph.chunk_entity_ptr, graph.chunk_entity_idx = _build_csr(
+            len(graph.chunk_ids), ((c, e) for e, c in ordered)
+        )
+        return graph
+
+    # ── Row accessors ──
+
+    def _row(self, indptr: list[int], indices: list[int], i: int) -> list[int]:
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def dependents(self, entity_type: str, entity_id: str | UUID) -> list[dict]:
+        """Dependency rows whose target is this entity (same shape as get_dependents)."""
+        idx = self.node_index.get(str(entity_id))
+        if idx is None:
+            return []
+        rows = (self.dependency_rows[e] for e in self._row(self.dep_in_ptr, self.dep_in_idx, idx))
+        return [r for r in rows if r.get("target_entity_type") == entity_type]
+
+    def dependencies(self, entity_type: str, entity_id: str | UUID) -> list[dict]:
+        """Dependency rows whose source is this entity (same shape as get_dependencies)."""
+        idx = self.node_index.get(str(entity_id))
+        if idx is None:
+            return []
+        rows = (self.dependency_rows[e] for e in self._row(self.dep_out_ptr, self.dep_out_idx, idx))
+        return [r for r in rows if r.get("source_entity_type") == entity_type]
+
+    def entity_type(self, entity_id: str) -> str:
+        """Entity type recorded for a node, or '' if unknown."""
+        idx = self.node_index.get(entity_id)
+        return self.node_types[idx] if idx is not None else ""
+
+    # ── Traversals ──
+
+    def link_distances(self, sources: Iterable[str], max_hops: int) -> dict[str, int]:
+        """Multi-source BFS over trusted dependency links.
+
+        Returns {entity_id: hop distance to the nearest source} for every node
+        within ``max_hops``; sources themselves are at distance 0.
+        """
+        dist: dict[int, int] = {}
+        frontier: list[int] = []
+        for sid in sources:
+            idx = self.node_index.get(sid)
+            if idx is not None and idx not in dist:
+                dist[idx] = 0
+                frontier.append(idx)
+
+        for hop in range(1, max_hops + 1):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for nb in self._row(self.link_ptr, self.link_idx, node):
+                    if nb not in dist:
+                        dist[nb] = hop
+                        next_frontier.append(nb)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return {self.node_ids[i]: d for i, d in dist.items()}
+
+    def cooccurrences(self, entity_id: str) -> dict[str, int]:
+        """Entities sharing at least one chunk with ``entity_id`` → shared chunk count."""
+        idx = self.node_index.get(entity_id)
+        if idx is None:
+            return {}
+        counts: dict[int, int] = {}
+        for chunk in self._row(self.entity_chunk_ptr, self.entity_chunk_idx, idx):
+            for other in self._row(self.chunk_entity_ptr, self.chunk_entity_idx, chunk):
+                if other != idx:
+                    counts[other] = counts.get(other, 0) + 1
+        return {self.node_ids[i]: c for i, c in counts.items()}
+
+    def neighborhood(self, entity_id: str, depth: int = 2) -> dict[str, int]:
+        """Co-occurrence neighbors within ``depth`` hops → hop number (1 or more)."""
+        idx = self.node_index.get(entity_id)
+        if idx is None:
+            return {}
+        hops: dict[int, int] = {idx: 0}
+        frontier = [idx]
+        for hop in range(1, depth + 1):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for chunk in self._row(self.entity_chunk_ptr, self.entity_chunk_idx, node):
+                    for other in self._row(self.chunk_entity_ptr, self.chunk_entity_idx, chunk):
+                        if other not in hops:
+                            hops[other] = hop
+                            next_frontier.append(other)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return {self.node_ids[i]: h for i, h in hops.items() if h > 0}
+
+    def cooccurrence_path(self, source_id: str, target_id: str, max_hops: int) -> list[str] | None:
+        """Shortest co-occurrence path from source to target, or None beyond ``max_hops``."""
+        src = self.node_index.get(source_id)
+        dst = self.node_index.get(target_id)
+        if src is None or dst is None:
+            return None
+        if src == dst:
+            return [source_id]
+
+        parent: dict[int, int] = {src: src}
+        frontier = [src]
+        for _ in range(max_hops):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for chunk in self._row(self.entity_chunk_ptr, self.entity_chunk_idx, node):
+                    for other in self._row(self.chunk_entity_ptr, self.chunk_entity_idx, chunk):
+                        if other in parent:
+                            continue
+                        parent[other] = node
+                        if other == dst:
+                            path = [dst]
+                            while path[-1] != src:
+                                path.append(parent[path[-1]])
+                            return [self.node_ids[i] for i in reversed(path)]
+                        next_frontier.append(other)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
+
+
+# ── Loading + cache ──
+
+
+def _fetch_all(build_query: Callable[[], Any]) -> list[dict]:
+    """Page through a PostgREST query so large projects aren't truncated at 1000 rows."""
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        resp = build_query().range(offset, offset + _PAGE_SIZE - 1).execute()
+        page = resp.data or []
+        rows.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return rows
+        offset += _PAGE_SIZE
+
+
+def _load_project_graph(project_id: str) -> ProjectGraph:
+    sb = get_supabase()
+    dependency_rows = _fetch_all(
+        lambda: sb.table("entity_dependencies").select("*").eq("project_id", project_id)
+    )
+    try:
+        impact_rows = _fetch_all(
+            lambda: sb.table("signal_impact")
+            .select("entity_id, entity_type, chunk_id")
+            .eq("project_id", project_id)
+        )
+    except Exception as e:
+        logger.debug(f"signal_impact load failed for graph {project_id}: {e}")
+        impact_rows = []
+
+    graph = ProjectGraph.build(project_id, dependency_rows, impact_rows)
+    logger.debug(
+        f"Loaded entity graph for {project_id}: {len(graph.node_ids)} nodes, "
+        f"{len(dependency_rows)} dependencies, {len(graph.chunk_ids)} chunks"
+    )
+    return graph
+
+
+def get_project_graph(project_id: UUID | str) -> ProjectGraph:
+    """Return the cached adjacency snapshot for a project, loading it on miss.
+
+    Raises whatever the dependency load raises — callers decide how to degrade.
+    """
+    pid = str(project_id)
+    now = monotonic()
+    with _lock:
+        cached = _graphs.get(pid)
+        if cached and now - cached[1] < _GRAPH_TTL_SECONDS:
+            return cached[0]
+        generation = _generations.get(pid, 0)
+
+    # Load outside the lock so one slow project doesn't block the others
+    graph = _load_project_graph(pid)
+
+    with _lock:
+        # A write landed while we were loading — serve this graph but don't cache it
+        if _generations.get(pid, 0) == generation:
+            _graphs[pid] = (graph, monotonic())
+    return graph
+
+
+def invalidate_project_graph(project_id: UUID | str) -> None:
+    """Drop the cached graph for a project. Call after any dependency/impact write."""
+    pid = str(project_id)
+    with _lock:
+        _graphs.pop(pid, None)
+        _generations[pid] = _generations.get(pid, 0) + 1
@@ -2,7 +2,8 @@
 
 Provides entity neighborhood traversal, reverse provenance (chunk→entities),
 BFS path finding, and structural tension detection. All queries use existing
-FKs and the signal_impact table — no new DB structures needed.
+FKs and the signal_impact table — no new DB structures needed. Multi-hop
+traversals run over the cached in-memory graph in app.db.entity_graph.
 """
 
 from __future__ import annotations
@@ -12,6 +13,7 @@ from typing import Any
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.db.entity_cooccurrence import get_cooccurrences, refresh_cooccurrence_later
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
@@ -314,6 +316,165 @@ def _get_belief_summary_batch(
         return {}
 
 
+def _hop2_from_chunks(
+    sb: Any,
+    seed_id: str,
+    hop1_seen: dict[str, dict],
+    cooccur_fn: Any,
+    max_related: int,
+    apply_recency: bool,
+) -> dict[str, dict]:
+    """Hop-2 expansion via signal_impact chunk joins (pre-materialization fallback).
+
+    Batched: 1 query for all hop-1 chunk_ids, 1 co-occurrence query, 1 query for
+    hop-2 chunk_ids to find the bridging hop-1 entity.
+    """
+    hop2_seen: dict[str, dict] = {}
+    hop1_ids = list(hop1_seen.keys())
+
+    # Single batched signal_impact query for all hop-1 entity chunk_ids
+    # Track which chunks belong to which hop-1 entity for intermediary mapping
+    h1_chunks_by_entity: dict[str, set[str]] = {}
+    try:
+        h1_impact_resp = (
+            sb.table("signal_impact")
+            .select("entity_id, chunk_id")
+            .in_("entity_id", hop1_ids[:20])
+            .limit(500)
+            .execute()
+        )
+        for row in h1_impact_resp.data or []:
+            eid = row["entity_id"]
+            cid = row.get("chunk_id")
+            if cid:
+                h1_chunks_by_entity.setdefault(eid, set()).add(cid)
+    except Exception as e:
+        logger.debug(f"Hop-2 chunk lookup failed: {e}")
+
+    hop2_chunk_ids = list({cid for chunks in h1_chunks_by_entity.values() for cid in chunks})
+
+    if hop2_chunk_ids:
+        # Single co-occurrence query from all hop-2 chunks
+        raw_hop2 = cooccur_fn(
+            sb, hop2_chunk_ids, seed_id, limit=max_related * 5,
+        )
+
+        # Also get chunk_ids for hop-2 entities to find intermediaries
+        # Single batched query for all new hop-2 entity chunk_ids
+        h2_entity_ids = [eid for eid in raw_hop2 if eid not in hop1_seen]
+        h2_chunks_by_entity: dict[str, set[str]] = {}
+        if h2_entity_ids:
+            try:
+                h2_impact_resp = (
+                    sb.table("signal_impact")
+                    .select("entity_id, chunk_id")
+                    .in_("entity_id", h2_entity_ids[:30])
+                    .limit(500)
+                    .execute()
+                )
+                for row in h2_impact_resp.data or []:
+                    eid = row["entity_id"]
+                    cid = row.get("chunk_id")
+                    if cid:
+                        h2_chunks_by_entity.setdefault(eid, set()).add(cid)
+            except Exception as e:
+                logger.debug(f"Hop-2 entity chunk lookup failed: {e}")
+
+        # Build intermediary mapping using pre-fetched chunk sets
+        for h2_id, h2_ent in raw_hop2.items():
+            if h2_id in hop1_seen:
+                continue  # Will keep hop-1 version (dedup below)
+
+            # Find which hop-1 entity bridged to this hop-2 entity
+            intermediary = None
+            h2_chunks = h2_chunks_by_entity.get(h2_id, set())
+            if h2_chunks:
+                for h1_id in hop1_ids:
+                    if h1_id == h2_id:
+                        continue
+                    h1_chunks = h1_chunks_by_entity.get(h1_id, set())
+                    if h1_chunks & h2_chunks:
+                        intermediary = hop1_seen[h1_id]
+                        break
+
+            # Apply 50% weight decay
+            if apply_recency:
+                decayed_weight = max(0.5, round(h2_ent["weight"] * 0.5, 1))
+            else:
+                decayed_weight = max(1, int(h2_ent["weight"] * 0.5))
+            h2_ent["weight"] = decayed_weight
+            h2_ent["hop"] = 2
+            h2_ent["path"] = []
+            if intermediary:
+                h2_ent["path"] = [{
+                    "entity_type": intermediary["entity_type"],
+                    "entity_id": intermediary["entity_id"],
+                    "entity_name": intermediary.get("entity_name", ""),
+                }]
+
+            hop2_seen[h2_id] = h2_ent
+
+    return hop2_seen
+
+
+def _hop2_from_edges(
+    sb: Any,
+    seed_id: str,
+    hop1_seen: dict[str, dict],
+    max_related: int,
+    apply_recency: bool,
+) -> dict[str, dict] | None:
+    """Hop-2 expansion from materialized co-occurrence edges (1 indexed read).
+
+    Hop-2 weight sums the edge weights through every hop-1 bridge; the strongest
+    bridge becomes the path intermediary. Returns None if edges can't be read,
+    or if a hop-1 entity has no edges at all (every hop-1 entity has at least
+    its edge back to the seed, so its edges haven't been materialized yet).
+    """
+    hop1_ids = list(hop1_seen.keys())[:20]
+    limit = max_related * 25
+    edges = get_cooccurrences(hop1_ids, limit=limit, apply_recency=apply_recency, sb=sb)
+    if edges is None:
+        return None
+    # Only a complete (untruncated) read can show that edges are missing
+    if sum(len(e) for e in edges.values()) < limit:
+        missing = [h1_id for h1_id in hop1_ids if h1_id not in edges]
+        if missing:
+            refresh_cooccurrence_later(missing)
+            return None
+
+    hop2_seen: dict[str, dict] = {}
+    best_bridge: dict[str, tuple[int | float, str]] = {}
+    for h1_id in hop1_ids:
+        for h2_id, edge in edges.get(h1_id, {}).items():
+            if h2_id == seed_id or h2_id in hop1_seen:
+                continue
+            if h2_id not in hop2_seen:
+                hop2_seen[h2_id] = dict(edge)
+            else:
+                hop2_seen[h2_id]["weight"] += edge["weight"]
+                if edge.get("freshness", "") > hop2_seen[h2_id].get("freshness", ""):
+                    hop2_seen[h2_id]["freshness"] = edge["freshness"]
+            if h2_id not in best_bridge or edge["weight"] > best_bridge[h2_id][0]:
+                best_bridge[h2_id] = (edge["weight"], h1_id)
+
+    for h2_id, h2_ent in hop2_seen.items():
+        # Apply 50% weight decay
+        if apply_recency:
+            h2_ent["weight"] = max(0.5, round(h2_ent["weight"] * 0.5, 1))
+        else:
+            h2_ent["weight"] = max(1, int(h2_ent["weight"] * 0.5))
+        h2_ent["hop"] = 2
+        intermediary = hop1_seen[best_bridge[h2_id][1]]
+        h2_ent["path"] = [{
+            "entity_type": intermediary["entity_type"],
+            "entity_id": intermediary["entity_id"],
+            "entity_name": intermediary.get("entity_name", ""),
+        }]
+
+    return hop2_seen
+
+
 def get_entity_neighborhood(
     entity_id: UUID,
     entity_type: str,
@@ -408,9 +569,24 @@ def get_entity_neighborhood(
         except Exception as e:
             logger.debug(f"Evidence chunk loading failed: {e}")
 
-    # Find hop-1 co-occurrences (temporal variant when recency is enabled)
-    _cooccur_fn = _get_cooccurrences_from_chunks_temporal if apply_recency else _get_cooccurrences_from_chunks
-    hop1_seen = _cooccur_fn(sb, chunk_ids, seed_id, limit=max_related * 5)
+    # Find hop-1 co-occurrences: one indexed read of the materialized edge table,
+    # falling back to the signal_impact chunk join if it isn't available
+    edges = get_cooccurrences(
+        [seed_id], limit=max_related * 5, apply_recency=apply_recency, sb=sb,
+    )
+    # No edges for an entity with evidence chunks means "not materialized yet",
+    # not "no neighbors": use the join, and queue a refresh if it finds any
+    materialized = edges is not None and (seed_id in edges or not chunk_ids)
+    if materialized:
+        hop1_seen = edges.get(seed_id, {})
+    else:
+        _cooccur_fn = (
+            _get_cooccurrences_from_chunks_temporal
+            if apply_recency else _get_cooccurrences_from_chunks
+        )
+        hop1_seen = _cooccur_fn(sb, chunk_ids, seed_id, limit=max_related * 5)
+        if edges is not None and hop1_seen:
+            refresh_cooccurrence_later([seed_id])
 
     stats = {
         "total_chunks": len(chunk_ids),
@@ -429,94 +605,22 @@ def get_entity_neighborhood(
         ent["path"] = []
 
     # ── Hop 2: neighbors-of-neighbors ──
-    # Batched: 1 query for all hop-1 chunk_ids, 1 co-occurrence query, 1 batch name resolution
     hop2_seen: dict[str, dict] = {}
     if depth >= 2 and hop1_seen:
-        hop1_ids = list(hop1_seen.keys())
-
-        # Single batched signal_impact query for all hop-1 entity chunk_ids
-        # Track which chunks belong to which hop-1 entity for intermediary mapping
-        h1_chunks_by_entity: dict[str, set[str]] = {}
-        try:
-            h1_impact_resp = (
-                sb.table("signal_impact")
-                .select("entity_id, chunk_id")
-                .in_("entity_id", hop1_ids[:20])
-                .limit(500)
-                .execute()
+        edges_hop2 = (
+            _hop2_from_edges(sb, seed_id, hop1_seen, max_related, apply_recency)
+            if materialized else None
+        )
+        if edges_hop2 is None:
+            cooccur_fn = (
+                _get_cooccurrences_from_chunks_temporal
+                if apply_recency else _get_cooccurrences_from_chunks
             )
-            for row in h1_impact_resp.data or []:
-                eid = row["entity_id"]
-                cid = row.get("chunk_id")
-                if cid:
-                    h1_chunks_by_entity.setdefault(eid, set()).add(cid)
-        except Exception as e:
-            logger.debug(f"Hop-2 chunk lookup failed: {e}")
-
-        hop2_chunk_ids = list({cid for chunks in h1_chunks_by_entity.values() for cid in chunks})
-
-        if hop2_chunk_ids:
-            # Single co-occurrence query from all hop-2 chunks
-            raw_hop2 = _cooccur_fn(
-                sb, hop2_chunk_ids, seed_id, limit=max_related * 5,
+            edges_hop2 = _hop2_from_chunks(
+                sb, seed_id, hop1_seen, cooccur_fn, max_related, apply_recency,
             )
-
-            # Also get chunk_ids for hop-2 entities to find intermediaries
-            # Single batched query for all new hop-2 entity chunk_ids
-            h2_entity_ids = [eid for eid in raw_hop2 if eid not in hop1_seen]
-            h2_chunks_by_entity: dict[str, set[str]] = {}
-            if h2_entity_ids:
-                try:
-                    h2_impact_resp = (
-                        sb.table("signal_impact")
-                        .select("entity_id, chunk_id")
-                        .in_("entity_id", h2_entity_ids[:30])
-                        .limit(500)
-                        .execute()
-                    )
-                    for row in h2_impact_resp.data or []:
-                        eid = row["entity_id"]
-                        cid = row.get("chunk_id")
-                        if cid:
-                            h2_chunks_by_entity.setdefault(eid, set()).add(cid)
-                except Exception as e:
-                    logger.debug(f"Hop-2 entity chunk lookup failed: {e}")
-
-            # Build intermediary mapping using pre-fetched chunk sets
-            for h2_id, h2_ent in raw_hop2.items():
-                if h2_id in hop1_seen:
-                    continue  # Will keep hop-1 version (dedup below)
-
-                # Find which hop-1 entity bridged to this hop-2 entity
-                intermediary = None
-                h2_chunks = h2_chunks_by_entity.get(h2_id, set())
-                if h2_chunks:
-                    for h1_id in hop1_ids:
-                        if h1_id == h2_id:
-                            continue
-                        h1_chunks = h1_chunks_by_entity.get(h1_id, set())
-                        if h1_chunks & h2_chunks:
-                            intermediary = hop1_seen[h1_id]
-                            break
-
-                # Apply 50% weight decay
-                if apply_recency:
-                    decayed_weight = max(0.5, round(h2_ent["weight"] * 0.5, 1))
-                else:
-                    decayed_weight = max(1, int(h2_ent["weight"] * 0.5))
-                h2_ent["weight"] = decayed_weight
-                h2_ent["hop"] = 2
-                h2_ent["path"] = []
-                if intermediary:
-                    h2_ent["path"] = [{
-                        "entity_type": intermediary["entity_type"],
-                        "entity_id": intermediary["entity_id"],
-                        "entity_name": intermediary.get("entity_name", ""),
-                    }]
-
-                hop2_seen[h2_id] = h2_ent
-
-            stats["hop2_candidates"] = len(hop2_seen)
+        hop2_seen = edges_hop2
+        stats["hop2_candidates"] = len(hop2_seen)
 
     # ── Merge hop-1 and hop-2 (hop-1 wins on overlap) ──
     merged: dict[str, dict] = dict(hop1_seen)
@@ -802,74 +906,42 @@ def find_entity_path(
 ) -> list[dict] | None:
     """BFS path finding between two entities via signal_impact co-occurrence.
 
+    Traverses the cached per-project graph in memory, so the search costs no
+    queries beyond the (shared) graph load and final name resolution.
+
     Returns path as list of {"entity_id", "entity_type"} or None if no path found.
-    Max 3 hops to keep query time <50ms.
     """
-    sb = get_supabase()
-    str_a = str(entity_a_id)
-    str_b = str(entity_b_id)
-
-    visited: set[str] = {str_a}
-    queue: list[list[str]] = [[str_a]]  # Each element is a path of entity_ids
-
-    for _ in range(max_hops):
-        next_queue: list[list[str]] = []
-
-        for path in queue:
-            current = path[-1]
-
-            # Get chunks for current entity
-            try:
-                impact_resp = (
-                    sb.table("signal_impact")
-                    .select("chunk_id")
-                    .eq("entity_id", current)
-                    .limit(20)
-                    .execute()
-                )
-                chunk_ids = list({r["chunk_id"] for r in (impact_resp.data or []) if r.get("chunk_id")})
-            except Exception:
-                continue
-
-            if not chunk_ids:
-                continue
-
-            # Get neighbor entities via shared chunks
-            try:
-                neighbor_resp = (
-                    sb.table("signal_impact")
-                    .select("entity_id, entity_type")
-                    .in_("chunk_id", chunk_ids[:20])
-                    .neq("entity_id", current)
-                    .limit(30)
-                    .execute()
-                )
-            except Exception:
-                continue
-
-            for row in neighbor_resp.data or []:
-                neighbor_id = row["entity_id"]
-                if neighbor_id in visited:
-                    continue
+    from app.db.entity_graph import get_project_graph
 
-                new_path = path + [neighbor_id]
+    try:
+        graph = get_project_graph(project_id)
+    except Exception as e:
+        logger.debug(f"Entity graph load failed for path search: {e}")
+        return None
 
-                if neighbor_id == str_b:
-                    # Found! Build result with entity details
-                    return _resolve_path_entities(new_path, sb)
+    path = graph.cooccurrence_path(str(entity_a_id), str(entity_b_id), max_hops)
+    if not path or len(path) < 2:
+        return None
 
-                visited.add(neighbor_id)
-                next_queue.append(new_path)
+    sb = get_supabase()
+    return _resolve_path_entities(path, sb, types={eid: graph.entity_type(eid) for eid in path})
 
-        queue = next_queue
-        if not queue:
-            break
 
-    return None  # No path found within max_hops
+def _resolve_path_entities(
+    path: list[str],
+    sb: Any,
+    types: dict[str, str] | None = None,
+) -> list[dict]:
+    """Resolve entity_ids in a path to full dicts with type and name.
 
+    When ``types`` maps ids to known entity types, names are batch-resolved
+    (1 query per type); otherwise each id is probed across entity tables.
+    """
+    if types and all(_TABLE_MAP.get(types.get(eid, "")) for eid in path):
+        return _resolve_entity_names_batch(
+            sb, [{"entity_id": eid, "entity_type": types[eid]} for eid in path],
+        )
 
-def _resolve_path_entities(path: list[str], sb: Any) -> list[dict]:
-    """Resolve entity_ids in a path to full dicts with type and name."""
     result = []
     for eid in path:
         # Check each entity table
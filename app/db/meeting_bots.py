@@ -155,22 +155,15 @@ def delete_user_bots(user_id: UUID) -> int:
     return len(result.data) if result.data else 0
 
 
-def null_expired_urls(days: int = 14) -> int:
-    """Null out recording/transcript URLs older than retention period."""
-    supabase = get_supabase()
+def null_expired_urls(
+    days: int = 14, project_id: UUID | None = None, dry_run: bool = False,
+) -> int:
+    """Null out recording/transcript URLs older than retention period (batched)."""
     from datetime import datetime, timedelta
 
-    cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+    from app.db.sweeps import run_sweep
 
-    result = (
-        supabase.table("meeting_bots")
-        .update({"recording_url": None, "transcript_url": None})
-        .eq("status", "done")
-        .lt("created_at", cutoff)
-        .not_.is_("recording_url", "null")
-        .execute()
-    )
-    count = len(result.data) if result.data else 0
-    if count:
-        logger.info(f"Nulled recording URLs for {count} bots older than {days} days")
-    return count
+    cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+    return run_sweep(
+        "recording_urls", {"p_cutoff": cutoff}, project_id=project_id, dry_run=dry_run,
+    ).affected
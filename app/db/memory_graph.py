@@ -7,11 +7,13 @@ Provides CRUD operations for:
 - Synthesis logging
 """
 
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Literal
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.core.write_behind import WriteBehindQueue
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
@@ -66,12 +68,113 @@ def create_node(
         Created node record
     """
     supabase = get_supabase()
+    payload = _node_payload(
+        project_id,
+        node_type=node_type,
+        content=content,
+        summary=summary,
+        confidence=confidence,
+        source_type=source_type,
+        source_id=source_id,
+        linked_entity_type=linked_entity_type,
+        linked_entity_id=linked_entity_id,
+        belief_domain=belief_domain,
+        insight_type=insight_type,
+        chunk_id=chunk_id,
+        source_quote=source_quote,
+        speaker_name=speaker_name,
+    )
+
+    try:
+        response = supabase.table("memory_nodes").insert(payload).execute()
+        node = response.data[0] if response.data else {}
+
+        # Embedding is deferred and coalesced per project (non-blocking)
+        if node:
+            _queue_node_embeddings(project_id, [node])
 
+        logger.info(f"Created {node_type} node for project {project_id}: {summary[:50]}")
+        return node
+    except Exception as e:
+        logger.error(f"Failed to create node: {e}")
+        raise
+
+
+def create_nodes(
+    project_id: UUID,
+    nodes: list[dict],
+    edges: list[dict] | None = None,
+) -> dict:
+    """
+    Create many nodes, and edges between them, in one insert each.
+
+    Args:
+        project_id: Project UUID
+        nodes: Node specs — create_node keyword arguments
+            (node_type, content, summary, confidence, source_type, ...)
+        edges: Edge specs {"from", "to", "edge_type", "strength", "rationale"}.
+            "from"/"to" are either an index into ``nodes`` or an existing
+            node ID. Edges with an unresolvable endpoint are skipped and
+            existing edges are left untouched.
+
+    Returns:
+        {"nodes": created nodes in input order, "edges": created edges}
+    """
+    supabase = get_supabase()
+    created: list[dict] = []
+
+    if nodes:
+        payloads = [_node_payload(project_id, **spec) for spec in nodes]
+        try:
+            response = supabase.table("memory_nodes").insert(payloads).execute()
+            created = response.data or []
+        except Exception as e:
+            logger.error(f"Failed to create {len(payloads)} nodes: {e}")
+            raise
+        _queue_node_embeddings(project_id, created)
+        logger.info(f"Created {len(created)} nodes for project {project_id}")
+
+    edge_payloads = []
+    for spec in edges or []:
+        from_id = _resolve_node_ref(spec.get("from"), created)
+        to_id = _resolve_node_ref(spec.get("to"), created)
+        if not from_id or not to_id:
+            logger.debug(f"Skipping edge with unresolved endpoint: {spec}")
+            continue
+        edge_payloads.append({
+            "project_id": str(project_id),
+            "from_node_id": from_id,
+            "to_node_id": to_id,
+            "edge_type": spec["edge_type"],
+            "strength": spec.get("strength", 1.0),
+            "rationale": spec.get("rationale"),
+        })
+
+    return {"nodes": created, "edges": _insert_edges(edge_payloads)}
+
+
+def _node_payload(
+    project_id: UUID,
+    node_type: NodeType,
+    content: str,
+    summary: str,
+    confidence: float = 1.0,
+    source_type: SourceType | None = None,
+    source_id: UUID | None = None,
+    linked_entity_type: EntityType | None = None,
+    linked_entity_id: UUID | None = None,
+    belief_domain: str | None = None,
+    insight_type: str | None = None,
+    chunk_id: UUID | None = None,
+    source_quote: str | None = None,
+    speaker_name: str | None = None,
+) -> dict:
+    """Build a memory_nodes row. Every row has the same keys (bulk inserts)."""
     # Facts always have confidence 1.0
     if node_type == "fact":
         confidence = 1.0
 
-    payload = {
+    return {
         "project_id": str(project_id),
         "node_type": node_type,
         "content": content,
@@ -88,36 +191,96 @@ def create_node(
         "speaker_name": speaker_name,
     }
 
+
+def _resolve_node_ref(ref: int | str | UUID | None, created: list[dict]) -> str | None:
+    """Edge endpoint → node ID (index into this batch, or a valid existing ID)."""
+    if isinstance(ref, bool) or ref is None:
+        return None
+    if isinstance(ref, int):
+        return created[ref]["id"] if 0 <= ref < len(created) else None
     try:
-        response = supabase.table("memory_nodes").insert(payload).execute()
-        node = response.data[0] if response.data else {}
+        return str(UUID(str(ref)))
+    except ValueError:
+        return None
 
-        # Embed the node (fire-and-forget)
-        if node:
-            _embed_node(node)
 
-        logger.info(f"Created {node_type} node for project {project_id}: {summary[:50]}")
-        return node
-    except Exception as e:
-        logger.error(f"Failed to create node: {e}")
-        raise
+# =============================================================================
+# Deferred embeddings
+# =============================================================================
+# Nodes are embedded off the request path. Pending nodes are grouped per
+# project; the first node queues one flush job and every node created before
+# that job runs joins it. A flush embeds the whole group in batched calls and
+# writes all vectors with one RPC. Flushes have their own write-behind queue:
+# a slow or retrying embedding call must not hold up the chat messages and
+# usage rows on the shared one.
+
+_EMBED_BATCH = 256
+_embedding_queue = WriteBehindQueue("memory-embeddings")
+_pending_embeddings: dict[str, dict[str, str]] = {}  # project_id -> {node_id: text}
+_pending_lock = threading.Lock()
+
+
+def _node_embedding_text(node: dict) -> str | None:
+    text = f"{node.get('summary', '')} {(node.get('content') or '')[:300]}".strip()
+    return text if len(text) >= 10 else None
+
+
+def _queue_node_embeddings(project_id: UUID, nodes: list[dict]) -> None:
+    """Add nodes to their project's pending embedding batch."""
+    texts = {
+        node["id"]: text
+        for node in nodes
+        if node.get("id") and (text := _node_embedding_text(node))
+    }
+    if not texts:
+        return
+
+    pid = str(project_id)
+    with _pending_lock:
+        pending = _pending_embeddings.get(pid)
+        if pending is not None:
+            pending.update(texts)  # a flush for this project is already queued
+            return
+        _pending_embeddings[pid] = texts
 
+    _embedding_queue.submit(lambda: _flush_project_embeddings(pid), "memory_node_embeddings")
 
-def _embed_node(node: dict) -> None:
-    """Generate and store an embedding for a memory node. Non-blocking."""
-    try:
-        text = f"{node.get('summary', '')} {(node.get('content') or '')[:300]}".strip()
-        if len(text) < 10:
-            return
 
+def _flush_project_embeddings(project_id: str) -> int:
+    """Embed and store every pending node for a project. Returns nodes written."""
+    with _pending_lock:
+        pending = _pending_embeddings.pop(project_id, {})
+    if not pending:
+        return 0
+
+    node_ids, texts = list(pending), list(pending.values())
+    try:
         from app.core.embeddings import embed_texts
-        embeddings = embed_texts([text])
-        if embeddings:
-            get_supabase().table("memory_nodes").update(
-                {"embedding": embeddings[0]}
-            ).eq("id", node["id"]).execute()
+
+        vectors: list[list[float]] = []
+        for i in range(0, len(texts), _EMBED_BATCH):
+            vectors.extend(embed_texts(texts[i:i + _EMBED_BATCH]))
+
+        rows = [
+            {"id": node_id, "embedding": vector}
+            for node_id, vector in zip(node_ids, vectors, strict=True)
+        ]
+        get_supabase().rpc("set_memory_node_embeddings", {"p_rows": rows}).execute()
+
+        # New vectors must be visible to in-memory contradiction search
+        from app.core.memory_contradiction import invalidate_belief_matrix
+
+        invalidate_belief_matrix(project_id)
+        logger.debug(f"Embedded {len(rows)} memory nodes for project {project_id}")
+        return len(rows)
     except Exception as e:
         logger.debug(f"Memory node embedding failed (non-fatal): {e}")
+        return 0
+
+
+def flush_node_embeddings(timeout: float = 5.0) -> bool:
+    """Wait for queued node embeddings to be written. Returns False on timeout."""
+    return _embedding_queue.flush(timeout)
 
 
 def get_node(node_id: UUID) -> dict | None:
@@ -715,6 +878,42 @@ def create_edge(
         raise
 
 
+def _insert_edges(payloads: list[dict]) -> list[dict]:
+    """Insert memory_edges rows in one request, skipping existing edges.
+
+    If the batch is rejected (e.g. an endpoint node doesn't exist), falls
+    back to per-edge inserts so valid edges still land.
+    """
+    if not payloads:
+        return []
+
+    supabase = get_supabase()
+    try:
+        response = (
+            supabase.table("memory_edges")
+            .upsert(
+                payloads,
+                on_conflict="from_node_id,to_node_id,edge_type",
+                ignore_duplicates=True,
+            )
+            .execute()
+        )
+        return response.data or []
+    except Exception as e:
+        logger.warning(f"Bulk edge insert failed, retrying per edge: {e}")
+
+    created = []
+    for payload in payloads:
+        try:
+            response = supabase.table("memory_edges").insert(payload).execute()
+            created.extend(response.data or [])
+        except Exception as e:
+            logger.debug(
+                f"Skipping edge {payload['from_node_id']} → {payload['to_node_id']}: {e}"
+            )
+    return created
+
+
 def get_edges_from_node(node_id: UUID, edge_type: EdgeType | None = None) -> list[dict]:
     """Get all edges originating from a node."""
     supabase = get_supabase()
@@ -964,99 +1163,81 @@ def fail_synthesis_log(log_id: UUID, error_message: str) -> dict:
 # =============================================================================
 
 
-def archive_old_insights(project_id: UUID, days_old: int = 60) -> int:
+def archive_old_insights(project_id: UUID | None, days_old: int = 60, dry_run: bool = False) -> int:
     """
     Archive insights older than specified days that haven't been used.
 
+    One batched sweep (sweep_archive_old_insights) instead of a per-insight
+    edge lookup and update.
+
     Args:
-        project_id: Project UUID
+        project_id: Project UUID (None = all projects)
         days_old: Archive insights older than this
+        dry_run: Only count the insights that would be archived
 
     Returns:
-        Number of insights archived
+        Number of insights archived (or archivable, for a dry run)
     """
-    supabase = get_supabase()
+    from app.db.sweeps import run_sweep
+
     cutoff = (datetime.utcnow() - timedelta(days=days_old)).isoformat()
 
     try:
-        # Find old insights with no recent edges
-        old_insights = (
-            supabase.table("memory_nodes")
-            .select("id")
-            .eq("project_id", str(project_id))
-            .eq("node_type", "insight")
-            .eq("is_active", True)
-            .lt("created_at", cutoff)
-            .execute()
+        result = run_sweep(
+            "archive_old_insights",
+            {
+                "p_cutoff": cutoff,
+                "p_reason": f"Auto-archived: older than {days_old} days with no usage",
+            },
+            project_id=project_id,
+            dry_run=dry_run,
         )
-
-        archived_count = 0
-        for insight in old_insights.data or []:
-            insight_id = insight["id"]
-
-            # Check if it has any recent edges (used recently)
-            edges = get_edges_from_node(UUID(insight_id))
-            if not edges:
-                archive_node(UUID(insight_id), f"Auto-archived: older than {days_old} days with no usage")
-                archived_count += 1
-
-        if archived_count > 0:
-            logger.info(f"Archived {archived_count} old insights for project {project_id}")
-
-        return archived_count
+        return result.affected
     except Exception as e:
         logger.error(f"Failed to archive old insights: {e}")
         return 0
 
 
 def archive_low_confidence_beliefs(
-    project_id: UUID,
+    project_id: UUID | None,
     confidence_threshold: float = 0.3,
     min_age_days: int = 7,
+    dry_run: bool = False,
 ) -> int:
     """
     Archive beliefs below confidence threshold that are old enough.
 
+    Archives and drops their edges in batches (sweep_archive_low_confidence_beliefs).
+
     Args:
-        project_id: Project UUID
+        project_id: Project UUID (None = all projects)
         confidence_threshold: Archive beliefs below this
         min_age_days: Only archive if older than this
+        dry_run: Only count the beliefs that would be archived
 
     Returns:
-        Number of beliefs archived
+        Number of beliefs archived (or archivable, for a dry run)
     """
-    supabase = get_supabase()
+    from app.db.sweeps import run_sweep
+
     cutoff = (datetime.utcnow() - timedelta(days=min_age_days)).isoformat()
 
     try:
-        low_conf_beliefs = (
-            supabase.table("memory_nodes")
-            .select("id, summary, confidence")
-            .eq("project_id", str(project_id))
-            .eq("node_type", "belief")
-            .eq("is_active", True)
-            .lt("confidence", confidence_threshold)
-            .lt("created_at", cutoff)
-            .execute()
+        result = run_sweep(
+            "archive_low_confidence_beliefs",
+            {"p_threshold": confidence_threshold, "p_cutoff": cutoff},
+            project_id=project_id,
+            dry_run=dry_run,
         )
-
-        archived_count = 0
-        for belief in low_conf_beliefs.data or []:
-            archive_node(
-                UUID(belief["id"]),
-                f"Auto-archived: confidence {belief['confidence']:.2f} below threshold {confidence_threshold}"
-            )
-            delete_edges_for_node(UUID(belief["id"]))
-            archived_count += 1
-
-        if archived_count > 0:
-            logger.info(f"Archived {archived_count} low-confidence beliefs for project {project_id}")
-
-        return archived_count
     except Exception as e:
         logger.error(f"Failed to archive low-confidence beliefs: {e}")
         return 0
 
+    if result.affected and not dry_run:
+        from app.core.memory_contradiction import invalidate_belief_matrix
+        invalidate_belief_matrix(project_id)
+    return result.affected
+
 
 def get_graph_stats(project_id: UUID) -> dict:
     """Get statistics about the memory graph for a project."""
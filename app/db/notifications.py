@@ -42,6 +42,32 @@ def create_notification(
     return result.data[0]
 
 
+def create_notifications(notifications: list[dict]) -> list[dict]:
+    """Create many notifications in one insert.
+
+    Each dict takes the create_notification() arguments (user_id, type,
+    title, and optionally body, project_id, entity_type, entity_id, metadata).
+    """
+    if not notifications:
+        return []
+    # Bulk inserts need the same columns on every row
+    rows = [
+        {
+            "user_id": str(n["user_id"]),
+            "type": n["type"],
+            "title": n["title"],
+            "body": n.get("body") or None,
+            "project_id": str(n["project_id"]) if n.get("project_id") else None,
+            "entity_type": n.get("entity_type"),
+            "entity_id": str(n["entity_id"]) if n.get("entity_id") else None,
+            "metadata": n.get("metadata") or {},
+        }
+        for n in notifications
+    ]
+    result = get_supabase().table("notifications").insert(rows).execute()
+    return result.data or []
+
+
 def list_notifications(
     user_id: str | UUID,
     unread_only: bool = False,
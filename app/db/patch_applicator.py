@@ -31,6 +31,7 @@ from app.core.schemas_entity_patch import (
     PatchApplicationResult,
 )
 from app.db.supabase_client import get_supabase
+from app.db.write_versions import note_project_write
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +129,8 @@ async def apply_entity_patches(
             pass  # Fail open — keep auto_confirm=True
 
     result = PatchApplicationResult()
+    # Revisions for the whole patch set, versioned in one call after the loop
+    revisions: list[dict] = []
 
     for patch in patches:
         # Escalate low-confidence and conflict patches
@@ -146,6 +149,7 @@ async def apply_entity_patches(
             applied = await _apply_single_patch(
                 project_id, patch, signal_id, run_id,
                 auto_confirm=auto_confirm,
+                revisions=revisions,
             )
             if applied:
                 result.applied.append(applied)
@@ -177,6 +181,13 @@ async def apply_entity_patches(
                 "patch_summary": _summarize_patch(patch),
             })
 
+    if revisions:
+        _record_entity_revisions(revisions)
+
+    # The write triggers bumped the project version; let this process see it
+    if result.applied:
+        note_project_write(project_id)
+
     # Embed modified entities (fire-and-forget, multi-vector when project_id available)
     if result.applied:
         _embed_modified_entities(result.applied, project_id=project_id)
@@ -285,8 +296,13 @@ async def _apply_single_patch(
     signal_id: UUID | None,
     run_id: UUID | None = None,
     auto_confirm: bool = False,
+    revisions: list[dict] | None = None,
 ) -> dict | None:
-    """Apply a single EntityPatch. Returns applied dict or None."""
+    """Apply a single EntityPatch. Returns applied dict or None.
+
+    Entity revisions are appended to `revisions` when given (the caller
+    writes them in one batch), otherwise recorded immediately.
+    """
     operation = patch.operation
     entity_type = patch.entity_type
 
@@ -304,11 +320,14 @@ async def _apply_single_patch(
         patch = _resolve_target_entity_id(project_id, patch, table)
 
     if operation == "create":
-        return _apply_create(project_id, patch, table, signal_id, run_id, auto_confirm=auto_confirm)
+        return _apply_create(
+            project_id, patch, table, signal_id, run_id,
+            auto_confirm=auto_confirm, revisions=revisions,
+        )
     elif operation == "merge":
-        return _apply_merge(project_id, patch, table, signal_id, run_id)
+        return _apply_merge(project_id, patch, table, signal_id, run_id, revisions=revisions)
     elif operation == "update":
-        return _apply_update(project_id, patch, table, signal_id, run_id)
+        return _apply_update(project_id, patch, table, signal_id, run_id, revisions=revisions)
     elif operation == "stale":
         return _apply_stale(patch, table)
     elif operation == "delete":
@@ -453,6 +472,7 @@ def _apply_create(
     signal_id: UUID | None,
     run_id: UUID | None = None,
     auto_confirm: bool = False,
+    revisions: list[dict] | None = None,
 ) -> dict | None:
     """Create a new entity from patch payload."""
     sb = get_supabase()
@@ -542,6 +562,7 @@ def _apply_create(
                 operation="create",
                 signal_id=signal_id,
                 run_id=run_id,
+                revisions=revisions,
             )
 
             return {
@@ -564,6 +585,7 @@ def _apply_merge(
     table: str,
     signal_id: UUID | None,
     run_id: UUID | None = None,
+    revisions: list[dict] | None = None,
 ) -> dict | None:
     """Merge new evidence/data into an existing entity."""
     if not patch.target_entity_id:
@@ -672,6 +694,7 @@ def _apply_merge(
             operation="merge",
             signal_id=signal_id,
             run_id=run_id,
+            revisions=revisions,
         )
 
         return {
@@ -692,6 +715,7 @@ def _apply_update(
     table: str,
     signal_id: UUID | None = None,
     run_id: UUID | None = None,
+    revisions: list[dict] | None = None,
 ) -> dict | None:
     """Update specific fields on an existing entity."""
     if not patch.target_entity_id:
@@ -761,6 +785,7 @@ def _apply_update(
             operation="update",
             signal_id=signal_id,
             run_id=run_id,
+            revisions=revisions,
         )
 
         return {
@@ -1068,12 +1093,16 @@ def _record_entity_revision(
     operation: str,
     signal_id: UUID | None,
     run_id: UUID | None,
+    revisions: list[dict] | None = None,
 ) -> None:
-    """Fire-and-forget revision tracking after patch application."""
+    """Fire-and-forget revision tracking after patch application.
+
+    Appends to `revisions` for a later batch write when given.
+    """
     try:
-        from app.core.change_tracking import track_entity_change
+        from app.core.change_tracking import build_revision
 
-        track_entity_change(
+        revision = build_revision(
             project_id=project_id,
             entity_type=entity_type,
             entity_id=UUID(entity_id),
@@ -1087,6 +1116,20 @@ def _record_entity_revision(
         )
     except Exception as e:
         logger.debug(f"Revision tracking failed for {entity_type} {entity_id}: {e}")
+        return
+    if revision is None:
+        return
+    if revisions is not None:
+        revisions.append(revision)
+    else:
+        _record_entity_revisions([revision])
+
+
+def _record_entity_revisions(revisions: list[dict]) -> None:
+    """Version a whole patch set in one call (numbers allocated server-side)."""
+    from app.core.change_tracking import track_entity_changes
+
+    track_entity_changes(revisions)
 
 
 def _link_entities_by_cooccurrence(
@@ -1392,12 +1435,15 @@ def _record_evidence_links(
     """Link chunk evidence to modified entities.
 
     Iterates applied patches and calls record_chunk_impacts per entity,
-    matching patches to their applied results by target_entity_id.
+    matching patches to their applied results by target_entity_id, then
+    refreshes the materialized co-occurrence edges once for all linked entities.
     """
+    from app.db.entity_cooccurrence import refresh_cooccurrence
     from app.db.signals import record_chunk_impacts
 
     # Build map of entity_id → applied result (for merge/update/stale matches)
     applied_map = {a["entity_id"]: a for a in applied_results}
+    linked_ids: list[str] = []
 
     for patch in patches:
         if not patch.evidence:
@@ -1425,10 +1471,15 @@ def _record_evidence_links(
                 chunk_ids=chunk_ids,
                 entity_type=patch.entity_type,
                 entity_id=UUID(entity_id),
+                refresh_cooccurrence=False,
             )
+            linked_ids.append(entity_id)
         except Exception as e:
             logger.warning(f"Evidence link failed for {entity_id}: {e}")
 
+    if linked_ids:
+        refresh_cooccurrence(linked_ids)
+
 
 # =============================================================================
 # Structural FK dependency registration
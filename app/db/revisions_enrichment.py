@@ -4,11 +4,21 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
 
+# History listing projection: everything but the snapshot/delta bodies
+REVISION_LIST_COLUMNS = (
+    "id, project_id, entity_type, entity_id, entity_label, revision_type, revision_number, "
+    "trigger_event, changes, diff_summary, context_summary, new_signals_count, "
+    "new_facts_count, source_signal_id, run_id, created_by, created_at"
+)
+
+_BODY_COLUMNS = "id, is_checkpoint, base_revision_id, snapshot, delta"
+
 
 def insert_enrichment_revision(
     project_id: UUID,
@@ -104,10 +114,119 @@ def insert_enrichment_revision(
         raise
 
 
+def insert_enrichment_revisions(revisions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Insert revisions with server-allocated revision numbers, in one call.
+
+    Numbers are allocated atomically per entity (insert_enrichment_revisions
+    RPC), continuing from the entity's latest revision; several revisions of
+    the same entity in one batch are numbered in list order. The RPC stores
+    the snapshot as a delta against the entity's latest checkpoint unless a
+    new checkpoint is due, so returned rows may have snapshot = None.
+
+    Args:
+        revisions: Revision dicts (project_id, entity_type, entity_id,
+            entity_label and optionally revision_type, trigger_event, snapshot,
+            changes, diff_summary, context_summary, source_signal_id, run_id,
+            created_by). revision_type defaults to created/updated by number.
+
+    Returns:
+        Created revision records, in the same order as `revisions`
+
+    Raises:
+        Exception: If database operation fails
+    """
+    if not revisions:
+        return []
+
+    rows = [
+        {k: (str(v) if isinstance(v, UUID) else v) for k, v in rev.items() if v is not None}
+        for rev in revisions
+    ]
+    response = get_supabase().rpc(
+        "insert_enrichment_revisions",
+        {"p_rows": rows, "p_checkpoint_interval": get_settings().REVISION_CHECKPOINT_INTERVAL},
+    ).execute()
+
+    # Returned rows are grouped by entity in revision order; map them back
+    created: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for row in response.data or []:
+        created.setdefault((row["entity_type"], str(row["entity_id"])), []).append(row)
+    ordered = []
+    for row in rows:
+        ordered.append(created[(row["entity_type"], row["entity_id"])].pop(0))
+    return ordered
+
+
+def apply_revision_delta(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Apply a {set, unset} delta to a checkpoint snapshot."""
+    unset = set(delta.get("unset") or [])
+    snapshot = {k: v for k, v in base.items() if k not in unset}
+    snapshot.update(delta.get("set") or {})
+    return snapshot
+
+
+def attach_revision_snapshots(revisions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Fill in the full snapshot of each revision, in place.
+
+    Checkpoints carry their snapshot; delta revisions are rebuilt from their
+    base checkpoint. Rows selected with REVISION_LIST_COLUMNS have their
+    bodies fetched first; rows that already include the body columns are
+    used as-is. At most two queries regardless of how many rows.
+
+    Args:
+        revisions: Revision records (must include id)
+
+    Returns:
+        The same records, each with a "snapshot" dict
+    """
+    if not revisions:
+        return revisions
+
+    supabase = get_supabase()
+    bodies = {r["id"]: r for r in revisions if "is_checkpoint" in r}
+    missing = [r["id"] for r in revisions if r["id"] not in bodies]
+    if missing:
+        response = (
+            supabase.table("enrichment_revisions")
+            .select(_BODY_COLUMNS)
+            .in_("id", missing)
+            .execute()
+        )
+        bodies.update({b["id"]: b for b in response.data or []})
+
+    bases = {rid: b for rid, b in bodies.items() if b.get("is_checkpoint", True)}
+    base_ids = {
+        b["base_revision_id"] for b in bodies.values()
+        if not b.get("is_checkpoint", True) and b.get("base_revision_id") not in bases
+    }
+    if base_ids:
+        response = (
+            supabase.table("enrichment_revisions")
+            .select("id, snapshot")
+            .in_("id", list(base_ids))
+            .execute()
+        )
+        bases.update({b["id"]: b for b in response.data or []})
+
+    for revision in revisions:
+        body = bodies.get(revision["id"]) or {}
+        if body.get("is_checkpoint", True):
+            revision["snapshot"] = body.get("snapshot") or {}
+        else:
+            base = bases.get(body.get("base_revision_id")) or {}
+            revision["snapshot"] = apply_revision_delta(
+                base.get("snapshot") or {}, body.get("delta") or {}
+            )
+    return revisions
+
+
 def list_entity_revisions(
     entity_type: str,
     entity_id: UUID,
     limit: int = 50,
+    include_snapshots: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Get change log for a specific entity.
@@ -116,9 +235,11 @@ def list_entity_revisions(
         entity_type: Type of entity (prd_section, vp_step, feature)
         entity_id: UUID of the entity
         limit: Maximum number of revisions to return (default 50)
+        include_snapshots: Also rebuild each revision's full snapshot
 
     Returns:
-        List of revision records ordered by created_at DESC
+        List of revision records ordered by created_at DESC (without
+        snapshots unless include_snapshots)
 
     Raises:
         Exception: If database operation fails
@@ -128,7 +249,7 @@ def list_entity_revisions(
     try:
         response = (
             supabase.table("enrichment_revisions")
-            .select("*")
+            .select(REVISION_LIST_COLUMNS)
             .eq("entity_type", entity_type)
             .eq("entity_id", str(entity_id))
             .order("created_at", desc=True)
@@ -136,7 +257,10 @@ def list_entity_revisions(
             .execute()
         )
 
-        return response.data or []
+        revisions = response.data or []
+        if include_snapshots:
+            attach_revision_snapshots(revisions)
+        return revisions
 
     except Exception as e:
         logger.error(
@@ -222,7 +346,7 @@ def get_latest_revision(
             .execute()
         )
 
-        return response.data[0] if response.data else None
+        return attach_revision_snapshots(response.data)[0] if response.data else None
 
     except Exception as e:
         logger.error(
@@ -232,6 +356,76 @@ def get_latest_revision(
         raise
 
 
+def get_entity_revision(
+    entity_type: str,
+    entity_id: UUID,
+    revision_number: int,
+) -> dict[str, Any] | None:
+    """
+    Get one revision of an entity with its full snapshot.
+
+    Args:
+        entity_type: Type of entity (prd_section, vp_step, feature)
+        entity_id: UUID of the entity
+        revision_number: Revision number to load
+
+    Returns:
+        Revision record or None if not found
+
+    Raises:
+        Exception: If database operation fails
+    """
+    supabase = get_supabase()
+
+    try:
+        response = (
+            supabase.table("enrichment_revisions")
+            .select("*")
+            .eq("entity_type", entity_type)
+            .eq("entity_id", str(entity_id))
+            .eq("revision_number", revision_number)
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+
+        return attach_revision_snapshots(response.data)[0] if response.data else None
+
+    except Exception as e:
+        logger.error(
+            f"Failed to get revision {revision_number} for {entity_type} {entity_id}: {e}",
+            extra={"entity_type": entity_type, "entity_id": str(entity_id)},
+        )
+        raise
+
+
+def compact_enrichment_revisions(
+    project_id: UUID | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """
+    Convert full-snapshot revisions written before checkpointing into deltas.
+
+    Runs the compact_enrichment_revisions sweep (migration 0207) in batches.
+
+    Args:
+        project_id: Limit to one project (None = all projects)
+        dry_run: Count convertible revisions without changing anything
+
+    Returns:
+        Sweep result dict (affected, batches, dry_run, capped)
+    """
+    from app.db.sweeps import run_sweep
+
+    result = run_sweep(
+        "compact_enrichment_revisions",
+        {"p_checkpoint_interval": get_settings().REVISION_CHECKPOINT_INTERVAL},
+        project_id=project_id,
+        dry_run=dry_run,
+    )
+    return result.to_dict()
+
+
 def count_new_signals_since(
     project_id: UUID,
     since_timestamp: datetime | None = None,
@@ -5,6 +5,8 @@ from typing import Any
 from uuid import UUID
 
 from app.core.logging import get_logger
+from app.db.entity_cooccurrence import refresh_cooccurrence as refresh_entity_cooccurrence
+from app.db.entity_graph import invalidate_project_graph
 from app.db.supabase_client import get_supabase
 
 logger = get_logger(__name__)
@@ -538,6 +540,7 @@ def record_chunk_impacts(
     entity_type: str,
     entity_id: UUID,
     usage_context: str = "evidence",
+    refresh_cooccurrence: bool = True,
 ) -> None:
     """
     Record that chunks influenced an entity.
@@ -550,6 +553,8 @@ def record_chunk_impacts(
         entity_type: Type of entity ('vp_step', 'feature', 'insight', 'persona')
         entity_id: UUID of the entity
         usage_context: How chunks were used ('evidence' or 'enrichment')
+        refresh_cooccurrence: Refresh this entity's materialized co-occurrence
+            edges. Batch callers pass False and refresh once for all entities.
 
     Raises:
         Exception: If database operation fails
@@ -598,6 +603,11 @@ def record_chunk_impacts(
             on_conflict="chunk_id,entity_type,entity_id"
         ).execute()
 
+        for project_id in {r["project_id"] for r in records}:
+            invalidate_project_graph(project_id)
+        if refresh_cooccurrence:
+            refresh_entity_cooccurrence([entity_id])
+
         logger.info(
             f"Recorded {len(records)} impact records for {entity_type} {entity_id}",
             extra={
@@ -1,5 +1,6 @@
 """Database operations for solution flows and steps."""
 
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
@@ -127,25 +128,8 @@ def get_flow_step(step_id: UUID) -> dict[str, Any] | None:
     )
 
 
-def create_flow_step(
-    flow_id: UUID, project_id: UUID, data: dict[str, Any]
-) -> dict[str, Any]:
-    """Insert a new step, auto-assigning step_index if not provided."""
-    supabase = get_supabase()
-
-    step_index = data.get("step_index")
-    if step_index is None:
-        # Auto-assign: max existing index + 1
-        existing = (
-            supabase.table("solution_flow_steps")
-            .select("step_index")
-            .eq("flow_id", str(flow_id))
-            .order("step_index", desc=True)
-            .limit(1)
-            .execute()
-        )
-        step_index = (existing.data[0]["step_index"] + 1) if existing.data else 0
-
+def _step_row(data: dict[str, Any]) -> dict[str, Any]:
+    """Step columns for an insert (without flow_id, project_id, step_index)."""
     # Serialize nested models
     info_fields = data.get("information_fields", [])
     if info_fields and hasattr(info_fields[0], "model_dump"):
@@ -156,9 +140,6 @@ def create_flow_step(
         open_qs = [q.model_dump() for q in open_qs]
 
     row = {
-        "flow_id": str(flow_id),
-        "project_id": str(project_id),
-        "step_index": step_index,
         "phase": data.get("phase", "core_experience"),
         "title": data["title"],
         "goal": data["goal"],
@@ -209,12 +190,99 @@ def create_flow_step(
     if data.get("review_target_stakeholder_id") is not None:
         row["review_target_stakeholder_id"] = str(data["review_target_stakeholder_id"])
 
+    return row
+
+
+def create_flow_step(
+    flow_id: UUID, project_id: UUID, data: dict[str, Any]
+) -> dict[str, Any]:
+    """Insert a new step, auto-assigning step_index if not provided."""
+    supabase = get_supabase()
+
+    step_index = data.get("step_index")
+    if step_index is None:
+        # Auto-assign: max existing index + 1
+        existing = (
+            supabase.table("solution_flow_steps")
+            .select("step_index")
+            .eq("flow_id", str(flow_id))
+            .order("step_index", desc=True)
+            .limit(1)
+            .execute()
+        )
+        step_index = (existing.data[0]["step_index"] + 1) if existing.data else 0
+
+    row = _step_row(data)
+    row.update({
+        "flow_id": str(flow_id),
+        "project_id": str(project_id),
+        "step_index": step_index,
+    })
+
     result = supabase.table("solution_flow_steps").insert(row).execute()
     if not result.data:
         raise ValueError("No data returned from step insert")
     return result.data[0]
 
 
+def persist_flow_steps(
+    flow_id: UUID,
+    steps: list[dict[str, Any]],
+    generation_version: int,
+) -> list[dict[str, Any]]:
+    """Replace a flow's generated steps in one transaction.
+
+    Args:
+        flow_id: Flow UUID
+        steps: The flow in its final order. Steps with an "id" are existing
+            (confirmed) steps to keep; the rest are inserted.
+        generation_version: Version of this generation
+
+    Returns:
+        Kept and inserted steps, ordered by step_index
+
+    Superseded ai_generated / needs_review steps are deleted, kept steps are
+    marked preserved from the previous version, and every step's step_index
+    is its position in `steps`.
+    """
+    payload = [
+        {"id": str(step["id"])} if step.get("id") else _step_row(step)
+        for step in steps
+    ]
+    result = get_supabase().rpc(
+        "persist_solution_flow_steps",
+        {
+            "p_flow_id": str(flow_id),
+            "p_generation_version": generation_version,
+            "p_steps": payload,
+        },
+    ).execute()
+    return result.data or []
+
+
+def update_step_narratives(narratives: dict[str, str]) -> int:
+    """Set background_narrative on many steps in one statement.
+
+    Args:
+        narratives: {step_id: narrative}
+
+    Returns:
+        Number of steps updated
+    """
+    if not narratives:
+        return 0
+    result = get_supabase().rpc(
+        "update_solution_flow_step_narratives",
+        {
+            "p_narratives": [
+                {"id": str(step_id), "background_narrative": narrative}
+                for step_id, narrative in narratives.items()
+            ],
+        },
+    ).execute()
+    return result.data or 0
+
+
 def update_flow_step(step_id: UUID, data: dict[str, Any]) -> dict[str, Any]:
     """Partial update of a step. Filters None values."""
     supabase = get_supabase()
@@ -281,6 +349,72 @@ def reorder_flow_steps(flow_id: UUID, step_ids: list[str]) -> list[dict[str, Any
     return list_flow_steps(flow_id)
 
 
+# ============================================================================
+# Step detail cache (migration 0211)
+# ============================================================================
+
+
+def get_cached_step_details(project_id: UUID, cache_keys: list[str]) -> dict[str, dict]:
+    """Load cached builder output for the given keys. Returns {cache_key: detail}."""
+    if not cache_keys:
+        return {}
+    try:
+        result = (
+            get_supabase()
+            .table("solution_flow_step_detail_cache")
+            .select("cache_key, detail")
+            .eq("project_id", str(project_id))
+            .in_("cache_key", cache_keys)
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load step detail cache: {e}")
+        return {}
+    return {row["cache_key"]: row["detail"] for row in result.data or []}
+
+
+def save_cached_step_details(
+    project_id: UUID,
+    details: dict[str, dict],
+    used_keys: list[str] | None = None,
+    max_age_days: int = 30,
+) -> None:
+    """Store fresh builder output, touch reused entries, drop stale ones.
+
+    Args:
+        details: {cache_key: detail} built in this run
+        used_keys: Keys served from the cache in this run
+        max_age_days: Entries unused for longer than this are deleted
+    """
+    supabase = get_supabase()
+    pid = str(project_id)
+    now = datetime.now(UTC)
+    try:
+        if details:
+            supabase.table("solution_flow_step_detail_cache").upsert(
+                [
+                    {
+                        "project_id": pid,
+                        "cache_key": key,
+                        "detail": detail,
+                        "created_at": now.isoformat(),
+                        "last_used_at": now.isoformat(),
+                    }
+                    for key, detail in details.items()
+                ],
+                on_conflict="project_id,cache_key",
+            ).execute()
+        if used_keys:
+            supabase.table("solution_flow_step_detail_cache").update(
+                {"last_used_at": now.isoformat()}
+            ).eq("project_id", pid).in_("cache_key", used_keys).execute()
+        supabase.table("solution_flow_step_detail_cache").delete().eq(
+            "project_id", pid
+        ).lt("last_used_at", (now - timedelta(days=max_age_days)).isoformat()).execute()
+    except Exception as e:
+        logger.warning(f"Failed to save step detail cache: {e}")
+
+
 # ============================================================================
 # Helpers
 # ============================================================================
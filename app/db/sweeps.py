@@ -0,0 +1,96 @@
+"""Batched, throttled archival and retention sweeps.
+
+Each sweep is a sweep_* RPC (migration 0205) that changes at most one
+batch of rows per call and returns how many it changed. run_sweep() calls
+it until a short batch comes back, pausing between batches and stopping
+at a per-run row cap, so a large project is worked down over several runs
+instead of holding locks for minutes. Dry runs return the candidate count
+and change nothing.
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SweepResult:
+    """Outcome of one sweep run."""
+
+    sweep: str
+    affected: int = 0  # rows changed (dry run: rows that would change)
+    batches: int = 0
+    dry_run: bool = False
+    capped: bool = False  # stopped at max_rows; more candidates remain
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def run_sweep(
+    sweep: str,
+    params: dict[str, Any],
+    project_id: UUID | str | None = None,
+    dry_run: bool = False,
+    batch_size: int | None = None,
+    pause_ms: int | None = None,
+    max_rows: int | None = None,
+) -> SweepResult:
+    """Run the sweep_<sweep> RPC in batches until done or capped.
+
+    Args:
+        sweep: Sweep name (RPC is sweep_<sweep>)
+        params: Sweep-specific RPC parameters
+        project_id: Limit to one project (None = all projects)
+        dry_run: Count candidates without changing anything
+        batch_size / pause_ms / max_rows: Override the SWEEP_* settings
+
+    Returns:
+        SweepResult with affected row and batch counts
+    """
+    settings = get_settings()
+    batch_size = batch_size or settings.SWEEP_BATCH_SIZE
+    pause_s = (settings.SWEEP_BATCH_PAUSE_MS if pause_ms is None else pause_ms) / 1000
+    max_rows = settings.SWEEP_MAX_ROWS_PER_RUN if max_rows is None else max_rows
+
+    rpc_params = {
+        **params,
+        "p_project_id": str(project_id) if project_id else None,
+        "p_dry_run": dry_run,
+    }
+    supabase = get_supabase()
+    result = SweepResult(sweep=sweep, dry_run=dry_run)
+
+    if dry_run:
+        response = supabase.rpc(f"sweep_{sweep}", {**rpc_params, "p_batch_size": 0}).execute()
+        result.affected = int(response.data or 0)
+        return result
+
+    while True:
+        limit = batch_size if not max_rows else min(batch_size, max_rows - result.affected)
+        response = supabase.rpc(f"sweep_{sweep}", {**rpc_params, "p_batch_size": limit}).execute()
+        changed = int(response.data or 0)
+        result.affected += changed
+        result.batches += 1
+        if changed < limit:
+            break
+        if max_rows and result.affected >= max_rows:
+            result.capped = True
+            break
+        if pause_s:
+            time.sleep(pause_s)
+
+    if result.affected:
+        scope = f"project {project_id}" if project_id else "all projects"
+        logger.info(
+            f"Sweep {sweep} changed {result.affected} rows in {result.batches} batches "
+            f"({scope}{', capped' if result.capped else ''})"
+        )
+    return result
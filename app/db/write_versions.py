@@ -0,0 +1,98 @@
+"""Per-project table write versions (project_write_versions).
+
+Statement-level triggers bump (project_id, source_table) on every insert,
+update and delete, so a reader can tell whether anything it depends on
+changed since it last looked without scanning the tables themselves.
+
+The same triggers bump one counter per project (project_versions, migration
+0215). In-process caches store the version they were computed at and
+compare it with current_project_version() instead of trusting a short TTL.
+"""
+
+import threading
+from time import monotonic
+from uuid import UUID
+
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+# current_project_version() re-reads the counter at most this often per
+# project; note_project_write() drops the memo for writes made here.
+_VERSION_MEMO_SECONDS = 2.0
+_memo_lock = threading.Lock()
+_version_memo: dict[str, tuple[float, int]] = {}
+
+
+def get_table_versions(project_id: UUID | str) -> dict[str, int] | None:
+    """Current write version per source table for a project.
+
+    Tables never written for the project are absent (version 0).
+    Returns None when the versions can't be read — callers must treat
+    that as "unknown" and not trust anything keyed on them.
+    """
+    try:
+        result = (
+            get_supabase()
+            .table("project_write_versions")
+            .select("source_table, version")
+            .eq("project_id", str(project_id))
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load write versions for {project_id}: {e}")
+        return None
+    return {row["source_table"]: int(row["version"]) for row in result.data or []}
+
+
+def get_project_version(project_id: UUID | str) -> int | None:
+    """Single monotonically increasing version for everything tracked in a project.
+
+    One primary-key read of project_versions. A project never written
+    since the triggers were attached is at version 0. None when the
+    version can't be read.
+    """
+    try:
+        result = (
+            get_supabase()
+            .table("project_versions")
+            .select("version")
+            .eq("project_id", str(project_id))
+            .limit(1)
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load project version for {project_id}: {e}")
+        return None
+    return int(result.data[0]["version"]) if result.data else 0
+
+
+def current_project_version(project_id: UUID | str) -> int | None:
+    """get_project_version(), memoized for a couple of seconds per project.
+
+    Lets hot in-process caches check freshness on every hit without a
+    round trip each time. Failed lookups are not memoized.
+    """
+    key = str(project_id)
+    now = monotonic()
+    with _memo_lock:
+        memo = _version_memo.get(key)
+        if memo and now - memo[0] < _VERSION_MEMO_SECONDS:
+            return memo[1]
+
+    version = get_project_version(key)
+    if version is not None:
+        with _memo_lock:
+            _version_memo[key] = (monotonic(), version)
+    return version
+
+
+def note_project_write(project_id: UUID | str) -> None:
+    """Forget the memoized version after a write made by this process.
+
+    The database triggers already bumped the counter; this only makes the
+    next current_project_version() call see it immediately.
+    """
+    with _memo_lock:
+        _version_memo.pop(str(project_id), None)
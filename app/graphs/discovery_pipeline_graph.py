@@ -7,20 +7,28 @@
 4. evidence_synthesis — Sonnet business driver extraction
 5. persist_results — Store signal, entities, memory
 
-Uses ThreadPoolExecutor for Node 2 parallelism (matching bulk_signal_graph pattern).
+Nodes are async and run on the caller's event loop (graph.ainvoke). Each
+run opens one AsyncAnthropic and one httpx.AsyncClient (DiscoveryClients,
+passed in the run config) that every phase chain and scraping/enrichment
+service call reuses. Node 2 runs its phases as tasks
+under a concurrency limit with a per-phase timeout. Each phase's output
+goes to the job's partial_results as soon as that phase finishes. Blocking
+Supabase calls run on the background pool.
 """
 
 import asyncio
-import concurrent.futures
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 from uuid import UUID
 
+import httpx
+from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
 from app.core.config import get_settings
+from app.core.executors import run_in_pool
 from app.core.logging import get_logger
 from app.db.jobs import complete_job, fail_job
 from app.db.supabase_client import get_supabase
@@ -29,6 +37,9 @@ logger = get_logger(__name__)
 
 MAX_STEPS = 12
 
+# Default timeout for the shared httpx client; services pass their own per request
+_HTTP_TIMEOUT_SECONDS = 30
+
 
 @dataclass
 class DiscoveryPipelineState:
@@ -99,6 +110,23 @@ class DiscoveryPipelineState:
     error: str | None = None
 
 
+@dataclass
+class DiscoveryClients:
+    """HTTP/LLM clients shared by every phase of one pipeline run.
+
+    Kept out of the graph state (which is checkpointed) and passed in the
+    run config instead. None means each call opens its own client.
+    """
+
+    llm: Any = None
+    http: httpx.AsyncClient | None = None
+
+
+def _clients(config: RunnableConfig | None) -> DiscoveryClients:
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("clients") or DiscoveryClients()
+
+
 def _check_max_steps(state: DiscoveryPipelineState) -> DiscoveryPipelineState:
     """Check and increment step count."""
     state.step_count += 1
@@ -163,6 +191,7 @@ def _update_job_progress(state: DiscoveryPipelineState, current_phase: str) -> N
                 "current_phase": current_phase,
                 "cost_so_far_usd": round(state.total_cost_usd, 2),
                 "elapsed_seconds": round(elapsed, 1),
+                "partial_results": _partial_results(state),
             },
         }).eq("id", str(state.job_id)).execute()
 
@@ -170,6 +199,32 @@ def _update_job_progress(state: DiscoveryPipelineState, current_phase: str) -> N
         logger.warning(f"Failed to update job progress: {e}")
 
 
+def _partial_results(state: DiscoveryPipelineState) -> dict[str, Any]:
+    """Outputs of the phases that have finished successfully so far."""
+    outputs = {
+        "company_intel": state.company_profile,
+        "competitor_intel": state.competitors,
+        "market_evidence": state.market_evidence,
+        "user_voice": state.user_voice,
+        "feature_analysis": {
+            "feature_matrix": state.feature_matrix,
+            "pricing_comparison": state.pricing_comparison,
+            "gap_analysis": state.gap_analysis,
+        },
+        "business_drivers": state.business_drivers,
+    }
+    return {
+        phase: output
+        for phase, output in outputs.items()
+        if phase in state.phase_timings and phase not in state.phase_errors
+    }
+
+
+async def _report_progress(state: DiscoveryPipelineState, current_phase: str) -> None:
+    """_update_job_progress off the event loop."""
+    await run_in_pool("background", _update_job_progress, state, current_phase)
+
+
 def _check_cost_cap(state: DiscoveryPipelineState) -> None:
     """Check if we've exceeded the cost cap."""
     settings = get_settings()
@@ -183,58 +238,54 @@ def _check_cost_cap(state: DiscoveryPipelineState) -> None:
 # Node 1: Source Mapping
 # ==========================================================================
 
-def source_mapping(state: DiscoveryPipelineState) -> dict[str, Any]:
-    """Node 1: Run SerpAPI source discovery + load project context."""
-    state = _check_max_steps(state)
-    state.started_at = time.time()
-    start = time.time()
-
-    logger.info(
-        f"Discovery pipeline starting for '{state.company_name}'",
-        extra={"project_id": str(state.project_id), "run_id": str(state.run_id)},
-    )
-
-    _update_job_progress(state, "source_mapping")
-
-    # Load project context for Phase 7 relationship matching
+def _load_project_context(project_id: UUID) -> dict[str, Any]:
+    """Vision, personas, features and VP steps for Phase 7 relationship matching."""
     try:
         supabase = get_supabase()
 
         # Project vision
         project = supabase.table("projects").select(
             "vision"
-        ).eq("id", str(state.project_id)).maybe_single().execute()
+        ).eq("id", str(project_id)).maybe_single().execute()
         project_vision = project.data.get("vision") if project.data else None
 
         # Personas
         personas = supabase.table("personas").select(
             "id, name"
-        ).eq("project_id", str(state.project_id)).execute()
-        persona_names = [p["name"] for p in (personas.data or []) if p.get("name")]
-        persona_ids = {p["name"]: p["id"] for p in (personas.data or []) if p.get("name")}
+        ).eq("project_id", str(project_id)).execute()
 
         # Features
         features = supabase.table("features").select(
             "id, name"
-        ).eq("project_id", str(state.project_id)).execute()
-        feature_names = [f["name"] for f in (features.data or []) if f.get("name")]
-        feature_ids = {f["name"]: f["id"] for f in (features.data or []) if f.get("name")}
+        ).eq("project_id", str(project_id)).execute()
 
         # VP steps (workflow labels)
         vp_steps = supabase.table("vp_steps").select(
             "id, label"
-        ).eq("project_id", str(state.project_id)).execute()
-        workflow_labels = [v["label"] for v in (vp_steps.data or []) if v.get("label")]
-        workflow_ids = {v["label"]: v["id"] for v in (vp_steps.data or []) if v.get("label")}
+        ).eq("project_id", str(project_id)).execute()
 
     except Exception as e:
         logger.warning(f"Failed to load project context: {e}")
-        project_vision = None
-        persona_names, persona_ids = [], {}
-        feature_names, feature_ids = [], {}
-        workflow_labels, workflow_ids = [], {}
+        return {
+            "project_vision": None,
+            "persona_names": [], "persona_ids": {},
+            "feature_names": [], "feature_ids": {},
+            "workflow_labels": [], "workflow_ids": {},
+        }
 
-    # Load seeded context for smarter searches
+    return {
+        "project_vision": project_vision,
+        "persona_names": [p["name"] for p in (personas.data or []) if p.get("name")],
+        "persona_ids": {p["name"]: p["id"] for p in (personas.data or []) if p.get("name")},
+        "feature_names": [f["name"] for f in (features.data or []) if f.get("name")],
+        "feature_ids": {f["name"]: f["id"] for f in (features.data or []) if f.get("name")},
+        "workflow_labels": [v["label"] for v in (vp_steps.data or []) if v.get("label")],
+        "workflow_ids": {v["label"]: v["id"] for v in (vp_steps.data or []) if v.get("label")},
+    }
+
+
+def _load_seeded_context(project_id: UUID) -> dict[str, Any]:
+    """Known company info, competitors and driver keywords for smarter searches."""
     known_competitor_names: list[str] = []
     known_competitor_urls: list[str] = []
     known_pain_keywords: list[str] = []
@@ -249,13 +300,13 @@ def source_mapping(state: DiscoveryPipelineState) -> dict[str, Any]:
         from app.db.competitor_refs import list_competitor_refs
 
         # Company info
-        ci = get_company_info(state.project_id)
+        ci = get_company_info(project_id)
         if ci:
             existing_company_info = ci
             has_pdl_enrichment = bool(ci.get("enriched_at"))
 
         # Known competitors
-        competitors = list_competitor_refs(state.project_id, limit=20)
+        competitors = list_competitor_refs(project_id, limit=20)
         for c in competitors:
             if c.get("name"):
                 known_competitor_names.append(c["name"])
@@ -263,7 +314,7 @@ def source_mapping(state: DiscoveryPipelineState) -> dict[str, Any]:
                 known_competitor_urls.append(c["website"])
 
         # Business drivers -> pain/goal keywords
-        drivers = list_business_drivers(state.project_id, limit=50)
+        drivers = list_business_drivers(project_id, limit=50)
         for d in drivers:
             desc = d.get("description", "")
             if desc:
@@ -286,38 +337,60 @@ def source_mapping(state: DiscoveryPipelineState) -> dict[str, Any]:
     except Exception as e:
         logger.warning(f"Failed to load seeded context (non-fatal): {e}")
 
-    # Run source mapping
-    source_registry: dict[str, list[dict]] = {}
-    cost_entries: list[dict] = []
+    return {
+        "known_competitor_names": known_competitor_names,
+        "known_competitor_urls": known_competitor_urls,
+        "known_pain_keywords": known_pain_keywords,
+        "known_goal_keywords": known_goal_keywords,
+        "existing_company_info": existing_company_info,
+        "has_pdl_enrichment": has_pdl_enrichment,
+        "existing_driver_descriptions": existing_driver_descriptions,
+    }
+
+
+async def source_mapping(
+    state: DiscoveryPipelineState, config: RunnableConfig | None = None
+) -> dict[str, Any]:
+    """Node 1: Run SerpAPI source discovery + load project context."""
+    state = _check_max_steps(state)
+    state.started_at = time.time()
+    start = time.time()
+
+    logger.info(
+        f"Discovery pipeline starting for '{state.company_name}'",
+        extra={"project_id": str(state.project_id), "run_id": str(state.run_id)},
+    )
 
+    _, project_context, seeded = await asyncio.gather(
+        _report_progress(state, "source_mapping"),
+        run_in_pool("background", _load_project_context, state.project_id),
+        run_in_pool("background", _load_seeded_context, state.project_id),
+    )
+
+    # Run source mapping
     try:
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                from app.chains.discover_sources import run_source_mapping
-                return loop.run_until_complete(
-                    run_source_mapping(
-                        company_name=state.company_name,
-                        industry=state.industry,
-                        focus_areas=state.focus_areas,
-                        known_competitors=known_competitor_names,
-                        known_pain_keywords=known_pain_keywords,
-                        company_website=existing_company_info.get("website") or state.company_website,
-                    )
-                )
-            finally:
-                loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_async)
-            source_registry, cost_entries = future.result(timeout=60)
+        from app.chains.discover_sources import run_source_mapping
+
+        source_registry, cost_entries = await asyncio.wait_for(
+            run_source_mapping(
+                company_name=state.company_name,
+                industry=state.industry,
+                focus_areas=state.focus_areas,
+                known_competitors=seeded["known_competitor_names"],
+                known_pain_keywords=seeded["known_pain_keywords"],
+                company_website=(
+                    seeded["existing_company_info"].get("website") or state.company_website
+                ),
+                http_client=_clients(config).http,
+            ),
+            timeout=60,
+        )
 
     except Exception as e:
-        logger.error(f"Source mapping failed: {e}", exc_info=True)
+        logger.error(f"Source mapping failed: {e!r}", exc_info=True)
         return {
-            "error": f"Source mapping failed: {e}",
-            "phase_errors": {"source_mapping": str(e)},
+            "error": f"Source mapping failed: {e!r}",
+            "phase_errors": {"source_mapping": str(e) or type(e).__name__},
             "step_count": state.step_count,
             "started_at": state.started_at,
         }
@@ -332,21 +405,9 @@ def source_mapping(state: DiscoveryPipelineState) -> dict[str, Any]:
         "phase_timings": {"source_mapping": duration},
         "step_count": state.step_count,
         "started_at": state.started_at,
-        "project_vision": project_vision,
-        "persona_names": persona_names,
-        "persona_ids": persona_ids,
-        "feature_names": feature_names,
-        "feature_ids": feature_ids,
-        "workflow_labels": workflow_labels,
-        "workflow_ids": workflow_ids,
+        **project_context,
         # Seeded context
-        "known_competitor_names": known_competitor_names,
-        "known_competitor_urls": known_competitor_urls,
-        "known_pain_keywords": known_pain_keywords,
-        "known_goal_keywords": known_goal_keywords,
-        "existing_company_info": existing_company_info,
-        "has_pdl_enrichment": has_pdl_enrichment,
-        "existing_driver_descriptions": existing_driver_descriptions,
+        **seeded,
     }
 
 
@@ -354,35 +415,32 @@ def source_mapping(state: DiscoveryPipelineState) -> dict[str, Any]:
 # Node 2: Parallel Intelligence (Phases 2-5)
 # ==========================================================================
 
-def parallel_intelligence(state: DiscoveryPipelineState) -> dict[str, Any]:
-    """Node 2: Run Company/Competitor/Market/UserVoice in parallel."""
+async def parallel_intelligence(
+    state: DiscoveryPipelineState, config: RunnableConfig | None = None
+) -> dict[str, Any]:
+    """Node 2: Run Company/Competitor/Market/UserVoice concurrently.
+
+    Phases run as tasks on this loop, at most DISCOVERY_PHASE_CONCURRENCY at
+    a time, each bounded by DISCOVERY_PHASE_TIMEOUT_SECONDS. A failed or
+    timed-out phase is recorded in phase_errors without affecting the
+    others, and job progress (with that phase's results) is written as each
+    one finishes. If the run is cancelled, the phase tasks are cancelled too.
+    """
     state = _check_max_steps(state)
-    _update_job_progress(state, "company_intel")
+    await _report_progress(state, "company_intel")
 
     settings = get_settings()
-    phase_errors: dict[str, str] = dict(state.phase_errors)
-    phase_timings: dict[str, float] = dict(state.phase_timings)
-
-    company_profile: dict = {}
-    competitors: list[dict] = []
-    market_evidence: list[dict] = []
-    user_voice: list[dict] = []
-    all_cost_entries: list[dict] = list(state.cost_ledger)
-
-    def run_phase_async(phase_name: str, coro_factory):
-        """Run an async phase in a fresh event loop."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            start = time.time()
-            result = loop.run_until_complete(coro_factory())
-            duration = time.time() - start
-            return phase_name, result, duration, None
-        except Exception as e:
-            duration = time.time() - start
-            return phase_name, None, duration, str(e)
-        finally:
-            loop.close()
+    timeout = settings.DISCOVERY_PHASE_TIMEOUT_SECONDS
+    semaphore = asyncio.Semaphore(settings.DISCOVERY_PHASE_CONCURRENCY)
+    clients = _clients(config)
+
+    # Progress snapshot, filled in as phases complete
+    progress = replace(
+        state,
+        phase_errors=dict(state.phase_errors),
+        phase_timings=dict(state.phase_timings),
+        cost_ledger=list(state.cost_ledger),
+    )
 
     # Define phase coroutine factories
     def company_factory():
@@ -393,6 +451,8 @@ def parallel_intelligence(state: DiscoveryPipelineState) -> dict[str, Any]:
             source_registry=state.source_registry,
             existing_company_info=state.existing_company_info,
             skip_pdl=state.has_pdl_enrichment,
+            client=clients.llm,
+            http_client=clients.http,
         )
 
     def competitor_factory():
@@ -403,68 +463,83 @@ def parallel_intelligence(state: DiscoveryPipelineState) -> dict[str, Any]:
             max_competitors=settings.DISCOVERY_MAX_COMPETITORS,
             known_competitor_names=state.known_competitor_names,
             known_competitor_urls=state.known_competitor_urls,
+            client=clients.llm,
+            http_client=clients.http,
         )
 
     def market_factory():
         from app.chains.discover_market import run_market_evidence
         return run_market_evidence(
             source_registry=state.source_registry,
+            client=clients.llm,
+            http_client=clients.http,
         )
 
     def user_voice_factory():
         from app.chains.discover_user_voice import run_user_voice
         return run_user_voice(
             source_registry=state.source_registry,
+            client=clients.llm,
+            http_client=clients.http,
         )
 
-    # Run all 4 phases in parallel using ThreadPoolExecutor
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {
-            executor.submit(run_phase_async, "company_intel", company_factory): "company_intel",
-            executor.submit(run_phase_async, "competitor_intel", competitor_factory): "competitor_intel",
-            executor.submit(run_phase_async, "market_evidence", market_factory): "market_evidence",
-            executor.submit(run_phase_async, "user_voice", user_voice_factory): "user_voice",
-        }
+    # Phase name -> (factory, state field for its result)
+    phases = {
+        "company_intel": (company_factory, "company_profile"),
+        "competitor_intel": (competitor_factory, "competitors"),
+        "market_evidence": (market_factory, "market_evidence"),
+        "user_voice": (user_voice_factory, "user_voice"),
+    }
 
-        for future in concurrent.futures.as_completed(futures, timeout=120):
+    async def run_phase(phase_name: str, coro_factory):
+        async with semaphore:
+            start = time.time()
             try:
-                phase_name, result, duration, error = future.result()
-                phase_timings[phase_name] = duration
-
-                if error:
-                    phase_errors[phase_name] = error
-                    logger.warning(f"Phase {phase_name} failed: {error}")
-                    continue
-
-                if phase_name == "company_intel" and result:
-                    company_profile, costs = result
-                    all_cost_entries.extend(costs)
-                elif phase_name == "competitor_intel" and result:
-                    competitors, costs = result
-                    all_cost_entries.extend(costs)
-                elif phase_name == "market_evidence" and result:
-                    market_evidence, costs = result
-                    all_cost_entries.extend(costs)
-                elif phase_name == "user_voice" and result:
-                    user_voice, costs = result
-                    all_cost_entries.extend(costs)
-
+                result = await asyncio.wait_for(coro_factory(), timeout=timeout)
+                return phase_name, result, time.time() - start, None
+            except TimeoutError:
+                return phase_name, None, time.time() - start, f"Timed out after {timeout}s"
             except Exception as e:
-                phase_name = futures[future]
-                phase_errors[phase_name] = str(e)
-                logger.error(f"Phase {phase_name} executor error: {e}")
+                return phase_name, None, time.time() - start, str(e)
 
-    total_cost = sum(c.get("cost_usd", 0) for c in all_cost_entries)
+    tasks = [
+        asyncio.create_task(run_phase(name, factory), name=f"discovery:{name}")
+        for name, (factory, _) in phases.items()
+    ]
+    pending = set(phases)
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            phase_name, result, duration, error = await next_done
+            pending.discard(phase_name)
+            progress.phase_timings[phase_name] = duration
+
+            if error:
+                progress.phase_errors[phase_name] = error
+                logger.warning(f"Phase {phase_name} failed: {error}")
+            elif result:
+                output, costs = result
+                setattr(progress, phases[phase_name][1], output)
+                progress.cost_ledger.extend(costs)
+                progress.total_cost_usd = sum(c.get("cost_usd", 0) for c in progress.cost_ledger)
+
+            running = next((name for name in phases if name in pending), "feature_analysis")
+            await _report_progress(progress, running)
+    finally:
+        # Propagate cancellation (or an unexpected error) to phases still running
+        for task in tasks:
+            if not task.done():
+                task.cancel()
 
     return {
-        "company_profile": company_profile,
-        "competitors": competitors,
-        "market_evidence": market_evidence,
-        "user_voice": user_voice,
-        "cost_ledger": all_cost_entries,
-        "total_cost_usd": total_cost,
-        "phase_errors": phase_errors,
-        "phase_timings": phase_timings,
+        "company_profile": progress.company_profile,
+        "competitors": progress.competitors,
+        "market_evidence": progress.market_evidence,
+        "user_voice": progress.user_voice,
+        "cost_ledger": progress.cost_ledger,
+        "total_cost_usd": progress.total_cost_usd,
+        "phase_errors": progress.phase_errors,
+        "phase_timings": progress.phase_timings,
         "step_count": state.step_count,
     }
 
@@ -473,10 +548,12 @@ def parallel_intelligence(state: DiscoveryPipelineState) -> dict[str, Any]:
 # Node 3: Feature Analysis (Phase 6)
 # ==========================================================================
 
-def feature_analysis(state: DiscoveryPipelineState) -> dict[str, Any]:
+async def feature_analysis(
+    state: DiscoveryPipelineState, config: RunnableConfig | None = None
+) -> dict[str, Any]:
     """Node 3: Feature matrix and gap analysis."""
     state = _check_max_steps(state)
-    _update_job_progress(state, "feature_analysis")
+    await _report_progress(state, "feature_analysis")
 
     start = time.time()
     phase_timings = dict(state.phase_timings)
@@ -490,29 +567,22 @@ def feature_analysis(state: DiscoveryPipelineState) -> dict[str, Any]:
     try:
         _check_cost_cap(state)
 
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                from app.chains.discover_features import run_feature_analysis
-                return loop.run_until_complete(
-                    run_feature_analysis(
-                        company_name=state.company_name,
-                        company_profile=state.company_profile,
-                        competitors=state.competitors,
-                    )
-                )
-            finally:
-                loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_async)
-            feature_matrix, pricing_comparison, gap_analysis, costs = future.result(timeout=60)
-            all_cost_entries.extend(costs)
+        from app.chains.discover_features import run_feature_analysis
+
+        feature_matrix, pricing_comparison, gap_analysis, costs = await asyncio.wait_for(
+            run_feature_analysis(
+                company_name=state.company_name,
+                company_profile=state.company_profile,
+                competitors=state.competitors,
+                client=_clients(config).llm,
+            ),
+            timeout=60,
+        )
+        all_cost_entries.extend(costs)
 
     except Exception as e:
-        phase_errors["feature_analysis"] = str(e)
-        logger.warning(f"Feature analysis failed: {e}")
+        phase_errors["feature_analysis"] = str(e) or type(e).__name__
+        logger.warning(f"Feature analysis failed: {e!r}")
 
     phase_timings["feature_analysis"] = time.time() - start
     total_cost = sum(c.get("cost_usd", 0) for c in all_cost_entries)
@@ -533,10 +603,12 @@ def feature_analysis(state: DiscoveryPipelineState) -> dict[str, Any]:
 # Node 4: Evidence Synthesis (Phase 7)
 # ==========================================================================
 
-def evidence_synthesis(state: DiscoveryPipelineState) -> dict[str, Any]:
+async def evidence_synthesis(
+    state: DiscoveryPipelineState, config: RunnableConfig | None = None
+) -> dict[str, Any]:
     """Node 4: Sonnet-powered business driver synthesis."""
     state = _check_max_steps(state)
-    _update_job_progress(state, "business_drivers")
+    await _report_progress(state, "business_drivers")
 
     start = time.time()
     phase_timings = dict(state.phase_timings)
@@ -548,39 +620,32 @@ def evidence_synthesis(state: DiscoveryPipelineState) -> dict[str, Any]:
     try:
         _check_cost_cap(state)
 
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                from app.chains.discover_drivers import run_driver_synthesis
-                return loop.run_until_complete(
-                    run_driver_synthesis(
-                        company_name=state.company_name,
-                        industry=state.industry,
-                        project_vision=state.project_vision,
-                        persona_names=state.persona_names,
-                        workflow_labels=state.workflow_labels,
-                        feature_names=state.feature_names,
-                        company_profile=state.company_profile,
-                        competitors=state.competitors,
-                        market_evidence=state.market_evidence,
-                        user_voice=state.user_voice,
-                        feature_matrix=state.feature_matrix,
-                        gap_analysis=state.gap_analysis,
-                        existing_drivers=state.existing_driver_descriptions,
-                    )
-                )
-            finally:
-                loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_async)
-            business_drivers, costs = future.result(timeout=60)
-            all_cost_entries.extend(costs)
+        from app.chains.discover_drivers import run_driver_synthesis
+
+        business_drivers, costs = await asyncio.wait_for(
+            run_driver_synthesis(
+                company_name=state.company_name,
+                industry=state.industry,
+                project_vision=state.project_vision,
+                persona_names=state.persona_names,
+                workflow_labels=state.workflow_labels,
+                feature_names=state.feature_names,
+                company_profile=state.company_profile,
+                competitors=state.competitors,
+                market_evidence=state.market_evidence,
+                user_voice=state.user_voice,
+                feature_matrix=state.feature_matrix,
+                gap_analysis=state.gap_analysis,
+                existing_drivers=state.existing_driver_descriptions,
+                client=_clients(config).llm,
+            ),
+            timeout=60,
+        )
+        all_cost_entries.extend(costs)
 
     except Exception as e:
-        phase_errors["business_drivers"] = str(e)
-        logger.warning(f"Business driver synthesis failed: {e}")
+        phase_errors["business_drivers"] = str(e) or type(e).__name__
+        logger.warning(f"Business driver synthesis failed: {e!r}")
 
     phase_timings["business_drivers"] = time.time() - start
     total_cost = sum(c.get("cost_usd", 0) for c in all_cost_entries)
@@ -599,10 +664,10 @@ def evidence_synthesis(state: DiscoveryPipelineState) -> dict[str, Any]:
 # Node 5: Persist Results (Phase 8)
 # ==========================================================================
 
-def persist_results(state: DiscoveryPipelineState) -> dict[str, Any]:
+async def persist_results(state: DiscoveryPipelineState) -> dict[str, Any]:
     """Node 5: Store signal, entities, update memory."""
     state = _check_max_steps(state)
-    _update_job_progress(state, "synthesis")
+    await _report_progress(state, "synthesis")
 
     start = time.time()
     phase_timings = dict(state.phase_timings)
@@ -614,45 +679,39 @@ def persist_results(state: DiscoveryPipelineState) -> dict[str, Any]:
     entities_stored: dict[str, int] = {}
 
     try:
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                from app.chains.discover_synthesis import run_synthesis
-                return loop.run_until_complete(
-                    run_synthesis(
-                        project_id=state.project_id,
-                        run_id=state.run_id,
-                        company_name=state.company_name,
-                        company_profile=state.company_profile,
-                        competitors=state.competitors,
-                        market_evidence=state.market_evidence,
-                        user_voice=state.user_voice,
-                        feature_matrix=state.feature_matrix,
-                        gap_analysis=state.gap_analysis,
-                        business_drivers=state.business_drivers,
-                        total_cost_usd=state.total_cost_usd,
-                        persona_ids=state.persona_ids,
-                        feature_ids=state.feature_ids,
-                        workflow_ids=state.workflow_ids,
-                        project_vision=state.project_vision,
-                    )
-                )
-            finally:
-                loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_async)
-            result_summary, costs = future.result(timeout=120)
-            all_cost_entries.extend(costs)
+        from app.chains.discover_synthesis import run_synthesis
+
+        # Synthesis runs on the background pool; the timeout frees this node
+        # but can't stop writes already under way in that thread
+        result_summary, costs = await asyncio.wait_for(
+            run_synthesis(
+                project_id=state.project_id,
+                run_id=state.run_id,
+                company_name=state.company_name,
+                company_profile=state.company_profile,
+                competitors=state.competitors,
+                market_evidence=state.market_evidence,
+                user_voice=state.user_voice,
+                feature_matrix=state.feature_matrix,
+                gap_analysis=state.gap_analysis,
+                business_drivers=state.business_drivers,
+                total_cost_usd=state.total_cost_usd,
+                persona_ids=state.persona_ids,
+                feature_ids=state.feature_ids,
+                workflow_ids=state.workflow_ids,
+                project_vision=state.project_vision,
+            ),
+            timeout=120,
+        )
+        all_cost_entries.extend(costs)
 
         if result_summary.get("signal_id"):
             signal_id = UUID(result_summary["signal_id"])
         entities_stored = result_summary.get("entities_stored", {})
 
     except Exception as e:
-        phase_errors["synthesis"] = str(e)
-        logger.error(f"Synthesis/persist failed: {e}", exc_info=True)
+        phase_errors["synthesis"] = str(e) or type(e).__name__
+        logger.error(f"Synthesis/persist failed: {e!r}", exc_info=True)
 
     phase_timings["synthesis"] = time.time() - start
     total_cost = sum(c.get("cost_usd", 0) for c in all_cost_entries)
@@ -662,9 +721,12 @@ def persist_results(state: DiscoveryPipelineState) -> dict[str, Any]:
 
     try:
         if phase_errors.get("source_mapping"):
-            fail_job(state.job_id, f"Pipeline failed: {phase_errors['source_mapping']}")
+            await run_in_pool(
+                "background", fail_job, state.job_id,
+                f"Pipeline failed: {phase_errors['source_mapping']}",
+            )
         else:
-            complete_job(state.job_id, {
+            await run_in_pool("background", complete_job, state.job_id, {
                 "signal_id": str(signal_id) if signal_id else None,
                 "entities_stored": entities_stored,
                 "total_cost_usd": round(total_cost, 2),
@@ -746,7 +808,7 @@ def get_discovery_pipeline_graph():
     return _discovery_graph
 
 
-def run_discovery_pipeline(
+async def run_discovery_pipeline(
     project_id: UUID,
     run_id: UUID,
     job_id: UUID,
@@ -756,7 +818,10 @@ def run_discovery_pipeline(
     focus_areas: list[str] | None = None,
 ) -> dict[str, Any]:
     """
-    Run the discovery pipeline.
+    Run the discovery pipeline on the caller's event loop.
+
+    Opens the run's shared LLM and HTTP clients and closes them when the
+    pipeline ends.
 
     Args:
         project_id: Project UUID
@@ -782,10 +847,22 @@ def run_discovery_pipeline(
         focus_areas=focus_areas or [],
     )
 
-    config = {"configurable": {"thread_id": str(run_id)}}
+    settings = get_settings()
+    llm = None
+    if settings.ANTHROPIC_API_KEY:
+        from anthropic import AsyncAnthropic
+
+        llm = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     try:
-        result = graph.invoke(initial_state, config=config)
+        async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT_SECONDS) as http_client:
+            config = {
+                "configurable": {
+                    "thread_id": str(run_id),
+                    "clients": DiscoveryClients(llm=llm, http=http_client),
+                }
+            }
+            result = await graph.ainvoke(initial_state, config=config)
 
         return {
             "success": not bool(result.get("error")),
@@ -801,10 +878,13 @@ def run_discovery_pipeline(
     except Exception as e:
         logger.error(f"Discovery pipeline failed: {e}", exc_info=True)
         try:
-            fail_job(job_id, str(e))
+            await run_in_pool("background", fail_job, job_id, str(e))
         except Exception:
             pass
         return {
             "success": False,
             "error": str(e),
         }
+    finally:
+        if llm is not None:
+            await llm.close()
@@ -189,6 +189,7 @@ def extract_content(state: DocumentProcessingState) -> dict[str, Any]:
                 filename=state.original_filename,
                 mime_type=state.mime_type,
                 extract_images=True,
+                project_id=state.project_id,
             )
         )
 
@@ -224,15 +225,59 @@ def process_embedded_images(state: DocumentProcessingState) -> dict[str, Any]:
         f"Processing {len(embedded_images)} embedded images from {state.original_filename}"
     )
 
-    from app.db.document_extracted_images import create_extracted_image
+    from app.core.document_processing.image_extractor import VISION_ANALYSIS_PROMPT
+    from app.core.document_processing.vision import (
+        VISION_MODEL,
+        decorative_reason,
+        detect_image_mime,
+        find_duplicate,
+        find_repeated_asset,
+        fingerprint_image,
+        prompt_key,
+    )
+    from app.db.document_extracted_images import (
+        create_extracted_image,
+        get_cached_vision_analyses,
+    )
+
+    # Drop decorative images and repeats (logos, slide backgrounds) before upload
+    kept: list[tuple[int, bytes, Any]] = []
+    seen: list[tuple[int, Any]] = []
+    for idx, img_bytes in enumerate(embedded_images):
+        fp = fingerprint_image(img_bytes)
+        if (
+            decorative_reason(fp)
+            or find_duplicate(fp, seen) is not None
+            or find_repeated_asset(fp, seen) is not None
+        ):
+            continue
+        seen.append((idx, fp))
+        kept.append((idx, img_bytes, fp))
+
+    if len(kept) < len(embedded_images):
+        logger.info(
+            f"Skipped {len(embedded_images) - len(kept)} decorative or duplicate images"
+        )
+
+    # Reuse analyses of the same image from earlier documents in this project
+    cached_analyses: dict[str, str] = {}
+    if kept:
+        try:
+            cached_analyses = get_cached_vision_analyses(
+                state.project_id,
+                [fp.key for _, _, fp in kept],
+                prompt_key(VISION_ANALYSIS_PROMPT),
+            )
+        except Exception as e:
+            logger.warning(f"Vision cache lookup failed: {e}")
 
     supabase = get_supabase()
     extracted_ids: list[str] = []
 
-    for idx, img_bytes in enumerate(embedded_images):
+    for idx, img_bytes, fp in kept:
         try:
             # Detect MIME type from magic bytes
-            mime_type = _detect_image_mime(img_bytes)
+            mime_type = detect_image_mime(img_bytes)
             ext = {
                 "image/png": "png",
                 "image/jpeg": "jpg",
@@ -273,6 +318,9 @@ def process_embedded_images(state: DocumentProcessingState) -> dict[str, Any]:
                 image_index=idx,
                 page_number=page_number,
                 source_context=source_context,
+                vision_analysis=cached_analyses.get(fp.key),
+                vision_model=VISION_MODEL if fp.key in cached_analyses else None,
+                metadata={"image_hash": fp.key},
             )
 
             extracted_ids.append(record["id"])
@@ -285,19 +333,6 @@ def process_embedded_images(state: DocumentProcessingState) -> dict[str, Any]:
     return {"extracted_image_ids": extracted_ids}
 
 
-def _detect_image_mime(img_bytes: bytes) -> str:
-    """Detect image MIME type from magic bytes."""
-    if img_bytes[:8] == b"\x89PNG\r\n\x1a\n":
-        return "image/png"
-    elif img_bytes[:2] == b"\xff\xd8":
-        return "image/jpeg"
-    elif img_bytes[:4] == b"RIFF" and len(img_bytes) > 12 and img_bytes[8:12] == b"WEBP":
-        return "image/webp"
-    elif img_bytes[:6] in (b"GIF87a", b"GIF89a"):
-        return "image/gif"
-    return "image/png"
-
-
 def classify_content(state: DocumentProcessingState) -> dict[str, Any]:
     """Classify the document."""
     state = _check_max_steps(state)
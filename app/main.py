@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.api import router as api_router
+from app.core.http_cache import HTTPCacheMiddleware
 
 
 class ProxyHeadersMiddleware(BaseHTTPMiddleware):
@@ -29,6 +30,9 @@ app = FastAPI(
     version="0.1.0",
 )
 
+# gzip + ETag/304 for JSON reads (innermost, so CORS headers still apply to 304s)
+app.add_middleware(HTTPCacheMiddleware)
+
 # Add proxy headers middleware (must be before CORS)
 app.add_middleware(ProxyHeadersMiddleware)
 
@@ -54,7 +58,8 @@ app.add_middleware(
     allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-API-Key"],
+    allow_headers=["Content-Type", "Authorization", "X-API-Key", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
 
@@ -74,11 +79,37 @@ async def health_check() -> JSONResponse:
     return JSONResponse(content={"status": "ok"}, status_code=200)
 
 
+@app.get("/health/executors")
+async def executor_health() -> JSONResponse:
+    """Queue depth, wait times and shed counts for the workload executor pools."""
+    from app.core.executors import pool_stats
+    return JSONResponse(content={"pools": pool_stats()}, status_code=200)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Start background services."""
-    from app.services.reminder_scheduler import start_reminder_scheduler
-    asyncio.create_task(start_reminder_scheduler())
+    from app.core.config import get_settings
+    if get_settings().SCHEDULER_ENABLED:
+        from app.services.scheduler import start_scheduler
+        asyncio.create_task(start_scheduler())
+
+    from app.context.intent_router import load_intent_router
+    await asyncio.to_thread(load_intent_router)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Drain write-behind persistence before the worker exits."""
+    from app.core.chat_stream import flush_chat_messages
+    from app.core.write_behind import flush_writes
+    from app.db.memory_graph import flush_node_embeddings
+    await asyncio.to_thread(flush_chat_messages, 5.0)
+    await asyncio.to_thread(flush_writes, 5.0)
+    await asyncio.to_thread(flush_node_embeddings, 5.0)
+
+    from app.core.executors import shutdown_pools
+    shutdown_pools()
 
 
 # Include v1 API router
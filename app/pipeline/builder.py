@@ -18,6 +18,13 @@ from pathlib import Path
 from typing import Any
 
 from app.core.config import get_settings
+from app.core.llm_usage import anthropic_usage_tokens, log_llm_usage
+from app.core.prompt_cache import (
+    PromptSegment,
+    Stability,
+    assemble_system,
+    warm_prompt_cache,
+)
 from app.core.schemas_prototype_builder import PrototypePayload
 
 logger = logging.getLogger(__name__)
@@ -586,6 +593,22 @@ def _format_single_screen(screen: dict, step_data: dict | None = None) -> str:
 # =============================================================================
 
 
+_BUILDER_MODEL = "claude-haiku-4-5-20251001"
+
+
+def _builder_system(plan_context: str) -> list[dict[str, Any]]:
+    """Builder instructions and component reference (shared by every
+    prototype), then this prototype's plan context."""
+    return assemble_system(
+        [
+            PromptSegment(BUILDER_SYSTEM_PROMPT),
+            PromptSegment(COMPONENT_TYPES_REFERENCE),
+            PromptSegment(plan_context, Stability.PROJECT),
+        ],
+        name="prototype_page_builder",
+    )
+
+
 async def _build_single_page(
     screen: dict,
     plan_context: str,
@@ -593,6 +616,7 @@ async def _build_single_page(
     client: Any,
     simplified: bool = False,
     step_data: dict | None = None,
+    project_id: str | None = None,
 ) -> dict | None:
     """Build a single page with one Haiku call.
 
@@ -626,26 +650,10 @@ async def _build_single_page(
 
     try:
         response = await client.messages.create(
-            model="claude-haiku-4-5-20251001",
+            model=_BUILDER_MODEL,
             max_tokens=12000,
             temperature=1,
-            system=[
-                {
-                    "type": "text",
-                    "text": BUILDER_SYSTEM_PROMPT,
-                    "cache_control": {"type": "ephemeral"},
-                },
-                {
-                    "type": "text",
-                    "text": COMPONENT_TYPES_REFERENCE,
-                    "cache_control": {"type": "ephemeral"},
-                },
-                {
-                    "type": "text",
-                    "text": plan_context,
-                    "cache_control": {"type": "ephemeral"},
-                },
-            ],
+            system=_builder_system(plan_context),
             tools=[PAGE_TOOL],
             messages=[{"role": "user", "content": user_message}],
         )
@@ -653,9 +661,18 @@ async def _build_single_page(
         duration = time.monotonic() - start
 
         # Check cache performance
-        usage = response.usage
-        cached = getattr(usage, "cache_read_input_tokens", 0)
-        created = getattr(usage, "cache_creation_input_tokens", 0)
+        usage = anthropic_usage_tokens(response.usage)
+        log_llm_usage(
+            workflow="prototype_builder",
+            chain="build_page",
+            model=_BUILDER_MODEL,
+            provider="anthropic",
+            duration_ms=int(duration * 1000),
+            project_id=project_id,
+            **usage,
+        )
+        cached = usage["tokens_cache_read"]
+        created = usage["tokens_cache_create"]
         if cached:
             logger.info(f"  {route}: cache hit ({cached} tokens cached)")
         elif created:
@@ -765,6 +782,14 @@ async def run_haiku_builders(
 
     start = time.monotonic()
 
+    # Write the shared prefix to the cache once, instead of every parallel
+    # call paying for its own cache write
+    if len(all_screens) > 1:
+        await warm_prompt_cache(
+            client, _BUILDER_MODEL, _builder_system(plan_context), [PAGE_TOOL],
+            workflow="prototype_builder", project_id=payload.project_id,
+        )
+
     # ── Pass 1: initial parallel build ──
     tasks = [
         _build_single_page(
@@ -773,6 +798,7 @@ async def run_haiku_builders(
             project_plan,
             client,
             step_data=step_by_route.get(screen["route"]),
+            project_id=payload.project_id,
         )
         for screen in all_screens
     ]
@@ -808,6 +834,7 @@ async def run_haiku_builders(
                 project_plan,
                 client,
                 step_data=step_by_route.get(r),
+                project_id=payload.project_id,
             )
             for r in failed_routes
         ]
@@ -840,6 +867,7 @@ async def run_haiku_builders(
                 client,
                 simplified=True,
                 step_data=step_by_route.get(r),
+                project_id=payload.project_id,
             )
             for r in failed_routes
         ]
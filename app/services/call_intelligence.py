@@ -3,10 +3,13 @@
 Pipeline: Recall.ai (media) -> Deepgram (transcription) -> Claude (analysis) -> AIOS signal
 """
 
+import asyncio
 from uuid import UUID, uuid4
 
 from app.core.config import get_settings
+from app.core.executors import run_in_pool
 from app.core.logging import get_logger
+from app.core.schemas_call_intelligence import AnalysisResult
 
 logger = get_logger(__name__)
 
@@ -33,7 +36,7 @@ class CallIntelligenceService:
         12. Trigger V2 pipeline
         13. Status -> complete
         """
-        from app.chains.analyze_call import analyze_call_transcript, resolve_dimensions
+        from app.chains.analyze_call import analyze_call_transcript, resolve_packs
         from app.core.recall_service import (
             compute_duration,
             extract_media_urls,
@@ -78,10 +81,13 @@ class CallIntelligenceService:
                 )
                 return {"status": "failed", "error": "no_audio_url"}
 
-            # Step 4-6: Transcribe
+            # Step 4-6: Transcribe (project context loads meanwhile)
             ci_db.update_call_recording(recording_id, {"status": "transcribing"})
 
-            transcript_result = await transcribe_audio(audio_url)
+            context_task = asyncio.ensure_future(
+                run_in_pool("background", self._build_context_blocks, project_id)
+            )
+            transcript_result = await transcribe_audio(audio_url, duration_seconds=duration)
 
             ci_db.save_transcript(
                 recording_id=recording_id,
@@ -97,52 +103,19 @@ class CallIntelligenceService:
             # Step 7-10: Analyze
             ci_db.update_call_recording(recording_id, {"status": "analyzing"})
 
-            context_blocks = self._build_context_blocks(project_id)
-            dimensions = resolve_dimensions(settings.CALL_ACTIVE_PACKS)
+            context_blocks = await context_task
 
-            analysis = analyze_call_transcript(
+            analysis = await analyze_call_transcript(
                 transcript_text=transcript_result.full_text,
-                dimensions=dimensions,
+                packs=resolve_packs(settings.CALL_ACTIVE_PACKS),
+                segments=transcript_result.segments,
                 context_blocks=context_blocks,
                 settings=settings,
                 project_id=project_id,
             )
 
-            # Save analysis
-            ci_db.save_analysis(
-                recording_id=recording_id,
-                engagement_score=analysis.engagement_score,
-                talk_ratio=analysis.talk_ratio,
-                engagement_timeline=analysis.engagement_timeline,
-                executive_summary=analysis.executive_summary,
-                custom_dimensions=analysis.custom_dimensions,
-                dimension_packs_used=analysis.dimension_packs_used,
-                model=analysis.model,
-                tokens_input=analysis.tokens_input,
-                tokens_output=analysis.tokens_output,
-            )
-
-            # Save child records
-            if analysis.feature_insights:
-                ci_db.save_feature_insights(
-                    recording_id,
-                    [fi.model_dump() for fi in analysis.feature_insights],
-                )
-            if analysis.call_signals:
-                ci_db.save_call_signals(
-                    recording_id,
-                    [cs.model_dump() for cs in analysis.call_signals],
-                )
-            if analysis.content_nuggets:
-                ci_db.save_content_nuggets(
-                    recording_id,
-                    [cn.model_dump() for cn in analysis.content_nuggets],
-                )
-            if analysis.competitive_mentions:
-                ci_db.save_competitive_mentions(
-                    recording_id,
-                    [cm.model_dump() for cm in analysis.competitive_mentions],
-                )
+            # Save analysis + child records
+            await run_in_pool("background", self._save_analysis, recording_id, analysis)
 
             # Step 11-12: Create AIOS signal and trigger V2 pipeline
             signal_id = await self._create_aios_signal(
@@ -220,7 +193,7 @@ class CallIntelligenceService:
         6. Post-call learning loop (if strategy brief exists)
         7. Status → complete
         """
-        from app.chains.analyze_call import analyze_call_transcript, resolve_dimensions
+        from app.chains.analyze_call import analyze_call_transcript, resolve_packs
         from app.db import call_intelligence as ci_db
         from app.services.deepgram_client import transcribe_audio
 
@@ -232,10 +205,15 @@ class CallIntelligenceService:
         project_id = recording["project_id"]
 
         try:
-            # Step 2: Transcribe
+            # Step 2: Transcribe (project context loads meanwhile)
             ci_db.update_call_recording(recording_id, {"status": "transcribing"})
 
-            transcript_result = await transcribe_audio(audio_url)
+            context_task = asyncio.ensure_future(
+                run_in_pool("background", self._build_context_blocks, project_id)
+            )
+            transcript_result = await transcribe_audio(
+                audio_url, duration_seconds=recording.get("duration_seconds")
+            )
 
             ci_db.save_transcript(
                 recording_id=recording_id,
@@ -251,50 +229,18 @@ class CallIntelligenceService:
             # Step 3-4: Analyze
             ci_db.update_call_recording(recording_id, {"status": "analyzing"})
 
-            context_blocks = self._build_context_blocks(project_id)
-            dimensions = resolve_dimensions(settings.CALL_ACTIVE_PACKS)
+            context_blocks = await context_task
 
-            analysis = analyze_call_transcript(
+            analysis = await analyze_call_transcript(
                 transcript_text=transcript_result.full_text,
-                dimensions=dimensions,
+                packs=resolve_packs(settings.CALL_ACTIVE_PACKS),
+                segments=transcript_result.segments,
                 context_blocks=context_blocks,
                 settings=settings,
                 project_id=project_id,
             )
 
-            ci_db.save_analysis(
-                recording_id=recording_id,
-                engagement_score=analysis.engagement_score,
-                talk_ratio=analysis.talk_ratio,
-                engagement_timeline=analysis.engagement_timeline,
-                executive_summary=analysis.executive_summary,
-                custom_dimensions=analysis.custom_dimensions,
-                dimension_packs_used=analysis.dimension_packs_used,
-                model=analysis.model,
-                tokens_input=analysis.tokens_input,
-                tokens_output=analysis.tokens_output,
-            )
-
-            if analysis.feature_insights:
-                ci_db.save_feature_insights(
-                    recording_id,
-                    [fi.model_dump() for fi in analysis.feature_insights],
-                )
-            if analysis.call_signals:
-                ci_db.save_call_signals(
-                    recording_id,
-                    [cs.model_dump() for cs in analysis.call_signals],
-                )
-            if analysis.content_nuggets:
-                ci_db.save_content_nuggets(
-                    recording_id,
-                    [cn.model_dump() for cn in analysis.content_nuggets],
-                )
-            if analysis.competitive_mentions:
-                ci_db.save_competitive_mentions(
-                    recording_id,
-                    [cm.model_dump() for cm in analysis.competitive_mentions],
-                )
+            await run_in_pool("background", self._save_analysis, recording_id, analysis)
 
             # Step 5: Create AIOS signal and trigger V2 pipeline
             signal_id = await self._create_aios_signal(
@@ -427,9 +373,11 @@ class CallIntelligenceService:
         """
         Trigger (re-)analysis on an existing recording with transcript.
 
-        Useful for re-running with different dimension packs.
+        Useful for adding dimension packs. Packs already analyzed are kept
+        and come from the per-pack cache; only new packs call the model and
+        only their child records are written.
         """
-        from app.chains.analyze_call import analyze_call_transcript, resolve_dimensions
+        from app.chains.analyze_call import analyze_call_transcript, resolve_packs
         from app.db import call_intelligence as ci_db
 
         settings = get_settings()
@@ -441,55 +389,29 @@ class CallIntelligenceService:
         if not transcript:
             raise ValueError(f"No transcript found for recording {recording_id}")
 
-        packs = dimension_packs or settings.CALL_ACTIVE_PACKS
-        dimensions = resolve_dimensions(packs)
+        requested = resolve_packs(dimension_packs or settings.CALL_ACTIVE_PACKS)
+        previous = (ci_db.get_analysis(recording_id) or {}).get("dimension_packs_used") or []
+        packs = list(dict.fromkeys([*previous, *requested]))
 
         ci_db.update_call_recording(recording_id, {"status": "analyzing"})
 
-        context_blocks = self._build_context_blocks(recording["project_id"])
+        context_blocks = await run_in_pool(
+            "background", self._build_context_blocks, recording["project_id"]
+        )
 
-        analysis = analyze_call_transcript(
+        analysis = await analyze_call_transcript(
             transcript_text=transcript["full_text"],
-            dimensions=dimensions,
+            packs=packs,
+            segments=transcript.get("segments"),
             context_blocks=context_blocks,
             settings=settings,
             project_id=recording["project_id"],
         )
 
-        ci_db.save_analysis(
-            recording_id=recording_id,
-            engagement_score=analysis.engagement_score,
-            talk_ratio=analysis.talk_ratio,
-            engagement_timeline=analysis.engagement_timeline,
-            executive_summary=analysis.executive_summary,
-            custom_dimensions=analysis.custom_dimensions,
-            dimension_packs_used=analysis.dimension_packs_used,
-            model=analysis.model,
-            tokens_input=analysis.tokens_input,
-            tokens_output=analysis.tokens_output,
+        await run_in_pool(
+            "background", self._save_analysis, recording_id, analysis, previous
         )
 
-        if analysis.feature_insights:
-            ci_db.save_feature_insights(
-                recording_id,
-                [fi.model_dump() for fi in analysis.feature_insights],
-            )
-        if analysis.call_signals:
-            ci_db.save_call_signals(
-                recording_id,
-                [cs.model_dump() for cs in analysis.call_signals],
-            )
-        if analysis.content_nuggets:
-            ci_db.save_content_nuggets(
-                recording_id,
-                [cn.model_dump() for cn in analysis.content_nuggets],
-            )
-        if analysis.competitive_mentions:
-            ci_db.save_competitive_mentions(
-                recording_id,
-                [cm.model_dump() for cm in analysis.competitive_mentions],
-            )
-
         ci_db.update_call_recording(recording_id, {"status": "complete"})
 
         return {
@@ -531,6 +453,56 @@ class CallIntelligenceService:
 
         return {"signal_id": signal_id}
 
+    def _save_analysis(
+        self,
+        recording_id: UUID,
+        analysis: AnalysisResult,
+        saved_packs: list[str] | None = None,
+    ) -> None:
+        """Upsert the analysis row and insert child records.
+
+        Child records come from the research pack; they are skipped when
+        saved_packs says that pack was already saved for this recording.
+        """
+        from app.db import call_intelligence as ci_db
+
+        ci_db.save_analysis(
+            recording_id=recording_id,
+            engagement_score=analysis.engagement_score,
+            talk_ratio=analysis.talk_ratio,
+            engagement_timeline=analysis.engagement_timeline,
+            executive_summary=analysis.executive_summary,
+            custom_dimensions=analysis.custom_dimensions,
+            dimension_packs_used=analysis.dimension_packs_used,
+            model=analysis.model,
+            tokens_input=analysis.tokens_input,
+            tokens_output=analysis.tokens_output,
+        )
+
+        if "research" in (saved_packs or []):
+            return
+
+        if analysis.feature_insights:
+            ci_db.save_feature_insights(
+                recording_id,
+                [fi.model_dump() for fi in analysis.feature_insights],
+            )
+        if analysis.call_signals:
+            ci_db.save_call_signals(
+                recording_id,
+                [cs.model_dump() for cs in analysis.call_signals],
+            )
+        if analysis.content_nuggets:
+            ci_db.save_content_nuggets(
+                recording_id,
+                [cn.model_dump() for cn in analysis.content_nuggets],
+            )
+        if analysis.competitive_mentions:
+            ci_db.save_competitive_mentions(
+                recording_id,
+                [cm.model_dump() for cm in analysis.competitive_mentions],
+            )
+
     def _build_context_blocks(self, project_id: str) -> list[dict]:
         """Build context blocks from project data for analysis."""
         blocks: list[dict] = []
@@ -545,6 +517,7 @@ class CallIntelligenceService:
                 supabase.table("features")
                 .select("name, category")
                 .eq("project_id", project_id)
+                .order("name")
                 .limit(30)
                 .execute()
             ).data or []
@@ -566,6 +539,7 @@ class CallIntelligenceService:
                 supabase.table("personas")
                 .select("name, description")
                 .eq("project_id", project_id)
+                .order("name")
                 .limit(10)
                 .execute()
             ).data or []
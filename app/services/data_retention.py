@@ -5,52 +5,85 @@ Enforces retention policies for communication data:
 - Sanitized signal text: 90 days → delete signals.raw_text, keep entities
 - Recording/transcript URLs: 14 days → null out
 - Email routing tokens: 7 days auto-expire → deactivate
+- Change feed events: 90 days → delete
 - Consent logs: 3 years → archive (no-op for now)
 """
 
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_REDACTED = "[REDACTED - retention policy]"
 
-def enforce_all_retention_policies() -> dict:
+
+def enforce_all_retention_policies(
+    project_id: UUID | None = None,
+    dry_run: bool = False,
+) -> dict:
     """
     Run all retention policies.
 
-    Called by cron endpoint (super_admin only).
+    Called by the scheduler and the cron endpoint (super_admin only). Each
+    policy is a batched sweep capped at SWEEP_MAX_ROWS_PER_RUN rows per run;
+    anything left over is picked up by the next run.
+
+    Args:
+        project_id: Limit to one project (None = all projects)
+        dry_run: Report what would change without changing anything
 
     Returns:
-        Dict with counts of records processed per policy
+        Dict with counts of records processed (or that would be) per policy
     """
     results = {}
 
-    results["recording_urls_nulled"] = _enforce_recording_retention()
-    results["tokens_deactivated"] = _enforce_token_retention()
-    results["signals_scrubbed"] = _enforce_signal_retention()
+    results["recording_urls_nulled"] = _enforce_recording_retention(project_id, dry_run)
+    results["tokens_deactivated"] = _enforce_token_retention(project_id, dry_run)
+    results["signals_scrubbed"] = _enforce_signal_retention(project_id, dry_run)
+    results["change_events_pruned"] = _enforce_change_event_retention(project_id, dry_run)
+    if dry_run:
+        results["dry_run"] = True
 
     logger.info(f"Retention enforcement complete: {results}")
     return results
 
 
-def _enforce_recording_retention() -> int:
+def _enforce_recording_retention(project_id: UUID | None = None, dry_run: bool = False) -> int:
     """Null out recording/transcript URLs past retention period."""
     from app.db import meeting_bots as bot_db
 
     settings = get_settings()
-    return bot_db.null_expired_urls(days=settings.RECORDING_RETENTION_DAYS)
+    return bot_db.null_expired_urls(
+        days=settings.RECORDING_RETENTION_DAYS, project_id=project_id, dry_run=dry_run,
+    )
 
 
-def _enforce_token_retention() -> int:
+def _enforce_token_retention(project_id: UUID | None = None, dry_run: bool = False) -> int:
     """Deactivate expired email routing tokens."""
     from app.db import email_routing_tokens as token_db
 
-    return token_db.deactivate_expired_tokens()
+    return token_db.deactivate_expired_tokens(project_id=project_id, dry_run=dry_run)
 
 
-def _enforce_signal_retention() -> int:
+def _enforce_change_event_retention(
+    project_id: UUID | None = None, dry_run: bool = False,
+) -> int:
+    """Delete change feed events past retention period."""
+    settings = get_settings()
+    if settings.CHANGE_EVENT_RETENTION_DAYS <= 0:
+        return 0
+
+    from app.db import change_events as change_db
+
+    return change_db.prune_change_events(
+        days=settings.CHANGE_EVENT_RETENTION_DAYS, project_id=project_id, dry_run=dry_run,
+    )
+
+
+def _enforce_signal_retention(project_id: UUID | None = None, dry_run: bool = False) -> int:
     """
     Scrub raw_text from email/transcript signals past retention period.
 
@@ -63,22 +96,23 @@ def _enforce_signal_retention() -> int:
     if retention_days <= 0:
         return 0
 
-    from app.db.supabase_client import get_supabase
+    from app.db.sweeps import run_sweep
 
-    supabase = get_supabase()
     cutoff = (datetime.now(UTC) - timedelta(days=retention_days)).isoformat()
 
     # Only scrub email and transcript signals
-    result = (
-        supabase.table("signals")
-        .update({"raw_text": "[REDACTED - retention policy]"})
-        .in_("signal_type", ["email", "meeting_transcript"])
-        .lt("created_at", cutoff)
-        .neq("raw_text", "[REDACTED - retention policy]")
-        .execute()
+    result = run_sweep(
+        "signal_raw_text",
+        {
+            "p_cutoff": cutoff,
+            "p_signal_types": ["email", "meeting_transcript"],
+            "p_redacted": _REDACTED,
+        },
+        project_id=project_id,
+        dry_run=dry_run,
     )
-
-    count = len(result.data) if result.data else 0
-    if count:
-        logger.info(f"Scrubbed raw_text from {count} signals older than {retention_days} days")
-    return count
+    if result.affected and not dry_run:
+        logger.info(
+            f"Scrubbed raw_text from {result.affected} signals older than {retention_days} days"
+        )
+    return result.affected
@@ -13,14 +13,23 @@ logger = get_logger(__name__)
 
 DEEPGRAM_API_URL = "https://api.deepgram.com/v1/listen"
 
+# Seconds of response wait allowed per minute of audio, beyond the base timeout
+TIMEOUT_PER_AUDIO_MINUTE = 10
 
-async def transcribe_audio(audio_url: str, timeout: int = 120) -> TranscriptResult:
+
+async def transcribe_audio(
+    audio_url: str,
+    timeout: int = 120,
+    duration_seconds: int | None = None,
+) -> TranscriptResult:
     """
     Transcribe audio via Deepgram REST API with speaker diarization.
 
     Args:
         audio_url: Public URL of the audio file (Deepgram fetches it)
-        timeout: Request timeout in seconds
+        timeout: Base request timeout in seconds
+        duration_seconds: Audio length when known; long calls get a
+            proportionally longer read timeout instead of failing at the base
 
     Returns:
         TranscriptResult with full text, segments, and speaker map
@@ -42,7 +51,11 @@ async def transcribe_audio(audio_url: str, timeout: int = 120) -> TranscriptResu
         "smart_format": "true",
     }
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    read_timeout = timeout
+    if duration_seconds:
+        read_timeout += duration_seconds // 60 * TIMEOUT_PER_AUDIO_MINUTE
+
+    async with httpx.AsyncClient(timeout=httpx.Timeout(read_timeout, connect=10.0)) as client:
         logger.info(f"Sending audio to Deepgram: model={settings.DEEPGRAM_MODEL}")
 
         response = await client.post(
@@ -0,0 +1,246 @@
+"""Lease-based scheduler for recurring background jobs.
+
+Every worker runs one Scheduler loop. Jobs register with a name, a sync
+function and an interval. The loop keeps a heap of due times and sleeps
+until the earliest one instead of polling on a fixed tick.
+
+Leader election is per job and per run, through a lease row in
+scheduler_leases (claim_scheduler_lease). A worker runs a job only when
+the row is due and not leased by another worker. The claim itself moves
+next_run_at forward, so each job runs once per interval across replicas.
+If a worker dies mid-run, its lease expires and another worker takes the
+job over. Workers that lose a claim sleep until the row's next_run_at.
+
+A job function may return a dict summary, stored as last_result.
+Including ``next_due_at`` (a datetime) in that dict schedules the next
+run earlier than the interval, e.g. when the next reminder falls due.
+"""
+
+import asyncio
+import heapq
+import os
+import socket
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from time import monotonic
+from typing import Any
+from uuid import uuid4
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MIN_DELAY_S = 1.0
+_CLAIM_RETRY_S = 60.0
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """A recurring job. fn is blocking and runs on the background pool."""
+
+    name: str
+    fn: Callable[[], dict | None]
+    interval: timedelta
+    lease: timedelta  # max expected run time before another worker may take over
+
+
+_jobs: dict[str, ScheduledJob] = {}
+
+
+def register_job(
+    name: str,
+    fn: Callable[[], dict | None],
+    interval: timedelta,
+    lease: timedelta | None = None,
+) -> ScheduledJob:
+    """Register (or replace) a recurring job."""
+    job = ScheduledJob(name, fn, interval, lease or min(interval, timedelta(minutes=30)))
+    _jobs[name] = job
+    return job
+
+
+def registered_jobs() -> dict[str, ScheduledJob]:
+    return dict(_jobs)
+
+
+def _parse_ts(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class Scheduler:
+    """Runs registered jobs when due, one lease-holding worker per run."""
+
+    def __init__(self, jobs: dict[str, ScheduledJob] | None = None, holder: str | None = None):
+        self.jobs = jobs if jobs is not None else registered_jobs()
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._heap: list[tuple[float, str]] = []
+        self._wake: asyncio.Event | None = None
+        self._running: set[asyncio.Task] = set()
+
+    def _push(self, name: str, delay: float) -> None:
+        heapq.heappush(self._heap, (monotonic() + max(delay, 0.0), name))
+        if self._wake:
+            self._wake.set()
+
+    def _delay_until(self, job: ScheduledJob, when: datetime | None) -> float:
+        """Seconds until `when`, clamped to [_MIN_DELAY_S, interval]."""
+        if when is None:
+            return job.interval.total_seconds()
+        delay = (when - datetime.now(UTC)).total_seconds()
+        return min(max(delay, _MIN_DELAY_S), job.interval.total_seconds())
+
+    def _claim(self, job: ScheduledJob) -> tuple[bool, datetime | None]:
+        from app.db.supabase_client import get_supabase
+
+        result = get_supabase().rpc("claim_scheduler_lease", {
+            "p_job_name": job.name,
+            "p_holder": self.holder,
+            "p_lease_seconds": int(job.lease.total_seconds()),
+            "p_interval_seconds": int(job.interval.total_seconds()),
+        }).execute()
+        row = (result.data or [{}])[0]
+        return bool(row.get("claimed")), _parse_ts(row.get("next_run_at"))
+
+    def _complete(
+        self, job: ScheduledJob, result: dict | None, next_due_at: datetime | None,
+    ) -> datetime | None:
+        from app.db.supabase_client import get_supabase
+
+        response = get_supabase().rpc("complete_scheduler_lease", {
+            "p_job_name": job.name,
+            "p_holder": self.holder,
+            "p_result": result,
+            "p_next_run_at": next_due_at.isoformat() if next_due_at else None,
+        }).execute()
+        return _parse_ts(response.data)
+
+    async def run_once(self, job: ScheduledJob) -> float:
+        """Claim and run one job if due. Returns seconds until it should be tried again."""
+        from app.core.executors import get_pool
+
+        pool = get_pool("background")
+        try:
+            claimed, next_run_at = await pool.run(self._claim, job)
+        except Exception as e:
+            logger.warning(f"[scheduler] Lease claim for '{job.name}' failed: {e}")
+            return min(_CLAIM_RETRY_S, job.interval.total_seconds())
+        if not claimed:
+            return self._delay_until(job, next_run_at)
+
+        started = monotonic()
+        next_due_at = None
+        try:
+            result = await pool.run(job.fn) or {}
+            next_due_at = _parse_ts(result.pop("next_due_at", None))
+            logger.info(f"[scheduler] {job.name} done in {monotonic() - started:.1f}s: {result}")
+        except Exception as e:
+            logger.exception(f"[scheduler] Job '{job.name}' failed")
+            result = {"error": str(e)[:500]}
+
+        try:
+            next_run_at = await pool.run(self._complete, job, result, next_due_at)
+        except Exception as e:
+            # The lease expires on its own; next_run_at was already set by the claim
+            logger.warning(f"[scheduler] Releasing lease for '{job.name}' failed: {e}")
+            next_run_at = None
+        return self._delay_until(job, next_run_at or next_due_at)
+
+    async def _run_job(self, name: str) -> None:
+        job = self.jobs[name]
+        delay = job.interval.total_seconds()
+        try:
+            delay = await self.run_once(job)
+        finally:
+            self._push(name, delay)
+
+    async def run_forever(self) -> None:
+        """Sleep until the earliest due job, run it in its own task, repeat."""
+        self._wake = asyncio.Event()
+        for name in self.jobs:
+            self._push(name, 0)
+        logger.info(f"[scheduler] Started as {self.holder} with jobs: {sorted(self.jobs)}")
+
+        while True:
+            self._wake.clear()
+            if not self._heap:
+                await self._wake.wait()
+                continue
+            due, name = self._heap[0]
+            delay = due - monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            # Long jobs (retention) must not hold up short ones (reminders)
+            task = asyncio.create_task(self._run_job(name))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+
+def _archive_stale_insights() -> dict:
+    """Archive unused old insights, project by project.
+
+    Sweeping per project applies the per-run row cap to each tenant, so one
+    large project can't use up a run.
+    """
+    from uuid import UUID
+
+    from app.agents.memory_agent import INSIGHT_ARCHIVE_DAYS
+    from app.db.memory_graph import archive_old_insights
+    from app.db.supabase_client import get_supabase
+
+    projects = get_supabase().table("projects").select("id").eq("status", "active").execute()
+    archived = sum(
+        archive_old_insights(UUID(p["id"]), days_old=INSIGHT_ARCHIVE_DAYS)
+        for p in projects.data or []
+    )
+    return {"projects": len(projects.data or []), "insights_archived": archived}
+
+
+def _refresh_readiness() -> dict:
+    """Recompute cached readiness scores (no narratives)."""
+    from app.core.readiness_cache import update_all_readiness_scores
+
+    result = update_all_readiness_scores()
+    return {"updated": result["updated"], "errors": len(result["errors"])}
+
+
+def register_default_jobs() -> None:
+    """Register the app's recurring jobs."""
+    from app.db.revisions_enrichment import compact_enrichment_revisions
+    from app.services.data_retention import enforce_all_retention_policies
+    from app.services.reminder_scheduler import send_due_reminders
+
+    register_job("reminders", send_due_reminders, timedelta(minutes=5), lease=timedelta(minutes=2))
+    register_job(
+        "data_retention", enforce_all_retention_policies, timedelta(hours=24),
+        lease=timedelta(hours=1),
+    )
+    register_job(
+        "insight_archival", _archive_stale_insights, timedelta(hours=24),
+        lease=timedelta(hours=1),
+    )
+    register_job(
+        "readiness_refresh", _refresh_readiness, timedelta(hours=6), lease=timedelta(hours=1),
+    )
+    register_job(
+        "revision_compaction", compact_enrichment_revisions, timedelta(hours=24),
+        lease=timedelta(hours=1),
+    )
+
+
+async def start_scheduler() -> None:
+    """Long-running coroutine: register the default jobs and run them."""
+    register_default_jobs()
+    await Scheduler().run_forever()
@@ -1852,6 +1852,7 @@ export interface IntelligenceBriefing {
   north_star_progress?: Record<string, any> | null
   computed_at: string
   narrative_cached: boolean
+  degraded_sections?: string[]
   phase: string
 }
 
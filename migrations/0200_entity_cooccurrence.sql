@@ -0,0 +1,93 @@
+-- Migration 0200: Materialized entity co-occurrence edges
+-- Replaces the per-call signal_impact self-join in get_entity_neighborhood with
+-- a maintained edge table. Each pair is stored in both directions so a
+-- neighborhood lookup is a single indexed read on entity_a_id.
+--
+-- Maintained incrementally by refresh_entity_cooccurrence(), which the app
+-- calls after signal_impact writes (record_chunk_impacts / evidence links).
+
+-- =============================================================================
+-- 1. Table
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS entity_cooccurrence (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    entity_a_id UUID NOT NULL,
+    entity_a_type TEXT NOT NULL,
+    entity_b_id UUID NOT NULL,
+    entity_b_type TEXT NOT NULL,
+    shared_chunk_count INT NOT NULL DEFAULT 0,
+    latest_chunk_at TIMESTAMPTZ,
+    -- entity_b's signal_impact timestamps on the shared chunks (newest first,
+    -- capped at 50) — lets callers apply recency weighting without a re-scan
+    chunk_times TIMESTAMPTZ[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (entity_a_id, entity_b_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_entity_cooccurrence_a_count
+    ON entity_cooccurrence (entity_a_id, shared_chunk_count DESC);
+CREATE INDEX IF NOT EXISTS idx_entity_cooccurrence_project
+    ON entity_cooccurrence (project_id);
+
+ALTER TABLE entity_cooccurrence ENABLE ROW LEVEL SECURITY;
+
+-- =============================================================================
+-- 2. refresh_entity_cooccurrence: recompute all edges touching the given entities
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.refresh_entity_cooccurrence(p_entity_ids uuid[])
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    DELETE FROM public.entity_cooccurrence
+    WHERE entity_a_id = ANY(p_entity_ids) OR entity_b_id = ANY(p_entity_ids);
+
+    WITH pairs AS (
+        SELECT
+            a.project_id,
+            a.entity_id AS entity_a_id,
+            min(a.entity_type) AS entity_a_type,
+            b.entity_id AS entity_b_id,
+            min(b.entity_type) AS entity_b_type,
+            count(DISTINCT a.chunk_id) AS shared_chunk_count,
+            max(b.created_at) AS latest_chunk_at,
+            (array_agg(b.created_at ORDER BY b.created_at DESC))[1:50] AS chunk_times
+        FROM public.signal_impact a
+        JOIN public.signal_impact b
+          ON b.chunk_id = a.chunk_id AND b.entity_id <> a.entity_id
+        WHERE a.entity_id = ANY(p_entity_ids) OR b.entity_id = ANY(p_entity_ids)
+        GROUP BY a.project_id, a.entity_id, b.entity_id
+    )
+    INSERT INTO public.entity_cooccurrence (
+        project_id, entity_a_id, entity_a_type, entity_b_id, entity_b_type,
+        shared_chunk_count, latest_chunk_at, chunk_times, updated_at
+    )
+    SELECT
+        project_id, entity_a_id, entity_a_type, entity_b_id, entity_b_type,
+        shared_chunk_count, latest_chunk_at, chunk_times, now()
+    FROM pairs
+    ON CONFLICT (entity_a_id, entity_b_id) DO UPDATE SET
+        shared_chunk_count = EXCLUDED.shared_chunk_count,
+        latest_chunk_at = EXCLUDED.latest_chunk_at,
+        chunk_times = EXCLUDED.chunk_times,
+        updated_at = now();
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
+
+-- =============================================================================
+-- 3. Backfill from existing signal_impact rows
+-- =============================================================================
+
+SELECT public.refresh_entity_cooccurrence(
+    ARRAY(SELECT DISTINCT entity_id FROM public.signal_impact)
+);
@@ -0,0 +1,24 @@
+-- Migration 0201: Bulk memory node embedding writes
+-- Memory nodes used to be embedded one at a time inside create_node (one
+-- OpenAI call + one UPDATE per node). The app now coalesces pending nodes per
+-- project, embeds them in one batched call and writes every vector with a
+-- single call to set_memory_node_embeddings().
+
+CREATE OR REPLACE FUNCTION public.set_memory_node_embeddings(p_rows jsonb)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    UPDATE public.memory_nodes m
+    SET embedding = (r.value->>'embedding')::vector(1536)
+    FROM jsonb_array_elements(p_rows) r
+    WHERE m.id = (r.value->>'id')::uuid;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
@@ -0,0 +1,32 @@
+-- Migration 0202: Set-based memory node similarity search
+-- Contradiction detection used to call match_memory_nodes() once per new
+-- fact. match_memory_nodes_batch() takes every fact embedding at once and
+-- returns the top-k nodes per query, tagged with the query's 0-based index.
+
+CREATE OR REPLACE FUNCTION match_memory_nodes_batch(
+    query_embeddings jsonb,          -- JSON array of embedding arrays
+    match_count int,
+    filter_project_id uuid,
+    filter_node_type text DEFAULT NULL
+) RETURNS TABLE (
+    query_index int,
+    node_id uuid,
+    node_type text,
+    summary text,
+    content text,
+    confidence float,
+    similarity float4
+)
+LANGUAGE sql STABLE SECURITY DEFINER SET search_path = 'public' AS $$
+    SELECT (q.ord - 1)::int, m.id, m.node_type, m.summary, m.content, m.confidence, m.similarity
+    FROM jsonb_array_elements(query_embeddings) WITH ORDINALITY AS q(emb, ord)
+    CROSS JOIN LATERAL (
+        SELECT mn.id, mn.node_type, mn.summary, mn.content, mn.confidence,
+               (1-(mn.embedding <=> (q.emb::text)::vector))::float4 AS similarity
+        FROM public.memory_nodes mn
+        WHERE mn.project_id = filter_project_id AND mn.is_active = TRUE AND mn.embedding IS NOT NULL
+          AND (filter_node_type IS NULL OR mn.node_type = filter_node_type)
+        ORDER BY mn.embedding <=> (q.emb::text)::vector
+        LIMIT match_count
+    ) m;
+$$;
@@ -0,0 +1,99 @@
+-- Migration 0203: Incremental intelligence briefing
+-- Each briefing section declares the tables it reads. A per-project,
+-- per-table write version (bumped by statement-level triggers) lets the
+-- briefing engine compare a section's stored input version vector with the
+-- current one and recompute only sections whose inputs changed.
+
+-- =============================================================================
+-- 1. Per-project table write versions
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS project_write_versions (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    source_table TEXT NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (project_id, source_table)
+);
+
+ALTER TABLE project_write_versions ENABLE ROW LEVEL SECURITY;
+
+-- Statement-level: one bump per (project, table) per statement, however many
+-- rows a bulk insert/update/delete touched. Rows without a project_id are
+-- ignored; on projects itself the row id is the project.
+CREATE OR REPLACE FUNCTION public.bump_project_write_versions()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    INSERT INTO public.project_write_versions AS v (project_id, source_table, version, updated_at)
+    SELECT DISTINCT pid, TG_TABLE_NAME, 1, now()
+    FROM (
+        SELECT COALESCE(
+            to_jsonb(r)->>'project_id',
+            CASE WHEN TG_TABLE_NAME = 'projects' THEN to_jsonb(r)->>'id' END
+        )::uuid AS pid
+        FROM changed_rows r
+    ) c
+    WHERE pid IS NOT NULL
+      AND EXISTS (SELECT 1 FROM public.projects p WHERE p.id = c.pid)
+    ON CONFLICT (project_id, source_table) DO UPDATE
+        SET version = v.version + 1, updated_at = now();
+    RETURN NULL;
+END;
+$$;
+
+-- Attach to every table a briefing section reads
+DO $$
+DECLARE
+    t text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'projects', 'signals', 'signal_impact',
+        'memory_nodes', 'memory_edges', 'belief_history',
+        'features', 'personas', 'vp_steps', 'workflows', 'stakeholders',
+        'business_drivers', 'data_entities', 'constraints',
+        'entity_dependencies', 'enrichment_revisions', 'solution_flow_steps',
+        'project_horizons', 'horizon_outcomes'
+    ]
+    LOOP
+        IF to_regclass('public.' || t) IS NULL THEN
+            CONTINUE;
+        END IF;
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_ins ON public.%1$I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_upd ON public.%1$I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_del ON public.%1$I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_ins AFTER INSERT ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_upd AFTER UPDATE ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_del AFTER DELETE ON public.%1$I '
+            'REFERENCING OLD TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+    END LOOP;
+END;
+$$;
+
+-- =============================================================================
+-- 2. Briefing section cache
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS briefing_section_cache (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    input_versions JSONB NOT NULL DEFAULT '{}',
+    payload JSONB,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (project_id, section)
+);
+
+ALTER TABLE briefing_section_cache ENABLE ROW LEVEL SECURITY;
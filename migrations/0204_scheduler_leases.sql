@@ -0,0 +1,102 @@
+-- Migration 0204: Lease-based background scheduler
+-- Recurring jobs (reminders, retention, insight archival, readiness refresh)
+-- used to rely on pg_try_advisory_lock over PostgREST. Advisory locks are
+-- session-scoped, and a pooled HTTP API gives no stable session, so every
+-- replica could run the same job. Each job now has a lease row: a replica
+-- runs a job only after atomically claiming a due, unleased row, and the
+-- claim moves next_run_at forward — one run per interval across replicas.
+
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+    job_name TEXT PRIMARY KEY,
+    holder TEXT,
+    lease_until TIMESTAMPTZ,
+    next_run_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_run_at TIMESTAMPTZ,
+    last_result JSONB,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE scheduler_leases ENABLE ROW LEVEL SECURITY;
+
+-- Claim a job if it is due and no live lease is held by another replica.
+-- Returns claimed = false plus the job's next_run_at when not claimable,
+-- so the caller can sleep until then.
+CREATE OR REPLACE FUNCTION public.claim_scheduler_lease(
+    p_job_name text,
+    p_holder text,
+    p_lease_seconds integer,
+    p_interval_seconds integer
+)
+RETURNS TABLE (claimed boolean, next_run_at timestamptz)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+#variable_conflict use_column
+BEGIN
+    INSERT INTO public.scheduler_leases (job_name, next_run_at)
+    VALUES (p_job_name, now())
+    ON CONFLICT (job_name) DO NOTHING;
+
+    RETURN QUERY
+    UPDATE public.scheduler_leases l
+    SET holder = p_holder,
+        lease_until = now() + make_interval(secs => p_lease_seconds),
+        next_run_at = now() + make_interval(secs => p_interval_seconds),
+        updated_at = now()
+    WHERE l.job_name = p_job_name
+      AND l.next_run_at <= now()
+      AND (l.lease_until IS NULL OR l.lease_until < now() OR l.holder = p_holder)
+    RETURNING true, l.next_run_at;
+
+    IF NOT FOUND THEN
+        RETURN QUERY
+        SELECT false, GREATEST(l.next_run_at, COALESCE(l.lease_until, l.next_run_at))
+        FROM public.scheduler_leases l
+        WHERE l.job_name = p_job_name;
+    END IF;
+END;
+$$;
+
+-- Release a claimed lease. p_next_run_at may pull the next run earlier
+-- (e.g. the next reminder falls due before the regular interval).
+CREATE OR REPLACE FUNCTION public.complete_scheduler_lease(
+    p_job_name text,
+    p_holder text,
+    p_result jsonb DEFAULT NULL,
+    p_next_run_at timestamptz DEFAULT NULL
+)
+RETURNS timestamptz
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+    UPDATE public.scheduler_leases l
+    SET holder = NULL,
+        lease_until = NULL,
+        last_run_at = now(),
+        last_result = p_result,
+        next_run_at = LEAST(l.next_run_at, COALESCE(p_next_run_at, l.next_run_at)),
+        updated_at = now()
+    WHERE l.job_name = p_job_name AND l.holder = p_holder
+    RETURNING l.next_run_at;
+$$;
+
+-- Flag reminder tasks as notified in one statement (was one UPDATE per task)
+CREATE OR REPLACE FUNCTION public.mark_reminders_notified(p_task_ids uuid[])
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    UPDATE public.tasks
+    SET metadata = COALESCE(metadata, '{}'::jsonb) || '{"reminder_notified": true}'::jsonb
+    WHERE id = ANY(p_task_ids);
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
@@ -0,0 +1,256 @@
+-- Migration 0205: Set-based archival and retention sweeps
+-- Insight/belief archival selected candidates and then archived them one
+-- row at a time (plus per-row edge lookups and deletes). The retention
+-- passes ran as single unbounded UPDATEs that returned every touched row.
+-- Each sweep is now one function that processes at most p_batch_size rows
+-- per call (FOR UPDATE SKIP LOCKED, so it never waits on interactive
+-- writers) and returns the number of rows it changed. The app calls it in
+-- a loop with a pause and a per-run row cap (app/db/sweeps.py).
+--
+-- p_dry_run = true changes nothing and returns the total candidate count.
+-- p_project_id = NULL sweeps every project.
+
+-- =============================================================================
+-- 1. Memory graph archival
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.sweep_archive_old_insights(
+    p_cutoff timestamptz,
+    p_reason text,
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    IF p_dry_run THEN
+        SELECT count(*) INTO v_count
+        FROM public.memory_nodes n
+        WHERE n.node_type = 'insight' AND n.is_active
+          AND n.created_at < p_cutoff
+          AND (p_project_id IS NULL OR n.project_id = p_project_id)
+          AND NOT EXISTS (SELECT 1 FROM public.memory_edges e WHERE e.from_node_id = n.id);
+        RETURN v_count;
+    END IF;
+
+    WITH batch AS (
+        SELECT n.id
+        FROM public.memory_nodes n
+        WHERE n.node_type = 'insight' AND n.is_active
+          AND n.created_at < p_cutoff
+          AND (p_project_id IS NULL OR n.project_id = p_project_id)
+          AND NOT EXISTS (SELECT 1 FROM public.memory_edges e WHERE e.from_node_id = n.id)
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.memory_nodes m
+    SET is_active = false, archived_at = now(), archive_reason = p_reason
+    FROM batch
+    WHERE m.id = batch.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.sweep_archive_low_confidence_beliefs(
+    p_threshold double precision,
+    p_cutoff timestamptz,
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_ids uuid[];
+BEGIN
+    IF p_dry_run THEN
+        RETURN (
+            SELECT count(*)
+            FROM public.memory_nodes n
+            WHERE n.node_type = 'belief' AND n.is_active
+              AND n.confidence < p_threshold
+              AND n.created_at < p_cutoff
+              AND (p_project_id IS NULL OR n.project_id = p_project_id)
+        );
+    END IF;
+
+    WITH batch AS (
+        SELECT n.id
+        FROM public.memory_nodes n
+        WHERE n.node_type = 'belief' AND n.is_active
+          AND n.confidence < p_threshold
+          AND n.created_at < p_cutoff
+          AND (p_project_id IS NULL OR n.project_id = p_project_id)
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    ), archived AS (
+        UPDATE public.memory_nodes m
+        SET is_active = false,
+            archived_at = now(),
+            archive_reason = format(
+                'Auto-archived: confidence %s below threshold %s',
+                to_char(m.confidence, 'FM0.00'), p_threshold
+            )
+        FROM batch
+        WHERE m.id = batch.id
+        RETURNING m.id
+    )
+    SELECT coalesce(array_agg(id), '{}') INTO v_ids FROM archived;
+
+    DELETE FROM public.memory_edges e
+    WHERE e.from_node_id = ANY(v_ids) OR e.to_node_id = ANY(v_ids);
+
+    RETURN cardinality(v_ids);
+END;
+$$;
+
+-- =============================================================================
+-- 2. Communication data retention
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.sweep_signal_raw_text(
+    p_cutoff timestamptz,
+    p_signal_types text[],
+    p_redacted text,
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    IF p_dry_run THEN
+        SELECT count(*) INTO v_count
+        FROM public.signals s
+        WHERE s.signal_type = ANY(p_signal_types)
+          AND s.created_at < p_cutoff
+          AND s.raw_text <> p_redacted
+          AND (p_project_id IS NULL OR s.project_id = p_project_id);
+        RETURN v_count;
+    END IF;
+
+    WITH batch AS (
+        SELECT s.id
+        FROM public.signals s
+        WHERE s.signal_type = ANY(p_signal_types)
+          AND s.created_at < p_cutoff
+          AND s.raw_text <> p_redacted
+          AND (p_project_id IS NULL OR s.project_id = p_project_id)
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.signals t
+    SET raw_text = p_redacted
+    FROM batch
+    WHERE t.id = batch.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.sweep_recording_urls(
+    p_cutoff timestamptz,
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    IF p_dry_run THEN
+        SELECT count(*) INTO v_count
+        FROM public.meeting_bots b
+        JOIN public.meetings mt ON mt.id = b.meeting_id
+        WHERE b.status = 'done'
+          AND b.created_at < p_cutoff
+          AND b.recording_url IS NOT NULL
+          AND (p_project_id IS NULL OR mt.project_id = p_project_id);
+        RETURN v_count;
+    END IF;
+
+    WITH batch AS (
+        SELECT b.id
+        FROM public.meeting_bots b
+        JOIN public.meetings mt ON mt.id = b.meeting_id
+        WHERE b.status = 'done'
+          AND b.created_at < p_cutoff
+          AND b.recording_url IS NOT NULL
+          AND (p_project_id IS NULL OR mt.project_id = p_project_id)
+        LIMIT p_batch_size
+        FOR UPDATE OF b SKIP LOCKED
+    )
+    UPDATE public.meeting_bots t
+    SET recording_url = NULL, transcript_url = NULL
+    FROM batch
+    WHERE t.id = batch.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.sweep_expired_routing_tokens(
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    IF p_dry_run THEN
+        SELECT count(*) INTO v_count
+        FROM public.email_routing_tokens t
+        WHERE t.is_active AND t.expires_at < now()
+          AND (p_project_id IS NULL OR t.project_id = p_project_id);
+        RETURN v_count;
+    END IF;
+
+    WITH batch AS (
+        SELECT t.id
+        FROM public.email_routing_tokens t
+        WHERE t.is_active AND t.expires_at < now()
+          AND (p_project_id IS NULL OR t.project_id = p_project_id)
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.email_routing_tokens r
+    SET is_active = false
+    FROM batch
+    WHERE r.id = batch.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
+
+-- Candidate scans for the archival sweeps
+CREATE INDEX IF NOT EXISTS idx_memory_nodes_sweep
+    ON memory_nodes(node_type, created_at)
+    WHERE is_active;
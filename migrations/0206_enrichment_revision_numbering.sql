@@ -0,0 +1,81 @@
+-- Migration 0206: Atomic revision number allocation
+-- Revision numbers were allocated client-side: read the entity's latest
+-- revision, then insert (and, in change_tracking, update the new row with
+-- the number). That is two or three round trips per revision, and two
+-- concurrent writers to the same entity could both read N and insert N+1.
+--
+-- insert_enrichment_revisions() takes a batch of revisions (one patch set),
+-- locks each entity's numbering for the transaction, numbers the rows
+-- after the entity's current max and inserts them in one statement.
+
+CREATE INDEX IF NOT EXISTS idx_enrichment_revisions_entity_number
+    ON enrichment_revisions(entity_type, entity_id, revision_number DESC);
+
+-- p_rows: [{project_id, entity_type, entity_id, entity_label, revision_type?,
+--           trigger_event?, snapshot?, changes?, diff_summary?, context_summary?,
+--           source_signal_id?, run_id?, created_by?}, ...]
+-- revision_type defaults to 'created' for an entity's first revision and
+-- 'updated' after; diff_summary/context_summary default to 'Version N'.
+-- Rows come back ordered by entity, then revision number (= input order
+-- within each entity).
+CREATE OR REPLACE FUNCTION public.insert_enrichment_revisions(p_rows jsonb)
+RETURNS SETOF public.enrichment_revisions
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    -- Serialize numbering per entity until commit; sorted to avoid deadlocks
+    PERFORM pg_advisory_xact_lock(hashtextextended(k.key, 0))
+    FROM (
+        SELECT DISTINCT (r->>'entity_type') || ':' || (r->>'entity_id') AS key
+        FROM jsonb_array_elements(p_rows) r
+        ORDER BY 1
+    ) k;
+
+    RETURN QUERY
+    WITH input AS (
+        SELECT t.r, t.ord
+        FROM jsonb_array_elements(p_rows) WITH ORDINALITY AS t(r, ord)
+    ), numbered AS (
+        SELECT
+            i.r,
+            i.ord,
+            COALESCE((
+                SELECT max(e.revision_number)
+                FROM public.enrichment_revisions e
+                WHERE e.entity_type = i.r->>'entity_type'
+                  AND e.entity_id = (i.r->>'entity_id')::uuid
+            ), 0) + row_number() OVER (
+                PARTITION BY i.r->>'entity_type', i.r->>'entity_id' ORDER BY i.ord
+            ) AS n
+        FROM input i
+    ), inserted AS (
+        INSERT INTO public.enrichment_revisions (
+            project_id, entity_type, entity_id, entity_label, revision_type,
+            revision_number, trigger_event, snapshot, changes, diff_summary,
+            context_summary, source_signal_id, run_id, created_by
+        )
+        SELECT
+            (r->>'project_id')::uuid,
+            r->>'entity_type',
+            (r->>'entity_id')::uuid,
+            r->>'entity_label',
+            COALESCE(r->>'revision_type', CASE WHEN n = 1 THEN 'created' ELSE 'updated' END),
+            n,
+            r->>'trigger_event',
+            COALESCE(r->'snapshot', '{}'::jsonb),
+            COALESCE(r->'changes', '{}'::jsonb),
+            COALESCE(r->>'diff_summary', 'Version ' || n),
+            COALESCE(r->>'context_summary', r->>'diff_summary', 'Version ' || n),
+            (r->>'source_signal_id')::uuid,
+            (r->>'run_id')::uuid,
+            COALESCE(r->>'created_by', 'system')
+        FROM numbered
+        ORDER BY ord
+        RETURNING *
+    )
+    SELECT * FROM inserted
+    ORDER BY entity_type, entity_id, revision_number;
+END;
+$$;
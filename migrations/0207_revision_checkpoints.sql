@@ -0,0 +1,245 @@
+-- Migration 0207: Checkpointed revision storage
+-- Every enrichment revision stored the full entity snapshot, so a feature
+-- enriched 40 times kept 40 copies of its body, and history views pulled
+-- all of them back.
+--
+-- Revisions are now either a checkpoint (full snapshot) or a delta against
+-- the entity's latest checkpoint:
+--   delta = {"set": {field: new_value, ...}, "unset": [field, ...]}
+-- Deltas are relative to the checkpoint, not the previous revision, so any
+-- version is rebuilt from exactly two rows. A new checkpoint is written
+-- every p_checkpoint_interval revisions, or sooner when the delta grows past
+-- half the snapshot size. `changes` (the display diff) is unchanged.
+--
+-- Existing rows stay checkpoints; sweep_compact_enrichment_revisions()
+-- converts them to deltas in batches (app/db/sweeps.py).
+
+ALTER TABLE enrichment_revisions
+    ADD COLUMN IF NOT EXISTS is_checkpoint boolean NOT NULL DEFAULT true,
+    ADD COLUMN IF NOT EXISTS base_revision_id uuid,
+    ADD COLUMN IF NOT EXISTS delta jsonb;
+
+COMMENT ON COLUMN enrichment_revisions.is_checkpoint IS 'True when snapshot holds the full entity body';
+COMMENT ON COLUMN enrichment_revisions.base_revision_id IS 'Checkpoint revision this row''s delta applies to';
+COMMENT ON COLUMN enrichment_revisions.delta IS 'Snapshot delta vs base checkpoint: {set: {...}, unset: [...]}';
+
+CREATE INDEX IF NOT EXISTS idx_enrichment_revisions_checkpoint
+    ON enrichment_revisions(entity_type, entity_id, revision_number DESC)
+    WHERE is_checkpoint;
+
+CREATE INDEX IF NOT EXISTS idx_enrichment_revisions_base
+    ON enrichment_revisions(base_revision_id)
+    WHERE base_revision_id IS NOT NULL;
+
+-- =============================================================================
+-- 1. Delta helper
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.jsonb_snapshot_delta(p_base jsonb, p_new jsonb)
+RETURNS jsonb
+LANGUAGE sql
+IMMUTABLE
+SET search_path = ''
+AS $$
+    SELECT jsonb_build_object(
+        'set', COALESCE((
+            SELECT jsonb_object_agg(n.key, n.value)
+            FROM jsonb_each(p_new) n
+            WHERE p_base -> n.key IS DISTINCT FROM n.value
+        ), '{}'::jsonb),
+        'unset', COALESCE((
+            SELECT jsonb_agg(b.key)
+            FROM jsonb_object_keys(p_base) b(key)
+            WHERE NOT p_new ? b.key
+        ), '[]'::jsonb)
+    );
+$$;
+
+-- =============================================================================
+-- 2. Checkpoint-aware batch insert (replaces the 0206 version)
+-- =============================================================================
+
+DROP FUNCTION IF EXISTS public.insert_enrichment_revisions(jsonb);
+
+-- Same contract as 0206: rows come back ordered by entity, then revision
+-- number. Delta rows come back with snapshot = NULL.
+CREATE OR REPLACE FUNCTION public.insert_enrichment_revisions(
+    p_rows jsonb,
+    p_checkpoint_interval integer DEFAULT 10
+)
+RETURNS SETOF public.enrichment_revisions
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_row jsonb;
+    v_n integer;
+    v_snapshot jsonb;
+    v_base_id uuid;
+    v_base_n integer;
+    v_base jsonb;
+    v_delta jsonb;
+    v_checkpoint boolean;
+    v_id uuid;
+    v_ids uuid[] := '{}';
+BEGIN
+    -- Serialize numbering per entity until commit; sorted to avoid deadlocks
+    PERFORM pg_advisory_xact_lock(hashtextextended(k.key, 0))
+    FROM (
+        SELECT DISTINCT (r->>'entity_type') || ':' || (r->>'entity_id') AS key
+        FROM jsonb_array_elements(p_rows) r
+        ORDER BY 1
+    ) k;
+
+    -- Row by row: a batch can hold several revisions of one entity, and each
+    -- one numbers (and may checkpoint) after the previous
+    FOR v_row IN
+        SELECT t.r FROM jsonb_array_elements(p_rows) WITH ORDINALITY AS t(r, ord) ORDER BY t.ord
+    LOOP
+        SELECT COALESCE(max(e.revision_number), 0) + 1 INTO v_n
+        FROM public.enrichment_revisions e
+        WHERE e.entity_type = v_row->>'entity_type'
+          AND e.entity_id = (v_row->>'entity_id')::uuid;
+
+        v_snapshot := COALESCE(v_row->'snapshot', '{}'::jsonb);
+        v_checkpoint := true;
+        v_delta := NULL;
+        v_base_id := NULL;
+
+        IF jsonb_typeof(v_snapshot) = 'object' AND v_snapshot <> '{}'::jsonb THEN
+            SELECT e.id, e.revision_number, e.snapshot INTO v_base_id, v_base_n, v_base
+            FROM public.enrichment_revisions e
+            WHERE e.entity_type = v_row->>'entity_type'
+              AND e.entity_id = (v_row->>'entity_id')::uuid
+              AND e.is_checkpoint
+            ORDER BY e.revision_number DESC, e.created_at DESC
+            LIMIT 1
+            -- Keeps the compaction sweep from converting the base meanwhile
+            FOR SHARE;
+
+            IF v_base_id IS NOT NULL
+               AND v_n - v_base_n < p_checkpoint_interval
+               AND v_base <> '{}'::jsonb THEN
+                v_delta := public.jsonb_snapshot_delta(v_base, v_snapshot);
+                v_checkpoint := octet_length(v_delta::text) * 2 > octet_length(v_snapshot::text);
+            END IF;
+        END IF;
+
+        INSERT INTO public.enrichment_revisions (
+            project_id, entity_type, entity_id, entity_label, revision_type,
+            revision_number, trigger_event, snapshot, is_checkpoint,
+            base_revision_id, delta, changes, diff_summary, context_summary,
+            source_signal_id, run_id, created_by
+        ) VALUES (
+            (v_row->>'project_id')::uuid,
+            v_row->>'entity_type',
+            (v_row->>'entity_id')::uuid,
+            v_row->>'entity_label',
+            COALESCE(v_row->>'revision_type', CASE WHEN v_n = 1 THEN 'created' ELSE 'updated' END),
+            v_n,
+            v_row->>'trigger_event',
+            CASE WHEN v_checkpoint THEN v_snapshot END,
+            v_checkpoint,
+            CASE WHEN NOT v_checkpoint THEN v_base_id END,
+            CASE WHEN NOT v_checkpoint THEN v_delta END,
+            COALESCE(v_row->'changes', '{}'::jsonb),
+            COALESCE(v_row->>'diff_summary', 'Version ' || v_n),
+            COALESCE(v_row->>'context_summary', v_row->>'diff_summary', 'Version ' || v_n),
+            (v_row->>'source_signal_id')::uuid,
+            (v_row->>'run_id')::uuid,
+            COALESCE(v_row->>'created_by', 'system')
+        )
+        RETURNING id INTO v_id;
+
+        v_ids := v_ids || v_id;
+    END LOOP;
+
+    RETURN QUERY
+    SELECT e.* FROM public.enrichment_revisions e
+    WHERE e.id = ANY(v_ids)
+    ORDER BY e.entity_type, e.entity_id, e.revision_number;
+END;
+$$;
+
+-- =============================================================================
+-- 3. Compaction sweep for existing full-snapshot revisions
+-- =============================================================================
+
+-- Converts checkpoints to deltas against the aligned checkpoint at
+-- revision 1, 1 + interval, 1 + 2*interval, ... Aligned rows are never
+-- converted, and neither is any checkpoint a delta already points at, so
+-- every base stays a checkpoint.
+CREATE OR REPLACE FUNCTION public.sweep_compact_enrichment_revisions(
+    p_checkpoint_interval integer DEFAULT 10,
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    IF p_dry_run THEN
+        SELECT count(*) INTO v_count
+        FROM public.enrichment_revisions r
+        CROSS JOIN LATERAL (
+            SELECT c.id
+            FROM public.enrichment_revisions c
+            WHERE c.entity_type = r.entity_type
+              AND c.entity_id = r.entity_id
+              AND c.revision_number = r.revision_number - ((r.revision_number - 1) % p_checkpoint_interval)
+              AND c.is_checkpoint
+              AND c.snapshot IS NOT NULL AND c.snapshot <> '{}'::jsonb
+            LIMIT 1
+        ) base
+        WHERE r.is_checkpoint
+          AND (r.revision_number - 1) % p_checkpoint_interval <> 0
+          AND r.snapshot IS NOT NULL AND r.snapshot <> '{}'::jsonb
+          AND (p_project_id IS NULL OR r.project_id = p_project_id)
+          AND NOT EXISTS (
+              SELECT 1 FROM public.enrichment_revisions d WHERE d.base_revision_id = r.id
+          );
+        RETURN v_count;
+    END IF;
+
+    WITH batch AS (
+        SELECT r.id, r.snapshot, base.id AS base_id, base.snapshot AS base_snapshot
+        FROM public.enrichment_revisions r
+        CROSS JOIN LATERAL (
+            SELECT c.id, c.snapshot
+            FROM public.enrichment_revisions c
+            WHERE c.entity_type = r.entity_type
+              AND c.entity_id = r.entity_id
+              AND c.revision_number = r.revision_number - ((r.revision_number - 1) % p_checkpoint_interval)
+              AND c.is_checkpoint
+              AND c.snapshot IS NOT NULL AND c.snapshot <> '{}'::jsonb
+            ORDER BY c.created_at
+            LIMIT 1
+        ) base
+        WHERE r.is_checkpoint
+          AND (r.revision_number - 1) % p_checkpoint_interval <> 0
+          AND r.snapshot IS NOT NULL AND r.snapshot <> '{}'::jsonb
+          AND (p_project_id IS NULL OR r.project_id = p_project_id)
+          AND NOT EXISTS (
+              SELECT 1 FROM public.enrichment_revisions d WHERE d.base_revision_id = r.id
+          )
+        LIMIT p_batch_size
+        FOR UPDATE OF r SKIP LOCKED
+    )
+    UPDATE public.enrichment_revisions t
+    SET delta = public.jsonb_snapshot_delta(batch.base_snapshot, batch.snapshot),
+        base_revision_id = batch.base_id,
+        is_checkpoint = false,
+        snapshot = NULL
+    FROM batch
+    WHERE t.id = batch.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
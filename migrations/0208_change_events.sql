@@ -0,0 +1,215 @@
+-- Migration 0208: Unified change feed
+-- The temporal diff ("what changed since your last visit") ran one query
+-- per source table (belief_history, signals, memory_nodes,
+-- enrichment_revisions) on every briefing, then merged and counted in
+-- Python. change_events is an append-only projection of those inserts,
+-- written by row triggers in the same transaction, so a diff is one range
+-- scan on (project_id, id) with grouping done server-side.
+--
+-- The bigserial id doubles as a client cursor: get_change_digest(after_id)
+-- returns only events past the cursor, plus the next cursor.
+
+CREATE TABLE IF NOT EXISTS change_events (
+    id BIGSERIAL PRIMARY KEY,
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    source_table TEXT NOT NULL,
+    source_id UUID NOT NULL,
+    -- Mirrors app.core.schemas_briefing.ChangeType
+    change_kind TEXT NOT NULL,
+    entity_type TEXT,
+    entity_id UUID,
+    summary TEXT NOT NULL,
+    confidence_delta DOUBLE PRECISION,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_change_events_project_id
+    ON change_events(project_id, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_change_events_project_created
+    ON change_events(project_id, created_at DESC);
+
+ALTER TABLE change_events ENABLE ROW LEVEL SECURITY;
+
+-- =============================================================================
+-- 1. Projection triggers
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.project_change_event()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'enrichment_revisions' THEN
+        INSERT INTO public.change_events
+            (project_id, source_table, source_id, change_kind, entity_type, entity_id, summary, created_at)
+        VALUES (
+            NEW.project_id, TG_TABLE_NAME, NEW.id,
+            CASE WHEN NEW.revision_type = 'created' THEN 'entity_created' ELSE 'entity_updated' END,
+            NEW.entity_type, NEW.entity_id,
+            left(COALESCE(NEW.diff_summary, NEW.context_summary, 'Entity updated'), 80),
+            COALESCE(NEW.created_at, now())
+        );
+
+    ELSIF TG_TABLE_NAME = 'belief_history' THEN
+        INSERT INTO public.change_events
+            (project_id, source_table, source_id, change_kind, entity_type, entity_id,
+             summary, confidence_delta, created_at)
+        VALUES (
+            NEW.project_id, TG_TABLE_NAME, NEW.id,
+            CASE NEW.change_type
+                WHEN 'confidence_increase' THEN 'belief_strengthened'
+                WHEN 'confidence_decrease' THEN 'belief_weakened'
+                ELSE 'belief_created'
+            END,
+            'memory_node', NEW.node_id,
+            COALESCE(NEW.change_reason, 'Belief updated'),
+            NEW.new_confidence - NEW.previous_confidence,
+            COALESCE(NEW.created_at, now())
+        );
+
+    ELSIF TG_TABLE_NAME = 'signals' THEN
+        INSERT INTO public.change_events
+            (project_id, source_table, source_id, change_kind, entity_type, entity_id, summary, created_at)
+        VALUES (
+            NEW.project_id, TG_TABLE_NAME, NEW.id, 'signal_processed', 'signal', NEW.id,
+            'New ' || COALESCE(NEW.signal_type, 'signal') || ': ' || left(COALESCE(NEW.title, 'untitled'), 60),
+            COALESCE(NEW.created_at, now())
+        );
+
+    ELSIF TG_TABLE_NAME = 'memory_nodes' AND NEW.node_type IN ('fact', 'insight') THEN
+        INSERT INTO public.change_events
+            (project_id, source_table, source_id, change_kind, entity_type, entity_id, summary, created_at)
+        VALUES (
+            NEW.project_id, TG_TABLE_NAME, NEW.id,
+            CASE WHEN NEW.node_type = 'fact' THEN 'fact_added' ELSE 'insight_added' END,
+            'memory_node', NEW.id,
+            left(COALESCE(NEW.summary, 'New knowledge added'), 80),
+            COALESCE(NEW.created_at, now())
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    t text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['enrichment_revisions', 'belief_history', 'signals', 'memory_nodes']
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_change_event ON public.%I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_change_event AFTER INSERT ON public.%I '
+            'FOR EACH ROW EXECUTE FUNCTION public.project_change_event()',
+            t
+        );
+    END LOOP;
+END;
+$$;
+
+-- Backfill the last 30 days so diffs right after deploy aren't empty
+INSERT INTO change_events
+    (project_id, source_table, source_id, change_kind, entity_type, entity_id, summary, confidence_delta, created_at)
+SELECT * FROM (
+    SELECT r.project_id, 'enrichment_revisions', r.id,
+           CASE WHEN r.revision_type = 'created' THEN 'entity_created' ELSE 'entity_updated' END,
+           r.entity_type, r.entity_id,
+           left(COALESCE(r.diff_summary, r.context_summary, 'Entity updated'), 80),
+           NULL::double precision, r.created_at
+    FROM enrichment_revisions r
+    WHERE r.created_at > now() - interval '30 days'
+    UNION ALL
+    SELECT b.project_id, 'belief_history', b.id,
+           CASE b.change_type
+               WHEN 'confidence_increase' THEN 'belief_strengthened'
+               WHEN 'confidence_decrease' THEN 'belief_weakened'
+               ELSE 'belief_created'
+           END,
+           'memory_node', b.node_id,
+           COALESCE(b.change_reason, 'Belief updated'),
+           b.new_confidence - b.previous_confidence, b.created_at
+    FROM belief_history b
+    WHERE b.created_at > now() - interval '30 days'
+    UNION ALL
+    SELECT s.project_id, 'signals', s.id, 'signal_processed', 'signal', s.id,
+           'New ' || COALESCE(s.signal_type, 'signal') || ': ' || left(COALESCE(s.title, 'untitled'), 60),
+           NULL, s.created_at
+    FROM signals s
+    WHERE s.created_at > now() - interval '30 days'
+    UNION ALL
+    SELECT n.project_id, 'memory_nodes', n.id,
+           CASE WHEN n.node_type = 'fact' THEN 'fact_added' ELSE 'insight_added' END,
+           'memory_node', n.id,
+           left(COALESCE(n.summary, 'New knowledge added'), 80),
+           NULL, n.created_at
+    FROM memory_nodes n
+    WHERE n.node_type IN ('fact', 'insight') AND n.is_active
+      AND n.created_at > now() - interval '30 days'
+) backfill
+WHERE project_id IS NOT NULL
+ORDER BY created_at;
+
+-- =============================================================================
+-- 2. Digest
+-- =============================================================================
+
+-- Events after p_after_id (cursor) and/or p_since, newest first:
+--   {counts: {change_kind: n}, entity_counts: {entity_type: n},
+--    changes: [latest p_limit events], cursor: bigint}
+-- counts cover the whole window, not just the returned page. The cursor
+-- only advances past events older than a few seconds: ids are allocated at
+-- insert, so a slower transaction can still commit a lower id than one
+-- already visible. Recent events may therefore come back again on the next
+-- call (dedupe by id) but are never skipped.
+CREATE OR REPLACE FUNCTION public.get_change_digest(
+    p_project_id uuid,
+    p_since timestamptz DEFAULT NULL,
+    p_after_id bigint DEFAULT NULL,
+    p_limit integer DEFAULT 20
+)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+    WITH w AS (
+        SELECT e.*
+        FROM public.change_events e
+        WHERE e.project_id = p_project_id
+          AND (p_after_id IS NULL OR e.id > p_after_id)
+          AND (p_since IS NULL OR e.created_at > p_since)
+    )
+    SELECT jsonb_build_object(
+        'counts', COALESCE(
+            (SELECT jsonb_object_agg(change_kind, n)
+             FROM (SELECT change_kind, count(*) AS n FROM w GROUP BY change_kind) k),
+            '{}'::jsonb
+        ),
+        'entity_counts', COALESCE(
+            (SELECT jsonb_object_agg(entity_type, n)
+             FROM (SELECT entity_type, count(*) AS n FROM w
+                   WHERE entity_type IS NOT NULL GROUP BY entity_type) t),
+            '{}'::jsonb
+        ),
+        'changes', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(p) ORDER BY p.id DESC)
+             FROM (SELECT id, change_kind, entity_type, entity_id, summary,
+                          confidence_delta, created_at
+                   FROM w ORDER BY id DESC LIMIT p_limit) p),
+            '[]'::jsonb
+        ),
+        'cursor', COALESCE(
+            (SELECT max(id) FROM w WHERE created_at < now() - interval '10 seconds'),
+            p_after_id,
+            (SELECT max(e.id) FROM public.change_events e
+             WHERE e.project_id = p_project_id
+               AND e.created_at < now() - interval '10 seconds'),
+            0
+        )
+    );
+$$;
@@ -0,0 +1,124 @@
+-- Migration 0209: Indexed lexical search
+-- Chat tools resolved entity names with ILIKE '%name%' and searched memory
+-- node summaries with ILIKE '%topic%'. Leading-wildcard patterns can't use
+-- a btree index, so both were sequential scans per project, and results
+-- were unranked. Trigram indexes make the fuzzy matches indexable and
+-- rankable; a full-text expression index covers multi-word topic search.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+-- =============================================================================
+-- 1. Indexes
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_features_name_trgm
+    ON features USING gin (name extensions.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_personas_name_trgm
+    ON personas USING gin (name extensions.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_vp_steps_label_trgm
+    ON vp_steps USING gin (label extensions.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_stakeholders_name_trgm
+    ON stakeholders USING gin (name extensions.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_data_entities_name_trgm
+    ON data_entities USING gin (name extensions.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_workflows_name_trgm
+    ON workflows USING gin (name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_memory_nodes_summary_trgm
+    ON memory_nodes USING gin (summary extensions.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_memory_nodes_summary_fts
+    ON memory_nodes USING gin (to_tsvector('english', coalesce(summary, '')));
+
+-- =============================================================================
+-- 2. Ranked entity name resolution
+-- =============================================================================
+
+-- Substring (ILIKE, trigram-indexed) or fuzzy word match on the entity's
+-- name column. Exact case-insensitive matches score 1.
+CREATE OR REPLACE FUNCTION public.search_entity_names(
+    p_project_id uuid,
+    p_entity_type text,
+    p_query text,
+    p_limit integer DEFAULT 5
+)
+RETURNS TABLE (id uuid, name text, score real)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+DECLARE
+    v_table text;
+    v_column text;
+BEGIN
+    v_table := CASE p_entity_type
+        WHEN 'feature' THEN 'features'
+        WHEN 'persona' THEN 'personas'
+        WHEN 'vp_step' THEN 'vp_steps'
+        WHEN 'stakeholder' THEN 'stakeholders'
+        WHEN 'data_entity' THEN 'data_entities'
+        WHEN 'workflow' THEN 'workflows'
+    END;
+    IF v_table IS NULL THEN
+        RAISE EXCEPTION 'Unknown entity type: %', p_entity_type;
+    END IF;
+    v_column := CASE WHEN p_entity_type = 'vp_step' THEN 'label' ELSE 'name' END;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT t.id, t.%1$I::text,
+                (CASE WHEN lower(t.%1$I) = lower($2) THEN 1
+                      ELSE greatest(similarity(t.%1$I, $2), word_similarity($2, t.%1$I)) END)::real AS score
+         FROM public.%2$I t
+         WHERE t.project_id = $1
+           AND (t.%1$I ILIKE ''%%'' || replace(replace(replace($2, ''\'', ''\\''), ''%%'', ''\%%''), ''_'', ''\_'') || ''%%''
+                OR $2 <%% t.%1$I)
+         ORDER BY score DESC, t.%1$I
+         LIMIT $3',
+        v_column, v_table
+    )
+    USING p_project_id, p_query, p_limit;
+END;
+$$;
+
+-- =============================================================================
+-- 3. Knowledge graph topic search
+-- =============================================================================
+
+-- Full-text match (any form of the words) or fuzzy trigram word match on
+-- active memory node summaries, ranked by text rank + word similarity.
+CREATE OR REPLACE FUNCTION public.search_memory_nodes_lexical(
+    p_project_id uuid,
+    p_query text,
+    p_limit integer DEFAULT 10,
+    p_node_types text[] DEFAULT NULL
+)
+RETURNS TABLE (
+    id uuid,
+    node_type text,
+    summary text,
+    confidence double precision,
+    consultant_status text,
+    linked_entity_type text,
+    linked_entity_id uuid,
+    created_at timestamptz,
+    score real
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+    WITH q AS (SELECT websearch_to_tsquery('english', p_query) AS tsq)
+    SELECT m.id, m.node_type, m.summary, m.confidence::double precision, m.consultant_status,
+           m.linked_entity_type, m.linked_entity_id, m.created_at,
+           (ts_rank_cd(to_tsvector('english', coalesce(m.summary, '')), q.tsq)
+            + word_similarity(p_query, m.summary))::real AS score
+    FROM public.memory_nodes m, q
+    WHERE m.project_id = p_project_id
+      AND m.is_active
+      AND (p_node_types IS NULL OR m.node_type = ANY(p_node_types))
+      AND (to_tsvector('english', coalesce(m.summary, '')) @@ q.tsq
+           OR p_query <% m.summary)
+    ORDER BY score DESC, m.confidence DESC NULLS LAST
+    LIMIT p_limit;
+$$;
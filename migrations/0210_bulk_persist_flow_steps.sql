@@ -0,0 +1,116 @@
+-- Migration 0210: Bulk solution flow step persistence
+-- Regenerating a flow wrote steps one request at a time: mark each
+-- confirmed step preserved, insert each new step, then update every step
+-- again with its final step_index (50+ sequential writes for 25 steps),
+-- followed by one more update per step for its background narrative.
+--
+-- persist_solution_flow_steps() does the whole regeneration in one
+-- transaction; update_solution_flow_step_narratives() writes all
+-- narratives in one statement.
+
+-- p_steps is the flow in its final order. Each element is either
+--   {id}                   an existing (confirmed) step to keep, or
+--   {title, goal, ...}     a new step (solution_flow_steps columns).
+-- Superseded ai_generated / needs_review steps are deleted, kept steps are
+-- marked preserved from the previous version, and every step gets
+-- step_index = its position. Returns the kept and inserted steps in order.
+CREATE OR REPLACE FUNCTION public.persist_solution_flow_steps(
+    p_flow_id uuid,
+    p_generation_version integer,
+    p_steps jsonb
+)
+RETURNS SETOF public.solution_flow_steps
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_project_id uuid;
+    v_kept uuid[];
+    v_inserted uuid[];
+BEGIN
+    -- Serialize concurrent regenerations of the same flow
+    SELECT f.project_id INTO v_project_id
+    FROM public.solution_flows f
+    WHERE f.id = p_flow_id
+    FOR UPDATE;
+    IF v_project_id IS NULL THEN
+        RAISE EXCEPTION 'Flow not found: %', p_flow_id;
+    END IF;
+
+    SELECT COALESCE(array_agg((s.value->>'id')::uuid), '{}')
+    INTO v_kept
+    FROM jsonb_array_elements(p_steps) s
+    WHERE s.value ? 'id';
+
+    DELETE FROM public.solution_flow_steps
+    WHERE flow_id = p_flow_id
+      AND confirmation_status IN ('ai_generated', 'needs_review')
+      AND id <> ALL(v_kept);
+
+    UPDATE public.solution_flow_steps t
+    SET step_index = s.ord - 1,
+        preserved_from_version = p_generation_version - 1,
+        generation_version = p_generation_version
+    FROM jsonb_array_elements(p_steps) WITH ORDINALITY AS s(value, ord)
+    WHERE s.value ? 'id'
+      AND t.id = (s.value->>'id')::uuid
+      AND t.flow_id = p_flow_id;
+
+    WITH ins AS (
+        INSERT INTO public.solution_flow_steps (
+            flow_id, project_id, step_index, phase, title, goal, actors,
+            information_fields, mock_data_narrative, open_questions, implied_pattern,
+            confirmation_status, linked_workflow_ids, linked_feature_ids,
+            linked_data_entity_ids, story_headline, user_actions, human_value_statement,
+            confidence_impact, background_narrative, generation_version,
+            success_criteria, pain_points_addressed, goals_addressed, ai_config,
+            needs_client_review, review_reason, review_target_stakeholder_id
+        )
+        SELECT
+            p_flow_id, v_project_id, s.ord - 1,
+            COALESCE(r.phase, 'core_experience'), r.title, r.goal,
+            COALESCE(r.actors, '{}'),
+            COALESCE(r.information_fields, '[]'::jsonb), r.mock_data_narrative,
+            COALESCE(r.open_questions, '[]'::jsonb), r.implied_pattern,
+            COALESCE(r.confirmation_status, 'ai_generated'),
+            COALESCE(r.linked_workflow_ids, '{}'), COALESCE(r.linked_feature_ids, '{}'),
+            COALESCE(r.linked_data_entity_ids, '{}'),
+            r.story_headline, COALESCE(r.user_actions, '[]'::jsonb), r.human_value_statement,
+            r.confidence_impact, r.background_narrative, p_generation_version,
+            r.success_criteria, r.pain_points_addressed, r.goals_addressed, r.ai_config,
+            COALESCE(r.needs_client_review, false), r.review_reason,
+            r.review_target_stakeholder_id
+        FROM jsonb_array_elements(p_steps) WITH ORDINALITY AS s(value, ord),
+             LATERAL jsonb_populate_record(NULL::public.solution_flow_steps, s.value) r
+        WHERE NOT s.value ? 'id'
+        ORDER BY s.ord
+        RETURNING id
+    )
+    SELECT COALESCE(array_agg(id), '{}') INTO v_inserted FROM ins;
+
+    RETURN QUERY
+    SELECT t.*
+    FROM public.solution_flow_steps t
+    WHERE t.flow_id = p_flow_id
+      AND t.id = ANY(v_kept || v_inserted)
+    ORDER BY t.step_index;
+END;
+$$;
+
+-- p_narratives: [{id, background_narrative}, ...]
+CREATE OR REPLACE FUNCTION public.update_solution_flow_step_narratives(p_narratives jsonb)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+    WITH updated AS (
+        UPDATE public.solution_flow_steps t
+        SET background_narrative = n.background_narrative
+        FROM jsonb_to_recordset(p_narratives) AS n(id uuid, background_narrative text)
+        WHERE t.id = n.id
+        RETURNING t.id
+    )
+    SELECT count(*)::integer FROM updated;
+$$;
@@ -0,0 +1,23 @@
+-- Migration 0211: Solution flow step detail cache
+-- Flow regeneration (v4 Phase 3) makes one LLM call per step skeleton, but
+-- after a small edit plan_architecture usually returns the same skeletons
+-- for most steps. Details are cached under a hash of everything the
+-- builder call sees (model, prompt, skeleton, assembled step context), so
+-- unchanged steps reuse their previous details.
+
+CREATE TABLE IF NOT EXISTS solution_flow_step_detail_cache (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    cache_key TEXT NOT NULL,
+    detail JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_used_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (project_id, cache_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_step_detail_cache_last_used
+    ON solution_flow_step_detail_cache(project_id, last_used_at);
+
+ALTER TABLE solution_flow_step_detail_cache ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "service_role_all_step_detail_cache" ON solution_flow_step_detail_cache
+    FOR ALL TO service_role USING (true);
@@ -0,0 +1,20 @@
+-- Migration 0212: Vision analysis cache
+-- Decks and PDFs repeat the same logo, header banner or screenshot across
+-- pages and across documents, and each copy got its own vision call.
+-- Analyses are now cached per project by image hash (a perceptual hash,
+-- so re-encoded copies match) and prompt, and reused by later documents.
+
+CREATE TABLE IF NOT EXISTS vision_analysis_cache (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    image_hash TEXT NOT NULL,
+    prompt_key TEXT NOT NULL,
+    analysis TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (project_id, image_hash, prompt_key)
+);
+
+ALTER TABLE vision_analysis_cache ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "service_role_all_vision_analysis_cache" ON vision_analysis_cache
+    FOR ALL TO service_role USING (true);
@@ -0,0 +1,24 @@
+-- Migration 0213: Call analysis cache per dimension pack
+-- trigger_analysis re-ran every pack over the whole transcript whenever a
+-- new pack was requested. Each pack's merged result is now cached under a
+-- hash of (transcript, pack, model, project context), so re-analysis only
+-- calls the model for packs that have not been analyzed yet.
+
+CREATE TABLE IF NOT EXISTS call_analysis_pack_cache (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    cache_key TEXT NOT NULL,
+    transcript_hash TEXT NOT NULL,
+    pack TEXT NOT NULL,
+    result JSONB NOT NULL,
+    model TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (project_id, cache_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_call_analysis_pack_cache_transcript
+    ON call_analysis_pack_cache(transcript_hash);
+
+ALTER TABLE call_analysis_pack_cache ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "service_role_all_call_analysis_pack_cache" ON call_analysis_pack_cache
+    FOR ALL TO service_role USING (true);
@@ -0,0 +1,41 @@
+-- Migration 0214: Write versions for workspace read endpoints
+-- The workspace BRD, canvas, solution flow and intelligence layer endpoints
+-- answer If-None-Match with 304 when the project's write version is
+-- unchanged (app/core/http_cache.py). Attach the 0203 write-version
+-- triggers to the remaining project tables those endpoints read, so a write
+-- to any of them changes the ETag.
+
+DO $$
+DECLARE
+    t text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'company_info', 'competitor_references', 'pending_items', 'gap_clusters',
+        'outcomes', 'canvas_synthesis', 'solution_flows', 'agents',
+        'intelligence_architecture', 'project_members', 'project_foundation'
+    ]
+    LOOP
+        IF to_regclass('public.' || t) IS NULL OR NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = t AND column_name = 'project_id'
+        ) THEN
+            CONTINUE;
+        END IF;
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_ins ON public.%1$I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_upd ON public.%1$I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_del ON public.%1$I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_ins AFTER INSERT ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_upd AFTER UPDATE ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_del AFTER DELETE ON public.%1$I '
+            'REFERENCING OLD TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+    END LOOP;
+END;
+$$;
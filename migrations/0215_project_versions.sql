@@ -0,0 +1,110 @@
+-- Migration 0215: Per-project write version counter
+-- Context caches (context_cache, the chat retrieval cache, the action
+-- engine's context frame, state_snapshots) decided freshness by TTL alone,
+-- or re-read the project to fingerprint it. The write-version trigger now
+-- also bumps a single counter per project, so a cache can store the version
+-- it was computed at and compare it with one primary-key read.
+
+-- =============================================================================
+-- 1. Counter table, seeded from the per-table versions
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS project_versions (
+    project_id UUID PRIMARY KEY REFERENCES projects(id) ON DELETE CASCADE,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE project_versions ENABLE ROW LEVEL SECURITY;
+
+-- Start at the old sum-of-tables version so versions never go backwards
+INSERT INTO project_versions (project_id, version, updated_at)
+SELECT project_id, SUM(version), MAX(updated_at)
+FROM project_write_versions
+GROUP BY project_id
+ON CONFLICT (project_id) DO NOTHING;
+
+-- =============================================================================
+-- 2. Bump the counter alongside the per-table version
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.bump_project_write_versions()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    WITH touched AS (
+        SELECT DISTINCT pid
+        FROM (
+            SELECT COALESCE(
+                to_jsonb(r)->>'project_id',
+                CASE WHEN TG_TABLE_NAME = 'projects' THEN to_jsonb(r)->>'id' END
+            )::uuid AS pid
+            FROM changed_rows r
+        ) c
+        WHERE pid IS NOT NULL
+          AND EXISTS (SELECT 1 FROM public.projects p WHERE p.id = c.pid)
+    ),
+    table_versions AS (
+        INSERT INTO public.project_write_versions AS v (project_id, source_table, version, updated_at)
+        SELECT pid, TG_TABLE_NAME, 1, now() FROM touched
+        ON CONFLICT (project_id, source_table) DO UPDATE
+            SET version = v.version + 1, updated_at = now()
+        RETURNING 1
+    )
+    INSERT INTO public.project_versions AS pv (project_id, version, updated_at)
+    SELECT pid, 1, now() FROM touched
+    ON CONFLICT (project_id) DO UPDATE
+        SET version = pv.version + 1, updated_at = now();
+    RETURN NULL;
+END;
+$$;
+
+-- =============================================================================
+-- 3. Track the remaining entity, signal and memory tables
+-- =============================================================================
+
+DO $$
+DECLARE
+    t text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'risks', 'tasks', 'unlocks', 'project_open_questions', 'strategic_context',
+        'confirmation_items', 'extracted_facts', 'batch_proposals', 'signal_chunks',
+        'project_memory', 'project_decisions', 'project_learnings',
+        'outcome_entity_links', 'outcome_actors', 'outcome_capabilities',
+        'entity_cooccurrence', 'meetings', 'document_uploads', 'project_context'
+    ]
+    LOOP
+        IF to_regclass('public.' || t) IS NULL OR NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = t AND column_name = 'project_id'
+        ) THEN
+            CONTINUE;
+        END IF;
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_ins ON public.%1$I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_upd ON public.%1$I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_write_version_del ON public.%1$I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_ins AFTER INSERT ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_upd AFTER UPDATE ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_del AFTER DELETE ON public.%1$I '
+            'REFERENCING OLD TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions()', t);
+    END LOOP;
+END;
+$$;
+
+-- =============================================================================
+-- 4. Version a state snapshot was built at
+-- =============================================================================
+
+ALTER TABLE state_snapshots ADD COLUMN IF NOT EXISTS project_version BIGINT;
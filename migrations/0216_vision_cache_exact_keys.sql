@@ -0,0 +1,7 @@
+-- Migration 0216: Vision analysis cache keyed by exact image hash
+-- 0212 keyed cached analyses on a 64-bit perceptual hash, which is too
+-- coarse: two screenshots sharing an app header and sidebar got the same
+-- key, and one received the other's analysis. Keys are now the SHA-256
+-- ("s" prefix); drop the perceptual-hash ("p" prefix) rows.
+
+DELETE FROM vision_analysis_cache WHERE image_hash LIKE 'p%';
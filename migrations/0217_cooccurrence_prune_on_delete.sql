@@ -0,0 +1,89 @@
+-- Migration 0217: Prune co-occurrence edges on deletes
+-- refresh_entity_cooccurrence() only ran after signal_impact inserts, so edges
+-- to a deleted entity, or built from a deleted signal's chunks, survived until
+-- the next full rebuild. signal_impact has no FK to the entity tables either:
+-- a deleted entity's impact rows stayed behind and a later refresh of any
+-- neighbor re-created its edges.
+--
+-- Now deleting an entity deletes its signal_impact rows, and any signal_impact
+-- delete (direct, or cascaded from signals / signal_chunks) refreshes the
+-- edges of the entities it touched.
+
+-- =============================================================================
+-- 1. signal_impact deletes refresh the affected entities' edges
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.refresh_cooccurrence_after_impact_delete()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    PERFORM public.refresh_entity_cooccurrence(
+        ARRAY(SELECT DISTINCT entity_id FROM deleted_impacts)
+    );
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_signal_impact_cooccurrence_del ON public.signal_impact;
+CREATE TRIGGER trg_signal_impact_cooccurrence_del AFTER DELETE ON public.signal_impact
+    REFERENCING OLD TABLE AS deleted_impacts FOR EACH STATEMENT
+    EXECUTE FUNCTION public.refresh_cooccurrence_after_impact_delete();
+
+-- =============================================================================
+-- 2. Entity deletes drop the entity's signal_impact rows (TG_ARGV[0] = type)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.delete_impacts_of_deleted_entities()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    DELETE FROM public.signal_impact
+    WHERE entity_type = TG_ARGV[0]
+      AND entity_id IN (SELECT id FROM deleted_entities);
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    entity record;
+BEGIN
+    FOR entity IN
+        SELECT * FROM (VALUES
+            ('feature', 'features'),
+            ('persona', 'personas'),
+            ('stakeholder', 'stakeholders'),
+            ('workflow', 'workflows'),
+            ('vp_step', 'vp_steps'),
+            ('data_entity', 'data_entities'),
+            ('business_driver', 'business_drivers'),
+            ('constraint', 'constraints'),
+            ('competitor', 'competitor_references'),
+            ('solution_flow_step', 'solution_flow_steps')
+        ) AS m(entity_type, table_name)
+    LOOP
+        IF to_regclass('public.' || entity.table_name) IS NULL THEN
+            CONTINUE;
+        END IF;
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS trg_%1$s_impacts_del ON public.%1$I', entity.table_name);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_impacts_del AFTER DELETE ON public.%1$I '
+            'REFERENCING OLD TABLE AS deleted_entities FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.delete_impacts_of_deleted_entities(%2$L)',
+            entity.table_name, entity.entity_type);
+
+        -- Impacts already orphaned by earlier deletes (fires section 1)
+        EXECUTE format(
+            'DELETE FROM public.signal_impact si WHERE si.entity_type = %2$L '
+            'AND NOT EXISTS (SELECT 1 FROM public.%1$I e WHERE e.id = si.entity_id)',
+            entity.table_name, entity.entity_type);
+    END LOOP;
+END;
+$$;
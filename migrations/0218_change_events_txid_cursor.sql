@@ -0,0 +1,118 @@
+-- Migration 0218: Commit-safe change feed cursor + change_events retention
+-- The 0208 cursor was a change_events id that only advanced past events
+-- older than 10 seconds. Ids are allocated at insert, not commit, so a
+-- transaction that committed more than 10s after inserting (a long signal
+-- pipeline run) landed below a cursor clients had already moved past, and
+-- its events were never delivered.
+--
+-- Each event now records the id of the transaction that wrote it (txid,
+-- assigned monotonically by Postgres). The cursor is the xmin of the
+-- reader's snapshot: every transaction below it has committed or aborted,
+-- so any event that becomes visible later has txid >= cursor. Events of
+-- transactions at or above the cursor that were already visible come back
+-- again on the next call (dedupe by id) but are never skipped.
+--
+-- change_events also had no retention; sweep_change_events deletes events
+-- past CHANGE_EVENT_RETENTION_DAYS in batches (app/db/sweeps.py).
+
+-- Existing rows get this migration's transaction id, below any new cursor
+ALTER TABLE change_events
+    ADD COLUMN IF NOT EXISTS txid xid8 NOT NULL DEFAULT pg_current_xact_id();
+
+CREATE INDEX IF NOT EXISTS idx_change_events_project_txid
+    ON change_events(project_id, txid);
+
+-- =============================================================================
+-- 1. Digest keyed on the transaction cursor (replaces the 0208 version)
+-- =============================================================================
+
+DROP FUNCTION IF EXISTS public.get_change_digest(uuid, timestamptz, bigint, integer);
+
+-- Events at or after p_cursor and/or after p_since, newest first:
+--   {counts: {change_kind: n}, entity_counts: {entity_type: n},
+--    changes: [latest p_limit events], cursor: bigint}
+-- counts cover the whole window, not just the returned page.
+CREATE OR REPLACE FUNCTION public.get_change_digest(
+    p_project_id uuid,
+    p_since timestamptz DEFAULT NULL,
+    p_cursor bigint DEFAULT NULL,
+    p_limit integer DEFAULT 20
+)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+    WITH w AS (
+        SELECT e.*
+        FROM public.change_events e
+        WHERE e.project_id = p_project_id
+          AND (p_cursor IS NULL OR e.txid >= p_cursor::text::xid8)
+          AND (p_since IS NULL OR e.created_at > p_since)
+    )
+    SELECT jsonb_build_object(
+        'counts', COALESCE(
+            (SELECT jsonb_object_agg(change_kind, n)
+             FROM (SELECT change_kind, count(*) AS n FROM w GROUP BY change_kind) k),
+            '{}'::jsonb
+        ),
+        'entity_counts', COALESCE(
+            (SELECT jsonb_object_agg(entity_type, n)
+             FROM (SELECT entity_type, count(*) AS n FROM w
+                   WHERE entity_type IS NOT NULL GROUP BY entity_type) t),
+            '{}'::jsonb
+        ),
+        'changes', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(p) ORDER BY p.id DESC)
+             FROM (SELECT id, change_kind, entity_type, entity_id, summary,
+                          confidence_delta, created_at
+                   FROM w ORDER BY id DESC LIMIT p_limit) p),
+            '[]'::jsonb
+        ),
+        'cursor', pg_snapshot_xmin(pg_current_snapshot())::text::bigint
+    );
+$$;
+
+-- =============================================================================
+-- 2. Retention sweep
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.sweep_change_events(
+    p_cutoff timestamptz,
+    p_project_id uuid DEFAULT NULL,
+    p_batch_size integer DEFAULT 500,
+    p_dry_run boolean DEFAULT false
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_count integer;
+BEGIN
+    IF p_dry_run THEN
+        SELECT count(*) INTO v_count
+        FROM public.change_events e
+        WHERE e.created_at < p_cutoff
+          AND (p_project_id IS NULL OR e.project_id = p_project_id);
+        RETURN v_count;
+    END IF;
+
+    WITH batch AS (
+        SELECT e.id
+        FROM public.change_events e
+        WHERE e.created_at < p_cutoff
+          AND (p_project_id IS NULL OR e.project_id = p_project_id)
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    DELETE FROM public.change_events t
+    USING batch
+    WHERE t.id = batch.id;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$;
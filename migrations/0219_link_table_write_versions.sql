@@ -0,0 +1,83 @@
+-- Migration 0219: Write versions for project link tables
+-- The write-version triggers (0203/0214/0215) resolve the project from the
+-- changed rows' project_id, so link tables without one were skipped: linking
+-- a data entity to a workflow step, or an entity to an outcome, left the
+-- project version unchanged and /workspace/brd kept answering 304 with the
+-- old link counts.
+--
+-- These tables now get a trigger that resolves project_id through the parent
+-- row (TG_ARGV[0] = parent table, TG_ARGV[1] = foreign key column). Rows
+-- whose parent was deleted in the same statement resolve to nothing; the
+-- parent's own delete already bumped the version.
+
+CREATE OR REPLACE FUNCTION public.bump_project_write_versions_via_parent()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_project_ids uuid[];
+BEGIN
+    EXECUTE format(
+        'SELECT array_agg(DISTINCT p.project_id) FROM public.%I p '
+        'WHERE p.project_id IS NOT NULL AND p.id IN ('
+        '  SELECT (to_jsonb(r)->>%L)::uuid FROM changed_rows r)',
+        TG_ARGV[0], TG_ARGV[1]
+    ) INTO v_project_ids;
+
+    IF v_project_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO public.project_write_versions AS v (project_id, source_table, version, updated_at)
+    SELECT pid, TG_TABLE_NAME, 1, now() FROM unnest(v_project_ids) AS pid
+    ON CONFLICT (project_id, source_table) DO UPDATE
+        SET version = v.version + 1, updated_at = now();
+
+    INSERT INTO public.project_versions AS pv (project_id, version, updated_at)
+    SELECT pid, 1, now() FROM unnest(v_project_ids) AS pid
+    ON CONFLICT (project_id) DO UPDATE
+        SET version = pv.version + 1, updated_at = now();
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    link record;
+BEGIN
+    FOR link IN
+        SELECT * FROM (VALUES
+            ('data_entity_workflow_steps', 'data_entities', 'data_entity_id'),
+            ('outcome_entity_links', 'outcomes', 'outcome_id'),
+            ('outcome_actors', 'outcomes', 'outcome_id')
+        ) AS m(table_name, parent_table, fk_column)
+    LOOP
+        IF to_regclass('public.' || link.table_name) IS NULL THEN
+            CONTINUE;
+        END IF;
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS trg_%1$s_write_version_ins ON public.%1$I', link.table_name);
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS trg_%1$s_write_version_upd ON public.%1$I', link.table_name);
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS trg_%1$s_write_version_del ON public.%1$I', link.table_name);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_ins AFTER INSERT ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions_via_parent(%2$L, %3$L)',
+            link.table_name, link.parent_table, link.fk_column);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_upd AFTER UPDATE ON public.%1$I '
+            'REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions_via_parent(%2$L, %3$L)',
+            link.table_name, link.parent_table, link.fk_column);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_write_version_del AFTER DELETE ON public.%1$I '
+            'REFERENCING OLD TABLE AS changed_rows FOR EACH STATEMENT '
+            'EXECUTE FUNCTION public.bump_project_write_versions_via_parent(%2$L, %3$L)',
+            link.table_name, link.parent_table, link.fk_column);
+    END LOOP;
+END;
+$$;
@@ -0,0 +1,6 @@
+-- Migration 0220: Per-call metadata on llm_usage_log
+-- Some chains report more than token counts, e.g. how many solution flow
+-- step details were served from the step detail cache. Store it with the
+-- usage row instead of a separate table.
+
+ALTER TABLE llm_usage_log ADD COLUMN IF NOT EXISTS metadata JSONB;
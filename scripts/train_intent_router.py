@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Train the local chat intent router from chat_routing_log.
+
+Harvests intent/strategy labels from past routing decisions (Haiku, plus
+regex pattern matches), embeds the messages with the configured embedding
+model, fits the router heads and writes a versioned artifact to
+app/context/artifacts/intent_router-<version>.json. The API loads the newest
+artifact at startup.
+
+A held-out split (20%) reports coverage (share of messages above the
+confidence threshold) and accuracy on that share before the final model is
+refit on all examples.
+
+Usage:
+    python scripts/train_intent_router.py [--days 90] [--min-confidence 0.7] [--dry-run]
+
+Options:
+    --days: Only use routing decisions from the last N days (default: 90)
+    --min-confidence: Threshold below which chat falls back to Haiku (default: 0.7)
+    --min-examples: Abort if fewer labelled examples are found (default: 200)
+    --dry-run: Train and report metrics without writing the artifact
+"""
+
+import argparse
+import random
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.context.intent_router import (
+    DEFAULT_MIN_CONFIDENCE,
+    TRAINING_SOURCES,
+    evaluate_router,
+    routing_log_examples,
+    save_router,
+    train_router,
+)
+from app.core.config import get_settings
+from app.core.embeddings import embed_texts
+from app.core.logging import get_logger
+from app.db.supabase_client import get_supabase
+
+logger = get_logger(__name__)
+
+PAGE_SIZE = 1000
+EMBED_BATCH = 256
+
+
+def fetch_routing_rows(days: int) -> list[dict]:
+    """Load labelled routing decisions, newest first."""
+    sb = get_supabase()
+    since = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        resp = (
+            sb.table("chat_routing_log")
+            .select("raw_message, intent_type, retrieval_strategy, classifier_source")
+            .in_("classifier_source", list(TRAINING_SOURCES))
+            .gte("created_at", since)
+            .order("created_at", desc=True)
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        )
+        page = resp.data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        offset += PAGE_SIZE
+
+
+def embed_all(messages: list[str]) -> list[list[float]]:
+    embeddings: list[list[float]] = []
+    for i in range(0, len(messages), EMBED_BATCH):
+        embeddings.extend(embed_texts(messages[i:i + EMBED_BATCH]))
+        logger.info(f"Embedded {len(embeddings)}/{len(messages)} messages")
+    return embeddings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the local chat intent router")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--min-confidence", type=float, default=DEFAULT_MIN_CONFIDENCE)
+    parser.add_argument("--min-examples", type=int, default=200)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    examples = routing_log_examples(fetch_routing_rows(args.days))
+    logger.info(f"Found {len(examples)} labelled examples (last {args.days} days)")
+    if len(examples) < args.min_examples:
+        logger.error(f"Need at least {args.min_examples} examples — aborting")
+        sys.exit(1)
+
+    random.Random(42).shuffle(examples)
+    messages = [m for m, _, _ in examples]
+    intents = [i for _, i, _ in examples]
+    strategies = [s for _, _, s in examples]
+    embeddings = embed_all(messages)
+
+    version = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    split = int(len(examples) * 0.8)
+    holdout_model = train_router(
+        embeddings[:split], intents[:split], strategies[:split],
+        version=version,
+        embedding_model=settings.EMBEDDING_MODEL,
+        min_confidence=args.min_confidence,
+    )
+    metrics = evaluate_router(
+        holdout_model, embeddings[split:], intents[split:], strategies[split:],
+    )
+    logger.info(
+        f"Holdout: coverage={metrics['coverage']:.1%} "
+        f"accuracy={metrics['accuracy']:.1%} (n={metrics['examples']})"
+    )
+
+    model = train_router(
+        embeddings, intents, strategies,
+        version=version,
+        embedding_model=settings.EMBEDDING_MODEL,
+        min_confidence=args.min_confidence,
+    )
+    model.metrics = {"holdout": metrics, "train_examples": len(examples)}
+
+    if args.dry_run:
+        logger.info("Dry run — artifact not written")
+        return
+    path = save_router(model)
+    logger.info(f"Wrote intent router {version} to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Tests for section-level briefing caching (app/core/briefing_sections.py)."""
+
+from datetime import UTC, datetime, timedelta
+
+from app.core.briefing_sections import (
+    SECTIONS,
+    cached_section,
+    encode_section,
+    input_vector,
+)
+from app.core.schemas_briefing import Hypothesis
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _row(section: str, vector: dict, payload, age: timedelta = timedelta(minutes=5)) -> dict:
+    return {
+        "section": section,
+        "input_versions": vector,
+        "payload": payload,
+        "computed_at": (NOW - age).isoformat(),
+    }
+
+
+def test_input_vector_only_covers_declared_tables():
+    versions = {"memory_nodes": 7, "features": 3, "signals": 9}
+    spec = SECTIONS["temporal_diff"]
+
+    vector = input_vector(spec, versions, extra={"since": "2026-02-28T00:00:00+00:00"})
+
+    assert vector == {
+        "enrichment_revisions": 0,
+        "memory_nodes": 7,
+        "signals": 9,
+        "belief_history": 0,
+        "@since": "2026-02-28T00:00:00+00:00",
+    }
+
+
+def test_hit_round_trips_models():
+    spec = SECTIONS["hypotheses_scan"]
+    hyps = [Hypothesis(hypothesis_id="h1", statement="Users want SSO", test_suggestion="Ask IT")]
+    vector = input_vector(spec, {"memory_nodes": 4})
+
+    row = _row(spec.name, vector, encode_section(spec, hyps))
+
+    hit, value = cached_section(spec, row, vector, NOW)
+
+    assert hit
+    assert value == hyps
+
+
+def test_changed_input_table_misses():
+    spec = SECTIONS["hypotheses_scan"]
+    stored = input_vector(spec, {"memory_nodes": 4})
+    row = _row(spec.name, stored, [])
+
+    # A write to an unrelated table leaves the section valid
+    assert cached_section(spec, row, input_vector(spec, {"memory_nodes": 4, "features": 9}), NOW)[0]
+    assert cached_section(spec, row, input_vector(spec, {"memory_nodes": 5}), NOW) == (False, None)
+
+
+def test_max_age_and_bad_payload_miss():
+    spec = SECTIONS["heartbeat"]
+    vector = input_vector(spec, {})
+
+    stale = _row(spec.name, vector, None, age=spec.max_age + timedelta(minutes=1))
+    corrupt = _row(spec.name, vector, {"completeness_pct": "not a number"})
+
+    assert cached_section(spec, stale, vector, NOW) == (False, None)
+    assert cached_section(spec, corrupt, vector, NOW) == (False, None)
+    assert cached_section(spec, None, vector, NOW) == (False, None)
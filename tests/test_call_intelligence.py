@@ -353,6 +353,173 @@ class TestAnalysisChain:
         assert len(DIMENSION_PACKS) == 2
 
 
+# ============================================================================
+# Windowed analysis tests
+# ============================================================================
+
+
+def _segments(minutes: int) -> list[dict]:
+    """One speaker turn per minute, alternating speakers."""
+    return [
+        {"speaker": f"Speaker {m % 2}", "text": f"Point {m}", "start": m * 60.0,
+         "end": m * 60.0 + 50}
+        for m in range(minutes)
+    ]
+
+
+def _analysis_client(responses: dict[str, dict]) -> MagicMock:
+    """Fake AsyncAnthropic; answers by the 'part N of' marker in the prompt."""
+    import json
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    async def create(**kwargs):
+        message = kwargs["messages"][0]["content"]
+        part = next((p for p in responses if p in message), "whole")
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(responses[part]))],
+            model="claude-test",
+            usage=SimpleNamespace(input_tokens=100, output_tokens=10),
+        )
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+    return client
+
+
+class TestWindowedAnalysis:
+    """Test transcript windowing, merging and per-pack caching."""
+
+    def test_split_transcript_by_time(self):
+        from app.chains.analyze_call import split_transcript
+
+        windows = split_transcript("full text", _segments(35), window_seconds=900)
+
+        assert [(w.start, w.end) for w in windows] == [(0, 890), (900, 1790), (1800, 2090)]
+        assert windows[0].text.splitlines()[1] == "[01:00] Speaker 1: Point 1"
+        assert split_transcript("full text", [], 900)[0].text == "full text"
+
+    def test_merge_window_analyses(self):
+        from app.chains.analyze_call import merge_window_analyses
+
+        merged = merge_window_analyses(
+            [
+                {
+                    "engagement_score": 0.4,
+                    "talk_ratio": {"Speaker 0": 1.0},
+                    "engagement_timeline": [{"timestamp_seconds": 300, "topic": "a"}],
+                    "executive_summary": "Intro.",
+                    "feature_insights": [{"feature_name": "Export", "quote": "Need it"}],
+                    "question_quality": {"score": 0.5, "missed_opportunities": ["x"]},
+                    "discovery_depth": {"deep_questions": 2},
+                },
+                {
+                    "engagement_score": 1.0,
+                    "talk_ratio": {"Speaker 0": 0.5, "Speaker 1": 0.5},
+                    "engagement_timeline": [{"timestamp_seconds": 100, "topic": "b"}],
+                    "executive_summary": "Pricing.",
+                    "feature_insights": [
+                        {"feature_name": "export", "quote": "Need it "},
+                        {"feature_name": "Alerts", "quote": "Yes"},
+                    ],
+                    "question_quality": {"score": 1.0, "missed_opportunities": ["y"]},
+                    "discovery_depth": {"deep_questions": 3},
+                },
+            ],
+            weights=[100, 300],
+        )
+
+        assert merged["engagement_score"] == 0.85
+        assert merged["talk_ratio"] == {"Speaker 0": 0.625, "Speaker 1": 0.375}
+        assert [e["topic"] for e in merged["engagement_timeline"]] == ["b", "a"]
+        assert merged["executive_summary"] == "Intro. Pricing."
+        assert [f["feature_name"] for f in merged["feature_insights"]] == ["Export", "Alerts"]
+        assert merged["question_quality"] == {"score": 0.875, "missed_opportunities": ["x", "y"]}
+        assert merged["discovery_depth"] == {"deep_questions": 5}
+
+    @pytest.mark.asyncio
+    async def test_long_call_is_windowed_and_packs_are_cached(self):
+        from app.chains.analyze_call import analyze_call_transcript
+
+        settings = MagicMock(
+            ANTHROPIC_API_KEY="k",
+            CALL_ANALYSIS_MODEL="claude-test",
+            CALL_ANALYSIS_MAX_TOKENS=1000,
+            CALL_ANALYSIS_WINDOW_SECONDS=900,
+            CALL_ANALYSIS_CONCURRENCY=2,
+        )
+        cache: dict[str, dict] = {}
+
+        def get_cached(project_id, keys):
+            return {k: cache[k] for k in keys if k in cache}
+
+        def save(project_id, rows):
+            cache.update({r["cache_key"]: r for r in rows})
+
+        async def run(packs, responses, context_blocks=None):
+            client = _analysis_client(responses)
+            with (
+                patch("app.db.call_intelligence.get_cached_pack_analyses", side_effect=get_cached),
+                patch("app.db.call_intelligence.save_pack_analyses", side_effect=save),
+                patch("app.chains.analyze_call.log_llm_usage"),
+            ):
+                result = await analyze_call_transcript(
+                    "full text", packs, segments=_segments(35), settings=settings,
+                    project_id="p1", client=client, context_blocks=context_blocks,
+                )
+            return result, client.messages.create
+
+        first, create = await run(
+            ["core"],
+            {
+                "part 1 of 3": {"engagement_score": 0.2, "executive_summary": "A."},
+                "part 2 of 3": {"engagement_score": 0.8, "executive_summary": "B."},
+                "part 3 of 3": {"executive_summary": "C."},
+            },
+            context_blocks=[{"label": "Project Features", "content": "- Export"}],
+        )
+        assert create.await_count == 3
+        assert first.engagement_score == 0.5
+        assert first.executive_summary == "A. B. C."
+        assert first.tokens_input == 300
+
+        # Adding a pack only analyzes the new pack, even though the analysis
+        # changed the project context in between
+        second, create = await run(
+            ["core", "consultant"],
+            {"part": {"consultant_summary": "Ok."}},
+            context_blocks=[{"label": "Project Features", "content": "- Export\n- Alerts"}],
+        )
+        assert create.await_count == 3
+        prompt = create.call_args.kwargs["messages"][0]["content"]
+        assert "consultant_summary" in prompt and "engagement_score" not in prompt
+        assert second.packs_from_cache == ["core"]
+        assert second.executive_summary == "A. B. C."
+        assert second.custom_dimensions == {"consultant_summary": "Ok."}
+
+        third, create = await run(["core", "consultant"], {})
+        create.assert_not_awaited()
+        assert third.packs_from_cache == ["core", "consultant"]
+
+    def test_reanalysis_does_not_duplicate_child_records(self):
+        from app.core.schemas_call_intelligence import AnalysisResult, CallSignalInsight
+        from app.services.call_intelligence import CallIntelligenceService
+
+        analysis = AnalysisResult(
+            call_signals=[CallSignalInsight(signal_type="goal", title="Faster close")]
+        )
+        with (
+            patch("app.db.call_intelligence.save_analysis") as save_analysis,
+            patch("app.db.call_intelligence.save_call_signals") as save_signals,
+        ):
+            service = CallIntelligenceService()
+            service._save_analysis("r1", analysis, saved_packs=["core", "research"])
+            save_signals.assert_not_called()
+            service._save_analysis("r1", analysis, saved_packs=["core"])
+            save_signals.assert_called_once()
+        assert save_analysis.call_count == 2
+
+
 # ============================================================================
 # Config tests
 # ============================================================================
@@ -0,0 +1,125 @@
+"""Tests for speculative chat context prefetch (start_context_prefetch → assemble_chat_context)."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.context.intent_classifier import ChatIntent
+from app.core.chat_context import assemble_chat_context, start_context_prefetch
+
+LOAD_S = 0.2
+
+
+def _intent(intent_type="discuss", strategy="full", topics=None) -> ChatIntent:
+    return ChatIntent(
+        type=intent_type,
+        retrieval_strategy=strategy,
+        topics=topics or [],
+    )
+
+
+async def _slow(value):
+    await asyncio.sleep(LOAD_S)
+    return value
+
+
+def _patches(retrieval: AsyncMock):
+    from app.context.project_awareness import ProjectAwareness
+
+    async def _name(*_args):
+        return await _slow("Proj")
+
+    async def _awareness(_pid, name):
+        return await _slow(ProjectAwareness(project_name=name))
+
+    def _loader(value):
+        async def _load(*_args):
+            return await _slow(value)
+        return _load
+
+    return (
+        patch("app.core.chat_context.get_project_name", _name),
+        patch("app.core.chat_context._safe_load_awareness", _awareness),
+        patch("app.core.chat_context._safe_load_confidence", _loader({"c": 1})),
+        patch("app.core.chat_context._safe_load_horizon", _loader({"h": 1})),
+        patch("app.core.chat_context._safe_load_warm_memory", _loader("warm")),
+        patch("app.core.chat_context._safe_load_next_actions", _loader(["next"])),
+        patch("app.core.chat_context._forge_enabled", return_value=False),
+        patch("app.core.chat_context.build_retrieval_context", retrieval),
+    )
+
+
+async def _assemble(predicted: ChatIntent, final: ChatIntent, classify_s: float = LOAD_S):
+    retrieval = AsyncMock(return_value="evidence")
+    p = _patches(retrieval)
+    with p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7]:
+        prefetch = start_context_prefetch(
+            "proj-1", "How do the personas use checkout?", None, None, MagicMock(),
+            conversation_id="conv-1", predicted_intent=predicted,
+        )
+        await asyncio.sleep(classify_s)  # intent classifier
+        start = time.monotonic()
+        ctx = await assemble_chat_context(
+            "proj-1", "How do the personas use checkout?", None, None, MagicMock(),
+            conversation_id="conv-1", intent=final, prefetch=prefetch,
+        )
+        join_s = time.monotonic() - start
+    return ctx, retrieval, prefetch, join_s
+
+
+@pytest.mark.asyncio
+async def test_loaders_overlap_classification():
+    ctx, retrieval, _, join_s = await _assemble(_intent(), _intent())
+
+    assert ctx.project_name == "Proj"
+    assert ctx.confidence_state == {"c": 1}
+    assert ctx.warm_memory == "warm"
+    assert ctx.next_actions == ["next"]
+    assert ctx.retrieval_context == "evidence"
+    retrieval.assert_awaited_once()
+    # project_name → awareness → retrieval is 2 loads deep; one was hidden
+    assert join_s < LOAD_S * 1.5
+
+
+@pytest.mark.asyncio
+async def test_mismatched_intent_reruns_retrieval_and_drops_skipped_loaders():
+    ctx, retrieval, prefetch, _ = await _assemble(
+        _intent("discuss", "full"), _intent("create", "light"),
+    )
+
+    # Speculative run (full) was cancelled before it reached retrieval
+    retrieval.assert_awaited_once()
+    assert retrieval.await_args.kwargs["skip_reranking"] is True
+    # Mutations skip confidence + horizon even if they were prefetched
+    assert ctx.confidence_state == {}
+    assert ctx.horizon_state == {}
+    assert ctx.retrieval_context == "evidence"
+    assert all(t.done() for t in prefetch.tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_strategy_none_cancels_speculative_retrieval():
+    ctx, _, prefetch, _ = await _assemble(
+        _intent("discuss", "full"), _intent("discuss", "none"), classify_s=0,
+    )
+
+    assert ctx.retrieval_context == ""
+    assert prefetch.retrieval.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_assemble_without_prefetch_still_loads_everything():
+    retrieval = AsyncMock(return_value="evidence")
+    p = _patches(retrieval)
+    with p[0], p[1], p[2], p[3], p[4], p[5], p[6], p[7]:
+        ctx = await assemble_chat_context(
+            "proj-1", "search for checkout", None, None, MagicMock(),
+            intent=_intent("search", "light", ["checkout"]),
+        )
+
+    assert ctx.project_name == "Proj"
+    assert ctx.warm_memory == ""  # no conversation yet
+    assert ctx.next_actions == []  # skipped for search
+    assert ctx.retrieval_context == "evidence"
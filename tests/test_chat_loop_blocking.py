@@ -0,0 +1,203 @@
+"""Event-loop blocking harness for the chat SSE generator.
+
+Runs a chat turn on a debug-mode event loop whose Supabase client sleeps on
+every ``execute()`` (simulating a slow database). The fake replaces the
+client get_supabase() returns, so the real context loaders and DB helpers
+run against it. asyncio logs any callback that holds the loop longer than
+``loop.slow_callback_duration``; the test fails if that happens. The LLM
+turn runs once unmeasured first, so lazy module imports (numpy via
+app.db.features, etc.) are paid before the measured turn, as in a warm server.
+Threshold: CHAT_LOOP_BLOCK_THRESHOLD_MS (default 100).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.chat_stream import ChatStreamConfig, flush_chat_messages, generate_chat_stream
+from app.core.write_behind import flush_writes
+
+THRESHOLD_S = int(os.environ.get("CHAT_LOOP_BLOCK_THRESHOLD_MS", "100")) / 1000
+DB_LATENCY_S = THRESHOLD_S * 2
+
+
+class _SlowQuery:
+    """Any query-builder chain; execute() blocks for DB_LATENCY_S."""
+
+    def __init__(self, db: "_SlowSupabase", name: str):
+        self._db = db
+        self._name = name
+        self._single = False
+        self._insert = False
+
+    def __getattr__(self, _attr: str):
+        return lambda *args, **kwargs: self
+
+    def single(self, *args: Any, **kwargs: Any) -> "_SlowQuery":
+        self._single = True
+        return self
+
+    maybe_single = single
+
+    def insert(self, row: Any, *args: Any, **kwargs: Any) -> "_SlowQuery":
+        self._db.inserts.append((self._name, row))
+        self._insert = True
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        self._db.queries.append(self._name)
+        time.sleep(DB_LATENCY_S)
+        if self._insert:
+            return SimpleNamespace(data=[{"id": "m1"}], count=1)
+        if self._single:
+            return SimpleNamespace(data=None, count=0)
+        return SimpleNamespace(data=[], count=0)
+
+
+class _SlowSupabase:
+    """Supabase client stand-in whose every query blocks for DB_LATENCY_S."""
+
+    def __init__(self):
+        self.queries: list[str] = []
+        self.inserts: list[tuple[str, Any]] = []
+
+    def table(self, name: str) -> _SlowQuery:
+        return _SlowQuery(self, name)
+
+    def rpc(self, name: str, *args: Any, **kwargs: Any) -> _SlowQuery:
+        return _SlowQuery(self, f"rpc:{name}")
+
+    def __getattr__(self, _attr: str):
+        return MagicMock()
+
+
+@pytest.fixture
+def slow_db():
+    """Make get_supabase() return a _SlowSupabase for the whole turn."""
+    from app.db import supabase_client
+
+    db = _SlowSupabase()
+    supabase_client.get_supabase.cache_clear()
+    with patch.object(supabase_client, "create_client", return_value=db):
+        yield db
+    supabase_client.get_supabase.cache_clear()
+
+
+class _FakeStream:
+    """Minimal stand-in for AsyncAnthropic().messages.stream(...)."""
+
+    def __init__(self, **_kwargs):
+        self._events = [
+            SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text="Hi")),
+        ]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for event in self._events:
+            yield event
+
+    async def get_final_message(self):
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="Hi")],
+            usage=SimpleNamespace(
+                input_tokens=10, output_tokens=2,
+                cache_read_input_tokens=0, cache_creation_input_tokens=0,
+            ),
+        )
+
+
+def _run_turn(
+    config: ChatStreamConfig, supabase: _SlowSupabase, debug: bool = True,
+) -> list[str]:
+    async def _consume() -> list[str]:
+        loop = asyncio.get_running_loop()
+        loop.slow_callback_duration = THRESHOLD_S
+        return [chunk async for chunk in generate_chat_stream(config, supabase)]
+
+    return asyncio.run(_consume(), debug=debug)
+
+
+def _slow_callbacks(caplog) -> list[str]:
+    return [
+        r.getMessage() for r in caplog.records
+        if r.name == "asyncio" and "took" in r.getMessage()
+    ]
+
+
+def _config(message: str) -> ChatStreamConfig:
+    return ChatStreamConfig(
+        project_id=uuid4(),
+        conversation_id=uuid4(),
+        message=message,
+        conversation_history=[],
+        anthropic_api_key="test",
+    )
+
+
+def test_fast_path_turn_does_not_block_loop(caplog, slow_db):
+    caplog.set_level(logging.WARNING, logger="asyncio")
+
+    with patch("app.core.chat_routing_log.enqueue_write") as routing_write:
+        events = _run_turn(_config("thanks"), slow_db)
+
+    assert any('"type": "done"' in e for e in events)
+    assert _slow_callbacks(caplog) == []
+    routing_write.assert_called_once()
+    assert flush_chat_messages(timeout=5.0)
+    assert [name for name, _ in slow_db.inserts] == ["messages", "messages"]  # user + assistant
+
+
+def test_llm_turn_does_not_block_loop(caplog, slow_db):
+    caplog.set_level(logging.WARNING, logger="asyncio")
+    intent = SimpleNamespace(
+        type="discuss", retrieval_strategy="none", complexity="simple",
+        classifier_source="regex", topics=[],
+    )
+    client = MagicMock()
+    client.messages.stream.side_effect = lambda **kw: _FakeStream(**kw)
+
+    async def _classify(*_args, **_kwargs):
+        return intent
+
+    async def _no_fast_path(*_args, **_kwargs):
+        return None
+
+    with (
+        patch("app.core.chat_stream.try_fast_path", _no_fast_path),
+        patch("app.core.chat_stream.classify_intent_async", _classify),
+        patch("anthropic.AsyncAnthropic", return_value=client),
+        patch("app.core.chat_stream.get_tools_for_context", return_value=[]),
+        patch("app.core.chat_routing_log.enqueue_write"),
+        patch("app.core.llm_usage.enqueue_write") as usage_write,
+    ):
+        # Warm-up turn (new project, so nothing below is served from cache)
+        _run_turn(_config("What should we focus on next?"), slow_db, debug=False)
+        caplog.clear()
+        slow_db.queries.clear()
+        usage_write.reset_mock()
+
+        events = _run_turn(_config("What should we focus on next?"), slow_db)
+
+    assert any('"content": "Hi"' in e for e in events)
+    assert any('"type": "done"' in e for e in events)
+    assert _slow_callbacks(caplog) == []
+    # The real context loaders ran against the slow database
+    assert len(slow_db.queries) > 3
+    usage_write.assert_called_once()
+    assert flush_chat_messages(timeout=5.0)
+    assert flush_writes(timeout=5.0)
@@ -0,0 +1,102 @@
+"""Tests for per-turn chat tool execution (app.chains.chat_tools.executor)."""
+
+import asyncio
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from app.chains.chat_tools import ToolExecutor
+
+PROJECT_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _fake_tools(calls: list, delay: float = 0.0):
+    async def execute_tool(project_id, tool_name, tool_input):
+        calls.append((tool_name, tool_input.get("action")))
+        await asyncio.sleep(delay)
+        return {"tool": tool_name, "n": len(calls)}
+
+    return execute_tool
+
+
+@pytest.mark.asyncio
+async def test_identical_reads_are_memoized_until_a_write():
+    calls: list = []
+    executor = ToolExecutor(PROJECT_ID)
+
+    with patch("app.chains.chat_tools.executor.execute_tool", _fake_tools(calls, 0.01)):
+        status = {"action": "status"}
+        first, second = await asyncio.gather(
+            executor.run("search", status), executor.run("search", dict(status))
+        )
+        again = await executor.run("search", {"action": "status"})
+        assert first == second == again
+        assert calls == [("search", "status")]
+
+        await executor.run("search", {"action": "pending"})
+        assert len(calls) == 2
+
+        await executor.run("write", {"action": "create"})
+        fresh = await executor.run("search", {"action": "status"})
+        assert fresh != first
+        assert calls[-1] == ("search", "status")
+        assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_memoized_and_timeouts_become_errors():
+    calls: list = []
+    executor = ToolExecutor(PROJECT_ID)
+
+    async def failing(project_id, tool_name, tool_input):
+        calls.append(tool_name)
+        return {"error": "boom"}
+
+    with patch("app.chains.chat_tools.executor.execute_tool", failing):
+        await executor.run("search", {"action": "status"})
+        await executor.run("search", {"action": "status"})
+    assert len(calls) == 2
+
+    with (
+        patch("app.chains.chat_tools.executor.execute_tool", _fake_tools([], delay=1)),
+        patch.dict("app.chains.chat_tools.executor._TOOL_TIMEOUTS", {"search": 0.01}),
+    ):
+        result = await executor.run("search", {"action": "documents"})
+    assert "timed out" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_mutating_tools_are_never_timed_out():
+    calls: list = []
+    executor = ToolExecutor(PROJECT_ID)
+
+    with (
+        patch("app.chains.chat_tools.executor.execute_tool", _fake_tools(calls, delay=0.05)),
+        patch.dict("app.chains.chat_tools.executor._TOOL_TIMEOUTS", {"process": 0.01}),
+    ):
+        result = await executor.run("process", {"action": "add_signal"})
+
+    assert "error" not in result
+    assert calls == [("process", "add_signal")]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_per_tool():
+    running = 0
+    peak = 0
+
+    async def tracked(project_id, tool_name, tool_input):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"ok": True}
+
+    executor = ToolExecutor(PROJECT_ID)
+    with patch("app.chains.chat_tools.executor.execute_tool", tracked):
+        await asyncio.gather(*[
+            executor.run("write", {"action": "create", "i": i}) for i in range(4)
+        ])
+    assert peak == 1
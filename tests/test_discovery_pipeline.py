@@ -0,0 +1,210 @@
+"""Tests for the async discovery pipeline graph nodes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.graphs.discovery_pipeline_graph import (
+    DiscoveryPipelineState,
+    parallel_intelligence,
+)
+
+
+def _state() -> DiscoveryPipelineState:
+    return DiscoveryPipelineState(
+        project_id=uuid4(),
+        run_id=uuid4(),
+        job_id=uuid4(),
+        company_name="Acme",
+        source_registry={"company": [{"url": "https://acme.test"}]},
+    )
+
+
+def _settings(timeout: float = 0.2, concurrency: int = 4) -> MagicMock:
+    settings = MagicMock()
+    settings.DISCOVERY_PHASE_TIMEOUT_SECONDS = timeout
+    settings.DISCOVERY_PHASE_CONCURRENCY = concurrency
+    settings.DISCOVERY_MAX_COMPETITORS = 5
+    return settings
+
+
+def _patches(settings: MagicMock, **chains):
+    defaults = {
+        "app.chains.discover_company.run_company_intelligence":
+            AsyncMock(return_value=({"name": "Acme"}, [{"cost_usd": 0.1}])),
+        "app.chains.discover_competitors.run_competitor_intelligence":
+            AsyncMock(return_value=([{"name": "Rival"}], [{"cost_usd": 0.2}])),
+        "app.chains.discover_market.run_market_evidence":
+            AsyncMock(return_value=([{"stat": "x"}], [])),
+        "app.chains.discover_user_voice.run_user_voice":
+            AsyncMock(return_value=([{"quote": "y"}], [])),
+    }
+    defaults.update(chains)
+    return [
+        patch("app.graphs.discovery_pipeline_graph.get_settings", return_value=settings),
+        *(patch(target, new=mock) for target, mock in defaults.items()),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_phase_timeout_is_isolated_and_progress_reported_per_phase():
+    async def hang(**_):
+        await asyncio.sleep(10)
+
+    updates = []
+    sb = MagicMock()
+    sb.table.return_value.update.side_effect = (
+        lambda row: updates.append(row["output"]) or MagicMock()
+    )
+
+    patches = _patches(
+        _settings(timeout=0.2),
+        **{"app.chains.discover_market.run_market_evidence": hang},
+    )
+    with patch("app.graphs.discovery_pipeline_graph.get_supabase", return_value=sb):
+        for p in patches:
+            p.start()
+        try:
+            result = await parallel_intelligence(_state())
+        finally:
+            for p in patches:
+                p.stop()
+
+    assert result["company_profile"] == {"name": "Acme"}
+    assert result["competitors"] == [{"name": "Rival"}]
+    assert result["user_voice"] == [{"quote": "y"}]
+    assert result["market_evidence"] == []
+    assert result["phase_errors"] == {"market_evidence": "Timed out after 0.2s"}
+    assert result["total_cost_usd"] == pytest.approx(0.3)
+
+    # One write when the node starts, then one per finished phase
+    assert len(updates) == 5
+    first_done = updates[1]
+    assert len(first_done["partial_results"]) == 1
+    final = updates[-1]
+    assert final["current_phase"] == "feature_analysis"
+    assert set(final["partial_results"]) == {"company_intel", "competitor_intel", "user_voice"}
+    assert final["phases"]["market_evidence"]["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_phase_concurrency_is_bounded():
+    running = 0
+    peak = 0
+
+    async def phase(**_):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return [], []
+
+    patches = _patches(
+        _settings(concurrency=2),
+        **{
+            "app.chains.discover_company.run_company_intelligence": phase,
+            "app.chains.discover_competitors.run_competitor_intelligence": phase,
+            "app.chains.discover_market.run_market_evidence": phase,
+            "app.chains.discover_user_voice.run_user_voice": phase,
+        },
+    )
+    with patch("app.graphs.discovery_pipeline_graph.get_supabase"):
+        for p in patches:
+            p.start()
+        try:
+            result = await parallel_intelligence(_state())
+        finally:
+            for p in patches:
+                p.stop()
+
+    assert peak == 2
+    assert result["phase_errors"] == {}
+
+
+@pytest.mark.asyncio
+async def test_synthesis_runs_off_the_event_loop():
+    import threading
+
+    from app.chains import discover_synthesis
+
+    threads = []
+
+    def fake_sync(**kwargs):
+        threads.append(threading.current_thread().name)
+        return {"signal_id": None, "entities_stored": {}}, []
+
+    with patch.object(discover_synthesis, "_run_synthesis_sync", fake_sync):
+        result, _ = await discover_synthesis.run_synthesis(
+            project_id=uuid4(), run_id=uuid4(), company_name="Acme",
+            company_profile={}, competitors=[], market_evidence=[], user_voice=[],
+            feature_matrix={}, gap_analysis=[], business_drivers=[], total_cost_usd=0.0,
+            persona_ids={}, feature_ids={}, workflow_ids={},
+        )
+
+    assert result["entities_stored"] == {}
+    assert threads and threads[0].startswith("pool-background")
+
+
+@pytest.mark.asyncio
+async def test_phases_share_one_llm_and_one_http_client_per_run():
+    from app.graphs import discovery_pipeline_graph as graph
+
+    seen: dict[str, tuple] = {}
+
+    def phase(name, result):
+        async def run(**kwargs):
+            seen[name] = (kwargs.get("client"), kwargs.get("http_client"))
+            return result
+        return run
+
+    seeded = {
+        "known_competitor_names": [], "known_competitor_urls": [], "known_pain_keywords": [],
+        "known_goal_keywords": [], "existing_company_info": {}, "has_pdl_enrichment": False,
+        "existing_driver_descriptions": [],
+    }
+    settings = _settings(timeout=1)
+    settings.ANTHROPIC_API_KEY = "k"
+    settings.DISCOVERY_MAX_COST_USD = 10
+    llm = MagicMock(close=AsyncMock())
+    patches = _patches(
+        settings,
+        **{
+            "app.chains.discover_company.run_company_intelligence":
+                phase("company", ({"name": "Acme"}, [])),
+            "app.chains.discover_competitors.run_competitor_intelligence":
+                phase("competitors", ([{"name": "Rival"}], [])),
+            "app.chains.discover_market.run_market_evidence": phase("market", ([], [])),
+            "app.chains.discover_user_voice.run_user_voice": phase("user_voice", ([], [])),
+            "app.chains.discover_sources.run_source_mapping":
+                phase("sources", ({"company": [{"url": "https://acme.test"}]}, [])),
+            "app.chains.discover_features.run_feature_analysis":
+                phase("features", ({}, [], [], [])),
+            "app.chains.discover_drivers.run_driver_synthesis": phase("drivers", ([], [])),
+            "app.chains.discover_synthesis.run_synthesis": AsyncMock(return_value=({}, [])),
+        },
+    )
+    with (
+        patch("anthropic.AsyncAnthropic", return_value=llm),
+        patch.object(graph, "_load_project_context", return_value={}),
+        patch.object(graph, "_load_seeded_context", return_value=seeded),
+        patch.object(graph, "_update_job_progress"),
+        patch.object(graph, "complete_job"),
+    ):
+        for p in patches:
+            p.start()
+        try:
+            result = await graph.run_discovery_pipeline(uuid4(), uuid4(), uuid4(), "Acme")
+        finally:
+            for p in patches:
+                p.stop()
+
+    assert result["success"] is True
+    http_clients = {http for _, http in seen.values() if http is not None}
+    assert len(http_clients) == 1 and http_clients.pop().is_closed
+    assert {llm_client for llm_client, _ in seen.values()} - {None} == {llm}
+    assert seen["company"] == (llm, seen["sources"][1])
+    assert seen["features"][0] is llm and seen["drivers"][0] is llm
+    llm.close.assert_awaited_once()
@@ -0,0 +1,168 @@
+"""Tests for materialized co-occurrence edges and their use in get_entity_neighborhood."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+from app.db.entity_cooccurrence import get_cooccurrences, refresh_cooccurrence
+
+SEED = "00000000-0000-0000-0000-000000000001"
+H1 = "00000000-0000-0000-0000-000000000002"
+H2 = "00000000-0000-0000-0000-000000000003"
+
+
+def _edge(a, b, count, times=None, b_type="feature"):
+    return {
+        "entity_a_id": a,
+        "entity_b_id": b,
+        "entity_b_type": b_type,
+        "shared_chunk_count": count,
+        "latest_chunk_at": (times or [None])[0],
+        "chunk_times": times or [],
+    }
+
+
+def _sb_returning(rows):
+    sb = MagicMock()
+    query = sb.table.return_value.select.return_value
+    for method in ("eq", "in_"):
+        ordered = getattr(query, method).return_value.order.return_value
+        ordered.limit.return_value.execute.return_value.data = rows
+    return sb
+
+
+class TestGetCooccurrences:
+    def test_groups_edges_by_seed(self):
+        sb = _sb_returning([_edge(SEED, H1, 4), _edge(H1, H2, 2)])
+        edges = get_cooccurrences([SEED, H1], sb=sb)
+        assert edges[SEED][H1]["weight"] == 4
+        assert edges[H1][H2]["entity_type"] == "feature"
+        sb.table.assert_called_once_with("entity_cooccurrence")
+
+    def test_recency_weighting(self):
+        recent = datetime.now(UTC).isoformat()
+        old = (datetime.now(UTC) - timedelta(days=60)).isoformat()
+        sb = _sb_returning([_edge(SEED, H1, 2, times=[recent, old])])
+        edge = get_cooccurrences([SEED], apply_recency=True, sb=sb)[SEED][H1]
+        assert edge["weight"] == 2.0  # 1.5 + 0.5
+        assert edge["freshness"] == recent[:10]
+
+    def test_returns_none_when_unreadable(self):
+        sb = MagicMock()
+        sb.table.side_effect = Exception("relation does not exist")
+        assert get_cooccurrences([SEED], sb=sb) is None
+
+    def test_empty_input(self):
+        assert get_cooccurrences([]) == {}
+
+
+class TestRefreshCooccurrence:
+    def test_dedupes_ids_and_calls_rpc(self):
+        sb = MagicMock()
+        sb.rpc.return_value.execute.return_value.data = 6
+        with patch("app.db.entity_cooccurrence.get_supabase", return_value=sb):
+            assert refresh_cooccurrence([UUID(SEED), SEED, H1]) == 6
+        sb.rpc.assert_called_once_with(
+            "refresh_entity_cooccurrence", {"p_entity_ids": [SEED, H1]}
+        )
+
+    def test_failure_is_swallowed(self):
+        sb = MagicMock()
+        sb.rpc.side_effect = Exception("boom")
+        with patch("app.db.entity_cooccurrence.get_supabase", return_value=sb):
+            assert refresh_cooccurrence([SEED]) == 0
+
+
+class TestHop2FromEdges:
+    def test_sums_bridges_and_picks_strongest_intermediary(self):
+        from app.db.graph_queries import _hop2_from_edges
+
+        hop1 = {
+            H1: {"entity_id": H1, "entity_type": "persona", "weight": 3},
+            "h1b": {"entity_id": "h1b", "entity_type": "feature", "weight": 1},
+        }
+        edges = {
+            H1: {H2: {"entity_id": H2, "entity_type": "feature", "weight": 4},
+                 SEED: {"entity_id": SEED, "entity_type": "feature", "weight": 3}},
+            "h1b": {H2: {"entity_id": H2, "entity_type": "feature", "weight": 2}},
+        }
+        with patch("app.db.graph_queries.get_cooccurrences", return_value=edges):
+            hop2 = _hop2_from_edges(MagicMock(), SEED, hop1, 10, False)
+
+        assert list(hop2) == [H2]
+        assert hop2[H2]["weight"] == 3  # (4 + 2) * 0.5
+        assert hop2[H2]["hop"] == 2
+        assert hop2[H2]["path"][0]["entity_id"] == H1
+
+    def test_none_when_edges_unavailable(self):
+        from app.db.graph_queries import _hop2_from_edges
+
+        with patch("app.db.graph_queries.get_cooccurrences", return_value=None):
+            assert _hop2_from_edges(MagicMock(), SEED, {H1: {}}, 10, False) is None
+
+    def test_hop1_entity_without_edges_is_unknown(self):
+        from app.db.graph_queries import _hop2_from_edges
+
+        with (
+            patch("app.db.graph_queries.get_cooccurrences", return_value={}),
+            patch("app.db.graph_queries.refresh_cooccurrence_later") as refresh_later,
+        ):
+            assert _hop2_from_edges(MagicMock(), SEED, {H1: {}}, 10, False) is None
+        refresh_later.assert_called_once_with([H1])
+
+
+class TestNeighborhoodWithoutEdges:
+    def _neighborhood(self, chunk_ids, join_result):
+        from app.db.graph_queries import get_entity_neighborhood
+
+        with (
+            patch("app.db.graph_queries.get_supabase", return_value=MagicMock()),
+            patch("app.db.graph_queries._get_chunk_ids_for_entity", return_value=chunk_ids),
+            patch("app.db.graph_queries.get_cooccurrences", return_value={}),
+            patch(
+                "app.db.graph_queries._get_cooccurrences_from_chunks",
+                return_value=join_result,
+            ) as join,
+            patch("app.db.graph_queries._resolve_entity_names_batch"),
+            patch("app.db.graph_queries.refresh_cooccurrence_later") as refresh_later,
+        ):
+            result = get_entity_neighborhood(UUID(SEED), "feature", UUID(H2))
+        return result, join, refresh_later
+
+    def test_empty_edges_with_evidence_fall_back_and_refresh(self):
+        hop1 = {H1: {"entity_id": H1, "entity_type": "persona", "weight": 2}}
+        result, join, refresh_later = self._neighborhood(["c1"], hop1)
+
+        join.assert_called_once()
+        refresh_later.assert_called_once_with([SEED])
+        assert [r["entity_id"] for r in result["related"]] == [H1]
+
+    def test_empty_edges_without_evidence_are_authoritative(self):
+        result, join, refresh_later = self._neighborhood([], {})
+
+        join.assert_not_called()
+        refresh_later.assert_not_called()
+        assert result["related"] == []
+
+
+def test_record_evidence_links_refreshes_once():
+    from app.db.patch_applicator import _record_evidence_links
+
+    ev = MagicMock(chunk_id="c1")
+    patches = [
+        MagicMock(evidence=[ev], target_entity_id=SEED, entity_type="feature"),
+        MagicMock(evidence=[ev], target_entity_id=H1, entity_type="persona"),
+    ]
+    applied = [
+        {"entity_id": SEED, "entity_type": "feature", "operation": "merge"},
+        {"entity_id": H1, "entity_type": "persona", "operation": "merge"},
+    ]
+    with (
+        patch("app.db.signals.record_chunk_impacts") as record,
+        patch("app.db.entity_cooccurrence.refresh_cooccurrence") as refresh,
+    ):
+        _record_evidence_links(patches, applied)
+
+    assert record.call_count == 2
+    assert all(c.kwargs["refresh_cooccurrence"] is False for c in record.call_args_list)
+    refresh.assert_called_once_with([SEED, H1])
@@ -0,0 +1,145 @@
+"""Tests for the cached in-memory entity graph (app.db.entity_graph)."""
+
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+from app.db.entity_graph import (
+    ProjectGraph,
+    get_project_graph,
+    invalidate_project_graph,
+)
+
+PROJECT = "10000000-0000-0000-0000-000000000000"
+GOAL = "00000000-0000-0000-0000-00000000000a"
+F1 = "00000000-0000-0000-0000-000000000001"
+F2 = "00000000-0000-0000-0000-000000000002"
+F3 = "00000000-0000-0000-0000-000000000003"
+P1 = "00000000-0000-0000-0000-000000000004"
+
+
+def _dep(src_type, src, tgt_type, tgt, confidence=0.7, disputed=False, dep_type="uses"):
+    return {
+        "source_entity_type": src_type,
+        "source_entity_id": src,
+        "target_entity_type": tgt_type,
+        "target_entity_id": tgt,
+        "dependency_type": dep_type,
+        "strength": 1.0,
+        "confidence": confidence,
+        "disputed": disputed,
+    }
+
+
+def _impact(entity_type, entity_id, chunk_id):
+    return {"entity_type": entity_type, "entity_id": entity_id, "chunk_id": chunk_id}
+
+
+DEPS = [
+    _dep("feature", F1, "business_driver", GOAL, dep_type="addresses"),
+    _dep("feature", F2, "feature", F1),
+    _dep("persona", P1, "feature", F2, dep_type="actor_of"),
+    _dep("feature", F3, "feature", F2, confidence=0.1),  # too weak for chains
+]
+
+IMPACTS = [
+    _impact("feature", F1, "c1"),
+    _impact("persona", P1, "c1"),
+    _impact("persona", P1, "c2"),
+    _impact("feature", F2, "c2"),
+    _impact("feature", F3, "c3"),
+]
+
+
+def _graph() -> ProjectGraph:
+    return ProjectGraph.build(PROJECT, DEPS, IMPACTS)
+
+
+class TestProjectGraph:
+    def test_link_distances_multi_source(self):
+        dist = _graph().link_distances({GOAL}, max_hops=5)
+        assert dist[GOAL] == 0
+        assert dist[F1] == 1
+        assert dist[F2] == 2
+        assert dist[P1] == 3
+        assert F3 not in dist  # confidence below threshold
+
+    def test_link_distances_respects_max_hops(self):
+        dist = _graph().link_distances({GOAL}, max_hops=2)
+        assert P1 not in dist
+
+    def test_disputed_links_excluded(self):
+        deps = [_dep("feature", F1, "business_driver", GOAL, disputed=True)]
+        dist = ProjectGraph.build(PROJECT, deps, []).link_distances({GOAL}, max_hops=5)
+        assert F1 not in dist
+
+    def test_dependents_matches_target_type(self):
+        graph = _graph()
+        rows = graph.dependents("feature", F2)
+        assert {r["source_entity_id"] for r in rows} == {P1, F3}
+        assert graph.dependents("persona", F2) == []
+
+    def test_dependencies(self):
+        rows = _graph().dependencies("feature", F1)
+        assert [r["target_entity_id"] for r in rows] == [GOAL]
+
+    def test_cooccurrences_counts_shared_chunks(self):
+        assert _graph().cooccurrences(P1) == {F1: 1, F2: 1}
+
+    def test_neighborhood_two_hops(self):
+        hops = _graph().neighborhood(F1, depth=2)
+        assert hops == {P1: 1, F2: 2}
+
+    def test_cooccurrence_path(self):
+        graph = _graph()
+        assert graph.cooccurrence_path(F1, F2, max_hops=3) == [F1, P1, F2]
+        assert graph.cooccurrence_path(F1, F2, max_hops=1) is None
+        assert graph.cooccurrence_path(F1, F3, max_hops=3) is None
+
+
+class TestGraphCache:
+    def test_cached_until_invalidated(self):
+        invalidate_project_graph(PROJECT)
+        with patch(
+            "app.db.entity_graph._load_project_graph", side_effect=lambda pid: _graph()
+        ) as load:
+            first = get_project_graph(PROJECT)
+            assert get_project_graph(UUID(PROJECT)) is first
+            assert load.call_count == 1
+
+            invalidate_project_graph(PROJECT)
+            assert get_project_graph(PROJECT) is not first
+            assert load.call_count == 2
+        invalidate_project_graph(PROJECT)
+
+
+class TestConsumers:
+    def test_batch_chain_completeness(self):
+        from app.core.pulse_engine import _batch_chain_completeness
+
+        sb = MagicMock()
+        sb.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [
+            {"id": GOAL, "driver_type": "goal"},
+        ]
+        with (
+            patch("app.db.entity_graph.get_project_graph", return_value=_graph()),
+            patch("app.db.supabase_client.get_supabase", return_value=sb),
+        ):
+            result = _batch_chain_completeness(
+                UUID(PROJECT), {"feature": [F1, F2, F3], "persona": [P1]}
+            )
+
+        assert result == {F1: True, F2: True, F3: False, P1: True}
+
+    def test_impact_analysis_traverses_in_memory(self):
+        from app.db.entity_dependencies import get_impact_analysis
+
+        with (
+            patch("app.db.entity_graph.get_project_graph", return_value=_graph()),
+            patch("app.db.entity_dependencies.get_supabase") as sb,
+        ):
+            result = get_impact_analysis(UUID(PROJECT), "feature", UUID(F1))
+
+        sb.assert_not_called()
+        assert [d["id"] for d in result["direct_impacts"]] == [F2]
+        assert {d["id"] for d in result["indirect_impacts"]} == {P1, F3}
+        assert result["total_affected"] == 3
@@ -0,0 +1,60 @@
+"""Tests for the workload executor pools (app/core/executors.py)."""
+
+import contextvars
+import threading
+
+import pytest
+
+from app.core.executors import WorkloadPool, get_pool
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def pool():
+    p = WorkloadPool("test", max_workers=1)
+    yield p
+    p.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_run_carries_context_and_records_metrics(pool):
+    request_id.set("req-1")
+
+    def _work(x):
+        return x * 2, request_id.get(), threading.current_thread().name
+
+    value, rid, thread = await pool.run(_work, 21)
+
+    assert (value, rid) == (42, "req-1")
+    assert thread.startswith("pool-test_")
+    stats = pool.stats()
+    assert stats["completed"] == 1 and stats["queued"] == 0 and stats["active"] == 0
+
+
+def test_admission_sheds_when_saturated(pool):
+    release = threading.Event()
+    running = pool.submit(release.wait, 5)
+    waiting = pool.submit(lambda: "queued")
+    try:
+        assert pool.saturated
+        assert pool.admit() is False
+        assert pool.stats()["shed"] == 1
+    finally:
+        release.set()
+    assert running.result(5) is True
+    assert waiting.result(5) == "queued"
+    assert pool.admit() is True
+    assert pool.stats()["wait_ms_max"] > 0
+
+
+def test_run_all_inside_own_worker_runs_inline(pool):
+    # With one worker, fanning out to the same pool from inside it would deadlock
+    nested = pool.submit(lambda: pool.run_all(lambda: 1, lambda: 2))
+    assert nested.result(5) == [1, 2]
+    assert pool.run_all(lambda: "a", lambda: "b") == ["a", "b"]
+
+
+def test_unknown_pool_name_rejected():
+    with pytest.raises(ValueError):
+        get_pool("gpu")
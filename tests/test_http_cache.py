@@ -0,0 +1,92 @@
+"""Tests for response compression and conditional GET (app.core.http_cache)."""
+
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.http_cache import HTTPCacheMiddleware
+
+PROJECT_ID = "11111111-1111-1111-1111-111111111111"
+BRD_PATH = f"/v1/projects/{PROJECT_ID}/workspace/brd"
+
+
+def _client() -> tuple[TestClient, dict]:
+    calls = {"brd": 0}
+    app = FastAPI()
+    app.add_middleware(HTTPCacheMiddleware, minimum_size=500, compresslevel=6)
+
+    @app.get(BRD_PATH)
+    async def brd():
+        calls["brd"] += 1
+        return {"features": ["x" * 20] * 100}
+
+    @app.get("/v1/projects/")
+    async def project_list():
+        return {"projects": [{"name": "Acme"}]}
+
+    @app.get("/v1/stream")
+    async def stream():
+        return StreamingResponse(iter([b"data: " + b"y" * 2000 + b"\n\n"]),
+                                 media_type="text/event-stream")
+
+    return TestClient(app), calls
+
+
+def test_versioned_route_returns_304_without_running_the_endpoint():
+    client, calls = _client()
+    version = AsyncMock(return_value=7)
+
+    with patch("app.core.http_cache._project_version", version):
+        first = client.get(BRD_PATH)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+
+        again = client.get(BRD_PATH, headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        assert calls["brd"] == 1
+
+        # Another write to the project: full response with a new ETag
+        version.return_value = 8
+        changed = client.get(BRD_PATH, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert calls["brd"] == 2
+
+        # Query parameters select a different representation
+        other = client.get(f"{BRD_PATH}?include_evidence=false", headers={"If-None-Match": etag})
+        assert other.status_code == 200
+
+
+def test_body_hash_route_and_unknown_version():
+    client, calls = _client()
+
+    first = client.get("/v1/projects/")
+    again = client.get("/v1/projects/", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+
+    # Version lookup failed: no ETag, never a 304
+    with patch("app.core.http_cache._project_version", AsyncMock(return_value=None)):
+        response = client.get(BRD_PATH, headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_large_json_is_gzipped_and_streams_are_not():
+    client, _ = _client()
+
+    with patch("app.core.http_cache._project_version", AsyncMock(return_value=1)):
+        response = client.get(BRD_PATH, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < 500
+    assert response.json()["features"][0] == "x" * 20
+
+    small = client.get("/v1/projects/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    stream = client.get("/v1/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in stream.headers
+    assert stream.text.startswith("data: ")
@@ -0,0 +1,154 @@
+"""Tests for the local embedding intent router and its use in classify_intent_async."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from app.context.intent_classifier import classify_intent_async
+from app.context.intent_router import (
+    load_intent_router,
+    routing_log_examples,
+    save_router,
+    train_router,
+)
+from app.core.embeddings import clear_query_embedding_cache, embed_queries_async
+
+DIM = 8
+EMBED_MODEL = "text-embedding-3-small"
+
+
+def _cluster(axis: int, n: int = 20, seed: int = 0) -> list[list[float]]:
+    rng = np.random.default_rng(seed + axis)
+    base = np.zeros(DIM)
+    base[axis] = 1.0
+    return (base + rng.normal(0, 0.05, (n, DIM))).tolist()
+
+
+def _model(min_confidence: float = 0.7):
+    embeddings = _cluster(0) + _cluster(1) + _cluster(2)
+    intents = ["plan"] * 20 + ["review"] * 20 + ["search"] * 20
+    strategies = ["full"] * 20 + ["light"] * 20 + ["full"] * 20
+    return train_router(
+        embeddings, intents, strategies,
+        version="20260101T000000Z", embedding_model=EMBED_MODEL,
+        min_confidence=min_confidence,
+    )
+
+
+def _axis(axis: int) -> list[float]:
+    v = [0.0] * DIM
+    v[axis] = 1.0
+    return v
+
+
+class TestRouterModel:
+    def test_predicts_cluster_labels(self):
+        intent, intent_p, strategy, strategy_p = _model().predict(_axis(1))
+        assert (intent, strategy) == ("review", "light")
+        assert intent_p > 0.7 and strategy_p > 0.7
+
+    def test_artifact_round_trip(self, tmp_path):
+        path = save_router(_model(), directory=tmp_path)
+        assert path.name == "intent_router-20260101T000000Z.json"
+
+        loaded = load_intent_router(path)
+        assert loaded is not None
+        assert loaded.predict(_axis(2))[0] == "search"
+        load_intent_router(tmp_path / "missing.json")  # reset module state
+
+    def test_embedding_model_mismatch_disables_router(self, tmp_path):
+        model = _model()
+        model.embedding_model = "some-other-model"
+        assert load_intent_router(save_router(model, directory=tmp_path)) is None
+
+
+def test_routing_log_examples_filters_untrusted_labels():
+    rows = [
+        {"raw_message": "Plan the rollout", "intent_type": "plan",
+         "retrieval_strategy": "full", "classifier_source": "haiku"},
+        {"raw_message": "plan the rollout", "intent_type": "discuss",
+         "retrieval_strategy": "light", "classifier_source": "haiku"},  # older duplicate
+        {"raw_message": "tell me more", "intent_type": "discuss",
+         "retrieval_strategy": "light", "classifier_source": "regex"},  # fall-through
+        {"raw_message": "find the quote", "intent_type": "search",
+         "retrieval_strategy": "full", "classifier_source": "regex"},
+        {"raw_message": "ok", "intent_type": "fast_path",
+         "retrieval_strategy": "none", "classifier_source": "regex"},
+        {"raw_message": "self", "intent_type": "plan",
+         "retrieval_strategy": "full", "classifier_source": "router"},
+    ]
+    assert routing_log_examples(rows) == [
+        ("Plan the rollout", "plan", "full"),
+        ("find the quote", "search", "full"),
+    ]
+
+
+class TestClassifyIntentAsync:
+    MESSAGE = "Let's think about how the rollout goes"
+
+    @pytest.mark.asyncio
+    async def test_confident_router_skips_haiku(self):
+        with (
+            patch("app.context.intent_router.get_intent_router", return_value=_model()),
+            patch("app.core.embeddings.embed_queries_async",
+                  new_callable=AsyncMock, return_value=[_axis(0)]),
+            patch("app.context.intent_classifier.classify_with_llm",
+                  new_callable=AsyncMock) as haiku,
+        ):
+            intent = await classify_intent_async(self.MESSAGE)
+
+        haiku.assert_not_called()
+        assert intent.type == "plan"
+        assert intent.retrieval_strategy == "full"
+        assert intent.classifier_source == "router"
+
+    @pytest.mark.asyncio
+    async def test_unsure_router_falls_back_to_haiku(self):
+        with (
+            patch("app.context.intent_router.get_intent_router",
+                  return_value=_model(min_confidence=0.999)),
+            patch("app.core.embeddings.embed_queries_async",
+                  new_callable=AsyncMock, return_value=[[1.0] * DIM]),
+            patch("app.context.intent_classifier.classify_with_llm",
+                  new_callable=AsyncMock, return_value=None) as haiku,
+        ):
+            intent = await classify_intent_async(self.MESSAGE)
+
+        haiku.assert_awaited_once()
+        assert intent.classifier_source == "regex"
+
+    @pytest.mark.asyncio
+    async def test_no_artifact_falls_back_to_haiku(self):
+        with (
+            patch("app.context.intent_router.get_intent_router", return_value=None),
+            patch("app.context.intent_classifier.classify_with_llm",
+                  new_callable=AsyncMock, return_value=None) as haiku,
+        ):
+            await classify_intent_async(self.MESSAGE)
+        haiku.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_shared_between_router_and_retrieval():
+    clear_query_embedding_cache()
+    calls: list[list[str]] = []
+
+    async def _embed(texts):
+        calls.append(list(texts))
+        await asyncio.sleep(0.01)
+        return [[float(len(t))] for t in texts]
+
+    with patch("app.core.embeddings.embed_texts_async", _embed):
+        first, second = await asyncio.gather(
+            embed_queries_async(["a question"]),
+            embed_queries_async(["a question", "sub query"]),
+        )
+        third = await embed_queries_async(["sub query", "a question"])
+
+    assert calls == [["a question"], ["sub query"]]
+    assert first == [[10.0]]
+    assert second == [[10.0], [9.0]]
+    assert third == [[9.0], [10.0]]
+    clear_query_embedding_cache()
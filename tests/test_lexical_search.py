@@ -0,0 +1,84 @@
+"""Tests for lexical search (app/core/lexical_search.py)."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.core.lexical_search import (
+    BM25Index,
+    fuse_rankings,
+    rank_names,
+    resolve_entity_names,
+    search_knowledge,
+)
+
+
+def test_bm25_ranks_rarer_matching_terms_higher():
+    index = BM25Index([
+        ("n1", "Users export invoices to CSV every month"),
+        ("n2", "Users want faster onboarding"),
+        ("n3", "Finance team reconciles invoices manually"),
+    ])
+
+    ranked = index.search("invoice export", limit=5)
+
+    assert [doc_id for doc_id, _ in ranked] == ["n1"]  # no stemming: only n1 has "export"
+    assert index.search("invoices", limit=5)[0][0] in {"n1", "n3"}
+    assert index.search("unrelated words") == []
+
+
+def test_rank_names_prefers_exact_then_fuzzy():
+    rows = [
+        {"id": "a", "name": "Invoice Export"},
+        {"id": "b", "name": "Export"},
+        {"id": "c", "name": "Onboarding Wizard"},
+    ]
+
+    ranked = rank_names("export", rows, "name")
+
+    assert [r["id"] for r in ranked] == ["b", "a"]
+    assert ranked[0]["score"] == 1.0
+    # Typos still resolve
+    assert rank_names("onbording wizzard", rows, "name")[0]["id"] == "c"
+
+
+def test_fuse_rankings_rewards_items_in_both_lists():
+    lexical = [{"id": "x", "summary": "lex"}, {"id": "y"}]
+    vector = [{"id": "y", "summary": "vec"}, {"id": "z"}]
+
+    fused = fuse_rankings([lexical, vector])
+
+    assert [i["id"] for i in fused] == ["y", "x", "z"]
+    assert fused[0]["fused_score"] > fused[1]["fused_score"]
+
+
+def test_resolve_entity_names_uses_rpc():
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(
+        data=[{"id": "f1", "name": "Invoice Export", "score": 0.8}]
+    )
+    pid = uuid4()
+
+    with patch("app.core.lexical_search.get_supabase", return_value=sb):
+        matches = resolve_entity_names(pid, "vp_step", "invoice", limit=1)
+
+    assert matches[0]["id"] == "f1"
+    sb.rpc.assert_called_once_with("search_entity_names", {
+        "p_project_id": str(pid), "p_entity_type": "vp_step", "p_query": "invoice", "p_limit": 1,
+    })
+    sb.table.assert_not_called()
+
+
+def test_search_knowledge_falls_back_to_bm25_when_rpc_missing():
+    sb = MagicMock()
+    sb.rpc.return_value.execute.side_effect = RuntimeError("function does not exist")
+    sb.table.return_value.select.return_value.eq.return_value.eq.return_value \
+        .limit.return_value.execute.return_value = MagicMock(data=[
+            {"id": "n1", "node_type": "fact", "summary": "CFO approves invoices weekly"},
+            {"id": "n2", "node_type": "belief", "summary": "Onboarding takes two weeks"},
+        ])
+
+    with patch("app.core.lexical_search.get_supabase", return_value=sb):
+        nodes = search_knowledge(uuid4(), "invoices approval")
+
+    assert [n["id"] for n in nodes] == ["n1"]
+    assert nodes[0]["score"] > 0
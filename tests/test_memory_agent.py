@@ -15,6 +15,13 @@ from app.agents.memory_agent import (
     MemoryWatcher,
 )
 
+
+def _fake_create_nodes(project_id, nodes, edges=None):
+    """Stand-in for create_nodes: every node and edge is created."""
+    created = [{"id": str(uuid4()), **node} for node in nodes]
+    return {"nodes": created, "edges": [{"id": str(uuid4())} for _ in edges or []]}
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -124,7 +131,7 @@ class TestMemoryWatcher:
             with patch("app.agents.memory_agent.get_recent_facts", return_value=sample_facts):
                 with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                     with patch("app.agents.memory_agent.complete_synthesis_log"):
-                        with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
+                        with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
                             with patch.object(
                                 MemoryWatcher,
                                 "__init__",
@@ -170,7 +177,7 @@ class TestMemoryWatcher:
             with patch("app.agents.memory_agent.get_recent_facts", return_value=sample_facts):
                 with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                     with patch("app.agents.memory_agent.complete_synthesis_log"):
-                        with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
+                        with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
                             with patch.object(
                                 MemoryWatcher,
                                 "__init__",
@@ -211,7 +218,7 @@ class TestMemoryWatcher:
             with patch("app.agents.memory_agent.get_recent_facts", return_value=sample_facts):
                 with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                     with patch("app.agents.memory_agent.complete_synthesis_log"):
-                        with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
+                        with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
                             with patch.object(
                                 MemoryWatcher,
                                 "__init__",
@@ -298,8 +305,8 @@ class TestMemorySynthesizer:
                     with patch("app.agents.memory_agent.get_edges_to_node", return_value=[]):
                         with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                             with patch("app.agents.memory_agent.complete_synthesis_log"):
-                                with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
-                                    with patch("app.agents.memory_agent.create_edge"):
+                                with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
+                                    with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
                                         with patch.object(
                                             MemorySynthesizer,
                                             "__init__",
@@ -404,8 +411,8 @@ class TestMemoryReflector:
                         with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                             with patch("app.agents.memory_agent.complete_synthesis_log"):
                                 with patch("app.agents.memory_agent.archive_old_insights", return_value=0):
-                                    with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
-                                        with patch("app.agents.memory_agent.create_edge"):
+                                    with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
+                                        with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
                                             with patch.object(
                                                 MemoryReflector,
                                                 "__init__",
@@ -464,7 +471,7 @@ class TestIntegrationHelpers:
             with patch("app.agents.memory_agent.get_recent_facts", return_value=[]):
                 with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                     with patch("app.agents.memory_agent.complete_synthesis_log"):
-                        with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
+                        with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
                             with patch("app.agents.memory_agent.Anthropic") as mock_anthropic:
                                 mock_client = MagicMock()
                                 mock_client.messages.create.return_value = mock_response
@@ -0,0 +1,145 @@
+"""Tests for set-based contradiction detection (memory_contradiction)."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.memory_contradiction import (
+    clear_classification_cache,
+    detect_contradictions,
+    invalidate_belief_matrix,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    clear_classification_cache()
+    invalidate_belief_matrix()
+    yield
+    clear_classification_cache()
+    invalidate_belief_matrix()
+
+
+def _unit(*values: float) -> list[float]:
+    return list(values) + [0.0] * (4 - len(values))
+
+
+BELIEFS = [
+    {"id": "b-budget", "summary": "Budget is growing", "content": "", "embedding": _unit(1.0)},
+    {"id": "b-mobile", "summary": "Mobile first", "content": "", "embedding": _unit(0, 1.0)},
+    {"id": "b-other", "summary": "Unrelated", "content": "", "embedding": _unit(0, 0, 0, 1.0)},
+]
+FACTS = [{"summary": "Budget was cut in half"}, {"summary": "Users mostly on phones"}]
+FACT_EMBEDDINGS = [_unit(0.8, 0.6), _unit(0.3, 0.9)]
+
+
+def _classifier(calls: list, verdicts: dict[str, str]):
+    async def _classify(pairs):
+        calls.append([p["belief_id"] for p in pairs])
+        for p in pairs:
+            p["relationship"] = verdicts[p["belief_id"]]
+        return True
+    return _classify
+
+
+async def _embed(_texts):
+    return FACT_EMBEDDINGS
+
+
+@pytest.mark.asyncio
+async def test_in_memory_search_and_pair_cache():
+    calls: list = []
+    classify = _classifier(calls, {"b-budget": "contradicts", "b-mobile": "supports"})
+    with (
+        patch("app.core.embeddings.embed_texts_async", _embed),
+        patch("app.core.memory_contradiction._classify_relationships", classify),
+        patch("app.db.supabase_client.get_supabase") as get_sb,
+    ):
+        first = await detect_contradictions(uuid4(), FACTS, existing_beliefs=BELIEFS)
+        second = await detect_contradictions(uuid4(), FACTS, existing_beliefs=BELIEFS)
+
+    get_sb.assert_not_called()
+    assert calls == [["b-mobile", "b-budget"]]  # one Haiku call, most similar first
+    for result in (first, second):
+        assert {(r["belief_id"], r["relationship"]) for r in result} == {
+            ("b-budget", "contradicts"), ("b-mobile", "supports"),
+        }
+
+
+@pytest.mark.asyncio
+async def test_large_project_uses_one_batched_rpc():
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(data=[
+        {"query_index": 0, "node_id": "b-budget", "summary": "Budget is growing",
+         "similarity": 0.8},
+        {"query_index": 1, "node_id": "b-mobile", "summary": "Mobile first", "similarity": 0.99},
+        {"query_index": 1, "node_id": "b-other", "summary": "Unrelated", "similarity": 0.4},
+    ])
+    calls: list = []
+    with (
+        patch("app.core.embeddings.embed_texts_async", _embed),
+        patch("app.core.memory_contradiction._project_belief_matrix", return_value=None),
+        patch("app.core.memory_contradiction._classify_relationships",
+              _classifier(calls, {"b-budget": "unrelated"})),
+        patch("app.db.supabase_client.get_supabase", return_value=sb),
+    ):
+        result = await detect_contradictions(uuid4(), FACTS)
+
+    sb.rpc.assert_called_once()
+    name, params = sb.rpc.call_args[0]
+    assert name == "match_memory_nodes_batch"
+    assert params["query_embeddings"] == FACT_EMBEDDINGS
+    # 0.99 is a restatement (no Haiku), 0.4 is below the band
+    assert calls == [["b-budget"]]
+    assert [(r["belief_id"], r["relationship"]) for r in result] == [("b-mobile", "supports")]
+
+
+@pytest.mark.asyncio
+async def test_failed_classification_is_not_cached():
+    async def _fail(_pairs):
+        return False
+
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(data=[
+        {"query_index": 0, "node_id": "b-budget", "summary": "Budget is growing",
+         "similarity": 0.9},
+        {"query_index": 1, "node_id": "b-mobile", "summary": "Mobile first", "similarity": 0.75},
+    ])
+    calls: list = []
+    with (
+        patch("app.core.embeddings.embed_texts_async", _embed),
+        patch("app.core.memory_contradiction._project_belief_matrix", return_value=None),
+        patch("app.db.supabase_client.get_supabase", return_value=sb),
+    ):
+        with patch("app.core.memory_contradiction._classify_relationships", _fail):
+            result = await detect_contradictions(uuid4(), FACTS)
+        with patch("app.core.memory_contradiction._classify_relationships",
+                   _classifier(calls, {"b-budget": "supports", "b-mobile": "unrelated"})):
+            await detect_contradictions(uuid4(), FACTS)
+
+    # Only high-similarity pairs survive a failed call, still unclassified
+    assert [(r["belief_id"], r["relationship"]) for r in result] == [
+        ("b-budget", "pending_classification"),
+    ]
+    assert calls == [["b-budget", "b-mobile"]]
+
+
+@pytest.mark.asyncio
+async def test_negated_restatement_is_classified_not_auto_supported():
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(data=[
+        {"query_index": 0, "node_id": "b-sso", "summary": "SSO is required", "similarity": 0.98},
+    ])
+    calls: list = []
+    with (
+        patch("app.core.embeddings.embed_texts_async", _embed),
+        patch("app.core.memory_contradiction._project_belief_matrix", return_value=None),
+        patch("app.core.memory_contradiction._classify_relationships",
+              _classifier(calls, {"b-sso": "contradicts"})),
+        patch("app.db.supabase_client.get_supabase", return_value=sb),
+    ):
+        result = await detect_contradictions(uuid4(), [{"summary": "SSO is not required"}])
+
+    assert calls == [["b-sso"]]
+    assert [(r["belief_id"], r["relationship"]) for r in result] == [("b-sso", "contradicts")]
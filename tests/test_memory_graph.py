@@ -14,6 +14,13 @@ import pytest
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def no_background_embeddings():
+    """Keep deferred node embeddings from reaching OpenAI in a worker thread."""
+    with patch("app.db.memory_graph._embedding_queue"):
+        yield
+
+
 @pytest.fixture
 def project_id():
     """Sample project UUID."""
@@ -204,6 +211,85 @@ class TestCreateNode:
             assert call_args["linked_entity_id"] == str(entity_id)
 
 
+class TestCreateNodes:
+    """Tests for the create_nodes bulk API and deferred embeddings."""
+
+    def test_one_insert_for_nodes_and_one_for_edges(self, project_id, mock_supabase):
+        """Nodes go in one insert; edges resolve batch indexes and go in one upsert."""
+        fact_id, belief_id, existing_id = str(uuid4()), str(uuid4()), str(uuid4())
+        mock_supabase.upsert.return_value = mock_supabase
+        mock_supabase.execute.side_effect = [
+            MagicMock(data=[
+                {"id": fact_id, "summary": "Deadline is Q2", "content": "Q2 compliance deadline"},
+                {"id": belief_id, "summary": "Compliance drives scope", "content": "..."},
+            ]),
+            MagicMock(data=[{"id": str(uuid4())}, {"id": str(uuid4())}]),
+        ]
+
+        with (
+            patch("app.db.memory_graph.get_supabase", return_value=mock_supabase),
+            patch("app.db.memory_graph._queue_node_embeddings") as queue_embeddings,
+        ):
+            from app.db.memory_graph import create_nodes
+
+            result = create_nodes(
+                project_id,
+                [
+                    {"node_type": "fact", "content": "Q2 compliance deadline",
+                     "summary": "Deadline is Q2", "confidence": 0.3},
+                    {"node_type": "belief", "content": "...",
+                     "summary": "Compliance drives scope", "confidence": 0.7},
+                ],
+                edges=[
+                    {"from": 0, "to": 1, "edge_type": "supports"},
+                    {"from": existing_id, "to": 1, "edge_type": "supports"},
+                    {"from": "not-a-uuid", "to": 1, "edge_type": "supports"},
+                    {"from": 5, "to": 1, "edge_type": "supports"},
+                ],
+            )
+
+        rows = mock_supabase.insert.call_args[0][0]
+        mock_supabase.insert.assert_called_once()
+        assert [r["confidence"] for r in rows] == [1.0, 0.7]  # facts forced to 1.0
+
+        edges = mock_supabase.upsert.call_args[0][0]
+        assert [(e["from_node_id"], e["to_node_id"]) for e in edges] == [
+            (fact_id, belief_id),
+            (existing_id, belief_id),
+        ]
+        assert mock_supabase.upsert.call_args.kwargs["ignore_duplicates"] is True
+        assert len(result["nodes"]) == 2 and len(result["edges"]) == 2
+        queue_embeddings.assert_called_once_with(project_id, result["nodes"])
+
+    def test_embeddings_coalesce_into_one_flush(self, project_id, mock_supabase):
+        """Nodes queued before the flush runs share one embed call and one RPC."""
+        jobs = []
+        nodes = [
+            {"id": str(uuid4()), "summary": f"Summary number {i}", "content": "body"}
+            for i in range(3)
+        ]
+        with patch("app.db.memory_graph._embedding_queue") as queue:
+            queue.submit.side_effect = lambda fn, label: jobs.append(fn)
+            from app.db.memory_graph import _queue_node_embeddings
+
+            _queue_node_embeddings(project_id, nodes[:1])
+            _queue_node_embeddings(project_id, nodes[1:] + [{"id": str(uuid4()), "summary": "x"}])
+
+        assert len(jobs) == 1
+
+        with (
+            patch("app.db.memory_graph.get_supabase", return_value=mock_supabase),
+            patch("app.core.embeddings.embed_texts", return_value=[[0.1]] * 3) as embed,
+        ):
+            jobs[0]()
+
+        embed.assert_called_once()
+        assert len(embed.call_args[0][0]) == 3  # too-short text skipped
+        name, params = mock_supabase.rpc.call_args[0]
+        assert name == "set_memory_node_embeddings"
+        assert [r["id"] for r in params["p_rows"]] == [n["id"] for n in nodes]
+
+
 class TestGetNodes:
     """Tests for node retrieval functions."""
 
@@ -10,6 +10,13 @@ from uuid import uuid4
 
 import pytest
 
+
+def _fake_create_nodes(project_id, nodes, edges=None):
+    """Stand-in for create_nodes: every node and edge is created."""
+    created = [{"id": str(uuid4()), **node} for node in nodes]
+    return {"nodes": created, "edges": [{"id": str(uuid4())} for _ in edges or []]}
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -142,9 +149,12 @@ class TestSignalToMemoryFlow:
                 with patch("app.agents.memory_agent.get_recent_facts", return_value=[]):
                     with patch("app.agents.memory_agent.get_all_edges", return_value=[]):
                         with patch("app.agents.memory_agent.get_edges_to_node", return_value=[]):
-                            with patch("app.agents.memory_agent.create_node") as mock_create:
-                                mock_create.side_effect = [created_node, created_belief]
-                                with patch("app.agents.memory_agent.create_edge"):
+                            with patch("app.agents.memory_agent.create_nodes") as mock_create:
+                                mock_create.side_effect = [
+                                    {"nodes": [created_node], "edges": []},
+                                    {"nodes": [created_belief], "edges": [{}]},
+                                ]
+                                with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
                                     with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                                         with patch("app.agents.memory_agent.complete_synthesis_log"):
                                             with patch("app.agents.memory_agent.Anthropic") as mock_anthropic:
@@ -295,8 +305,8 @@ class TestContradictionHandling:
                 with patch("app.agents.memory_agent.get_recent_facts", return_value=[]):
                     with patch("app.agents.memory_agent.get_all_edges", return_value=[]):
                         with patch("app.agents.memory_agent.get_edges_to_node", return_value=[]):
-                            with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
-                                with patch("app.agents.memory_agent.create_edge"):
+                            with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
+                                with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
                                     with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                                         with patch("app.agents.memory_agent.complete_synthesis_log"):
                                             with patch("app.agents.memory_agent.update_belief_confidence") as mock_update:
@@ -344,8 +354,8 @@ class TestReflectionFlow:
                 with patch("app.agents.memory_agent.get_recent_facts", return_value=[]):
                     with patch("app.agents.memory_agent.get_insights", return_value=[]):
                         with patch("app.agents.memory_agent.get_all_edges", return_value=[]):
-                            with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
-                                with patch("app.agents.memory_agent.create_edge"):
+                            with patch("app.agents.memory_agent.create_nodes", side_effect=_fake_create_nodes):
+                                with patch("app.agents.memory_agent.create_node", return_value={"id": str(uuid4())}):
                                     with patch("app.agents.memory_agent.start_synthesis_log", return_value=uuid4()):
                                         with patch("app.agents.memory_agent.complete_synthesis_log"):
                                             with patch("app.agents.memory_agent.archive_old_insights", return_value=0):
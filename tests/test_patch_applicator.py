@@ -876,3 +876,40 @@ class TestResolveTargetEntityId:
         assert result.merged_count == 1
         assert result.total_applied == 1
         assert full_id in result.entity_ids_modified
+
+
+class TestRevisionBatching:
+    @pytest.mark.asyncio
+    async def test_patch_set_versioned_in_one_call(self, project_id, run_id, signal_id):
+        """All revisions of a patch set are written with one insert call."""
+        mock_sb, mock_table = _mock_supabase()
+        ids = [str(uuid4()), str(uuid4())]
+        mock_table.execute.side_effect = [
+            MagicMock(data=[]),  # auto_confirm project lookup
+            MagicMock(data=[{"id": ids[0], "name": "SSO"}]),
+            MagicMock(data=[{"id": ids[1], "name": "Audit log"}]),
+        ] + [MagicMock(data=[])] * 50
+
+        patches = [
+            EntityPatch(
+                operation="create", entity_type="feature", payload={"name": name},
+                confidence="high", source_authority="client",
+            )
+            for name in ("SSO", "Audit log")
+        ]
+
+        with (
+            patch("app.db.patch_applicator.get_supabase", return_value=mock_sb),
+            patch("app.db.patch_applicator._record_state_revision"),
+            patch("app.db.patch_applicator._record_evidence_links"),
+            patch("app.core.change_tracking.insert_enrichment_revisions",
+                  return_value=[]) as insert_revisions,
+        ):
+            result = await apply_entity_patches(project_id, patches, run_id, signal_id)
+
+        assert result.created_count == 2
+        insert_revisions.assert_called_once()
+        rows = insert_revisions.call_args[0][0]
+        assert [str(r["entity_id"]) for r in rows] == ids
+        assert {r["revision_type"] for r in rows} == {"created"}
+        assert all("revision_number" not in r for r in rows)
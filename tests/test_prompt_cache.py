@@ -0,0 +1,132 @@
+"""Tests for prompt-cache-aware prompt assembly (app.core.prompt_cache).
+
+The stable-prefix tests build real prompts for two different calls and
+require the cached prefix to be byte-identical: a timestamp, ID or other
+per-call value leaking into a cached tier makes them fail.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core import prompt_cache
+from app.core.llm_usage import _estimate_cost, anthropic_usage_tokens
+from app.core.prompt_cache import (
+    PromptSegment,
+    Stability,
+    assemble_system,
+    cached_prefixes,
+    warm_prompt_cache,
+)
+
+
+def test_segments_are_ordered_static_first_with_breakpoints_at_tier_ends():
+    blocks = assemble_system([
+        PromptSegment("question", Stability.CALL),
+        PromptSegment("brd", Stability.PROJECT),
+        PromptSegment("rules"),
+        PromptSegment(""),
+        PromptSegment("schema"),
+    ])
+
+    assert [b["text"] for b in blocks] == ["rules", "schema", "brd", "question"]
+    assert ["cache_control" in b for b in blocks] == [False, True, True, False]
+
+    # Fewer breakpoints than tiers: keep the longest prefix
+    blocks = assemble_system(
+        [PromptSegment("rules"), PromptSegment("brd", Stability.PROJECT)], max_breakpoints=1
+    )
+    assert ["cache_control" in b for b in blocks] == [False, True]
+
+
+def test_static_prefix_drift_is_logged():
+    prompt_cache._static_fingerprints.pop("drift_test", None)
+    with patch.object(prompt_cache, "logger") as logger:
+        assemble_system([PromptSegment("rules v1")], name="drift_test")
+        assemble_system([PromptSegment("rules v1")], name="drift_test")
+        logger.warning.assert_not_called()
+        assemble_system([PromptSegment("rules v2")], name="drift_test")
+        logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_only_for_cacheable_prefixes():
+    usage = SimpleNamespace(input_tokens=3, output_tokens=1, cache_creation_input_tokens=5000)
+    client = MagicMock()
+    client.messages.create = AsyncMock(return_value=SimpleNamespace(usage=usage))
+    short = assemble_system([PromptSegment("rules")])
+    long = assemble_system([PromptSegment("x" * 20000)])
+
+    with patch("app.core.llm_usage.log_llm_usage") as log_usage:
+        assert await warm_prompt_cache(client, "claude-haiku-4-5-20251001", short) is False
+        assert await warm_prompt_cache(client, "claude-haiku-4-5-20251001", long) is True
+
+    client.messages.create.assert_awaited_once()
+    assert client.messages.create.call_args.kwargs["max_tokens"] == 1
+    assert log_usage.call_args.kwargs["tokens_cache_create"] == 5000
+
+
+def test_usage_tokens_and_cost_count_cache_reads_and_writes():
+    usage = SimpleNamespace(
+        input_tokens=100, output_tokens=10,
+        cache_read_input_tokens=1000, cache_creation_input_tokens=None,
+    )
+    assert anthropic_usage_tokens(usage) == {
+        "tokens_input": 100,
+        "tokens_output": 10,
+        "tokens_cache_read": 1000,
+        "tokens_cache_create": 0,
+    }
+    # $3/M input: 100 + 1000 * 0.1 + 1000 * 1.25 = 1450 input-equivalent tokens
+    assert _estimate_cost("claude-sonnet-4-6", 100, 0, 1000, 1000) == pytest.approx(0.00435)
+
+
+# ── Stable prefixes of real prompts ───────────────────────────────
+
+
+def _compiled(project_name: str, mode, retrieval: str):
+    from app.context.project_awareness import ProjectAwareness
+    from app.context.prompt_compiler import (
+        CognitiveFrame,
+        ConfidencePosture,
+        Scope,
+        TemporalEmphasis,
+        compile_prompt,
+    )
+
+    frame = CognitiveFrame(
+        mode, TemporalEmphasis.PRESENT_STATE, Scope.CONTEXTUAL, ConfidencePosture.EXPLORATORY
+    )
+    return compile_prompt(
+        frame, ProjectAwareness(project_name=project_name, active_phase="brd"),
+        "brd:features", None,
+        retrieval_context=retrieval,
+        solution_flow_ctx=None,
+        confidence_state={},
+        horizon_state={},
+    )
+
+
+def test_chat_prompt_prefix_is_stable_across_turns_and_projects():
+    from app.context.prompt_compiler import CognitiveMode
+
+    first = assemble_system(_compiled("Acme", CognitiveMode.DISCOVER, "payments").segments)
+    next_turn = assemble_system(_compiled("Acme", CognitiveMode.REFINE, "invoices").segments)
+    other_project = assemble_system(_compiled("Globex", CognitiveMode.DISCOVER, "").segments)
+
+    assert len(cached_prefixes(first)) == 2
+    assert cached_prefixes(first) == cached_prefixes(next_turn)
+    assert cached_prefixes(first)[0] == cached_prefixes(other_project)[0]
+    assert "Acme" not in cached_prefixes(first)[0]
+
+
+def test_solution_flow_and_builder_prefixes_are_stable_across_projects():
+    from app.chains.solution_flow_v4 import architecture, insights
+    from app.pipeline.builder import _builder_system
+
+    for build in (architecture._system_blocks, insights._system_blocks, _builder_system):
+        acme, globex = build("Acme BRD"), build("Globex BRD")
+        assert cached_prefixes(acme)[0] == cached_prefixes(globex)[0]
+        assert cached_prefixes(acme)[-1] == cached_prefixes(build("Acme BRD"))[-1]
+        assert "Acme" not in cached_prefixes(acme)[0]
@@ -0,0 +1,72 @@
+"""Tests for batched enrichment revision inserts and checkpoint reconstruction."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.db.revisions_enrichment import (
+    apply_revision_delta,
+    attach_revision_snapshots,
+    insert_enrichment_revisions,
+)
+
+
+def test_batch_insert_maps_server_numbers_back_to_input_order():
+    a, b = str(uuid4()), str(uuid4())
+    revisions = [
+        {"project_id": uuid4(), "entity_type": "feature", "entity_id": a, "entity_label": "A1"},
+        {"project_id": uuid4(), "entity_type": "persona", "entity_id": b, "entity_label": "B1",
+         "run_id": None},
+        {"project_id": uuid4(), "entity_type": "feature", "entity_id": a, "entity_label": "A2"},
+    ]
+    sb = MagicMock()
+    # RPC returns rows grouped by entity, in revision order
+    sb.rpc.return_value.execute.return_value = MagicMock(data=[
+        {"id": "r1", "entity_type": "feature", "entity_id": a, "revision_number": 4},
+        {"id": "r2", "entity_type": "feature", "entity_id": a, "revision_number": 5},
+        {"id": "r3", "entity_type": "persona", "entity_id": b, "revision_number": 1},
+    ])
+
+    with patch("app.db.revisions_enrichment.get_supabase", return_value=sb):
+        created = insert_enrichment_revisions(revisions)
+
+    assert [r["id"] for r in created] == ["r1", "r3", "r2"]
+    name, params = sb.rpc.call_args[0]
+    assert name == "insert_enrichment_revisions"
+    # UUIDs serialized, None values left to column defaults
+    assert isinstance(params["p_rows"][0]["project_id"], str)
+    assert "run_id" not in params["p_rows"][1]
+
+
+def test_apply_delta_sets_and_unsets_fields():
+    base = {"name": "Export", "status": "draft", "notes": "x"}
+    delta = {"set": {"status": "confirmed", "priority": "high"}, "unset": ["notes"]}
+
+    assert apply_revision_delta(base, delta) == {
+        "name": "Export", "status": "confirmed", "priority": "high",
+    }
+    assert base["status"] == "draft"  # checkpoint left untouched
+
+
+def test_attach_snapshots_rebuilds_deltas_from_checkpoints():
+    # Listing rows (no body columns): r3 is a delta on r1, r2 a checkpoint
+    rows = [{"id": "r3", "revision_number": 3}, {"id": "r2", "revision_number": 2}]
+    bodies = [
+        {"id": "r3", "is_checkpoint": False, "base_revision_id": "r1", "snapshot": None,
+         "delta": {"set": {"status": "confirmed"}, "unset": []}},
+        {"id": "r2", "is_checkpoint": True, "base_revision_id": None,
+         "snapshot": {"name": "B"}, "delta": None},
+    ]
+    sb = MagicMock()
+    sb.table.return_value.select.return_value.in_.return_value.execute.side_effect = [
+        MagicMock(data=bodies),
+        MagicMock(data=[{"id": "r1", "snapshot": {"name": "A", "status": "draft"}}]),
+    ]
+
+    with patch("app.db.revisions_enrichment.get_supabase", return_value=sb):
+        attach_revision_snapshots(rows)
+
+    assert rows[0]["snapshot"] == {"name": "A", "status": "confirmed"}
+    assert rows[1]["snapshot"] == {"name": "B"}
+    in_calls = sb.table.return_value.select.return_value.in_.call_args_list
+    assert sorted(in_calls[0].args[1]) == ["r2", "r3"]
+    assert in_calls[1].args[1] == ["r1"]
@@ -0,0 +1,84 @@
+"""Tests for the lease-based scheduler and the batched reminder job."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.reminder_scheduler import send_due_reminders
+from app.services.scheduler import ScheduledJob, Scheduler
+
+
+def _rpc_client(responses: dict) -> MagicMock:
+    """Supabase mock whose rpc(name, params).execute() returns responses[name]."""
+    sb = MagicMock()
+    sb.rpc.side_effect = lambda name, params: MagicMock(
+        execute=MagicMock(return_value=MagicMock(data=responses[name]))
+    )
+    return sb
+
+
+def _job(fn) -> ScheduledJob:
+    return ScheduledJob("demo", fn, timedelta(minutes=10), timedelta(minutes=1))
+
+
+@pytest.mark.asyncio
+async def test_job_skipped_when_lease_not_claimed():
+    next_run = datetime.now(UTC) + timedelta(minutes=4)
+    sb = _rpc_client({
+        "claim_scheduler_lease": [{"claimed": False, "next_run_at": next_run.isoformat()}],
+    })
+    fn = MagicMock()
+
+    with patch("app.db.supabase_client.get_supabase", return_value=sb):
+        delay = await Scheduler({}, holder="w1").run_once(_job(fn))
+
+    fn.assert_not_called()
+    assert 230 < delay <= 240  # sleeps until the row is due again
+
+
+@pytest.mark.asyncio
+async def test_claimed_job_runs_and_pulls_next_run_earlier():
+    next_due = datetime.now(UTC) + timedelta(minutes=2)
+    sb = _rpc_client({
+        "claim_scheduler_lease": [{"claimed": True, "next_run_at": None}],
+        "complete_scheduler_lease": next_due.isoformat(),
+    })
+
+    with patch("app.db.supabase_client.get_supabase", return_value=sb):
+        delay = await Scheduler({}, holder="w1").run_once(
+            _job(lambda: {"sent": 3, "next_due_at": next_due})
+        )
+
+    name, params = sb.rpc.call_args_list[-1].args
+    assert name == "complete_scheduler_lease"
+    assert params["p_holder"] == "w1"
+    assert params["p_result"] == {"sent": 3}
+    assert params["p_next_run_at"] == next_due.isoformat()
+    assert 110 < delay <= 120
+
+
+def test_reminders_sent_in_one_batch():
+    tasks = [
+        {"id": "t1", "title": "Call CFO", "assigned_to": "u1", "project_id": "p1", "metadata": {}},
+        {"id": "t2", "title": "Old", "created_by": "u2", "metadata": {"reminder_notified": True}},
+        {"id": "t3", "title": "Nobody", "metadata": None},
+        {"id": "t4", "title": "Send deck", "created_by": "u3", "description": "v2"},
+    ]
+    sb = MagicMock()
+    query = sb.table.return_value.select.return_value
+    query.eq.return_value.eq.return_value.not_.is_.return_value.lte.return_value \
+        .execute.return_value = MagicMock(data=tasks)
+    query.eq.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value \
+        .execute.return_value = MagicMock(data=[])
+
+    with (
+        patch("app.services.reminder_scheduler.get_supabase", return_value=sb),
+        patch("app.services.reminder_scheduler.create_notifications") as create,
+    ):
+        result = send_due_reminders()
+
+    assert result == {"sent": 2, "next_due_at": None}
+    create.assert_called_once()
+    assert [n["user_id"] for n in create.call_args.args[0]] == ["u1", "u3"]
+    sb.rpc.assert_called_once_with("mark_reminders_notified", {"p_task_ids": ["t1", "t4"]})
@@ -0,0 +1,106 @@
+"""Tests for bulk solution flow step persistence and batched narratives."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.chains.solution_flow_v4 import _build_narratives_for_steps, _persist_steps
+from app.core.solution_flow_narrative import build_step_narratives
+from app.db.solution_flow import persist_flow_steps
+
+FEATURE_ID = "11111111-1111-1111-1111-111111111111"
+WORKFLOW_ID = "22222222-2222-2222-2222-222222222222"
+
+
+def test_persist_flow_steps_sends_one_rpc_with_final_order():
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(data=[{"id": "a"}, {"id": "b"}])
+    flow_id = uuid4()
+
+    with patch("app.db.solution_flow.get_supabase", return_value=sb):
+        saved = persist_flow_steps(
+            flow_id,
+            [{"id": "a"}, {"title": "New", "goal": "Do it", "step_index": 1}],
+            generation_version=3,
+        )
+
+    assert saved == [{"id": "a"}, {"id": "b"}]
+    name, params = sb.rpc.call_args[0]
+    assert name == "persist_solution_flow_steps"
+    assert params["p_flow_id"] == str(flow_id)
+    assert params["p_generation_version"] == 3
+    assert params["p_steps"][0] == {"id": "a"}
+    new_row = params["p_steps"][1]
+    assert new_row["title"] == "New"
+    assert new_row["confirmation_status"] == "ai_generated"
+    assert "flow_id" not in new_row and "step_index" not in new_row
+    sb.table.assert_not_called()
+
+
+def test_v4_persist_interleaves_confirmed_steps_and_drops_invalid_ones():
+    confirmed = [{"id": "c1", "step_index": 1, "confirmation_status": "confirmed_client"}]
+    new_steps = [
+        {"title": "First", "goal": "g1", "linked_feature_ids": [FEATURE_ID, "Login page"]},
+        {"title": "Broken"},
+        {"title": "Third", "goal": "g3", "goal_sentence": "drop me"},
+    ]
+    saved = [{"id": "c1"}, {"id": "n1"}, {"id": "n3"}]
+
+    with (
+        patch("app.db.solution_flow.persist_flow_steps", return_value=saved) as persist,
+        patch("app.db.entity_embeddings.embed_entities_batch") as embed,
+    ):
+        result = _persist_steps(uuid4(), uuid4(), new_steps, confirmed, generation_version=2)
+
+    assert result == saved
+    ordered = persist.call_args[0][1]
+    assert ordered[0] == {"id": "c1"}
+    assert [s["title"] for s in ordered[1:]] == ["First", "Third"]
+    assert ordered[1]["linked_feature_ids"] == [FEATURE_ID]
+    assert "goal_sentence" not in ordered[2]
+    # Only new steps are embedded, in one batch
+    embed.assert_called_once_with("solution_flow_step", [{"id": "n1"}, {"id": "n3"}])
+
+
+def test_narratives_share_one_query_per_table_and_one_write():
+    sb = MagicMock()
+
+    def table(name):
+        rows = {
+            "features": [{"id": FEATURE_ID, "name": "Export",
+                          "confirmation_status": "confirmed_client", "source_signal_ids": ["s"]}],
+            "workflows": [{"id": WORKFLOW_ID, "name": "Month end",
+                           "confirmation_status": "ai_generated", "source_signal_ids": []}],
+        }[name]
+        t = MagicMock()
+        t.select.return_value.in_.return_value.execute.return_value = MagicMock(data=rows)
+        return t
+
+    sb.table.side_effect = table
+    steps = [
+        {"id": f"s{i}", "linked_feature_ids": [FEATURE_ID], "linked_workflow_ids": [WORKFLOW_ID],
+         "generation_version": 2}
+        for i in range(10)
+    ]
+
+    with patch("app.db.supabase_client.get_supabase", return_value=sb):
+        narratives = build_step_narratives(steps, uuid4())
+
+    assert sb.table.call_count == 2
+    assert narratives["s0"].startswith(
+        "This step was derived from Feature: Export (confirmed by client, 1 signal) "
+        "and Workflow: Month end (AI-generated, 0 signals)."
+    )
+    assert len(narratives) == 10
+
+    with (
+        patch("app.core.solution_flow_narrative.build_step_narratives",
+              return_value={"s1": "n"}) as build,
+        patch("app.db.solution_flow.update_step_narratives") as write,
+    ):
+        _build_narratives_for_steps(
+            [{"id": "s0", "confirmation_status": "confirmed_consultant"}, {"id": "s1"}],
+            uuid4(),
+        )
+
+    assert build.call_args[0][0] == [{"id": "s1"}]
+    write.assert_called_once_with({"s1": "n"})
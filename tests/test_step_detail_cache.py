@@ -0,0 +1,145 @@
+"""Tests for the v4 step detail cache (solution_flow_v4.builders)."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.chains.solution_flow_v4.builders import build_step_details
+from app.chains.solution_flow_v4.intelligence import FlowIntelligenceContext
+
+FEATURE_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _skeletons() -> list[dict]:
+    return [
+        {"title": "Intake", "phase": "entry", "goal_sentence": "Capture requests",
+         "actors": ["Sarah"], "data_outputs": ["request"]},
+        {"title": "Review", "phase": "core_experience", "goal_sentence": "Approve requests",
+         "actors": ["Sarah"], "data_inputs": ["request"], "linked_feature_ids": [FEATURE_ID]},
+    ]
+
+
+def _ctx(feature_overview: str) -> FlowIntelligenceContext:
+    return FlowIntelligenceContext(
+        personas=[{"id": "p1", "name": "Sarah", "role": "Ops lead"}],
+        features=[{"id": FEATURE_ID, "name": "Approvals", "overview": feature_overview}],
+    )
+
+
+def _detail(title: str) -> dict:
+    return {
+        "information_fields": [{"name": "Amount", "type": "captured", "mock_value": "$10",
+                                "confidence": "known"}],
+        "mock_data_narrative": f"Sarah opens {title}.",
+        "implied_pattern": "form",
+        "success_criteria": ["Done"],
+        "story_headline": title,
+        "user_actions": ["Submit"],
+        "ai_config": {"role": "r", "agent_name": "Checker", "agent_type": "classifier",
+                      "behaviors": ["b"], "automation_estimate": 80},
+    }
+
+
+class _FakeCache:
+    """In-memory stand-in for the step detail cache table."""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+
+    def get(self, project_id, keys):
+        return {k: json.loads(json.dumps(self.rows[k])) for k in keys if k in self.rows}
+
+    def save(self, project_id, details, used_keys=None):
+        self.rows.update(details)
+
+
+async def _run(ctx, cache, client):
+    with (
+        patch("anthropic.AsyncAnthropic", return_value=client),
+        patch("app.core.config.Settings"),
+        patch("app.db.solution_flow.get_cached_step_details", side_effect=cache.get),
+        patch("app.db.solution_flow.save_cached_step_details", side_effect=cache.save),
+        patch("app.chains.solution_flow_v4.builders._log_usage_batch") as usage,
+    ):
+        steps = await build_step_details(_skeletons(), ctx, {}, uuid4())
+    return steps, usage
+
+
+def _client() -> MagicMock:
+    async def create(**kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        title = "Review" if "Title: Review" in prompt else "Intake"
+        block = SimpleNamespace(type="tool_use", name="submit_step_detail", input=_detail(title))
+        return SimpleNamespace(content=[block])
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_unchanged_steps_reuse_cached_details():
+    cache = _FakeCache()
+
+    client = _client()
+    first, usage = await _run(_ctx("Approve spend"), cache, client)
+    assert client.messages.create.await_count == 2
+    assert usage.call_args.kwargs["cache_hits"] == 0
+
+    # Same skeletons and entities: no model calls, same details
+    client = _client()
+    second, usage = await _run(_ctx("Approve spend"), cache, client)
+    assert client.messages.create.await_count == 0
+    assert usage.call_args.kwargs["cache_hits"] == 2
+    assert second == first
+    assert second[1]["goal"] == "Approve requests"
+
+    # A linked entity's content changed: only the step linking it is rebuilt
+    client = _client()
+    _, usage = await _run(_ctx("Approve spend over $5K"), cache, client)
+    assert client.messages.create.await_count == 1
+    assert "Title: Review" in client.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert usage.call_args.kwargs["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_builds_are_not_cached():
+    cache = _FakeCache()
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=RuntimeError("overloaded"))
+
+    steps, _ = await _run(_ctx("Approve spend"), cache, client)
+
+    assert [s["implied_pattern"] for s in steps] == ["form", "form"]
+    assert cache.rows == {}
+
+
+def test_usage_row_records_the_step_cache_hit_rate():
+    from app.chains.solution_flow_v4.builders import _log_usage_batch
+
+    sb = MagicMock()
+    with (
+        patch("app.core.llm_usage.get_supabase", return_value=sb),
+        patch("app.core.llm_usage.enqueue_write", side_effect=lambda write, label: write()),
+    ):
+        _log_usage_batch(
+            uuid4(), "solution_flow_builders", "claude-sonnet-4-6", 4, 2.5, cache_hits=1,
+            usage={"tokens_input": 900, "tokens_output": 300,
+                   "tokens_cache_read": 0, "tokens_cache_create": 0},
+        )
+
+        # Every step from the cache: no tokens, still a row for the hit rate
+        _log_usage_batch(
+            uuid4(), "solution_flow_builders", "claude-sonnet-4-6", 2, 0.1, cache_hits=2,
+        )
+
+    sb.table.assert_called_with("llm_usage_log")
+    partial, all_cached = [c[0][0] for c in sb.table.return_value.insert.call_args_list]
+    assert partial["chain"] == "solution_flow_builders"
+    assert partial["tokens_input"] == 900
+    assert partial["metadata"] == {"steps": 4, "cache_hits": 1, "cache_hit_rate": 0.25}
+    assert all_cached["tokens_input"] == 0
+    assert all_cached["metadata"] == {"steps": 2, "cache_hits": 2, "cache_hit_rate": 1.0}
@@ -0,0 +1,80 @@
+"""Tests for batched archival/retention sweeps (app/db/sweeps.py)."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.db.sweeps import run_sweep
+
+
+def _sweep_client(batches: list[int]) -> MagicMock:
+    """Supabase mock whose sweep RPC returns the given changed-row counts in order."""
+    sb = MagicMock()
+    sb.rpc.return_value.execute.side_effect = [MagicMock(data=n) for n in batches]
+    return sb
+
+
+def test_runs_batches_until_short_batch():
+    sb = _sweep_client([100, 100, 37])
+    pid = uuid4()
+
+    with (
+        patch("app.db.sweeps.get_supabase", return_value=sb),
+        patch("app.db.sweeps.time.sleep") as sleep,
+    ):
+        result = run_sweep(
+            "signal_raw_text", {"p_cutoff": "2026-01-01"}, project_id=pid,
+            batch_size=100, pause_ms=50, max_rows=0,
+        )
+
+    assert (result.affected, result.batches, result.capped) == (237, 3, False)
+    assert sleep.call_count == 2
+    name, params = sb.rpc.call_args[0]
+    assert name == "sweep_signal_raw_text"
+    assert params == {
+        "p_cutoff": "2026-01-01", "p_project_id": str(pid), "p_dry_run": False,
+        "p_batch_size": 100,
+    }
+
+
+def test_stops_at_row_cap():
+    sb = _sweep_client([100, 100, 50])
+
+    with patch("app.db.sweeps.get_supabase", return_value=sb):
+        result = run_sweep("archive_old_insights", {}, batch_size=100, pause_ms=0, max_rows=250)
+
+    assert (result.affected, result.batches, result.capped) == (250, 3, True)
+    # Last batch is shrunk to what's left under the cap
+    assert sb.rpc.call_args[0][1]["p_batch_size"] == 50
+
+
+def test_dry_run_counts_once():
+    sb = _sweep_client([1234])
+
+    with patch("app.db.sweeps.get_supabase", return_value=sb):
+        result = run_sweep("recording_urls", {"p_cutoff": "x"}, dry_run=True)
+
+    sb.rpc.assert_called_once()
+    assert sb.rpc.call_args[0][1]["p_dry_run"] is True
+    assert result.to_dict() == {
+        "sweep": "recording_urls", "affected": 1234, "batches": 0,
+        "dry_run": True, "capped": False,
+    }
+
+
+def test_change_events_are_pruned_by_the_retention_job():
+    from app.services.data_retention import enforce_all_retention_policies
+
+    sb = _sweep_client([3])
+
+    with (
+        patch("app.db.sweeps.get_supabase", return_value=sb),
+        patch("app.services.data_retention._enforce_recording_retention", return_value=0),
+        patch("app.services.data_retention._enforce_token_retention", return_value=0),
+        patch("app.services.data_retention._enforce_signal_retention", return_value=0),
+    ):
+        results = enforce_all_retention_policies(dry_run=True)
+
+    assert results["change_events_pruned"] == 3
+    name, params = sb.rpc.call_args[0]
+    assert name == "sweep_change_events"
+    assert "p_cutoff" in params
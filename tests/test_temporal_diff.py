@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from app.core.schemas_briefing import ChangeType
 from app.core.temporal_diff import compute_temporal_diff
 
 
@@ -15,118 +16,84 @@ class TestComputeTemporalDiff:
         assert result.changes == []
         assert result.counts == {}
 
-    @patch("app.db.supabase_client.get_supabase")
+    @patch("app.db.change_events.get_supabase")
     def test_with_recent_session(self, mock_get_sb):
-        """Queries all 4 data sources when since is provided."""
-        mock_sb = MagicMock()
+        """Reads the change feed with one digest call when since is provided."""
+        mock_sb = _digest_client({"counts": {}, "entity_counts": {}, "changes": [], "cursor": 7})
         mock_get_sb.return_value = mock_sb
 
-        # Empty results for all queries
-        mock_response = MagicMock()
-        mock_response.data = []
-
-        # Chain all select/eq/gt/order/limit combos to return empty
-        table = mock_sb.table.return_value
-        table.select.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
-        table.select.return_value.eq.return_value.in_.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
-
         since = datetime.now(UTC) - timedelta(days=2)
         result = compute_temporal_diff(uuid4(), since)
 
         assert result.since_label == "2 days ago"
         assert result.changes == []
+        mock_sb.rpc.assert_called_once()
+        name, params = mock_sb.rpc.call_args[0]
+        assert name == "get_change_digest"
+        assert params["p_since"] == since.isoformat()
+        assert "p_cursor" in params
 
-    @patch("app.db.supabase_client.get_supabase")
+    @patch("app.db.change_events.get_supabase")
     def test_belief_changes_mapped_correctly(self, mock_get_sb):
-        """Belief history changes are mapped to correct ChangeType."""
-        mock_sb = MagicMock()
-        mock_get_sb.return_value = mock_sb
-
-        # belief_history returns a confidence increase
-        mock_belief_response = MagicMock()
-        mock_belief_response.data = [
-            {
-                "node_id": str(uuid4()),
-                "change_type": "confidence_increase",
-                "change_reason": "New evidence supports this",
-                "previous_confidence": 0.6,
-                "new_confidence": 0.8,
-                "created_at": datetime.now(UTC).isoformat(),
-            }
-        ]
-
-        # Empty for other queries
-        mock_empty = MagicMock()
-        mock_empty.data = []
-
-        table = mock_sb.table.return_value
-        # First call is belief_history, rest are empty
-        call_count = [0]
-
-        def mock_select(*args, **kwargs):
-            call_count[0] += 1
-            result = MagicMock()
-            if call_count[0] == 1:
-                result.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_belief_response
-            else:
-                result.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_empty
-                result.eq.return_value.in_.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_empty
-            return result
-
-        table.select = mock_select
+        """Digest rows and kind counts map to ChangeTypes and briefing count keys."""
+        entity_id = str(uuid4())
+        mock_get_sb.return_value = _digest_client({
+            "counts": {"belief_strengthened": 1, "entity_updated": 3, "entity_created": 1},
+            "entity_counts": {"feature": 4, "memory_node": 1},
+            "changes": [
+                {
+                    "id": 12, "change_kind": "entity_updated", "entity_type": "feature",
+                    "entity_id": entity_id, "summary": "Updated name",
+                    "confidence_delta": None, "created_at": datetime.now(UTC).isoformat(),
+                },
+                {
+                    "id": 11, "change_kind": "belief_strengthened", "entity_type": "memory_node",
+                    "entity_id": str(uuid4()), "summary": "New evidence supports this",
+                    "confidence_delta": 0.2, "created_at": datetime.now(UTC).isoformat(),
+                },
+            ],
+            "cursor": 12,
+        })
 
         since = datetime.now(UTC) - timedelta(hours=6)
         result = compute_temporal_diff(uuid4(), since)
 
         assert result.since_label == "earlier today"
-        assert result.counts.get("beliefs_changed", 0) == 1
-
-    def test_since_label_yesterday(self):
-        """since_label says 'yesterday' for 1 day old."""
-        # Can't easily test the label generation in isolation since it's inside the function,
-        # but we verify the function handles various timestamps gracefully
-        pass
+        assert result.counts["beliefs_changed"] == 1
+        assert result.counts["entities_updated"] == 4
+        assert result.counts["new_signals"] == 0
+        entity, belief = result.changes
+        assert entity.change_type == ChangeType.ENTITY_UPDATED
+        assert (entity.entity_type, entity.entity_id) == ("feature", entity_id)
+        assert belief.change_type == ChangeType.BELIEF_STRENGTHENED
+        assert belief.confidence_delta == 0.2
+        assert belief.entity_id is None
+
+    @patch("app.db.change_events.get_supabase")
+    def test_digest_failure_returns_empty_diff(self, mock_get_sb):
+        """A failed digest query degrades to an empty diff."""
+        mock_get_sb.return_value.rpc.side_effect = RuntimeError("db down")
+
+        result = compute_temporal_diff(uuid4(), datetime.now(UTC) - timedelta(days=1))
+
+        assert result.since_label == "yesterday"
+        assert result.changes == []
+        assert result.counts == {}
 
-    @patch("app.db.supabase_client.get_supabase")
+    @patch("app.db.change_events.get_supabase")
     def test_caps_at_20_changes(self, mock_get_sb):
-        """Never returns more than 20 changes."""
-        mock_sb = MagicMock()
+        """Asks the digest for at most 20 changes; counts still cover the window."""
+        mock_sb = _digest_client({"counts": {"signal_processed": 25}, "changes": [], "cursor": 3})
         mock_get_sb.return_value = mock_sb
 
-        # 25 belief changes
-        mock_response = MagicMock()
-        mock_response.data = [
-            {
-                "node_id": str(uuid4()),
-                "change_type": "confidence_increase",
-                "change_reason": f"Change {i}",
-                "previous_confidence": 0.5,
-                "new_confidence": 0.6,
-                "created_at": datetime.now(UTC).isoformat(),
-            }
-            for i in range(25)
-        ]
-
-        mock_empty = MagicMock()
-        mock_empty.data = []
-
-        table = mock_sb.table.return_value
-        call_count = [0]
-
-        def mock_select(*args, **kwargs):
-            call_count[0] += 1
-            result = MagicMock()
-            if call_count[0] == 1:
-                result.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
-            else:
-                result.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_empty
-                result.eq.return_value.in_.return_value.eq.return_value.gt.return_value.order.return_value.limit.return_value.execute.return_value = mock_empty
-            return result
-
-        table.select = mock_select
-
-        since = datetime.now(UTC) - timedelta(days=3)
-        result = compute_temporal_diff(uuid4(), since)
+        result = compute_temporal_diff(uuid4(), datetime.now(UTC) - timedelta(days=3))
+
+        assert mock_sb.rpc.call_args[0][1]["p_limit"] == 20
+        assert result.counts["new_signals"] == 25
+
 
-        # belief_history returns up to 20 (query limit), then cap to 20 total
-        assert len(result.changes) <= 20
+def _digest_client(digest: dict) -> MagicMock:
+    """Supabase mock whose get_change_digest RPC returns the given digest."""
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(data=digest)
+    return sb
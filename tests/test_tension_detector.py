@@ -1,7 +1,7 @@
 """Tests for the tension detector — pure graph walking, no LLM."""
 
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from app.core.tension_detector import _build_tension_summary, detect_tensions
 
@@ -138,3 +138,143 @@ class TestDetectTensions:
 
         result = detect_tensions(uuid4())
         assert len(result) <= 5
+
+
+class _FakeQuery:
+    """Chainable PostgREST stand-in: applies eq/in_/gte filters to table rows."""
+
+    def __init__(self, db, calls, table):
+        self._rows = list(db.get(table, []))
+        calls.append(table)
+
+    def select(self, *_args):
+        return self
+
+    def eq(self, col, value):
+        self._rows = [r for r in self._rows if r.get(col) == value]
+        return self
+
+    def in_(self, col, values):
+        self._rows = [r for r in self._rows if r.get(col) in values]
+        return self
+
+    def gte(self, col, value):
+        self._rows = [r for r in self._rows if (r.get(col) or 0) >= value]
+        return self
+
+    @property
+    def not_(self):
+        return self
+
+    def is_(self, *_args):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def limit(self, n):
+        self._rows = self._rows[:n]
+        return self
+
+    def execute(self):
+        return MagicMock(data=self._rows)
+
+
+def _fake_supabase(db):
+    calls: list[str] = []
+    sb = MagicMock()
+    sb.table.side_effect = lambda table: _FakeQuery(db, calls, table)
+    return sb, calls
+
+
+class TestBulkLoading:
+    def test_query_count_independent_of_project_size(self):
+        pid = str(uuid4())
+        workflows = [
+            {"id": f"wf{i}", "name": f"Flow {i}", "project_id": pid, "workflow_type": "current"}
+            for i in range(30)
+        ]
+        steps = [
+            {"id": f"s{i}", "label": "Step", "pain_level": 5, "workflow_id": f"wf{i}"}
+            for i in range(30)
+        ]
+        features = [
+            {"id": f"f{i}", "name": f"Feature {i}", "project_id": pid,
+             "confirmation_status": "confirmed_client", "workflow_id": f"wf{i}"}
+            for i in range(28)  # wf28, wf29 have no addressing feature
+        ]
+        impacts = [{"id": f"i{i}", "entity_id": f"f{i}"} for i in range(1, 20)]  # f0 ungrounded
+        sb, calls = _fake_supabase({
+            "workflows": workflows, "vp_steps": steps,
+            "features": features, "signal_impact": impacts,
+        })
+
+        with patch("app.db.supabase_client.get_supabase", return_value=sb):
+            result = detect_tensions(UUID(pid))
+
+        assert len(calls) <= 8
+        ids = {t.tension_id for t in result}
+        assert {"unaddressed_pain:wf28", "unaddressed_pain:wf29", "ungrounded:f0"} <= ids
+
+    def test_failed_load_only_disables_its_strategies(self):
+        pid = str(uuid4())
+        sb, _ = _fake_supabase({
+            "features": [{"id": "f1", "name": "Login", "project_id": pid,
+                          "confirmation_status": "confirmed_consultant"}],
+        })
+        original = sb.table.side_effect
+
+        def _table(name):
+            if name == "workflows":
+                raise RuntimeError("down")
+            return original(name)
+
+        sb.table.side_effect = _table
+
+        with patch("app.db.supabase_client.get_supabase", return_value=sb):
+            result = detect_tensions(UUID(pid))
+
+        assert [t.tension_id for t in result] == ["ungrounded:f1"]
+
+    def test_evidence_past_the_row_cap_still_counts(self):
+        pid = str(uuid4())
+        features = [
+            {"id": f"f{i}", "name": f"Feature {i}", "project_id": pid,
+             "confirmation_status": "confirmed_client"}
+            for i in range(3)
+        ]
+        # f0 fills a whole response; f1's only impact row comes after it
+        impacts = [{"entity_id": "f0"}] * 5 + [{"entity_id": "f1"}]
+        sb, calls = _fake_supabase({"features": features, "signal_impact": impacts})
+
+        with (
+            patch("app.db.supabase_client.get_supabase", return_value=sb),
+            patch("app.core.tension_detector._PAGE_SIZE", 5),
+        ):
+            result = detect_tensions(UUID(pid))
+
+        assert [t.tension_id for t in result] == ["ungrounded:f2"]
+        assert calls.count("signal_impact") == 2
+
+
+def test_registered_strategy_runs_on_shared_inputs():
+    from app.core import tension_detector
+    from app.core.schemas_briefing import ActiveTension
+
+    seen_inputs = []
+
+    def _rule(inputs):
+        seen_inputs.append(inputs)
+        return [ActiveTension(tension_id="custom", summary="s", side_a="a", side_b="b",
+                              involved_entities=[], confidence=0.99)]
+
+    tension_detector.tension_strategy("custom")(_rule)
+    try:
+        with patch.object(tension_detector, "load_tension_inputs",
+                          return_value=tension_detector.TensionInputs()):
+            result = detect_tensions(uuid4())
+    finally:
+        tension_detector._STRATEGIES.pop()
+
+    assert [t.tension_id for t in result] == ["custom"]
+    assert len(seen_inputs) == 1
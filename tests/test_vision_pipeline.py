@@ -0,0 +1,165 @@
+"""Tests for the shared document vision pipeline (document_processing.vision)."""
+
+import asyncio
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import fitz
+import pytest
+
+from app.core.document_processing.vision import (
+    analyze_images,
+    decorative_reason,
+    downscale_for_vision,
+    fingerprint_image,
+)
+
+
+def _pixmap(width: int, height: int, seed: int, flip: bool = False):
+    """Noisy two-band gradient; distinct enough to survive re-encoding."""
+    rng = random.Random(seed)
+    buf = bytearray()
+    for y in range(height):
+        for x in range(width):
+            v = x * 255 // width
+            if flip:
+                v = 255 - v
+            if (y * 4 // height) % 2:
+                v = 255 - v
+            buf += bytes((min(255, v + rng.randrange(30)),) * 3)
+    return fitz.Pixmap(fitz.csRGB, width, height, bytes(buf), 0)
+
+
+def _client() -> MagicMock:
+    async def create(**kwargs):
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="A login screen")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+    return client
+
+
+async def _analyze(images, client, cached=None, **kwargs):
+    with (
+        patch(
+            "app.db.document_extracted_images.get_cached_vision_analyses",
+            return_value=cached or {},
+        ) as get_cache,
+        patch("app.db.document_extracted_images.save_vision_analyses") as save_cache,
+        patch("app.core.llm_usage.log_llm_usage"),
+    ):
+        result = await analyze_images(images, "Describe", client=client, **kwargs)
+    return result, get_cache, save_cache
+
+
+@pytest.mark.asyncio
+async def test_identical_and_decorative_images_cost_no_calls():
+    screen = _pixmap(400, 300, seed=1)
+    logo = _pixmap(300, 200, seed=5)
+    images = [
+        screen.tobytes("png"),
+        screen.tobytes("png"),  # same screenshot embedded twice
+        _pixmap(1200, 100, seed=3).tobytes("png"),  # banner
+        logo.tobytes("png"),
+        logo.tobytes("jpeg", jpg_quality=90),  # same logo, re-encoded
+    ]
+    client = _client()
+
+    result, _, save_cache = await _analyze(images, client, project_id=uuid4())
+
+    assert client.messages.create.await_count == 2
+    assert result.duplicate_of == {1: 0}
+    assert result.skipped == {2: "banner", 4: "repeated_asset"}
+    assert result.analyses == ["A login screen", "A login screen", None, "A login screen", None]
+    assert len(save_cache.call_args[0][1]) == 2
+
+
+@pytest.mark.asyncio
+async def test_screens_sharing_a_layout_are_analyzed_separately():
+    first = _pixmap(400, 300, seed=1)
+    second = _pixmap(400, 300, seed=1)
+    for x in range(100, 300, 3):  # different body text, same header and sidebar
+        for y in range(150, 160):
+            second.set_pixel(x, y, (0, 0, 0))
+    images = [first.tobytes("png"), second.tobytes("png")]
+    fps = [fingerprint_image(img) for img in images]
+    assert fps[0].phash == fps[1].phash
+    client = _client()
+
+    result, _, save_cache = await _analyze(images, client, project_id=uuid4())
+
+    assert client.messages.create.await_count == 2
+    assert not result.duplicate_of and not result.skipped
+    assert set(save_cache.call_args[0][1]) == {fp.key for fp in fps}
+
+
+@pytest.mark.asyncio
+async def test_cached_images_are_not_sent_again():
+    img = _pixmap(400, 300, seed=1).tobytes("png")
+    key = fingerprint_image(img).key
+    client = _client()
+
+    result, get_cache, save_cache = await _analyze(
+        [img], client, cached={key: "From cache"}, project_id=uuid4()
+    )
+
+    client.messages.create.assert_not_awaited()
+    save_cache.assert_not_called()
+    assert get_cache.call_args[0][1] == [key]
+    assert result.analyses == ["From cache"]
+    assert result.cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_are_bounded_by_configured_concurrency():
+    images = [_pixmap(200, 150, seed=i).tobytes("png") for i in range(6)]
+    in_flight = peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=None)
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+
+    with (
+        patch("app.core.document_processing.vision.get_settings") as settings,
+        patch("app.core.document_processing.vision.find_duplicate", return_value=None),
+        patch("app.core.document_processing.vision.find_repeated_asset", return_value=None),
+    ):
+        settings.return_value.VISION_MAX_CONCURRENCY = 2
+        settings.return_value.VISION_MAX_IMAGE_EDGE = 1568
+        result, _, _ = await _analyze(images, client)
+
+    assert result.vision_calls == 6
+    assert peak == 2
+
+
+def test_downscale_caps_longest_edge_and_leaves_small_images_alone():
+    big = _pixmap(1600, 800, seed=4).tobytes("png")
+    data, mime = downscale_for_vision(big, max_edge=400)
+    small = fitz.Pixmap(data)
+    assert (small.width, small.height) == (400, 200)
+    assert mime in ("image/png", "image/jpeg")
+    assert len(data) < len(big)
+
+    assert downscale_for_vision(big, max_edge=2000) == (big, "image/png")
+
+
+def test_tiny_and_blank_images_are_decorative():
+    assert decorative_reason(fingerprint_image(b"\x89PNG\r\n\x1a\n" + b"0" * 100)) == (
+        "too_small_bytes"
+    )
+    blank = fitz.Pixmap(fitz.csRGB, 300, 300, bytes([200] * 300 * 300 * 3), 0)
+    fp = fingerprint_image(blank.tobytes("png"))
+    fp.size_bytes = 50_000  # flat PNGs compress below the byte threshold
+    assert decorative_reason(fp) == "blank"
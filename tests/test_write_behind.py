@@ -0,0 +1,49 @@
+"""Tests for the write-behind queue (app.core.write_behind)."""
+
+import threading
+import time
+
+from app.core.write_behind import WriteBehindQueue
+
+
+def test_runs_writes_in_submission_order():
+    q = WriteBehindQueue("test-order")
+    seen: list[int] = []
+    for i in range(20):
+        q.submit(lambda i=i: seen.append(i))
+    assert q.flush(timeout=2.0)
+    assert seen == list(range(20))
+    assert q.depth == 0
+
+
+def test_submit_does_not_wait_for_slow_write():
+    q = WriteBehindQueue("test-slow")
+    release = threading.Event()
+    start = time.monotonic()
+    q.submit(release.wait)
+    assert time.monotonic() - start < 0.05
+    assert q.depth == 1
+    release.set()
+    assert q.flush(timeout=2.0)
+
+
+def test_failures_are_swallowed_and_queue_keeps_draining():
+    q = WriteBehindQueue("test-fail")
+    seen: list[str] = []
+
+    def boom():
+        raise RuntimeError("insert failed")
+
+    q.submit(boom, "boom")
+    q.submit(lambda: seen.append("after"))
+    assert q.flush(timeout=2.0)
+    assert seen == ["after"]
+
+
+def test_flush_times_out():
+    q = WriteBehindQueue("test-timeout")
+    release = threading.Event()
+    q.submit(release.wait)
+    assert q.flush(timeout=0.05) is False
+    release.set()
+    assert q.flush(timeout=2.0)
@@ -0,0 +1,100 @@
+"""Tests for the per-project write version and the caches keyed on it."""
+
+import time
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.db import context_cache, write_versions
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    write_versions._version_memo.clear()
+    context_cache._cache.clear()
+    yield
+    write_versions._version_memo.clear()
+    context_cache._cache.clear()
+
+
+def _supabase_with_version(version: int | None) -> MagicMock:
+    sb = MagicMock()
+    query = sb.table.return_value.select.return_value.eq.return_value.limit.return_value
+    query.execute.return_value = MagicMock(data=[{"version": version}] if version else [])
+    return sb
+
+
+def test_project_version_reads_one_row_and_defaults_to_zero():
+    sb = _supabase_with_version(42)
+    with patch("app.db.write_versions.get_supabase", return_value=sb):
+        assert write_versions.get_project_version(uuid4()) == 42
+    sb.table.assert_called_once_with("project_versions")
+
+    with patch("app.db.write_versions.get_supabase", return_value=_supabase_with_version(None)):
+        assert write_versions.get_project_version(uuid4()) == 0
+
+    with patch("app.db.write_versions.get_supabase", side_effect=RuntimeError("down")):
+        assert write_versions.get_project_version(uuid4()) is None
+
+
+def test_current_version_is_memoized_until_a_local_write():
+    pid = uuid4()
+    lookup = MagicMock(side_effect=[3, 4])
+    with patch("app.db.write_versions.get_project_version", lookup):
+        assert write_versions.current_project_version(pid) == 3
+        assert write_versions.current_project_version(pid) == 3
+        assert lookup.call_count == 1
+
+        write_versions.note_project_write(pid)
+        assert write_versions.current_project_version(pid) == 4
+        assert lookup.call_count == 2
+
+
+def test_context_cache_serves_until_the_version_changes():
+    pid = uuid4()
+    compute = MagicMock(side_effect=["first", "second"])
+    version = MagicMock(return_value=5)
+
+    with patch("app.db.write_versions.current_project_version", version):
+        assert context_cache._get_or_compute(f"facts:{pid}", pid, compute) == "first"
+        # Past the old 30s TTL, but nothing was written
+        key = f"facts:{pid}"
+        value, ts, cached_version = context_cache._cache[key]
+        context_cache._cache[key] = (value, ts - 600, cached_version)
+        assert context_cache._get_or_compute(key, pid, compute) == "first"
+
+        version.return_value = 6
+        assert context_cache._get_or_compute(key, pid, compute) == "second"
+    assert compute.call_count == 2
+
+
+def test_context_cache_falls_back_to_ttl_when_version_unknown():
+    pid = uuid4()
+    compute = MagicMock(side_effect=["first", "second"])
+    key = f"facts:{pid}"
+
+    with patch("app.db.write_versions.current_project_version", return_value=None):
+        assert context_cache._get_or_compute(key, pid, compute) == "first"
+        assert context_cache._get_or_compute(key, pid, compute) == "first"
+        value, ts, cached_version = context_cache._cache[key]
+        context_cache._cache[key] = (value, ts - context_cache._TTL_SECONDS, cached_version)
+        assert context_cache._get_or_compute(key, pid, compute) == "second"
+
+
+@pytest.mark.asyncio
+async def test_context_frame_skips_data_load_while_version_unchanged():
+    from app.core import action_engine
+
+    pid = uuid4()
+    frame = object()
+    action_engine._context_frame_cache[str(pid)] = (time.time(), 9, "fp", frame)
+    load = MagicMock(side_effect=AssertionError("project data should not be loaded"))
+    try:
+        with (
+            patch("app.db.write_versions.current_project_version", return_value=9),
+            patch("app.core.action_engine._load_project_data", load),
+        ):
+            assert await action_engine.compute_context_frame(pid) is frame
+    finally:
+        action_engine._context_frame_cache.pop(str(pid), None)